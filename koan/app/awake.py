@@ -54,6 +54,7 @@ from app.outbox_manager import OutboxManager, parse_outbox_priority
 from app.shutdown_manager import is_shutdown_requested, clear_shutdown
 from app.config import (
     get_chat_tools,
+    get_context_budget,
     get_tools_description,
     get_model_config,
 )
@@ -145,24 +146,28 @@ def parse_project(text: str) -> Tuple[Optional[str], str]:
 def _build_chat_prompt(text: str, *, lite: bool = False) -> str:
     """Build the prompt for a chat response.
 
+    Context sections are packed into the ``context_budget.chat`` token
+    budget by priority: missions state and conversation history survive
+    longest, emotional memory and the journal are trimmed first.
+
     Args:
         text: The user's message.
         lite: If True, strip heavy context (journal, summary) to stay under budget.
     """
+    from app.context_packer import (
+        CHARS_PER_TOKEN, Section, estimate_tokens, pack_sections,
+    )
+
     # Load recent conversation history
     history = load_recent_history(CONVERSATION_HISTORY_FILE, max_messages=10)
     history_context = format_conversation_history(history)
 
     journal_context = ""
     if not lite:
-        # Load today's journal for recent context
-        from app.journal import read_all_journals
-        journal_content = read_all_journals(INSTANCE_DIR, date.today())
-        if journal_content:
-            if len(journal_content) > 2000:
-                journal_context = "...\n" + journal_content[-2000:]
-            else:
-                journal_context = journal_content
+        # Load the tail of today's journal for recent context — twice the
+        # section cap, so the packer can still cut on a line boundary.
+        from app.journal import read_journals_tail
+        journal_context, _ = read_journals_tail(INSTANCE_DIR, date.today(), 4000)
 
     # Load human preferences for personality context
     prefs_context = ""
@@ -237,38 +242,48 @@ def _build_chat_prompt(text: str, *, lite: bool = False) -> str:
     # Load tools description
     tools_desc = get_tools_description()
 
-    from app.prompts import load_prompt
-
-    summary_budget = 0 if lite else 1500
-    summary_block = f"Summary of past sessions:\n{SUMMARY[:summary_budget]}" if SUMMARY and summary_budget else ""
-    prefs_block = f"About the human:\n{prefs_context}" if prefs_context else ""
-    journal_block = f"Today's journal (excerpt):\n{journal_context}" if journal_context else ""
-    missions_block = f"Current missions state:\n{missions_context}" if missions_context else ""
-
     # Load emotional memory for relationship-aware responses
     emotional_context = ""
     if not lite:
         emotional_path = INSTANCE_DIR / "memory" / "global" / "emotional-memory.md"
         if emotional_path.exists():
-            content = emotional_path.read_text().strip()
-            # Take last 800 chars — enough for tone, not too heavy
-            if len(content) > 800:
-                emotional_context = "...\n" + content[-800:]
-            else:
-                emotional_context = content
-
-    prompt = load_prompt(
-        "chat",
-        SOUL=SOUL,
-        TOOLS_DESC=tools_desc or "",
-        PREFS=prefs_block,
-        SUMMARY=summary_block,
-        JOURNAL=journal_block,
-        MISSIONS=missions_block,
-        HISTORY=history_context or "",
-        TIME_HINT=time_hint,
-        TEXT=text,
-    )
+            emotional_context = emotional_path.read_text().strip()
+
+    from app.prompts import load_prompt
+
+    def render(blocks: dict) -> str:
+        return load_prompt(
+            "chat",
+            SOUL=SOUL,
+            TOOLS_DESC=tools_desc or "",
+            PREFS=blocks.get("prefs", ""),
+            SUMMARY=blocks.get("summary", ""),
+            JOURNAL=blocks.get("journal", ""),
+            MISSIONS=blocks.get("missions", ""),
+            HISTORY=blocks.get("history", ""),
+            TIME_HINT=time_hint,
+            TEXT=text,
+        )
+
+    # Pack variable context into what the fixed part (soul, template,
+    # user message) leaves of the budget.
+    budget = get_context_budget("chat")
+    fixed_tokens = estimate_tokens(render({}))
+    packed = pack_sections([
+        Section("missions", missions_context, priority=1,
+                header="Current missions state:\n", max_tokens=450),
+        Section("history", history_context or "", priority=2),
+        Section("prefs", prefs_context, priority=3, header="About the human:\n",
+                keep="head"),
+        Section("summary", SUMMARY if not lite else "", priority=4,
+                header="Summary of past sessions:\n", max_tokens=375, keep="head"),
+        Section("journal", journal_context, priority=5,
+                header="Today's journal (excerpt):\n", max_tokens=500),
+        Section("emotional", emotional_context, priority=6, max_tokens=200,
+                min_tokens=50),
+    ], budget=max(0, budget - fixed_tokens), label="chat")
+
+    prompt = render(packed.sections)
 
     # Inject language preference override
     lang_instruction = get_language_instruction()
@@ -276,20 +291,17 @@ def _build_chat_prompt(text: str, *, lite: bool = False) -> str:
         prompt += f"\n\n{lang_instruction}"
 
     # Inject emotional memory before the user message (if available)
-    if emotional_context:
+    emotional_block = packed.get("emotional")
+    if emotional_block:
         prompt = prompt.replace(
             f"« {text} »",
-            f"Emotional memory (relationship context, use to color your tone):\n{emotional_context}\n\nThe human sends you this message on Telegram:\n\n  « {text} »",
+            f"Emotional memory (relationship context, use to color your tone):\n{emotional_block}\n\nThe human sends you this message on Telegram:\n\n  « {text} »",
         )
 
-    # Hard cap: if prompt exceeds 12k chars, force lite mode
-    MAX_PROMPT_CHARS = 12000
-    if len(prompt) > MAX_PROMPT_CHARS and not lite:
-        return _build_chat_prompt(text, lite=True)
-
-    # Last resort: if lite mode still exceeds the cap, truncate user message
-    if len(prompt) > MAX_PROMPT_CHARS:
-        overflow = len(prompt) - MAX_PROMPT_CHARS
+    # Last resort: pinned content alone exceeds the budget — truncate the user message
+    max_prompt_chars = budget * CHARS_PER_TOKEN
+    if len(prompt) > max_prompt_chars:
+        overflow = len(prompt) - max_prompt_chars
         max_text_len = max(200, len(text) - overflow - 50)  # 50 chars margin for ellipsis/safety
         if len(text) > max_text_len:
             truncated_text = text[:max_text_len] + "… [truncated]"
@@ -432,6 +444,9 @@ def handle_chat(text: str):
             send_telegram(error_msg)
             save_conversation_message(CONVERSATION_HISTORY_FILE, "assistant", error_msg)
 
+    from app.model_warmup import warm_for_chat
+    warm_for_chat(after_reply=True)
+
 
 # ---------------------------------------------------------------------------
 # Outbox — delegated to OutboxManager (backward-compatible wrappers)
@@ -599,6 +614,9 @@ def handle_message(text: str):
     elif is_mission(text):
         handle_mission(text)
     else:
+        # Local models: load the chat model while the prompt is built
+        from app.model_warmup import warm_for_chat
+        warm_for_chat()
         _run_in_worker(handle_chat, text)
 
 
@@ -0,0 +1,238 @@
+"""
+Kōan -- One-shot snapshot of a branch's changes against its base.
+
+After a mission, verification, the quality scan, the lint gate and the
+auto-merge check all look at the same thing: what the branch changed
+relative to upstream.  Instead of each running its own ``git diff`` /
+``git log`` and re-parsing the output, the post-mission pipeline builds a
+:class:`BranchChangeSet` once and hands it to every step.
+
+Building it costs three git reads: the current branch, one
+``git diff --raw --numstat -p`` (status, line counts and the full patch
+in a single output) and one ``git log`` for the commit subjects.  The
+base ref is resolved through the shared :mod:`app.git_service`.
+"""
+
+import codecs
+import re
+from dataclasses import dataclass, field
+from typing import Iterator, List, Optional, Tuple
+
+from app.git_service import get_git_service
+from app.git_utils import run_git
+
+BASE_REF_CANDIDATES = ("upstream/main", "origin/main", "upstream/master", "origin/master")
+
+_HUNK_RE = re.compile(r"^@@ -\d+(?:,\d+)? \+(\d+)")
+
+
+@dataclass
+class FileChange:
+    """One file touched by the branch."""
+
+    path: str
+    status: str  # A, M, D, R, C, T (first letter of git's raw status)
+    old_path: str = ""
+    added: int = 0
+    removed: int = 0
+    binary: bool = False
+    hunks: List[str] = field(default_factory=list)
+    added_lines: List[Tuple[int, str]] = field(default_factory=list)
+
+    @property
+    def deleted(self) -> bool:
+        return self.status == "D"
+
+
+@dataclass
+class BranchChangeSet:
+    """Everything the post-mission checks need to know about a branch."""
+
+    project_path: str
+    branch: str
+    base_ref: str
+    files: List[FileChange] = field(default_factory=list)
+    commits: List[Tuple[str, str]] = field(default_factory=list)  # (sha, subject)
+    patch: str = ""
+
+    @property
+    def paths(self) -> List[str]:
+        return [f.path for f in self.files]
+
+    @property
+    def existing_paths(self) -> List[str]:
+        """Changed paths that still exist on the branch (no deletions)."""
+        return [f.path for f in self.files if not f.deleted]
+
+    @property
+    def subjects(self) -> List[str]:
+        return [subject for _, subject in self.commits]
+
+    @property
+    def insertions(self) -> int:
+        return sum(f.added for f in self.files)
+
+    @property
+    def deletions(self) -> int:
+        return sum(f.removed for f in self.files)
+
+    def diffstat(self) -> str:
+        """Summary line in ``git diff --stat`` wording."""
+        if not self.files:
+            return ""
+        n = len(self.files)
+        parts = [f"{n} file{'s' if n != 1 else ''} changed"]
+        if self.insertions:
+            parts.append(f"{self.insertions} insertion{'s' if self.insertions != 1 else ''}(+)")
+        if self.deletions:
+            parts.append(f"{self.deletions} deletion{'s' if self.deletions != 1 else ''}(-)")
+        return ", ".join(parts)
+
+    def iter_added_lines(self) -> Iterator[Tuple[str, int, str]]:
+        """Yield ``(file, line_number, content)`` for every added line."""
+        for f in self.files:
+            for line_num, content in f.added_lines:
+                yield f.path, line_num, content
+
+
+# ---------------------------------------------------------------------------
+# Parsing
+# ---------------------------------------------------------------------------
+
+def _unquote(path: str) -> str:
+    """Undo git's C-style quoting of unusual paths (``"a\\tb.py"``)."""
+    if len(path) < 2 or not (path.startswith('"') and path.endswith('"')):
+        return path
+    return codecs.escape_decode(path[1:-1].encode())[0].decode("utf-8", errors="replace")
+
+
+def _parse_patch_block(block: List[str], change: FileChange) -> None:
+    """Fill *change* with the hunks and added lines of one file's patch."""
+    hunk: List[str] = []
+    line_num = 0
+    in_hunk = False
+    for line in block:
+        match = _HUNK_RE.match(line)
+        if match:
+            if hunk:
+                change.hunks.append("\n".join(hunk))
+            hunk = [line]
+            line_num = int(match.group(1))
+            in_hunk = True
+            continue
+        if not in_hunk:
+            continue
+        hunk.append(line)
+        if line.startswith("+"):
+            change.added_lines.append((line_num, line[1:]))
+            line_num += 1
+        elif not line.startswith(("-", "\\")):
+            line_num += 1
+    if hunk:
+        change.hunks.append("\n".join(hunk))
+
+
+def parse_diff_output(output: str) -> Tuple[List[FileChange], str]:
+    """Parse ``git diff --raw --numstat -p`` output.
+
+    Git prints the raw records, then the numstat records, then the patch,
+    all in the same file order — so the three sections are zipped by
+    position rather than by (possibly renamed or quoted) path.
+
+    Returns the per-file changes and the patch section of the output.
+    Raises ValueError if the sections don't line up.
+    """
+    lines = output.splitlines()
+    files: List[FileChange] = []
+    i = 0
+
+    while i < len(lines) and lines[i].startswith(":"):
+        meta, _, paths = lines[i].partition("\t")
+        status = meta.split()[-1][:1] if meta.split() else "M"
+        names = [_unquote(p) for p in paths.split("\t")]
+        if status in ("R", "C") and len(names) == 2:
+            files.append(FileChange(path=names[1], status=status, old_path=names[0]))
+        else:
+            files.append(FileChange(path=names[0], status=status))
+        i += 1
+
+    for change in files:
+        if i >= len(lines) or "\t" not in lines[i]:
+            break
+        added, removed = lines[i].split("\t", 2)[:2]
+        if added == "-":
+            change.binary = True
+        else:
+            change.added, change.removed = int(added), int(removed)
+        i += 1
+
+    while i < len(lines) and not lines[i].startswith("diff --git "):
+        i += 1
+    patch_lines = lines[i:]
+
+    blocks: List[List[str]] = []
+    for line in patch_lines:
+        if line.startswith("diff --git "):
+            blocks.append([])
+        elif blocks:
+            blocks[-1].append(line)
+    if len(blocks) != len(files):
+        raise ValueError(f"{len(files)} files but {len(blocks)} patch blocks")
+    for change, block in zip(files, blocks):
+        _parse_patch_block(block, change)
+    return files, "\n".join(patch_lines)
+
+
+# ---------------------------------------------------------------------------
+# Building
+# ---------------------------------------------------------------------------
+
+def compute_changeset(
+    project_path: str,
+    base_ref: Optional[str] = None,
+) -> Optional[BranchChangeSet]:
+    """Snapshot the current branch's changes against *base_ref*.
+
+    *base_ref* defaults to the first of upstream/origin main/master that
+    exists.  Returns None when the branch or base cannot be determined or
+    git fails — callers then fall back to their own git queries.
+    """
+    rc, branch, _ = run_git("rev-parse", "--abbrev-ref", "HEAD", cwd=project_path)
+    if rc != 0 or not branch:
+        return None
+    if base_ref is None:
+        base_ref = get_git_service(project_path).first_existing(BASE_REF_CANDIDATES)
+        if not base_ref:
+            return None
+
+    rc, diff, _ = run_git(
+        "-c", "core.quotePath=false",
+        "diff", "--raw", "--numstat", "-p", "-M", "--no-color", "--no-ext-diff",
+        f"{base_ref}...HEAD",
+        cwd=project_path, timeout=60,
+    )
+    if rc != 0:
+        return None
+    rc, log, _ = run_git(
+        "log", "--format=%H %s", f"{base_ref}..HEAD", cwd=project_path,
+    )
+    if rc != 0:
+        return None
+
+    try:
+        files, patch = parse_diff_output(diff)
+    except ValueError:
+        return None
+    commits = []
+    for line in log.splitlines():
+        sha, _, subject = line.partition(" ")
+        if sha:
+            commits.append((sha, subject))
+    return BranchChangeSet(
+        project_path=project_path,
+        branch=branch,
+        base_ref=base_ref,
+        files=files,
+        commits=commits,
+        patch=patch,
+    )
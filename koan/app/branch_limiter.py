@@ -8,16 +8,41 @@ When the count reaches ``max_pending_branches``, the project is
 considered branch-saturated: no new missions are picked up and
 exploration is blocked until branches are reviewed/merged.
 
+Counting costs several git processes and a ``gh`` call, and the loop
+asks for every project on every iteration, so counts are cached per
+project.  Events that change the count (a mission pushing its branch,
+a PR opened, merged or auto-merged, merged branches cleaned up) call
+invalidate_branch_state(), which bumps a per-project stamp under
+``KOAN_ROOT/.koan-branch-state/`` so the agent loop notices even when
+the event happened in another process (dashboard, skills).  Counts
+also expire after ``BRANCH_STATE_TTL`` seconds to catch merges made
+outside Kōan.
+
 Provides:
 - count_pending_branches(project_path, github_urls, author) -> int
+- cached_count_pending_branches(...) -> int
+- invalidate_branch_state(project_name, koan_root=None)
 - is_project_branch_saturated(config, project_name, ...) -> bool
 """
 
 import logging
-from typing import List, Set
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Set, Tuple
+
+from app.signals import BRANCH_STATE_DIR
 
 log = logging.getLogger(__name__)
 
+# Seconds a cached pending-branch count stays valid without an event.
+BRANCH_STATE_TTL = 600
+
+# (instance_dir, project_name) -> (count, computed_at, stamp, (urls, author))
+_count_cache: Dict[Tuple[str, str], tuple] = {}
+_count_cache_lock = threading.Lock()
+
 
 def _get_local_unmerged_branches(instance_dir: str, project_name: str,
                                   project_path: str) -> Set[str]:
@@ -72,6 +97,70 @@ def count_pending_branches(
     return len(local_branches | pr_branches)
 
 
+def _stamp_path(koan_root: str, project_name: str) -> Path:
+    return Path(koan_root) / BRANCH_STATE_DIR / project_name
+
+
+def _read_stamp(instance_dir: str, project_name: str) -> str:
+    try:
+        return _stamp_path(str(Path(instance_dir).parent), project_name).read_text()
+    except OSError:
+        return ""
+
+
+def invalidate_branch_state(project_name: str, koan_root: Optional[str] = None) -> None:
+    """Mark *project_name*'s cached pending-branch count as stale.
+
+    *koan_root* defaults to ``$KOAN_ROOT``.  Never raises — a missed
+    invalidation only delays the update until the TTL expires.
+    """
+    with _count_cache_lock:
+        for key in [k for k in _count_cache if k[1] == project_name]:
+            del _count_cache[key]
+    from app.github import clear_pr_count_cache
+    clear_pr_count_cache()
+
+    koan_root = koan_root or os.environ.get("KOAN_ROOT", "")
+    if not koan_root:
+        return
+    path = _stamp_path(koan_root, project_name)
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(str(time.time_ns()))
+    except OSError as e:
+        log.debug("Failed to bump branch state for %s: %s", project_name, e)
+
+
+def cached_count_pending_branches(
+    instance_dir: str,
+    project_name: str,
+    project_path: str,
+    github_urls: List[str],
+    author: str,
+) -> int:
+    """count_pending_branches(), reused until invalidated or expired.
+
+    A cache hit costs one small file read and no git or network calls.
+    """
+    key = (instance_dir, project_name)
+    query = (tuple(sorted(github_urls)), author)
+    stamp = _read_stamp(instance_dir, project_name)
+    now = time.monotonic()
+    with _count_cache_lock:
+        cached = _count_cache.get(key)
+    if (cached and cached[2] == stamp and cached[3] == query
+            and now - cached[1] < BRANCH_STATE_TTL):
+        return cached[0]
+
+    # Stamp read before counting: an event during the count invalidates it.
+    count = count_pending_branches(
+        instance_dir, project_name, project_path, github_urls, author,
+    )
+    with _count_cache_lock:
+        _count_cache[key] = (count, now, stamp, query)
+    return count
+
+
 def is_project_branch_saturated(
     config: dict,
     project_name: str,
@@ -91,7 +180,7 @@ def is_project_branch_saturated(
     if limit == 0:
         return False
 
-    count = count_pending_branches(
+    count = cached_count_pending_branches(
         instance_dir, project_name, project_path, github_urls, author,
     )
     if count >= limit:
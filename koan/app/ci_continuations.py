@@ -0,0 +1,198 @@
+"""Parked skill runs waiting for CI — continuations resumed by the CI queue.
+
+A skill that needs a CI result must not sleep inside the mission process:
+the whole agent loop would idle for the length of a GitHub Actions run.
+Instead it *parks*: it records the mission to run once CI on the PR
+completes, enqueues the PR in the ## CI section of missions.md, and
+exits.  ``ci_queue_runner.drain_one()`` keeps
+polling the PR between missions; when CI reaches a terminal status it
+calls :func:`resume`, which injects the parked mission.  The resumed skill
+calls :func:`take_resumed` to get the CI outcome back.  Anything else
+the resumed run needs (e.g. the fix-attempt count) lives in its ## CI
+entry.
+
+File location: ``instance/.ci-continuations.json``
+
+Entries::
+
+    {
+        "pr_url": "https://github.com/owner/repo/pull/123",
+        "mission": "[project:koan] /ci_check https://github.com/owner/repo/pull/123",
+        "resume_on": ["failure"],
+        "parked_at": "2026-03-26T10:30:00+00:00",
+        "ci_status": "",          # set on resume
+        "run_id": null,           # set on resume
+        "resumed_at": ""          # set on resume
+    }
+
+Process-safe via fcntl file locking, following ``ci_queue.py``.
+"""
+
+import fcntl
+import json
+from contextlib import contextmanager
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Iterable, List, Optional
+
+# Terminal CI statuses reported by ci_queue_runner.check_ci_status().
+TERMINAL_STATUSES = ("success", "failure", "none")
+
+# Continuations older than this (parked or unclaimed) are dropped.
+_MAX_AGE_HOURS = 24
+
+
+def _store_path(instance_dir) -> Path:
+    return Path(instance_dir) / ".ci-continuations.json"
+
+
+def _lock_path(instance_dir) -> Path:
+    return Path(instance_dir) / ".ci-continuations.lock"
+
+
+def _load(instance_dir) -> List[dict]:
+    path = _store_path(instance_dir)
+    if not path.exists():
+        return []
+    try:
+        data = json.loads(path.read_text())
+        return data if isinstance(data, list) else []
+    except (json.JSONDecodeError, OSError, TypeError):
+        return []
+
+
+def _save(instance_dir, entries: List[dict]):
+    from app.utils import atomic_write
+
+    atomic_write(_store_path(instance_dir), json.dumps(entries, indent=2) + "\n")
+
+
+def _is_expired(entry: dict) -> bool:
+    stamp = entry.get("resumed_at") or entry.get("parked_at")
+    if not stamp:
+        return True
+    try:
+        ts = datetime.fromisoformat(stamp)
+    except (ValueError, TypeError):
+        return True
+    return (datetime.now(timezone.utc) - ts).total_seconds() > _MAX_AGE_HOURS * 3600
+
+
+@contextmanager
+def _locked(instance_dir):
+    """Hold the store lock; yields the live (non-expired) entries list."""
+    with open(_lock_path(instance_dir), "a") as lf:
+        fcntl.flock(lf, fcntl.LOCK_EX)
+        try:
+            yield [e for e in _load(instance_dir) if not _is_expired(e)]
+        finally:
+            fcntl.flock(lf, fcntl.LOCK_UN)
+
+
+def park(
+    instance_dir,
+    pr_url: str,
+    mission: str,
+    *,
+    resume_on: Iterable[str] = TERMINAL_STATUSES,
+) -> None:
+    """Record *mission* to be injected when CI on *pr_url* completes.
+
+    Parking the same mission for the same PR again replaces the earlier
+    record (e.g. after another fix push).  The caller is responsible for
+    enqueueing the PR in ## CI — see ``claude_step.park_until_ci()``.
+
+    Args:
+        instance_dir: Path to the instance directory.
+        pr_url: PR whose CI outcome the mission waits for.
+        mission: Mission line (without the leading ``- ``) to inject.
+        resume_on: Terminal statuses that resume the mission; on any other
+            terminal status the continuation is dropped.
+    """
+    record = {
+        "pr_url": pr_url,
+        "mission": mission,
+        "resume_on": [s for s in resume_on if s in TERMINAL_STATUSES],
+        "parked_at": datetime.now(timezone.utc).isoformat(),
+        "ci_status": "",
+        "run_id": None,
+        "resumed_at": "",
+    }
+    with _locked(instance_dir) as entries:
+        entries = [
+            e for e in entries
+            if not (e.get("pr_url") == pr_url and e.get("mission") == mission)
+        ]
+        entries.append(record)
+        _save(instance_dir, entries)
+
+
+def has_parked(instance_dir, pr_url: str) -> bool:
+    """True if a continuation is still waiting on CI for *pr_url*."""
+    return any(
+        e.get("pr_url") == pr_url and not e.get("resumed_at")
+        for e in _load(instance_dir) if not _is_expired(e)
+    )
+
+
+def resume(instance_dir, pr_url: str, ci_status: str,
+           run_id: Optional[int] = None) -> List[str]:
+    """Resolve the continuations parked on *pr_url* with a CI outcome.
+
+    Continuations interested in *ci_status* are marked resumed (their
+    outcome stays available to :func:`take_resumed`); the others are
+    dropped.  Returns the missions to inject, without duplicates.
+    """
+    if not _store_path(instance_dir).exists():
+        return []
+    missions: List[str] = []
+    now = datetime.now(timezone.utc).isoformat()
+    with _locked(instance_dir) as entries:
+        kept = []
+        changed = False
+        for entry in entries:
+            if entry.get("pr_url") != pr_url or entry.get("resumed_at"):
+                kept.append(entry)
+                continue
+            changed = True
+            if ci_status not in entry.get("resume_on", ()):
+                continue
+            entry.update(ci_status=ci_status, run_id=run_id, resumed_at=now)
+            kept.append(entry)
+            if entry["mission"] not in missions:
+                missions.append(entry["mission"])
+        if changed:
+            _save(instance_dir, kept)
+    return missions
+
+
+def take_resumed(instance_dir, pr_url: str) -> Optional[dict]:
+    """Claim the resumed continuation for *pr_url*, if any.
+
+    Returns ``{"ci_status", "run_id"}`` and removes the record,
+    or None when the current run was not resumed from a continuation.
+    """
+    if not _store_path(instance_dir).exists():
+        return None
+    with _locked(instance_dir) as entries:
+        for i, entry in enumerate(entries):
+            if entry.get("pr_url") == pr_url and entry.get("resumed_at"):
+                del entries[i]
+                _save(instance_dir, entries)
+                return {
+                    "ci_status": entry.get("ci_status", ""),
+                    "run_id": entry.get("run_id"),
+                }
+    return None
+
+
+def discard(instance_dir, pr_url: str) -> int:
+    """Drop every continuation for *pr_url*. Returns how many were removed."""
+    if not _store_path(instance_dir).exists():
+        return 0
+    with _locked(instance_dir) as entries:
+        kept = [e for e in entries if e.get("pr_url") != pr_url]
+        removed = len(entries) - len(kept)
+        if removed:
+            _save(instance_dir, kept)
+    return removed
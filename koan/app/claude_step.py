@@ -415,6 +415,9 @@ def wait_for_ci(
 ) -> Tuple[str, Optional[int], str]:
     """Poll GitHub Actions CI for a branch until completion or timeout.
 
+    This blocks the mission process (and so the agent loop) for the whole
+    CI run; skills running under Kōan should prefer :func:`park_until_ci`.
+
     Args:
         branch: Branch name to check CI for.
         full_repo: "owner/repo" string.
@@ -470,6 +473,75 @@ def wait_for_ci(
     return ("timeout", None, "")
 
 
+def park_until_ci(
+    pr_url: str,
+    branch: str,
+    full_repo: str,
+    pr_number: str,
+    project_path: str,
+    resume_mission: str,
+    *,
+    resume_on: Tuple[str, ...] = ("success", "failure", "none"),
+    project_name: str = "",
+    attempt: int = 0,
+) -> bool:
+    """Park the current skill run until CI on *branch* completes.
+
+    Non-blocking alternative to :func:`wait_for_ci`: enqueues the PR in
+    the ## CI section (polled between missions by
+    ``ci_queue_runner.drain_one()``) and records *resume_mission* as a
+    continuation, injected once CI reaches one of *resume_on*.  The caller
+    should return right after; the resumed run gets the CI outcome back
+    from ``ci_continuations.take_resumed()``.
+
+    *project_name* tags the ## CI entry (defaults to the directory name
+    of *project_path*).  *attempt* is the entry's fix-attempt count: 0 for
+    a fresh CI run, the current count when a fix run parks again — so
+    ``ci_fix_max_attempts`` still bounds the failure → fix cycle.
+
+    Returns:
+        True if parked.  False when not running under Kōan (KOAN_ROOT
+        unset) or the queue could not be written.
+    """
+    import os
+
+    koan_root = os.environ.get("KOAN_ROOT", "")
+    if not koan_root:
+        print("[claude_step] KOAN_ROOT not set, cannot park until CI", file=sys.stderr)
+        return False
+
+    instance_dir = Path(koan_root) / "instance"
+    from app import ci_continuations
+    from app.missions import add_ci_item
+    from app.utils import load_config, modify_missions_file
+
+    max_attempts = load_config().get("ci_fix_max_attempts", 5)
+    project_name = project_name or (Path(project_path).name if project_path else "")
+    try:
+        modify_missions_file(
+            instance_dir / "missions.md",
+            lambda c: add_ci_item(
+                c, project_name, pr_url, pr_number, branch, full_repo, max_attempts,
+                attempt=attempt,
+            ),
+        )
+    except Exception as e:
+        print(f"[claude_step] Failed to enqueue CI check: {e}", file=sys.stderr)
+        return False
+
+    # Without the continuation drain_one() still reports the CI outcome;
+    # only the resume is lost.
+    try:
+        ci_continuations.park(
+            instance_dir, pr_url, resume_mission,
+            resume_on=resume_on,
+        )
+    except OSError as e:
+        print(f"[claude_step] Failed to park continuation: {e}", file=sys.stderr)
+        return False
+    return True
+
+
 def _fetch_failed_logs(run_id: int, full_repo: str, max_chars: int = 8000) -> str:
     """Fetch logs for failed jobs in a GitHub Actions run.
 
@@ -1,9 +1,14 @@
 """CLI output journal streamer — tail thread for real-time visibility.
 
-Provides a lightweight tail thread that polls a subprocess stdout temp file
-and appends new content to the project's daily journal file. This gives
-users real-time visibility via ``tail -f`` on the journal without changing
-the subprocess I/O path at all.
+Provides a lightweight tail thread that follows a subprocess stdout temp
+file and appends new content to the project's daily journal file. This
+gives users real-time visibility via ``tail -f`` on the journal without
+changing the subprocess I/O path at all.
+
+Reads are woken by inotify on Linux (interval polling elsewhere) and
+journal writes are coalesced through one held append handle, so a
+chatty mission costs a few flushes per second instead of an
+open/lock/close cycle per chunk.
 
 Usage::
 
@@ -12,7 +17,9 @@ Usage::
     stop_journal_stream(stream, exit_code, stderr_file)
 """
 
+import functools
 import os
+import select
 import sys
 import threading
 import time
@@ -20,8 +27,10 @@ from pathlib import Path
 from typing import Optional, Tuple
 
 
-_POLL_INTERVAL = 1.0  # seconds between tail polls
-_CHUNK_SIZE = 8192    # bytes per read
+_POLL_INTERVAL = 1.0     # max seconds between reads (inotify wakes earlier)
+_CHUNK_SIZE = 8192       # bytes per read
+_COALESCE_CHARS = 4096   # flush the journal buffer at this size...
+_COALESCE_DELAY = 0.5    # ...or once its oldest text is this old (seconds)
 
 
 def _decode_safe(data: bytes) -> tuple:
@@ -59,61 +68,195 @@ def _journal_write(instance_dir: Path, project_name: str, content: str) -> None:
         print(f"[cli-journal] write error: {e}", file=sys.stderr)
 
 
+# inotify(7) event mask: content changes, truncation, deletion/rename.
+_IN_MODIFY = 0x00000002
+_IN_ATTRIB = 0x00000004
+_IN_CLOSE_WRITE = 0x00000008
+_IN_DELETE_SELF = 0x00000400
+_IN_MOVE_SELF = 0x00000800
+_WATCH_MASK = _IN_MODIFY | _IN_ATTRIB | _IN_CLOSE_WRITE | _IN_DELETE_SELF | _IN_MOVE_SELF
+
+
+@functools.lru_cache(maxsize=1)
+def _load_libc():
+    """Return libc with inotify support, or None (non-Linux, no ctypes)."""
+    if not sys.platform.startswith("linux"):
+        return None
+    try:
+        import ctypes
+        import ctypes.util
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or None, use_errno=True)
+        libc.inotify_init1
+        libc.inotify_add_watch
+        return libc
+    except (ImportError, OSError, AttributeError):
+        return None
+
+
+class _FileWatcher:
+    """Wait for writes to a file via inotify instead of sleeping blindly.
+
+    Only available on Linux; :meth:`open` returns None elsewhere (or when
+    the file does not exist yet) and callers fall back to interval polling.
+    """
+
+    def __init__(self, fd: int, wake_fd: Optional[int]):
+        self._fd = fd
+        self._wake_fd = wake_fd
+
+    @classmethod
+    def open(cls, path: str, wake_fd: Optional[int] = None) -> Optional["_FileWatcher"]:
+        libc = _load_libc()
+        if libc is None:
+            return None
+        # IN_NONBLOCK / IN_CLOEXEC share their values with O_NONBLOCK / O_CLOEXEC.
+        fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        if fd < 0:
+            return None
+        if libc.inotify_add_watch(fd, os.fsencode(path), _WATCH_MASK) < 0:
+            os.close(fd)
+            return None
+        return cls(fd, wake_fd)
+
+    def wait(self, timeout: float) -> None:
+        """Block until the file changes, the stop pipe fires, or *timeout*."""
+        fds = [self._fd] if self._wake_fd is None else [self._fd, self._wake_fd]
+        try:
+            ready, _, _ = select.select(fds, [], [], timeout)
+        except (OSError, ValueError):
+            return
+        if self._fd in ready:
+            try:
+                while os.read(self._fd, 4096):
+                    pass
+            except BlockingIOError:
+                pass
+            except OSError:
+                pass
+
+    def close(self) -> None:
+        try:
+            os.close(self._fd)
+        except OSError:
+            pass
+
+
+class _StopEvent(threading.Event):
+    """Stop flag that also wakes a tail loop blocked on inotify."""
+
+    def __init__(self):
+        super().__init__()
+        self._pipe_lock = threading.Lock()
+        self._wake_r, self._wake_w = os.pipe()
+
+    def fileno(self) -> Optional[int]:
+        return self._wake_r
+
+    def set(self) -> None:
+        super().set()
+        with self._pipe_lock:
+            if self._wake_w is not None:
+                try:
+                    os.write(self._wake_w, b"\0")
+                except OSError:
+                    pass
+
+    def close(self) -> None:
+        """Release the wake pipe (called by the tail thread on exit)."""
+        with self._pipe_lock:
+            for fd in (self._wake_r, self._wake_w):
+                if fd is not None:
+                    try:
+                        os.close(fd)
+                    except OSError:
+                        pass
+            self._wake_r = self._wake_w = None
+
+
+def _read_new(stdout_file: str, pos: int, leftover: bytes, appender) -> Tuple[int, bytes]:
+    """Feed bytes appended to *stdout_file* since *pos* into *appender*.
+
+    Returns the new ``(pos, leftover)``; a truncated file is left alone.
+    When the journal can't be written, reading pauses: the text already
+    read stays buffered in *appender* and is retried on its next flush.
+    """
+    try:
+        if os.path.getsize(stdout_file) <= pos:
+            return pos, leftover
+        with open(stdout_file, "rb") as f:
+            f.seek(pos)
+            while True:
+                raw = f.read(_CHUNK_SIZE)
+                if not raw:
+                    break
+                pos += len(raw)
+                text, leftover = _decode_safe(leftover + raw)
+                if not text:
+                    continue
+                try:
+                    appender.write(text)
+                except OSError as e:
+                    print(f"[cli-journal] write error: {e}", file=sys.stderr)
+                    break
+    except OSError:
+        pass  # file may not exist yet; non-critical, avoid log spam
+    return pos, leftover
+
+
 def _tail_loop(
     stdout_file: str,
     instance_dir: Path,
     project_name: str,
     stop_event: threading.Event,
 ) -> None:
-    """Poll *stdout_file* for new bytes and append them to the journal."""
-    append = _get_append_fn()
-    pos = 0
-    leftover = b""  # incomplete UTF-8 trailing bytes from previous read
-
-    while not stop_event.is_set():
-        try:
-            size = os.path.getsize(stdout_file)
-        except OSError:
-            stop_event.wait(_POLL_INTERVAL)
-            continue
-
-        if size <= pos:
-            stop_event.wait(_POLL_INTERVAL)
-            continue
+    """Stream new bytes of *stdout_file* into the journal until stopped.
 
-        try:
-            with open(stdout_file, "rb") as f:
-                f.seek(pos)
-                raw = f.read(_CHUNK_SIZE)
-                if raw:
-                    pos += len(raw)
-                    chunk = leftover + raw
-                    text, leftover = _decode_safe(chunk)
-                    if text:
-                        try:
-                            append(instance_dir, project_name, text)
-                        except OSError:
-                            pass  # non-critical; avoid log spam in tight loop
-        except OSError:
-            pass  # file may not exist yet
+    Reads are driven by inotify where available (interval polling
+    otherwise), and journal writes are coalesced by a JournalAppender.
+    """
+    from app.journal import JournalAppender
 
-        stop_event.wait(_POLL_INTERVAL)
+    appender = JournalAppender(
+        instance_dir, project_name,
+        max_chars=_COALESCE_CHARS, max_delay=_COALESCE_DELAY,
+    )
+    wake_fd = stop_event.fileno() if isinstance(stop_event, _StopEvent) else None
+    watcher: Optional[_FileWatcher] = None
+    pos = 0
+    leftover = b""  # incomplete UTF-8 trailing bytes from previous read
 
-    # Final flush: pick up anything written since last poll
     try:
-        size = os.path.getsize(stdout_file)
-        if size > pos:
-            with open(stdout_file, "rb") as f:
-                f.seek(pos)
-                raw = f.read()
-                if raw:
-                    chunk = leftover + raw
-                    leftover = b""
-                    append(instance_dir, project_name, chunk.decode("utf-8", errors="replace"))
-        elif leftover:
-            append(instance_dir, project_name, leftover.decode("utf-8", errors="replace"))
+        while not stop_event.is_set():
+            pos, leftover = _read_new(stdout_file, pos, leftover, appender)
+            try:
+                appender.flush_if_due()
+            except OSError:
+                pass  # non-critical; retried on the next flush
+
+            timeout = _POLL_INTERVAL
+            due = appender.seconds_until_due()
+            if due is not None:
+                timeout = min(timeout, due)
+            if watcher is None:
+                watcher = _FileWatcher.open(stdout_file, wake_fd)
+            if watcher is not None:
+                # The poll interval still bounds the wait as a safety net.
+                watcher.wait(timeout)
+            else:
+                stop_event.wait(timeout)
+
+        # Final flush: pick up anything written since last read
+        pos, leftover = _read_new(stdout_file, pos, leftover, appender)
+        if leftover:
+            appender.write(leftover.decode("utf-8", errors="replace"))
+        appender.close()
     except Exception as e:
-        print(f"[cli-journal] final flush error: {e}", file=sys.stderr)
+        print(f"[cli-journal] tail error: {e}", file=sys.stderr)
+    finally:
+        if watcher is not None:
+            watcher.close()
+        if isinstance(stop_event, _StopEvent):
+            stop_event.close()
 
 
 def start_tail_thread(
@@ -124,8 +267,8 @@ def start_tail_thread(
 ) -> Tuple[threading.Thread, threading.Event]:
     """Start a background thread that tails *stdout_file* into the journal.
 
-    Writes a header line to the journal immediately, then polls for new
-    content every ~1 s and appends it.
+    Writes a header line to the journal immediately, then streams new
+    content as it is written, flushing the journal at least every ~0.5 s.
 
     Args:
         stdout_file: Path to the subprocess stdout temp file.
@@ -144,7 +287,7 @@ def start_tail_thread(
     )
     _journal_write(inst, project_name, header)
 
-    stop_event = threading.Event()
+    stop_event = _StopEvent()
     thread = threading.Thread(
         target=_tail_loop,
         args=(stdout_file, inst, project_name, stop_event),
@@ -28,8 +28,12 @@ from app.provider import (  # noqa: F401
     # Registry & resolution
     get_provider_name,
     get_provider,
+    get_provider_by_name,
     get_cli_binary,
+    is_known_provider,
+    provider_scope,
     reset_provider,
+    set_provider_override,
     # Convenience functions
     build_cli_flags,
     build_tool_flags,
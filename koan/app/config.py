@@ -178,6 +178,65 @@ def get_model_config(project_name: str = "") -> dict:
     return result
 
 
+def get_model_routing_config() -> dict:
+    """Get complexity-based model routing configuration from config.yaml.
+
+    When enabled, simple missions (typo fixes, changelog, small docs —
+    see app/model_router.py) run on ``light_model`` with a turn cap, and
+    everything else on ``models.mission``.
+
+    Config key: model_routing
+      - enabled (bool): Master switch (default: False)
+      - light_model (str): Model for simple missions (default: "sonnet")
+      - light_max_turns (int): Turn cap for simple missions, 0 = none
+        (default: 40)
+      - escalate_on_failure (bool): Re-run a failed simple mission once
+        on the mission model (default: True)
+
+    Returns:
+        Dict with keys: enabled, light_model, light_max_turns,
+        escalate_on_failure.
+    """
+    config = _load_config()
+    routing_cfg = config.get("model_routing", {})
+    if not isinstance(routing_cfg, dict):
+        routing_cfg = {}
+    return {
+        "enabled": bool(routing_cfg.get("enabled", False)),
+        "light_model": str(routing_cfg.get("light_model", "sonnet") or ""),
+        "light_max_turns": max(0, _safe_int(routing_cfg.get("light_max_turns", 40), 40)),
+        "escalate_on_failure": bool(routing_cfg.get("escalate_on_failure", True)),
+    }
+
+
+def get_model_warmup_config() -> dict:
+    """Get local model warm-keeping configuration from config.yaml.
+
+    Only used with the ``local`` and ``ollama-launch`` providers (see
+    app/model_warmup.py): the mission model is preloaded shortly before
+    the next iteration, the chat model when a chat message arrives.
+
+    Config key: model_warmup
+      - enabled (bool): Master switch (default: True)
+      - lead_seconds (int): Preload this long before the next iteration
+        (default: 60)
+      - chat_keep_alive (int): Seconds the chat model stays loaded after
+        a chat message (default: 900)
+
+    Returns:
+        Dict with keys: enabled, lead_seconds, chat_keep_alive.
+    """
+    config = _load_config()
+    warmup_cfg = config.get("model_warmup", {})
+    if not isinstance(warmup_cfg, dict):
+        warmup_cfg = {}
+    return {
+        "enabled": bool(warmup_cfg.get("enabled", True)),
+        "lead_seconds": max(0, _safe_int(warmup_cfg.get("lead_seconds", 60), 60)),
+        "chat_keep_alive": max(0, _safe_int(warmup_cfg.get("chat_keep_alive", 900), 900)),
+    }
+
+
 def get_mcp_configs(project_name: str = "") -> List[str]:
     """Get MCP server config file paths from config.yaml with per-project overrides.
 
@@ -272,6 +331,17 @@ def get_startup_reflection() -> bool:
     return bool(config.get("startup_reflection", False))
 
 
+def get_defer_startup_tasks() -> bool:
+    """Check if non-critical startup tasks run in the background.
+
+    When True (default), the daily report and morning ritual run in a
+    background thread so the first mission can start right away. When
+    False, startup waits for them.
+    """
+    config = _load_config()
+    return bool(config.get("defer_startup_tasks", True))
+
+
 def get_auto_pause() -> bool:
     """Check if auto-pause is enabled in config.yaml.
 
@@ -679,6 +749,70 @@ def get_auto_merge_config(config: dict, project_name: str) -> dict:
     }
 
 
+def get_git_sync_workers() -> int:
+    """Get the number of projects git sync processes concurrently.
+
+    Config key: git_sync_workers (default: 4, minimum 1).
+    """
+    config = _load_config()
+    try:
+        return max(1, int(config.get("git_sync_workers", 4)))
+    except (TypeError, ValueError):
+        return 4
+
+
+def get_provider_pool_config() -> dict:
+    """Get the CLI provider pool configuration from config.yaml.
+
+    When enabled, each mission runs on the best eligible provider of the
+    pool (see app/provider_pool.py) and a quota hit fails over to the
+    next one instead of pausing the agent.
+
+    Config key: provider_pool
+      - enabled (bool): Master switch (default: False)
+      - providers (list): Provider names in preference order
+      - costs (dict): Relative cost weight per provider (default: 1.0)
+
+    Returns:
+        Dict with keys: enabled (bool), providers (list of str),
+        costs (dict of str -> float).
+    """
+    config = _load_config()
+    pool_cfg = config.get("provider_pool", {})
+    if not isinstance(pool_cfg, dict):
+        pool_cfg = {}
+    providers = pool_cfg.get("providers", [])
+    if not isinstance(providers, list):
+        providers = []
+    names = []
+    for name in providers:
+        name = str(name).strip().lower()
+        if name and name not in names:
+            names.append(name)
+    costs = {}
+    raw_costs = pool_cfg.get("costs", {})
+    if isinstance(raw_costs, dict):
+        for name, cost in raw_costs.items():
+            try:
+                costs[str(name).strip().lower()] = max(0.01, float(cost))
+            except (TypeError, ValueError):
+                continue
+    return {
+        "enabled": bool(pool_cfg.get("enabled", False)) and bool(names),
+        "providers": names,
+        "costs": costs,
+    }
+
+
+def get_project_cli_provider(project_name: str) -> str:
+    """Get the CLI provider pinned for a project in projects.yaml.
+
+    Returns "" when the project doesn't set ``cli_provider``.
+    """
+    value = _load_project_overrides(project_name).get("cli_provider", "")
+    return str(value or "").strip().lower()
+
+
 def get_branch_cleanup_config() -> dict:
     """Get branch cleanup configuration from config.yaml.
 
@@ -723,18 +857,24 @@ def get_prompt_guard_config() -> dict:
 def get_review_concurrency_config() -> dict:
     """Get review concurrency configuration from config.yaml.
 
-    Controls parallelism for GitHub API calls during PR reviews. The LLM
-    call (Claude CLI) is always sequential — only GitHub data-fetching is
-    parallelised.
+    Controls parallelism during PR reviews: GitHub API fetches, and the
+    map-reduce review of large PRs, whose diff is split into chunks of at
+    most ``chunk_tokens`` that are reviewed by concurrent CLI calls.
 
     Config key: review_concurrency
-      - enabled (bool): Enable parallel GitHub API fetches (default: True)
+      - enabled (bool): Enable parallel GitHub API fetches and chunk
+        reviews (default: True)
       - github_workers (int): Max concurrent GitHub API calls (default: 4)
+      - review_workers (int): Max concurrent chunk reviews (default: 3)
+      - chunk_tokens (int): Diff size, in estimated tokens, above which a
+        PR is reviewed in chunks of that size (default: 25000)
 
     Returns:
         Dict with keys:
           - enabled (bool): Whether parallel fetching is active.
           - github_workers (int): ThreadPoolExecutor max_workers for gh calls.
+          - review_workers (int): ThreadPoolExecutor max_workers for chunks.
+          - chunk_tokens (int): Token budget per review chunk.
     """
     config = _load_config()
     review_cfg = config.get("review_concurrency", {})
@@ -743,9 +883,44 @@ def get_review_concurrency_config() -> dict:
     return {
         "enabled": bool(review_cfg.get("enabled", True)),
         "github_workers": _safe_int(review_cfg.get("github_workers", 4), 4),
+        "review_workers": max(1, _safe_int(review_cfg.get("review_workers", 3), 3)),
+        "chunk_tokens": max(1000, _safe_int(review_cfg.get("chunk_tokens", 25000), 25000)),
     }
 
 
+_DEFAULT_CONTEXT_BUDGETS = {
+    "chat": 3000,
+    "dashboard": 3000,
+    "mission": 16000,
+}
+
+
+def get_context_budget(role: str) -> int:
+    """Get the prompt token budget for a context packer role.
+
+    Sections assembled by app.context_packer (summary, journal,
+    conversation history, drift reports…) are shrunk by priority until
+    the prompt fits this budget.
+
+    Config key: context_budget
+      - chat (int): Telegram chat prompt budget (default: 3000)
+      - dashboard (int): Dashboard chat prompt budget (default: 3000)
+      - mission (int): Agent mission prompt budget (default: 16000)
+
+    Args:
+        role: One of "chat", "dashboard", "mission".
+
+    Returns:
+        Budget in estimated tokens (minimum 500).
+    """
+    config = _load_config()
+    budget_cfg = config.get("context_budget", {})
+    if not isinstance(budget_cfg, dict):
+        budget_cfg = {}
+    default = _DEFAULT_CONTEXT_BUDGETS.get(role, 3000)
+    return max(500, _safe_int(budget_cfg.get(role, default), default))
+
+
 def get_review_ignore_config() -> dict:
     """Get review ignore patterns from config.yaml.
 
@@ -46,6 +46,7 @@ CONFIG_SCHEMA: Dict[str, Any] = {
     "start_on_pause": "bool",
     "start_passive": "bool",
     "startup_reflection": "bool",
+    "defer_startup_tasks": "bool",
     "auto_pause": "bool",
     "attention_github_notifications": "bool",
     "skip_permissions": "bool",
@@ -60,6 +61,7 @@ CONFIG_SCHEMA: Dict[str, Any] = {
     "jira": _NESTED,
     "schedule": _NESTED,
     "logs": _NESTED,
+    "audit": _NESTED,
     "local_llm": _NESTED,
     "ollama_launch": _NESTED,
     "usage": _NESTED,
@@ -71,10 +73,15 @@ CONFIG_SCHEMA: Dict[str, Any] = {
     "prompt_caching": _NESTED,
     "prompt_guard": _NESTED,
     "plan_review": _NESTED,
+    "git_sync_workers": "int",
     "branch_cleanup": _NESTED,
+    "provider_pool": _NESTED,
+    "model_routing": _NESTED,
+    "model_warmup": _NESTED,
     "review_concurrency": _NESTED,
     "review_ignore": _NESTED,
     "automation_rules": _NESTED,
+    "context_budget": _NESTED,
 }
 
 # Sub-schemas for nested sections
@@ -123,6 +130,13 @@ SECTION_SCHEMAS: Dict[str, Dict[str, str]] = {
         "deep_hours": "str",
         "work_hours": "str",
     },
+    "audit": {
+        "enabled": "bool",
+        "max_size_mb": "int",
+        "redact_patterns": "list",
+        "buffered": "bool",
+        "flush_interval_ms": "int",
+    },
     "logs": {
         "max_backups": "int",
         "max_size_mb": "int",
@@ -132,6 +146,8 @@ SECTION_SCHEMAS: Dict[str, Dict[str, str]] = {
         "base_url": "str",
         "model": "str",
         "api_key": "str",
+        "stream": "bool",
+        "context_tokens": "int",
     },
     "ollama_launch": {
         "model": "str",
@@ -189,9 +205,27 @@ SECTION_SCHEMAS: Dict[str, Dict[str, str]] = {
         "enabled": "bool",
         "delete_remote_branches": "bool",
     },
+    "model_routing": {
+        "enabled": "bool",
+        "light_model": "str",
+        "light_max_turns": "int",
+        "escalate_on_failure": "bool",
+    },
+    "model_warmup": {
+        "enabled": "bool",
+        "lead_seconds": "int",
+        "chat_keep_alive": "int",
+    },
+    "provider_pool": {
+        "enabled": "bool",
+        "providers": "list",
+        "costs": "dict",
+    },
     "review_concurrency": {
         "enabled": "bool",
         "github_workers": "int",
+        "review_workers": "int",
+        "chunk_tokens": "int",
     },
     "review_ignore": {
         "glob": "list",
@@ -200,6 +234,11 @@ SECTION_SCHEMAS: Dict[str, Dict[str, str]] = {
     "automation_rules": {
         "max_fires_per_minute": "int",
     },
+    "context_budget": {
+        "chat": "int",
+        "dashboard": "int",
+        "mission": "int",
+    },
 }
 
 # Type name → Python type(s) for isinstance checks
@@ -0,0 +1,208 @@
+"""
+Kōan -- Token-budgeted context packer.
+
+Chat and mission prompts are assembled from many sections (soul, summary,
+preferences, conversation history, journal excerpts, drift reports…)
+whose size grows with the instance's memory files.  Instead of per-site
+character caps, callers describe each section with a priority and let
+the packer fit everything into a per-call token budget:
+
+- Sections are measured with a cheap token estimate (no tokenizer).
+- Each section may declare its own ``max_tokens`` ceiling.
+- When the total exceeds the budget, the lowest-priority sections are
+  shrunk first (down to ``min_tokens``), then dropped.
+- Priority 0 sections are pinned and never cut.
+- Every cut is reported, so prompt size stays predictable and visible.
+
+Usage:
+    from app.context_packer import Section, pack_sections
+
+    packed = pack_sections([
+        Section("history", history, priority=1, keep="tail"),
+        Section("journal", journal, priority=3, header="Journal:\\n", max_tokens=500),
+    ], budget=3000, label="chat")
+    journal_block = packed.get("journal")
+"""
+
+import sys
+from dataclasses import dataclass, field
+from typing import Dict, List
+
+# Conservative average for mixed English/French prose and code.
+CHARS_PER_TOKEN = 4
+
+TRUNCATION_MARKER = "...\n"
+
+
+def estimate_tokens(text: str) -> int:
+    """Estimate the token count of *text* (~4 chars per token, rounded up)."""
+    if not text:
+        return 0
+    return (len(text) + CHARS_PER_TOKEN - 1) // CHARS_PER_TOKEN
+
+
+def truncate_to_tokens(text: str, max_tokens: int, keep: str = "tail") -> str:
+    """Cut *text* to roughly *max_tokens*, preferring line boundaries.
+
+    Args:
+        text: Text to shorten.
+        max_tokens: Target size in estimated tokens.
+        keep: ``"tail"`` keeps the most recent end (journals, history),
+            ``"head"`` keeps the beginning (summaries, specs).
+
+    Returns:
+        The shortened text with a ``...`` marker on the cut side (the
+        marker itself, one token, is not counted), or an empty string
+        when *max_tokens* is not positive.
+    """
+    if estimate_tokens(text) <= max_tokens:
+        return text
+    max_chars = max_tokens * CHARS_PER_TOKEN
+    if max_chars <= 0:
+        return ""
+
+    if keep == "head":
+        cut = text[:max_chars]
+        newline = cut.rfind("\n")
+        if newline > max_chars // 2:
+            cut = cut[:newline]
+        return cut.rstrip() + "\n" + TRUNCATION_MARKER.rstrip()
+
+    cut = text[-max_chars:]
+    newline = cut.find("\n")
+    if 0 <= newline < max_chars // 2:
+        cut = cut[newline + 1:]
+    return TRUNCATION_MARKER + cut.lstrip()
+
+
+@dataclass
+class Section:
+    """One prompt section competing for the token budget.
+
+    Attributes:
+        name: Identifier used in reports and for lookup.
+        text: Section body (empty sections are ignored).
+        priority: 0 = pinned (never cut); higher numbers are cut first.
+        header: Label prepended when the section is kept; not truncated.
+        max_tokens: Per-section ceiling applied before budgeting (0 = none).
+        min_tokens: Below this size the section is dropped rather than
+            shrunk further (0 = shrink all the way).
+        keep: Which end survives truncation: ``"tail"`` or ``"head"``.
+    """
+
+    name: str
+    text: str
+    priority: int = 1
+    header: str = ""
+    max_tokens: int = 0
+    min_tokens: int = 0
+    keep: str = "tail"
+
+
+@dataclass
+class PackResult:
+    """Outcome of packing: rendered sections plus what got cut.
+
+    ``capped`` lists per-section ceilings that applied (routine);
+    ``cuts`` lists sections shrunk or dropped to meet the budget.
+    """
+
+    sections: Dict[str, str]
+    used_tokens: int
+    budget: int
+    cuts: List[str] = field(default_factory=list)
+    capped: List[str] = field(default_factory=list)
+
+    def get(self, name: str) -> str:
+        """Rendered text (header + body) for *name*, or empty string."""
+        return self.sections.get(name, "")
+
+    @property
+    def over_budget(self) -> bool:
+        return self.used_tokens > self.budget
+
+
+def _render(section: Section, body: str) -> str:
+    if not body:
+        return ""
+    return f"{section.header}{body}"
+
+
+def pack_sections(
+    sections: List[Section],
+    budget: int,
+    label: str = "",
+) -> PackResult:
+    """Fit *sections* into *budget* tokens, cutting low-priority ones first.
+
+    Args:
+        sections: Sections to pack; order is irrelevant.
+        budget: Total token budget for all sections (including headers).
+        label: Caller name for the stderr report (e.g. ``"chat"``).
+
+    Returns:
+        PackResult with each section rendered under its name.  Pinned
+        sections are always kept, so ``used_tokens`` may exceed the budget
+        when they alone do not fit (``over_budget`` is then True).
+    """
+    bodies: Dict[str, str] = {}
+    cuts: List[str] = []
+    capped_report: List[str] = []
+
+    for s in sections:
+        body = (s.text or "").strip()
+        if body and s.max_tokens and s.priority > 0:
+            capped = truncate_to_tokens(body, s.max_tokens, keep=s.keep)
+            if capped != body:
+                capped_report.append(
+                    f"{s.name} capped {estimate_tokens(body)}→{estimate_tokens(capped)}"
+                )
+            body = capped
+        bodies[s.name] = body
+
+    def total() -> int:
+        return sum(estimate_tokens(_render(s, bodies[s.name])) for s in sections)
+
+    # Lowest priority first; among equals, the later section goes first.
+    order = sorted(
+        (i for i, s in enumerate(sections) if s.priority > 0),
+        key=lambda i: (-sections[i].priority, -i),
+    )
+    used = total()
+    for i in order:
+        if used <= budget:
+            break
+        s = sections[i]
+        body = bodies[s.name]
+        if not body:
+            continue
+        current = estimate_tokens(_render(s, body))
+        overflow = used - budget
+        # One extra token for the truncation marker.
+        target = current - overflow - estimate_tokens(s.header) - 1
+        if target >= max(s.min_tokens, 1):
+            shrunk = truncate_to_tokens(body, target, keep=s.keep)
+        else:
+            shrunk = ""
+        if shrunk:
+            cuts.append(f"{s.name} {estimate_tokens(body)}→{estimate_tokens(shrunk)}")
+        else:
+            cuts.append(f"{s.name} dropped ({estimate_tokens(body)})")
+        bodies[s.name] = shrunk
+        used = total()
+
+    result = PackResult(
+        sections={s.name: _render(s, bodies[s.name]) for s in sections},
+        used_tokens=used,
+        budget=budget,
+        cuts=cuts,
+        capped=capped_report,
+    )
+    if cuts or result.over_budget:
+        prefix = f"[context_packer] {label}: " if label else "[context_packer] "
+        summary = ", ".join(cuts) if cuts else "no cuts possible"
+        print(
+            f"{prefix}{summary} — {result.used_tokens}/{budget} tokens",
+            file=sys.stderr,
+        )
+    return result
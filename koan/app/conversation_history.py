@@ -12,6 +12,8 @@ from datetime import datetime
 from pathlib import Path
 from typing import Dict, List
 
+from app.tail_reader import tail_jsonl
+
 
 def _atomic_write(path: Path, content: str):
     """Crash-safe file write using temp file + rename.
@@ -103,15 +105,7 @@ def load_recent_history(history_file: Path, max_messages: int = 10) -> List[Dict
         return []
 
     try:
-        with open(history_file, "r", encoding="utf-8") as f:
-            fcntl.flock(f, fcntl.LOCK_SH)
-            try:
-                lines = f.readlines()
-            finally:
-                fcntl.flock(f, fcntl.LOCK_UN)
-
-        messages = _parse_jsonl_lines(lines)
-        return messages[-max_messages:] if len(messages) > max_messages else messages
+        return tail_jsonl(history_file, max_messages)
     except OSError as e:
         print(f"[conversation_history] Error loading history: {e}")
         return []
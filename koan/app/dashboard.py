@@ -21,6 +21,7 @@ import re
 import subprocess
 import sys
 import time
+from contextlib import closing
 from datetime import date, timedelta
 from pathlib import Path
 
@@ -28,6 +29,7 @@ from flask import Flask, Response, jsonify, redirect, render_template, request,
 from app.cli_provider import build_full_command
 from app.config import (
     get_allowed_tools,
+    get_context_budget,
     get_tools_description,
     get_model_config,
 )
@@ -67,6 +69,7 @@ from app.automation_rules import (
     toggle_rule,
     update_rule_params,
 )
+from app.tail_reader import iter_lines_reverse
 
 # ---------------------------------------------------------------------------
 # Paths
@@ -379,11 +382,15 @@ def get_journal_entries(limit: int = 7) -> list:
 def _build_dashboard_prompt(text: str, *, lite: bool = False) -> str:
     """Build the prompt for a dashboard chat response.
 
+    Summary, journal and history are packed into the
+    ``context_budget.dashboard`` token budget by priority.
+
     Args:
         text: The user's message.
         lite: If True, strip heavy context (journal, summary) to reduce prompt size.
     """
-    from app.journal import read_all_journals
+    from app.context_packer import Section, estimate_tokens, pack_sections
+    from app.journal import read_journals_tail
 
     history = load_recent_history(CONVERSATION_HISTORY_FILE, max_messages=10)
     history_context = format_conversation_history(history)
@@ -392,29 +399,38 @@ def _build_dashboard_prompt(text: str, *, lite: bool = False) -> str:
 
     summary = ""
     if not lite:
-        summary = read_file(SUMMARY_FILE)[:1500]
+        summary = read_file(SUMMARY_FILE)
 
     journal_context = ""
     if not lite:
-        journal_content = read_all_journals(INSTANCE_DIR, date.today())
-        if journal_content:
-            journal_context = journal_content[-2000:] if len(journal_content) > 2000 else journal_content
+        # Twice the section cap, so the packer can cut on a line boundary.
+        journal_context, _ = read_journals_tail(INSTANCE_DIR, date.today(), 4000)
 
     from app.prompts import load_prompt
 
     tools_desc = get_tools_description()
-    summary_block = f"Summary of past sessions:\n{summary}" if summary else ""
-    journal_block = f"Today's journal (excerpt):\n{journal_context}" if journal_context else ""
-
-    return load_prompt(
-        "dashboard-chat",
-        SOUL=soul,
-        TOOLS_DESC=tools_desc or "",
-        SUMMARY=summary_block,
-        JOURNAL=journal_block,
-        HISTORY=history_context or "",
-        TEXT=text,
-    )
+
+    def render(blocks: dict) -> str:
+        return load_prompt(
+            "dashboard-chat",
+            SOUL=soul,
+            TOOLS_DESC=tools_desc or "",
+            SUMMARY=blocks.get("summary", ""),
+            JOURNAL=blocks.get("journal", ""),
+            HISTORY=blocks.get("history", ""),
+            TEXT=text,
+        )
+
+    budget = get_context_budget("dashboard")
+    packed = pack_sections([
+        Section("history", history_context or "", priority=1),
+        Section("summary", summary, priority=2,
+                header="Summary of past sessions:\n", max_tokens=375, keep="head"),
+        Section("journal", journal_context, priority=3,
+                header="Today's journal (excerpt):\n", max_tokens=500),
+    ], budget=max(0, budget - estimate_tokens(render({}))), label="dashboard")
+
+    return render(packed.sections)
 
 
 # ---------------------------------------------------------------------------
@@ -1437,11 +1453,12 @@ def _get_rule_history(limit: int = 50) -> list:
         auto_file = day_dir / "automation.md"
         if not auto_file.exists():
             continue
-        for line in reversed(auto_file.read_text().splitlines()):
-            if "[automation_rule]" in line:
-                entries.append({"date": day_dir.name, "line": line.strip()})
-                if len(entries) >= limit:
-                    return entries
+        with closing(iter_lines_reverse(auto_file)) as lines:
+            for line in lines:
+                if "[automation_rule]" in line:
+                    entries.append({"date": day_dir.name, "line": line.strip()})
+                    if len(entries) >= limit:
+                        return entries
     return entries
 
 
@@ -0,0 +1,307 @@
+"""
+Kōan -- In-process file index for the local LLM agent's search tools.
+
+``local_llm_runner``'s ``glob`` and ``grep`` tools used to re-walk the
+whole tree on every call (``glob.glob(recursive=True)``, ``grep -rn``),
+including ``.git``, ``node_modules`` and ``.worktrees``.  Instead, the
+file list of the working directory is built once per run and shared by
+every search:
+
+- Inside a git checkout the list comes from
+  ``git ls-files --cached --others --exclude-standard``, i.e. exactly the
+  files .gitignore does not exclude; elsewhere from a walk that skips
+  ``SKIP_DIRS``.
+- ``write_file`` adds its path to the index; ``shell`` and ``skill``
+  calls can touch anything, so they mark the index stale and the next
+  search rebuilds it.
+- ``grep`` uses ripgrep when it is installed (it applies the same ignore
+  rules itself) and otherwise scans the indexed files in-process.  Both
+  stop reading as soon as the output cap is reached.
+
+Usage:
+    from app.file_index import get_index
+
+    index = get_index(cwd)
+    paths = index.glob("**/*.py", base)
+    output = index.grep("TODO", base, file_glob="*.py")
+"""
+
+import os
+import re
+import shutil
+import subprocess
+import threading
+from typing import Dict, List, Optional
+
+# Directories never indexed, even outside git or when not gitignored.
+SKIP_DIRS = frozenset({
+    ".git", ".hg", ".svn", ".worktrees", "node_modules", "__pycache__",
+    ".venv", "venv", ".tox", ".mypy_cache", ".pytest_cache",
+})
+
+# Files larger than this are skipped by the in-process grep.
+GREP_MAX_FILE_BYTES = 2_000_000
+
+GREP_TIMEOUT = 30
+
+TRUNCATED = "\n... (truncated)"
+
+
+def _segment_regex(segment: str) -> str:
+    """Regex for one path segment of a glob pattern (no ``/`` crossing)."""
+    out = []
+    i = 0
+    while i < len(segment):
+        c = segment[i]
+        if c == "*":
+            out.append("[^/]*")
+        elif c == "?":
+            out.append("[^/]")
+        elif c == "[":
+            end = segment.find("]", i + 2 if segment[i + 1:i + 2] in ("!", "]") else i + 1)
+            if end == -1:
+                out.append(re.escape(c))
+            else:
+                body = segment[i + 1:end]
+                if body.startswith("!"):
+                    body = "^" + body[1:]
+                out.append("[" + body.replace("\\", "\\\\") + "]")
+                i = end
+        else:
+            out.append(re.escape(c))
+        i += 1
+    return "".join(out)
+
+
+def glob_to_regex(pattern: str) -> "re.Pattern[str]":
+    """Compile a glob pattern over ``/``-separated relative paths.
+
+    ``*``, ``?`` and ``[...]`` stay within one segment; a ``**`` segment
+    matches any number of directories (including none), as in
+    ``glob.glob(recursive=True)``.
+    """
+    segments = [s for s in pattern.strip("/").split("/") if s not in ("", ".")]
+    parts = []
+    for i, segment in enumerate(segments):
+        last = i == len(segments) - 1
+        if segment == "**":
+            parts.append(".*" if last else "(?:[^/]+/)*")
+        else:
+            parts.append(_segment_regex(segment) + ("" if last else "/"))
+    return re.compile("".join(parts) + r"\Z")
+
+
+def _compile_grep_pattern(pattern: str) -> "re.Pattern[str]":
+    """Compile *pattern* as a regex, or as a literal when it isn't one."""
+    try:
+        return re.compile(pattern)
+    except re.error:
+        return re.compile(re.escape(pattern))
+
+
+class FileIndex:
+    """Relative paths of the searchable files under *root*."""
+
+    def __init__(self, root: str):
+        self.root = os.path.realpath(root)
+        self._files: Optional[set] = None
+        self._sorted: Optional[List[str]] = None
+        self._lock = threading.Lock()
+
+    # -- building ----------------------------------------------------------
+
+    def _list_git(self) -> Optional[List[str]]:
+        from app.git_utils import run_git
+
+        rc, out, _ = run_git(
+            "ls-files", "--cached", "--others", "--exclude-standard", "-z",
+            cwd=self.root, timeout=30,
+        )
+        if rc != 0:
+            return None
+        return [p for p in out.split("\0") if p]
+
+    def _list_walk(self) -> List[str]:
+        paths = []
+        for dirpath, dirnames, filenames in os.walk(self.root):
+            dirnames[:] = [d for d in dirnames if d not in SKIP_DIRS]
+            rel_dir = os.path.relpath(dirpath, self.root)
+            for name in filenames:
+                rel = name if rel_dir == "." else f"{rel_dir}/{name}"
+                paths.append(rel.replace(os.sep, "/"))
+        return paths
+
+    def _ensure(self) -> List[str]:
+        with self._lock:
+            if self._files is None:
+                listed = self._list_git()
+                if listed is None:
+                    listed = self._list_walk()
+                self._files = {
+                    p for p in listed if not SKIP_DIRS.intersection(p.split("/")[:-1])
+                }
+                self._sorted = None
+            if self._sorted is None:
+                self._sorted = sorted(self._files)
+            return self._sorted
+
+    # -- updates -----------------------------------------------------------
+
+    def _relative(self, path: str) -> Optional[str]:
+        real = os.path.realpath(path)
+        if not real.startswith(self.root + os.sep):
+            return None
+        return os.path.relpath(real, self.root).replace(os.sep, "/")
+
+    def add(self, path: str) -> None:
+        """Record a file written under the root."""
+        rel = self._relative(path)
+        with self._lock:
+            if rel is None or self._files is None or rel in self._files:
+                return
+            self._files.add(rel)
+            self._sorted = None
+
+    def invalidate(self) -> None:
+        """Forget the file list; the next search rebuilds it."""
+        with self._lock:
+            self._files = None
+            self._sorted = None
+
+    # -- queries -----------------------------------------------------------
+
+    def files_under(self, base: str) -> List[str]:
+        """Indexed paths below *base*, relative to *base*."""
+        files = self._ensure()
+        if os.path.realpath(base) == self.root:
+            return files
+        rel_base = self._relative(base)
+        if rel_base is None:
+            return []
+        prefix = rel_base + "/"
+        return [p[len(prefix):] for p in files if p.startswith(prefix)]
+
+    def glob(self, pattern: str, base: str) -> List[str]:
+        """Sorted absolute paths under *base* matching *pattern*.
+
+        Directories that contain indexed files match too, like
+        ``glob.glob``.  Paths removed since the index was built are
+        dropped.
+        """
+        regex = glob_to_regex(pattern)
+        base = os.path.realpath(base)
+        rel_files = self.files_under(base)
+        candidates = set(rel_files)
+        for rel in rel_files:
+            parts = rel.split("/")[:-1]
+            for depth in range(1, len(parts) + 1):
+                candidates.add("/".join(parts[:depth]))
+        matches = [
+            os.path.join(base, rel) for rel in sorted(candidates)
+            if regex.match(rel) and os.path.lexists(os.path.join(base, rel))
+        ]
+        return matches
+
+    def grep(
+        self,
+        pattern: str,
+        path: str,
+        file_glob: str = "",
+        max_chars: int = 20000,
+    ) -> str:
+        """``path:line:text`` matches of *pattern* under *path*, capped at *max_chars*."""
+        if shutil.which("rg"):
+            return self._grep_rg(pattern, path, file_glob, max_chars)
+        return self._grep_native(pattern, path, file_glob, max_chars)
+
+    def _grep_rg(
+        self,
+        pattern: str,
+        path: str,
+        file_glob: str,
+        max_chars: int,
+        fixed_strings: bool = False,
+    ) -> str:
+        # --hidden plus the SKIP_DIRS excludes search the same files as
+        # the index: dotfiles included unless gitignored, .git never.
+        cmd = ["rg", "--line-number", "--with-filename", "--no-heading",
+               "--color", "never", "--no-messages", "--hidden"]
+        if fixed_strings:
+            cmd.append("--fixed-strings")
+        if file_glob:
+            cmd.extend(["--glob", file_glob])
+        for name in sorted(SKIP_DIRS):
+            cmd.extend(["--glob", f"!{name}"])
+        cmd.extend(["-e", pattern, "--", path])
+        proc = subprocess.Popen(
+            cmd, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+            stdin=subprocess.DEVNULL, text=True, errors="replace",
+        )
+        timer = threading.Timer(GREP_TIMEOUT, proc.kill)
+        timer.start()
+        try:
+            out, size = [], 0
+            for line in proc.stdout:
+                out.append(line)
+                size += len(line)
+                if size > max_chars:
+                    return "".join(out)[:max_chars] + TRUNCATED
+        finally:
+            timer.cancel()
+            if proc.poll() is None:
+                proc.kill()
+            proc.stdout.close()
+            proc.wait()
+        if proc.returncode == 2 and not out and not fixed_strings:
+            # Not a valid regex for rg: search it literally, like the
+            # in-process grep does.
+            return self._grep_rg(pattern, path, file_glob, max_chars, fixed_strings=True)
+        return "".join(out)
+
+    def _grep_native(self, pattern: str, path: str, file_glob: str, max_chars: int) -> str:
+        regex = _compile_grep_pattern(pattern)
+        if os.path.isfile(path):
+            targets = [path]
+        else:
+            name_re = glob_to_regex(file_glob) if file_glob else None
+            targets = [
+                os.path.join(path, rel) for rel in self.files_under(path)
+                if name_re is None or name_re.match(rel.rsplit("/", 1)[-1])
+            ]
+
+        out, size = [], 0
+        for target in targets:
+            try:
+                if os.path.getsize(target) > GREP_MAX_FILE_BYTES:
+                    continue
+                with open(target, "rb") as f:
+                    data = f.read()
+            except OSError:
+                continue
+            if b"\0" in data[:8192]:
+                continue
+            text = data.decode("utf-8", errors="replace")
+            if not regex.search(text):
+                continue
+            for lineno, line in enumerate(text.splitlines(), 1):
+                if regex.search(line):
+                    entry = f"{target}:{lineno}:{line}\n"
+                    out.append(entry)
+                    size += len(entry)
+                    if size > max_chars:
+                        return "".join(out)[:max_chars] + TRUNCATED
+        return "".join(out)
+
+
+_indexes: Dict[str, FileIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_index(root: str) -> FileIndex:
+    """The shared index for *root* (built lazily on first search)."""
+    key = os.path.realpath(root)
+    with _indexes_lock:
+        index = _indexes.get(key)
+        if index is None:
+            index = _indexes[key] = FileIndex(key)
+        return index
@@ -280,6 +280,9 @@ class GitAutoMerger:
         })
         print(f"[git_auto_merge] Successfully merged {branch} into {base_branch} ({strategy})")
 
+        from app.branch_limiter import invalidate_branch_state
+        invalidate_branch_state(self.project_name)
+
         # Always delete local branch after successful merge (stay on base_branch)
         if self.cleanup_local_branch(branch):
             print(f"[git_auto_merge] Deleted local branch {branch}")
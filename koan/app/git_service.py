@@ -0,0 +1,279 @@
+"""
+Kōan -- Long-lived per-repository git reader.
+
+Post-mission verification, quality scans and sync reports ask the same
+repository dozens of small questions ("does origin/main exist?", "what
+does this ref point to?"), and each ``run_git()`` call pays a full
+fork+exec of ``git``.  :class:`GitService` keeps one
+``git cat-file --batch-check`` and one ``git cat-file --batch`` process
+per repository alive and pipes those queries through them, several
+names per round-trip.
+
+Processes are started lazily, restarted after ``IDLE_TIMEOUT`` seconds
+without use (so a long-running agent doesn't pin a repository forever)
+and closed at exit.  Refs are resolved by git on every query, so the
+answers track fetches and new commits.  If a process cannot be started
+or dies mid-query, the service falls back to one-shot ``run_git()``
+calls — callers never see the difference except in speed.
+
+Usage::
+
+    svc = get_git_service(project_path)
+    base = svc.first_existing(["upstream/main", "origin/main"])
+    shas = svc.resolve(["HEAD", "origin/main"])
+"""
+
+import atexit
+import os
+import select
+import subprocess
+import threading
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from app.git_utils import run_git
+
+# Restart cat-file processes that have been idle this long (seconds).
+IDLE_TIMEOUT = 60.0
+
+# Seconds to wait for one reply line before declaring the process stuck.
+READ_TIMEOUT = 10.0
+
+# Names sent per round-trip.  Keeps both pipe directions well under the
+# kernel buffer size so writer and reader can never deadlock.
+_BATCH_SIZE = 256
+
+ObjectInfo = Tuple[str, str, int]  # (sha, type, size)
+
+
+class _CatFile:
+    """One ``git cat-file --batch[-check]`` child process.
+
+    Not thread-safe on its own; :class:`GitService` serializes access.
+    """
+
+    def __init__(self, repo_path: str, mode: str):
+        self.repo_path = repo_path
+        self.mode = mode
+        self.proc: Optional[subprocess.Popen] = None
+        self.last_used = 0.0
+        self._buf = b""
+
+    def _ensure(self) -> subprocess.Popen:
+        now = time.monotonic()
+        if self.proc is not None and (
+            self.proc.poll() is not None or now - self.last_used > IDLE_TIMEOUT
+        ):
+            self.close()
+        if self.proc is None:
+            self.proc = subprocess.Popen(
+                ["git", "cat-file", f"--{self.mode}"],
+                cwd=self.repo_path,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.DEVNULL,
+            )
+            self._buf = b""
+        self.last_used = now
+        return self.proc
+
+    def _fill(self) -> None:
+        fd = self.proc.stdout.fileno()
+        ready, _, _ = select.select([fd], [], [], READ_TIMEOUT)
+        if not ready:
+            raise TimeoutError(f"git cat-file --{self.mode} did not answer")
+        chunk = os.read(fd, 65536)
+        if not chunk:
+            raise EOFError(f"git cat-file --{self.mode} exited")
+        self._buf += chunk
+
+    def _read_line(self) -> bytes:
+        while b"\n" not in self._buf:
+            self._fill()
+        line, self._buf = self._buf.split(b"\n", 1)
+        return line
+
+    def _read_exact(self, size: int) -> bytes:
+        while len(self._buf) < size:
+            self._fill()
+        data, self._buf = self._buf[:size], self._buf[size:]
+        return data
+
+    def query(self, names: List[str]) -> List[Tuple[Optional[ObjectInfo], Optional[bytes]]]:
+        """Send *names* in one write and read one reply per name.
+
+        Returns ``(info, content)`` pairs; *info* is None for names that
+        don't resolve, *content* is only set in ``batch`` mode.
+        Raises OSError/EOFError/TimeoutError if the process misbehaves.
+        """
+        proc = self._ensure()
+        proc.stdin.write("".join(f"{n}\n" for n in names).encode())
+        proc.stdin.flush()
+        replies = []
+        for _ in names:
+            header = self._read_line().decode(errors="replace").split()
+            if len(header) != 3 or header[1] in ("missing", "ambiguous"):
+                replies.append((None, None))
+                continue
+            info = (header[0], header[1], int(header[2]))
+            content = None
+            if self.mode == "batch":
+                content = self._read_exact(info[2])
+                self._read_exact(1)  # trailing newline
+            replies.append((info, content))
+        return replies
+
+    def close(self) -> None:
+        proc, self.proc = self.proc, None
+        self._buf = b""
+        if proc is None:
+            return
+        try:
+            proc.stdin.close()
+            proc.wait(timeout=2)
+        except (OSError, subprocess.TimeoutExpired):
+            proc.kill()
+            try:
+                proc.wait(timeout=2)
+            except subprocess.TimeoutExpired:
+                pass
+        proc.stdout.close()
+
+
+class GitService:
+    """Batched, long-lived git reads for one repository."""
+
+    def __init__(self, repo_path: str):
+        self.repo_path = repo_path
+        self._lock = threading.Lock()
+        self._check = _CatFile(repo_path, "batch-check")
+        self._batch = _CatFile(repo_path, "batch")
+
+    def _query(self, proc: _CatFile, names: List[str]):
+        """Run *names* through *proc*; None if the process is unusable."""
+        replies = []
+        with self._lock:
+            try:
+                for i in range(0, len(names), _BATCH_SIZE):
+                    replies.extend(proc.query(names[i:i + _BATCH_SIZE]))
+            except (OSError, EOFError, TimeoutError, ValueError):
+                proc.close()
+                return None
+        return replies
+
+    # -- object and ref lookups -------------------------------------------
+
+    def object_info(self, names: Iterable[str]) -> Dict[str, Optional[ObjectInfo]]:
+        """Map each name to ``(sha, type, size)``, or None if it doesn't resolve."""
+        names = list(dict.fromkeys(n for n in names if n and "\n" not in n))
+        if not names:
+            return {}
+        replies = self._query(self._check, names)
+        if replies is not None:
+            return {n: info for n, (info, _) in zip(names, replies)}
+
+        result: Dict[str, Optional[ObjectInfo]] = {}
+        for name in names:
+            rc, sha, _ = run_git(
+                "rev-parse", "--verify", "--quiet", name, cwd=self.repo_path,
+            )
+            result[name] = (sha, "", 0) if rc == 0 and sha else None
+        return result
+
+    def resolve(self, names: Iterable[str]) -> Dict[str, Optional[str]]:
+        """Map each ref/revision name to its object SHA (None if missing)."""
+        return {
+            name: info[0] if info else None
+            for name, info in self.object_info(names).items()
+        }
+
+    def ref_exists(self, name: str) -> bool:
+        """Equivalent of ``git rev-parse --verify <name>`` succeeding."""
+        return self.resolve([name]).get(name) is not None
+
+    def first_existing(self, names: Iterable[str]) -> Optional[str]:
+        """Return the first name that resolves, checking all in one round-trip."""
+        names = list(names)
+        resolved = self.resolve(names)
+        return next((n for n in names if resolved.get(n)), None)
+
+    def read_object(self, name: str) -> Optional[bytes]:
+        """Return the raw content of an object (e.g. ``"HEAD:README.md"``)."""
+        if not name or "\n" in name:
+            return None
+        replies = self._query(self._batch, [name])
+        if replies is not None:
+            return replies[0][1]
+        try:
+            result = subprocess.run(
+                ["git", "cat-file", "-p", name],
+                cwd=self.repo_path, stdin=subprocess.DEVNULL,
+                capture_output=True, timeout=30,
+            )
+        except (OSError, subprocess.SubprocessError):
+            return None
+        return result.stdout if result.returncode == 0 else None
+
+    # -- history queries ----------------------------------------------------
+
+    def count_commits(self, *revs: str, since: str = "") -> int:
+        """Count commits reachable from *revs* (default HEAD); -1 on error.
+
+        A single ``git rev-list --count`` instead of listing every
+        commit and counting lines in Python.
+        """
+        args = ["rev-list", "--count"]
+        if since:
+            args.append(f"--since={since}")
+        args.extend(revs or ("HEAD",))
+        rc, out, _ = run_git(*args, cwd=self.repo_path, timeout=10)
+        if rc != 0:
+            return -1
+        try:
+            return int(out)
+        except ValueError:
+            return -1
+
+    def close(self) -> None:
+        """Stop the cat-file processes (they restart on next use)."""
+        with self._lock:
+            self._check.close()
+            self._batch.close()
+
+
+# ---------------------------------------------------------------------------
+# Per-repository registry
+# ---------------------------------------------------------------------------
+
+_services: Dict[str, GitService] = {}
+_services_lock = threading.Lock()
+
+
+def get_git_service(repo_path: str) -> GitService:
+    """Return the shared :class:`GitService` for *repo_path*."""
+    key = os.path.realpath(repo_path)
+    with _services_lock:
+        service = _services.get(key)
+        if service is None:
+            service = _services[key] = GitService(repo_path)
+        return service
+
+
+def close_all() -> None:
+    """Close every service's processes. Registered with atexit."""
+    with _services_lock:
+        services = list(_services.values())
+        _services.clear()
+    for service in services:
+        service.close()
+
+
+def _reset_after_fork() -> None:
+    """Forget the parent's processes in a forked child (pipes are shared)."""
+    global _services, _services_lock
+    _services = {}
+    _services_lock = threading.Lock()
+
+
+atexit.register(close_all)
+os.register_at_fork(after_in_child=_reset_after_fork)
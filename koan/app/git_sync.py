@@ -21,6 +21,7 @@ from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
+from app.git_service import get_git_service
 from app.git_utils import run_git as _run_git_core
 
 log = logging.getLogger(__name__)
@@ -113,10 +114,8 @@ class GitSync:
     def _get_target_branches(self) -> List[str]:
         """Return remote target branches that exist in this repo."""
         candidates = ["origin/main", "origin/master", "origin/staging", "origin/develop", "origin/production"]
-        existing = []
-        for ref in candidates:
-            if run_git(self.project_path, "rev-parse", "--verify", ref):
-                existing.append(ref)
+        resolved = get_git_service(self.project_path).resolve(candidates)
+        existing = [ref for ref in candidates if resolved.get(ref)]
         return existing or ["origin/main"]
 
     def get_merged_branches(self) -> List[str]:
@@ -348,14 +347,23 @@ class GitSync:
                 if not result:
                     log.debug("Remote deletion failed (may already be gone): %s", branch)
 
+        if deleted:
+            from app.branch_limiter import invalidate_branch_state
+            invalidate_branch_state(self.project_name)
+
         return deleted
 
-    def build_sync_report(self) -> str:
-        """Build a human-readable git sync report."""
+    def build_sync_report(self, github_merged: Optional[List[str]] = None) -> str:
+        """Build a human-readable git sync report.
+
+        *github_merged* is a prefetched result of get_github_merged_branches()
+        (see sync_projects); when None it is queried here.
+        """
         run_git(self.project_path, "fetch", "--prune")
 
         merged = self.get_merged_branches()
-        github_merged = self.get_github_merged_branches()
+        if github_merged is None:
+            github_merged = self.get_github_merged_branches()
         unmerged = self.get_unmerged_branches()
         recent = self.get_recent_main_commits(since_hours=12)
 
@@ -424,13 +432,108 @@ class GitSync:
         entry = f"\n## Git Sync — {datetime.now().strftime('%H:%M')}\n\n{report}\n"
         append_to_journal(Path(self.instance_dir), self.project_name, entry)
 
-    def sync_and_report(self) -> str:
+    def sync_and_report(self, github_merged: Optional[List[str]] = None) -> str:
         """Full sync: build report and write to journal. Returns the report."""
-        report = self.build_sync_report()
+        report = self.build_sync_report(github_merged=github_merged)
         self.write_sync_to_journal(report)
         return report
 
 
+# ---------------------------------------------------------------------------
+# Multi-project sync
+# ---------------------------------------------------------------------------
+
+# Remotes gh takes the base repository from when none was chosen with
+# ``gh repo set-default``, in its order of preference.
+_GH_BASE_REMOTES = ("upstream", "github", "origin")
+
+
+def _gh_base_repo(project_path: str) -> Optional[str]:
+    """``owner/repo`` that ``gh pr list`` run in *project_path* would query.
+
+    Follows gh's own resolution, so in a fork checkout the batched query
+    asks about the upstream repository like the per-repo fallback does.
+    """
+    from app.utils import get_github_remote
+
+    remotes = list(_GH_BASE_REMOTES)
+    configured = run_git(project_path, "config", "--get-regexp", r"^remote\..*\.gh-resolved$")
+    for line in configured.splitlines():
+        key, _, value = line.partition(" ")
+        if value.strip() == "base":
+            remotes.insert(0, key[len("remote."):-len(".gh-resolved")])
+    return get_github_remote(project_path, remotes=tuple(remotes))
+
+
+def _prefetch_github_merged(projects: List[Tuple[str, str]]) -> Dict[str, List[str]]:
+    """Merged agent branches per project path, from one batched GitHub query.
+
+    Projects whose repository can't be determined or that the batch
+    didn't answer are left out; their GitSync queries on its own.
+    """
+    from app.github import batch_merged_pr_branches
+
+    repos = {path: _gh_base_repo(path) for _, path in projects}
+    try:
+        batch = batch_merged_pr_branches([r for r in repos.values() if r])
+    except Exception as e:
+        log.debug("Batched merged-PR query failed: %s", e)
+        return {}
+
+    prefix = _get_prefix()
+    return {
+        path: [b for b in batch[repo] if b.startswith(prefix)]
+        for path, repo in repos.items()
+        if repo in batch
+    }
+
+
+def sync_projects(
+    instance_dir: str,
+    projects: List[Tuple[str, str]],
+    max_workers: Optional[int] = None,
+) -> Dict[str, str]:
+    """Sync and report every project concurrently.
+
+    Per-project syncs (fetch, branch queries, cleanup) run on up to
+    *max_workers* threads (default: ``git_sync_workers`` config), so wall
+    time tracks the slowest repository rather than the sum.  The GitHub
+    merged-PR lookup is shared across repositories in one batched query.
+    Each report is appended to its project's journal in a single locked
+    write, so concurrent syncs never interleave.
+
+    Returns a dict of project name → report; projects whose sync failed
+    are logged and omitted.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    from app.run_log import log as run_log
+
+    if not projects:
+        return {}
+    if max_workers is None:
+        from app.config import get_git_sync_workers
+        max_workers = get_git_sync_workers()
+
+    github_merged = _prefetch_github_merged(projects) if len(projects) > 1 else {}
+
+    def _sync(name: str, path: str) -> str:
+        return GitSync(instance_dir, name, path).sync_and_report(
+            github_merged=github_merged.get(path),
+        )
+
+    reports: Dict[str, str] = {}
+    workers = max(1, min(max_workers, len(projects)))
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="git-sync") as pool:
+        futures = [(name, pool.submit(_sync, name, path)) for name, path in projects]
+        for name, future in futures:
+            try:
+                reports[name] = future.result()
+            except Exception as e:
+                run_log("error", f"Git sync failed for {name}: {e}")
+    return reports
+
+
 # ---------------------------------------------------------------------------
 # CLI
 # ---------------------------------------------------------------------------
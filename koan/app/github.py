@@ -446,6 +446,19 @@ def cached_count_open_prs(github_url: str, author: str) -> int:
     return result
 
 
+def get_cached_pr_count(github_url: str, author: str) -> Optional[int]:
+    """Return the cached open-PR count if still within its TTL, else None."""
+    cached = _pr_count_cache.get(f"{github_url}:{author}")
+    if cached and (time.monotonic() - cached[1]) < _PR_COUNT_TTL:
+        return cached[0]
+    return None
+
+
+def clear_pr_count_cache() -> None:
+    """Forget cached open-PR counts (e.g. after opening or merging a PR)."""
+    _pr_count_cache.clear()
+
+
 def batch_count_open_prs(repos: list, author: str) -> Dict[str, int]:
     """Count open PRs across multiple repos in a single GraphQL call.
 
@@ -506,6 +519,190 @@ def batch_count_open_prs(repos: list, author: str) -> Dict[str, int]:
         return {}
 
 
+# Max repositories per aliased merged-PR query.
+_MERGED_BRANCHES_BATCH_SIZE = 20
+
+# Merged PRs read per repository — the same depth as the per-repo
+# ``gh pr list --limit 200`` it replaces, fetched in GraphQL pages.
+_MERGED_BRANCHES_LIMIT = 200
+_GRAPHQL_PAGE_SIZE = 100  # GitHub's maximum for ``first``
+
+
+def batch_merged_pr_branches(repos: list) -> Dict[str, List[str]]:
+    """List the head branches of recently merged PRs across many repos.
+
+    Aliased ``gh api graphql`` calls covering ``_MERGED_BRANCHES_BATCH_SIZE``
+    repositories each read the ``_MERGED_BRANCHES_LIMIT`` most recently
+    updated merged PRs of every repo (a second page is requested only for
+    repos that have more), instead of one ``gh pr list --state merged``
+    per repo.
+
+    Args:
+        repos: List of repository identifiers in ``owner/repo`` format.
+
+    Returns:
+        Dict mapping ``owner/repo`` → sorted head branch names.  Repos
+        that errored individually, or whose batch failed, are omitted —
+        the caller should fall back to a per-repo query for them.
+    """
+    unique = [r for r in dict.fromkeys(repos) if r and r.count("/") == 1]
+    results: Dict[str, List[str]] = {}
+
+    for start in range(0, len(unique), _MERGED_BRANCHES_BATCH_SIZE):
+        branches: Dict[str, set] = {}
+        read: Dict[str, int] = {}
+        cursors: Dict[str, Optional[str]] = {
+            repo: None for repo in unique[start:start + _MERGED_BRANCHES_BATCH_SIZE]
+        }
+        while cursors:
+            fragments = []
+            alias_map = {}  # alias -> repo
+            for i, (repo, cursor) in enumerate(cursors.items()):
+                alias = f"r{i}"
+                alias_map[alias] = repo
+                owner, name = (part.replace('"', '\\"') for part in repo.split("/"))
+                after = f', after: "{cursor.replace(chr(34), "")}"' if cursor else ""
+                fragments.append(
+                    f'{alias}: repository(owner: "{owner}", name: "{name}") {{ '
+                    f"pullRequests(states: MERGED, first: {_GRAPHQL_PAGE_SIZE}{after}, "
+                    f"orderBy: {{field: UPDATED_AT, direction: DESC}}) {{ "
+                    f"nodes {{ headRefName }} pageInfo {{ hasNextPage endCursor }} }} }}"
+                )
+
+            query = "query { " + " ".join(fragments) + " }"
+            next_cursors: Dict[str, Optional[str]] = {}
+            try:
+                output = run_gh(
+                    "api", "graphql",
+                    "-f", f"query={query}",
+                    timeout=30,
+                )
+                data = json.loads(output).get("data") or {}
+                for alias, repo in alias_map.items():
+                    node = data.get(alias)
+                    if not isinstance(node, dict):
+                        branches.pop(repo, None)
+                        continue
+                    conn = node.get("pullRequests") or {}
+                    prs = conn.get("nodes") or []
+                    branches.setdefault(repo, set()).update(
+                        pr["headRefName"] for pr in prs
+                        if isinstance(pr, dict) and pr.get("headRefName")
+                    )
+                    read[repo] = read.get(repo, 0) + len(prs)
+                    page = conn.get("pageInfo") or {}
+                    if (page.get("hasNextPage") and page.get("endCursor")
+                            and read[repo] < _MERGED_BRANCHES_LIMIT):
+                        next_cursors[repo] = page["endCursor"]
+            except (RuntimeError, subprocess.TimeoutExpired, json.JSONDecodeError,
+                    OSError, TypeError, KeyError, AttributeError) as e:
+                print(f"[github] Batched merged-PR query failed: {e}", file=sys.stderr)
+                # A partial listing would look authoritative: drop the repos
+                # this page was for so the caller queries them itself.
+                for repo in alias_map.values():
+                    branches.pop(repo, None)
+            cursors = next_cursors
+
+        results.update((repo, sorted(names)) for repo, names in branches.items())
+
+    return results
+
+
+# Max PRs per aliased CI status query — keeps each query well under
+# GitHub's GraphQL node limits.
+_CI_STATUS_BATCH_SIZE = 25
+
+# Conclusions of a completed workflow run that don't count as a failure;
+# anything else does, as in ci_queue_runner.check_ci_status().
+_PASSED_SUITE_CONCLUSIONS = {"SUCCESS", "NEUTRAL", "SKIPPED"}
+
+
+def _ci_status_from_commit(commit: dict) -> tuple:
+    """Map a PR head commit's workflow runs to ``(status, run_id)``.
+
+    Status uses the ``ci_queue_runner.check_ci_status()`` vocabulary:
+    "success", "failure", "pending" or "none", and like it only looks at
+    GitHub Actions runs — check suites of other apps and commit statuses
+    (coverage, review bots) are ignored.  A failed run wins over runs
+    still in progress, and its id is returned for fetching logs;
+    otherwise the run_id is the newest workflow run.
+    """
+    suites = ((commit.get("checkSuites") or {}).get("nodes") or [])
+    runs = [
+        s for s in suites
+        if isinstance(s, dict) and (s.get("workflowRun") or {}).get("databaseId")
+    ]
+    if not runs:
+        return "none", None
+
+    failed = [
+        s for s in runs
+        if s.get("status") == "COMPLETED" and s.get("conclusion") not in _PASSED_SUITE_CONCLUSIONS
+    ]
+    if failed:
+        return "failure", failed[-1]["workflowRun"]["databaseId"]
+    run_id = runs[-1]["workflowRun"]["databaseId"]
+    if any(s.get("status") != "COMPLETED" for s in runs):
+        return "pending", run_id
+    return "success", run_id
+
+
+def batch_pr_ci_status(prs: list) -> Dict[tuple, tuple]:
+    """Fetch CI status for many PRs with aliased GraphQL queries.
+
+    Reads the workflow-run check suites of each PR's head commit,
+    ``_CI_STATUS_BATCH_SIZE`` PRs per ``gh api graphql`` call, instead of
+    one ``gh run list`` per PR.
+
+    Args:
+        prs: List of ``(owner/repo, pr_number)`` tuples.
+
+    Returns:
+        Dict mapping ``(owner/repo, pr_number)`` → ``(status, run_id)``
+        (see ``_ci_status_from_commit``).  PRs that errored individually,
+        or whose batch failed, are omitted — the caller should fall back
+        to a per-PR check for them.
+    """
+    unique = [
+        (repo, str(number)) for repo, number in dict.fromkeys(prs)
+        if repo.count("/") == 1 and str(number).isdigit()
+    ]
+    results: Dict[tuple, tuple] = {}
+
+    for start in range(0, len(unique), _CI_STATUS_BATCH_SIZE):
+        fragments = []
+        alias_map = {}  # alias -> (repo, number)
+        for i, (repo, number) in enumerate(unique[start:start + _CI_STATUS_BATCH_SIZE]):
+            alias = f"p{i}"
+            alias_map[alias] = (repo, number)
+            owner, name = (part.replace('"', '\\"') for part in repo.split("/"))
+            fragments.append(
+                f'{alias}: repository(owner: "{owner}", name: "{name}") {{ '
+                f"pullRequest(number: {number}) {{ commits(last: 1) {{ nodes {{ commit {{ "
+                f"checkSuites(last: 20) {{ nodes {{ status conclusion workflowRun {{ databaseId }} }} }} "
+                f"}} }} }} }} }}"
+            )
+
+        query = "query { " + " ".join(fragments) + " }"
+        try:
+            output = run_gh(
+                "api", "graphql",
+                "-f", f"query={query}",
+                timeout=30,
+            )
+            data = json.loads(output).get("data") or {}
+            for alias, key in alias_map.items():
+                pr = (data.get(alias) or {}).get("pullRequest") or {}
+                nodes = (pr.get("commits") or {}).get("nodes") or []
+                if nodes and isinstance(nodes[-1], dict):
+                    results[key] = _ci_status_from_commit(nodes[-1].get("commit") or {})
+        except (RuntimeError, subprocess.TimeoutExpired, json.JSONDecodeError,
+                OSError, TypeError, KeyError, AttributeError) as e:
+            print(f"[github] Batched CI status query failed: {e}", file=sys.stderr)
+
+    return results
+
+
 def list_open_pr_branches(repo: str, author: str, cwd: str = None) -> List[str]:
     """List branch names of open PRs by a specific author in a repository.
 
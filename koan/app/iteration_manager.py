@@ -177,10 +177,10 @@ def _inject_recurring(instance_dir: Path):
 
 
 def _drain_ci_queue(instance_dir: Path):
-    """Drain one CI queue entry (non-blocking).
+    """Check every CI queue entry in one pass (non-blocking).
 
     Returns:
-        status message string, or None if queue is empty / still pending.
+        status message(s), or None if queue is empty / still pending.
     """
     try:
         from app.ci_queue_runner import drain_one
@@ -559,7 +559,12 @@ def _filter_exploration_projects(
     if skip_pr_limit:
         return FilterResult(projects=exploration_enabled, pr_limited=[], branch_saturated=[], focus_gated=focus_gated)
 
-    from app.github import get_gh_username, batch_count_open_prs, cached_count_open_prs
+    from app.github import (
+        batch_count_open_prs,
+        cached_count_open_prs,
+        get_cached_pr_count,
+        get_gh_username,
+    )
     author = get_gh_username()
 
     # Phase 1: Collect all repos that need PR counts
@@ -602,7 +607,16 @@ def _filter_exploration_projects(
             all_repos.extend(urls)
         all_repos = list(dict.fromkeys(all_repos))  # deduplicate, preserve order
 
-        batch_results = batch_count_open_prs(all_repos, author)
+        # Counts fetched within the cache TTL are reused; only stale repos
+        # go to GitHub, so steady-state iterations make no network call.
+        batch_results = {}
+        for repo in all_repos:
+            count = get_cached_pr_count(repo, author)
+            if count is not None:
+                batch_results[repo] = count
+        stale_repos = [r for r in all_repos if r not in batch_results]
+        if stale_repos:
+            batch_results.update(batch_count_open_prs(stale_repos, author))
 
         # Phase 3: Evaluate limits using batch results (fall back to sequential on miss)
         for name, (path, limit, urls_to_check) in projects_needing_check.items():
@@ -655,8 +669,8 @@ def _filter_exploration_projects(
                 urls.add(u)
 
         try:
-            from app.branch_limiter import count_pending_branches
-            count = count_pending_branches(
+            from app.branch_limiter import cached_count_pending_branches
+            count = cached_count_pending_branches(
                 instance_dir, name, path, list(urls), author,
             )
         except Exception as e:
@@ -8,12 +8,17 @@ Jira Cloud comment bodies are ADF (Atlassian Document Format) JSON —
 this module extracts plain text from ADF before regex matching.
 """
 
+import http.client
 import json
 import logging
 import os
 import re
+import threading
 import time
+import urllib.parse
+import urllib.request
 from base64 import b64encode
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Set, Tuple
@@ -31,12 +36,19 @@ _CODE_BLOCK_RE = re.compile(r'\{\{.*?\}\}|{{noformat.*?noformat}}|\{code.*?\{cod
 
 
 class JiraFetchResult:
-    """Result from fetch_jira_mentions."""
+    """Result from fetch_jira_mentions.
 
-    __slots__ = ("mentions",)
+    ``watermarks`` are the advanced per-project watermarks, to be saved
+    with :func:`commit_jira_watermarks` once the mentions are handled
+    (None when nothing advanced).
+    """
+
+    __slots__ = ("mentions", "watermarks")
 
-    def __init__(self, mentions: List[dict]):
+    def __init__(self, mentions: List[dict],
+                 watermarks: Optional[Dict[str, datetime]] = None):
         self.mentions = mentions
+        self.watermarks = watermarks
 
 
 def _make_auth_header(email: str, api_token: str) -> str:
@@ -46,6 +58,125 @@ def _make_auth_header(email: str, api_token: str) -> str:
     return f"Basic {encoded}"
 
 
+# --- Keep-alive HTTP connections ---
+#
+# Every poll cycle makes a search call plus per-issue comment calls; with
+# urlopen each one paid a fresh TCP + TLS handshake.  Idle connections are
+# kept per host and reused (by any thread) until the server closes them.
+
+_MAX_IDLE_CONNECTIONS = 4
+_HTTP_TIMEOUT = 30
+_idle_connections: Dict[Tuple[str, str], List[http.client.HTTPConnection]] = {}
+_pool_lock = threading.Lock()
+
+# Errors raised when reusing a connection the server already closed.
+_STALE_CONNECTION_ERRORS = (
+    http.client.RemoteDisconnected,
+    http.client.CannotSendRequest,
+    ConnectionResetError,
+    BrokenPipeError,
+)
+
+
+def _checkout_connection(scheme: str, netloc: str) -> Tuple[http.client.HTTPConnection, bool]:
+    """Return ``(connection, reused)`` for a host, reusing an idle one if any."""
+    with _pool_lock:
+        idle = _idle_connections.get((scheme, netloc))
+        if idle:
+            return idle.pop(), True
+    if scheme == "https":
+        return http.client.HTTPSConnection(netloc, timeout=_HTTP_TIMEOUT), False
+    return http.client.HTTPConnection(netloc, timeout=_HTTP_TIMEOUT), False
+
+
+def _checkin_connection(scheme: str, netloc: str, conn: http.client.HTTPConnection) -> None:
+    """Return a connection to the idle pool (closing it if the pool is full)."""
+    with _pool_lock:
+        idle = _idle_connections.setdefault((scheme, netloc), [])
+        if len(idle) < _MAX_IDLE_CONNECTIONS:
+            idle.append(conn)
+            return
+    conn.close()
+
+
+def close_jira_connections() -> None:
+    """Close all idle pooled Jira connections."""
+    with _pool_lock:
+        conns = [c for idle in _idle_connections.values() for c in idle]
+        _idle_connections.clear()
+    for conn in conns:
+        conn.close()
+
+
+def _uses_proxy(scheme: str, host: str) -> bool:
+    """True if urllib would route this host through an environment proxy."""
+    return scheme in urllib.request.getproxies() and not urllib.request.proxy_bypass(host)
+
+
+def _jira_request(
+    method: str,
+    base_url: str,
+    auth_header: str,
+    path: str,
+    params: Optional[Dict[str, Any]] = None,
+    body: Optional[Dict[str, Any]] = None,
+) -> Optional[dict]:
+    """Send a request to the Jira REST API over a pooled connection.
+
+    Falls back to urlopen when an environment proxy applies.
+
+    Returns:
+        Parsed JSON dict/list, or None for an empty response.
+
+    Raises:
+        OSError, http.client.HTTPException, ValueError: on transport,
+        HTTP status (>= 400) or JSON errors.
+    """
+    parts = urllib.parse.urlsplit(base_url)
+    query = "?" + urllib.parse.urlencode(params) if params else ""
+    url_path = parts.path.rstrip("/") + path + query
+    headers = {
+        "Authorization": auth_header,
+        "Accept": "application/json",
+        "Content-Type": "application/json",
+    }
+    data = json.dumps(body).encode("utf-8") if body is not None else None
+
+    if _uses_proxy(parts.scheme, parts.hostname or ""):
+        req = urllib.request.Request(
+            base_url.rstrip("/") + path + query,
+            data=data, method=method, headers=headers,
+        )
+        with urllib.request.urlopen(req, timeout=_HTTP_TIMEOUT) as resp:
+            raw = resp.read().decode("utf-8")
+            return json.loads(raw) if raw else None
+
+    while True:
+        conn, reused = _checkout_connection(parts.scheme, parts.netloc)
+        try:
+            conn.request(method, url_path, body=data, headers=headers)
+            resp = conn.getresponse()
+            raw = resp.read().decode("utf-8")
+        except _STALE_CONNECTION_ERRORS:
+            conn.close()
+            if reused:
+                # The server dropped an idle connection — retry on a new one
+                continue
+            raise
+        except BaseException:
+            conn.close()
+            raise
+        if resp.will_close:
+            conn.close()
+        else:
+            _checkin_connection(parts.scheme, parts.netloc, conn)
+        break
+
+    if resp.status >= 400:
+        raise http.client.HTTPException(f"HTTP {resp.status} {resp.reason}")
+    return json.loads(raw) if raw else None
+
+
 def _jira_get(base_url: str, auth_header: str, path: str, params: Optional[Dict[str, Any]] = None) -> Optional[dict]:
     """Make a GET request to the Jira REST API.
 
@@ -59,21 +190,7 @@ def _jira_get(base_url: str, auth_header: str, path: str, params: Optional[Dict[
         Parsed JSON dict/list, or None on error.
     """
     try:
-        import urllib.request
-        import urllib.parse
-
-        url = base_url + path
-        if params:
-            url += "?" + urllib.parse.urlencode(params)
-
-        req = urllib.request.Request(url)
-        req.add_header("Authorization", auth_header)
-        req.add_header("Accept", "application/json")
-        req.add_header("Content-Type", "application/json")
-
-        with urllib.request.urlopen(req, timeout=30) as resp:
-            raw = resp.read().decode("utf-8")
-            return json.loads(raw) if raw else None
+        return _jira_request("GET", base_url, auth_header, path, params=params)
     except Exception as e:
         log.warning("Jira API GET %s failed: %s", path, e)
         return None
@@ -92,19 +209,7 @@ def _jira_post(base_url: str, auth_header: str, path: str, body: Dict[str, Any])
         Parsed JSON dict/list, or None on error.
     """
     try:
-        import urllib.request
-
-        url = base_url + path
-        data = json.dumps(body).encode("utf-8")
-
-        req = urllib.request.Request(url, data=data, method="POST")
-        req.add_header("Authorization", auth_header)
-        req.add_header("Accept", "application/json")
-        req.add_header("Content-Type", "application/json")
-
-        with urllib.request.urlopen(req, timeout=30) as resp:
-            raw = resp.read().decode("utf-8")
-            return json.loads(raw) if raw else None
+        return _jira_request("POST", base_url, auth_header, path, body=body)
     except Exception as e:
         log.warning("Jira API POST %s failed: %s", path, e)
         return None
@@ -400,40 +505,49 @@ def resolve_branch_from_jira_key(issue_key: str, branch_map: Dict[str, str]) ->
     return branch_map.get(jira_project_key)
 
 
+# Jira project keys are uppercase alphanumerics (validated to prevent JQL injection)
+_PROJECT_KEY_RE = re.compile(r'^[A-Z0-9]+$')
+
+
 def _search_issues_with_comments(
     base_url: str,
     auth_header: str,
-    project_keys: List[str],
-    since: datetime,
-) -> List[dict]:
-    """Search for Jira issues updated since a given time using JQL.
+    project_since: Dict[str, datetime],
+) -> Tuple[List[dict], bool]:
+    """Search for Jira issues updated since per-project times using JQL.
 
-    Uses JQL to find recently-updated issues in the mapped projects.
-    Paginates to handle large result sets.
+    Requests the ``comment`` field inline so most issues need no further
+    round-trip.  Paginates to handle large result sets.
 
     Args:
         base_url: Jira instance base URL.
         auth_header: Basic auth header value.
-        project_keys: List of Jira project keys to search.
-        since: Minimum updated timestamp.
+        project_since: Jira project key → minimum updated timestamp.
 
     Returns:
-        List of issue dicts from Jira API.
+        ``(issues, complete)`` — the issue dicts from the Jira API, and
+        whether every result page was fetched.
     """
-    if not project_keys:
-        return []
+    if not project_since:
+        return [], True
+
+    safe = {k: v for k, v in project_since.items() if _PROJECT_KEY_RE.match(k)}
+    if not safe:
+        log.warning("Jira: no valid project keys after sanitization (got %s)", list(project_since))
+        return [], True
 
-    # Build JQL: project in (FOO, BAR) AND updated >= "YYYY-MM-DD HH:MM"
     # Jira JQL uses "YYYY-MM-DD HH:MM" format for datetime comparisons
-    since_str = since.strftime("%Y-%m-%d %H:%M")
-    # Validate project keys to prevent JQL injection (keys must be alphanumeric)
-    _PROJECT_KEY_RE = re.compile(r'^[A-Z0-9]+$')
-    safe_keys = [k for k in project_keys if _PROJECT_KEY_RE.match(k)]
-    if not safe_keys:
-        log.warning("Jira: no valid project keys after sanitization (got %s)", project_keys)
-        return []
-    project_in = ", ".join(f'"{k}"' for k in safe_keys)
-    jql = f'project in ({project_in}) AND updated >= "{since_str}" ORDER BY updated DESC'
+    since_strs = {k: v.strftime("%Y-%m-%d %H:%M") for k, v in safe.items()}
+    if len(set(since_strs.values())) == 1:
+        # project in (FOO, BAR) AND updated >= "YYYY-MM-DD HH:MM"
+        project_in = ", ".join(f'"{k}"' for k in since_strs)
+        since_str = next(iter(since_strs.values()))
+        clause = f'project in ({project_in}) AND updated >= "{since_str}"'
+    else:
+        clause = " OR ".join(
+            f'(project = "{k}" AND updated >= "{v}")' for k, v in since_strs.items()
+        )
+    jql = f"{clause} ORDER BY updated DESC"
 
     issues: List[dict] = []
     max_results = 50
@@ -443,14 +557,16 @@ def _search_issues_with_comments(
         body: Dict[str, Any] = {
             "jql": jql,
             "maxResults": max_results,
-            "fields": ["summary", "updated"],
+            "fields": ["summary", "updated", "comment"],
         }
         if next_page_token is not None:
             body["nextPageToken"] = next_page_token
 
         data = _jira_post(base_url, auth_header, "/rest/api/3/search/jql", body)
         if not data or not isinstance(data, dict):
-            break
+            # A failed first page is just "nothing found"; a failed later
+            # page leaves the result incomplete.
+            return issues, not issues
 
         batch = data.get("issues", [])
         if not batch:
@@ -464,7 +580,45 @@ def _search_issues_with_comments(
         if not next_page_token:
             break
 
-    return issues
+    return issues, True
+
+
+def _parse_jira_time(value: str) -> Optional[datetime]:
+    """Parse a Jira timestamp (e.g. "2024-01-15T10:30:00.000+0000")."""
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except (ValueError, TypeError, AttributeError):
+        return None
+
+
+def _filter_comments_since(comments: List[dict], since: datetime) -> List[dict]:
+    """Keep comments updated at or after *since* (and unparseable ones)."""
+    kept = []
+    for comment in comments:
+        updated_str = comment.get("updated", "")
+        if not updated_str:
+            continue
+        updated = _parse_jira_time(updated_str)
+        if updated is None or updated >= since:
+            kept.append(comment)  # Include on parse error
+    return kept
+
+
+def _inline_comments(issue: dict) -> Optional[List[dict]]:
+    """Return the issue's comments from the search response, if complete.
+
+    Returns None when the ``comment`` field is missing or truncated, in
+    which case the comments must be fetched separately.
+    """
+    field = (issue.get("fields") or {}).get("comment")
+    if not isinstance(field, dict):
+        return None
+    comments = field.get("comments")
+    if not isinstance(comments, list):
+        return None
+    if field.get("total", len(comments)) > len(comments):
+        return None
+    return comments
 
 
 def _get_issue_comments(
@@ -472,7 +626,7 @@ def _get_issue_comments(
     auth_header: str,
     issue_key: str,
     since: datetime,
-) -> List[dict]:
+) -> Optional[List[dict]]:
     """Fetch comments on a Jira issue updated since the given time.
 
     Paginates through all comments on the issue.
@@ -484,7 +638,7 @@ def _get_issue_comments(
         since: Minimum updated timestamp.
 
     Returns:
-        List of comment dicts from Jira API.
+        List of comment dicts from Jira API, or None if a page failed.
     """
     comments = []
     start_at = 0
@@ -502,24 +656,13 @@ def _get_issue_comments(
             params,
         )
         if not data or not isinstance(data, dict):
-            break
+            return None
 
         batch = data.get("comments", [])
         if not batch:
             break
 
-        for comment in batch:
-            # Filter by updated time
-            updated_str = comment.get("updated", "")
-            if updated_str:
-                try:
-                    updated = datetime.fromisoformat(
-                        updated_str.replace("Z", "+00:00")
-                    )
-                    if updated >= since:
-                        comments.append(comment)
-                except (ValueError, TypeError):
-                    comments.append(comment)  # Include on parse error
+        comments.extend(_filter_comments_since(batch, since))
 
         total = data.get("total", 0)
         start_at += len(batch)
@@ -530,6 +673,41 @@ def _get_issue_comments(
     return comments
 
 
+# --- Per-project `updated` watermarks ---
+#
+# The newest issue ``updated`` time fully processed per Jira project, so
+# a restart resumes where polling stopped instead of rescanning the whole
+# max_age_hours window.
+
+
+def _load_watermarks(watermark_path: Path) -> Dict[str, datetime]:
+    """Load per-project watermarks from .jira-watermarks.json."""
+    try:
+        if watermark_path.exists():
+            data = json.loads(watermark_path.read_text())
+            if isinstance(data, dict):
+                marks = {}
+                for key, value in data.items():
+                    parsed = _parse_jira_time(value)
+                    if parsed is not None:
+                        marks[str(key)] = parsed
+                return marks
+    except (OSError, json.JSONDecodeError, ValueError):
+        pass
+    return {}
+
+
+def _save_watermarks(watermark_path: Path, marks: Dict[str, datetime]) -> None:
+    """Persist per-project watermarks (atomic write)."""
+    try:
+        from app.utils import atomic_write
+
+        data = {k: v.isoformat() for k, v in sorted(marks.items())}
+        atomic_write(watermark_path, json.dumps(data, indent=2))
+    except Exception as e:
+        log.debug("Failed to save Jira watermarks: %s", e)
+
+
 def fetch_jira_issue(
     issue_key: str,
 ) -> Tuple[str, str, List[dict]]:
@@ -627,23 +805,35 @@ def fetch_jira_issue(
     return title, body, all_comments
 
 
+# Concurrent comment fetches for issues whose comments were not inline.
+_COMMENT_FETCH_WORKERS = 4
+
+
 def fetch_jira_mentions(
     config: dict,
     project_map: Dict[str, str],
     since_iso: Optional[str] = None,
+    watermark_path: Optional[Path] = None,
 ) -> JiraFetchResult:
     """Fetch Jira comments that @mention the bot.
 
-    Searches recently-updated issues in mapped projects, fetches their
-    comments, and returns those containing @bot mentions.
+    Searches recently-updated issues in mapped projects — with their
+    comments inline — and returns those containing @bot mentions.
+    Issues whose inline comments were truncated get their comments
+    fetched concurrently.  Every changed issue is processed.
 
     Args:
         config: Global config dict (from config.yaml).
         project_map: Jira project key → Kōan project name mapping.
         since_iso: ISO 8601 timestamp to search from. If None, uses max_age_hours.
+        watermark_path: Optional .jira-watermarks.json path. When given,
+            each project is searched from its persisted watermark (if
+            newer than *since_iso*), and a complete cycle returns the
+            advanced watermarks.  Nothing is written here: the caller
+            saves them with commit_jira_watermarks() after processing.
 
     Returns:
-        JiraFetchResult with list of mention dicts.
+        JiraFetchResult with list of mention dicts and new watermarks.
     """
     from app.jira_config import (
         get_jira_api_token,
@@ -671,47 +861,56 @@ def fetch_jira_mentions(
         return JiraFetchResult([])
 
     # Determine time window
-    if since_iso:
-        try:
-            since = datetime.fromisoformat(since_iso.replace("Z", "+00:00"))
-        except (ValueError, TypeError):
-            since = datetime.now(timezone.utc) - timedelta(hours=max_age_hours)
-    else:
+    since = _parse_jira_time(since_iso) if since_iso else None
+    if since is None:
         since = datetime.now(timezone.utc) - timedelta(hours=max_age_hours)
 
-    # Search for recently-updated issues (cap at 20 to limit API calls)
-    _MAX_ISSUES_PER_CYCLE = 20
-    issues = _search_issues_with_comments(base_url, auth_header, project_keys, since)
+    marks = _load_watermarks(watermark_path) if watermark_path else {}
+    project_since = {key: max(since, marks.get(key, since)) for key in project_keys}
+
+    issues, search_complete = _search_issues_with_comments(
+        base_url, auth_header, project_since,
+    )
     if not issues:
         log.debug("Jira: no recently-updated issues found")
         return JiraFetchResult([])
+    log.debug("Jira: found %d recently-updated issues", len(issues))
 
-    if len(issues) > _MAX_ISSUES_PER_CYCLE:
-        log.debug(
-            "Jira: found %d issues, capping at %d to limit API calls",
-            len(issues), _MAX_ISSUES_PER_CYCLE,
-        )
-        issues = issues[:_MAX_ISSUES_PER_CYCLE]
-    else:
-        log.debug("Jira: found %d recently-updated issues", len(issues))
-
-    # Collect @mention comments from all issues
-    mentions = []
-    bot_mention_lower = f"@{nickname}".lower()
-
+    # Resolve comments: inline when complete, otherwise fetched concurrently
+    issue_comments: Dict[str, Optional[List[dict]]] = {}
+    to_fetch = []
     for issue in issues:
         issue_key = issue.get("key", "")
         if not issue_key:
             continue
-
-        # Determine Kōan project for this issue
-        project_name = resolve_project_from_jira_key(issue_key, project_map)
-        if not project_name:
+        if not resolve_project_from_jira_key(issue_key, project_map):
             log.debug("Jira: issue %s has no project mapping, skipping", issue_key)
             continue
+        key_since = project_since.get(issue_key.split("-")[0].upper(), since)
+        inline = _inline_comments(issue)
+        if inline is not None:
+            issue_comments[issue_key] = _filter_comments_since(inline, key_since)
+        else:
+            to_fetch.append((issue_key, key_since))
+
+    if to_fetch:
+        with ThreadPoolExecutor(
+            max_workers=min(_COMMENT_FETCH_WORKERS, len(to_fetch)),
+        ) as pool:
+            fetched = pool.map(
+                lambda item: _get_issue_comments(base_url, auth_header, *item),
+                to_fetch,
+            )
+            for (issue_key, _), comments in zip(to_fetch, fetched):
+                issue_comments[issue_key] = comments
+
+    # Collect @mention comments from all issues
+    mentions = []
+    bot_mention_lower = f"@{nickname}".lower()
 
-        comments = _get_issue_comments(base_url, auth_header, issue_key, since)
-        for comment in comments:
+    for issue_key, comments in issue_comments.items():
+        project_name = resolve_project_from_jira_key(issue_key, project_map)
+        for comment in comments or []:
             body = comment.get("body", "")
             text = _extract_comment_text(body)
             if bot_mention_lower not in text.lower():
@@ -733,9 +932,77 @@ def fetch_jira_mentions(
                 ),
             })
 
+    watermarks = None
+    if watermark_path and search_complete:
+        watermarks = _advance_watermarks(marks, issues, issue_comments)
+
     if mentions:
         log.debug("Jira: found %d @%s mention(s)", len(mentions), nickname)
     else:
         log.debug("Jira: no @%s mentions found", nickname)
 
-    return JiraFetchResult(mentions)
+    return JiraFetchResult(mentions, watermarks)
+
+
+def _advance_watermarks(
+    marks: Dict[str, datetime],
+    issues: List[dict],
+    issue_comments: Dict[str, Optional[List[dict]]],
+) -> Optional[Dict[str, datetime]]:
+    """Move each project's watermark to its newest fully-fetched issue.
+
+    A project whose comment fetch failed for any issue keeps its old
+    watermark, so those issues are searched again next cycle.  Returns
+    the updated marks, or None when none moved.
+    """
+    newest: Dict[str, datetime] = {}
+    failed: Set[str] = set()
+    for issue in issues:
+        issue_key = issue.get("key", "")
+        if issue_key not in issue_comments:
+            continue
+        project_key = issue_key.split("-")[0].upper()
+        if issue_comments[issue_key] is None:
+            failed.add(project_key)
+            continue
+        updated = _parse_jira_time((issue.get("fields") or {}).get("updated", ""))
+        if updated and (project_key not in newest or updated > newest[project_key]):
+            newest[project_key] = updated
+
+    advanced = dict(marks)
+    for project_key, updated in newest.items():
+        if project_key in failed:
+            continue
+        if project_key not in advanced or updated > advanced[project_key]:
+            advanced[project_key] = updated
+    return advanced if advanced != marks else None
+
+
+def commit_jira_watermarks(
+    watermark_path: Path,
+    result: JiraFetchResult,
+    unhandled: List[dict] = (),
+) -> None:
+    """Save *result*'s watermarks once its mentions have been processed.
+
+    A project with an *unhandled* mention (processing failed or raised)
+    advances only up to that comment's ``updated`` time, so the mention
+    is fetched again next cycle; the processed tracker skips the ones
+    already handled.
+    """
+    if not result.watermarks:
+        return
+    old = _load_watermarks(watermark_path)
+    marks = dict(result.watermarks)
+    for mention in unhandled:
+        project_key = mention.get("issue_key", "").split("-")[0].upper()
+        if project_key not in marks:
+            continue
+        updated = _parse_jira_time(mention.get("updated", ""))
+        cap = min(marks[project_key], updated) if updated else old.get(project_key)
+        if cap is None:
+            del marks[project_key]
+        else:
+            marks[project_key] = cap
+    if marks != old:
+        _save_watermarks(watermark_path, marks)
@@ -6,8 +6,12 @@ Supports both flat (journal/YYYY-MM-DD.md) and nested
 """
 
 import fcntl
+import os
+import time
 from pathlib import Path
-from typing import Optional
+from typing import List, Optional, Tuple
+
+from app.tail_reader import read_tail_text
 
 
 def _to_date_string(target_date) -> str:
@@ -45,36 +49,83 @@ def get_journal_file(instance_dir: Path, target_date, project_name: str) -> Path
     return nested
 
 
-def read_all_journals(instance_dir: Path, target_date) -> str:
-    """Read all journal entries for a date across all project subdirs.
+_JOURNAL_SEPARATOR = "\n\n---\n\n"
 
-    Combines flat (legacy) and nested per-project files.
 
-    Args:
-        instance_dir: Path to instance directory
-        target_date: date object or string "YYYY-MM-DD"
+def _journal_sources(instance_dir: Path, target_date) -> List[Tuple[str, Path]]:
+    """List the journal files for a date as ``(prefix, path)`` pairs.
 
-    Returns:
-        Combined journal content
+    Flat (legacy) file first, then nested per-project files by name.
     """
     date_str = _to_date_string(target_date)
 
     journal_base = instance_dir / "journal"
     journal_dir = journal_base / date_str
-    parts = []
+    sources = []
 
     # Check for flat file (legacy)
     flat = journal_base / f"{date_str}.md"
     if flat.is_file():
-        parts.append(flat.read_text())
+        sources.append(("", flat))
 
     # Check nested per-project files
     if journal_dir.is_dir():
         for f in sorted(journal_dir.iterdir()):
             if f.suffix == ".md":
-                parts.append(f"[{f.stem}]\n{f.read_text()}")
+                sources.append((f"[{f.stem}]\n", f))
+
+    return sources
+
+
+def read_all_journals(instance_dir: Path, target_date) -> str:
+    """Read all journal entries for a date across all project subdirs.
+
+    Combines flat (legacy) and nested per-project files.
+
+    Args:
+        instance_dir: Path to instance directory
+        target_date: date object or string "YYYY-MM-DD"
+
+    Returns:
+        Combined journal content
+    """
+    return _JOURNAL_SEPARATOR.join(
+        f"{prefix}{path.read_text()}"
+        for prefix, path in _journal_sources(instance_dir, target_date)
+    )
 
-    return "\n\n---\n\n".join(parts)
+
+def read_journals_tail(instance_dir: Path, target_date,
+                       max_chars: int) -> Tuple[str, bool]:
+    """Read the last *max_chars* of the combined journal for a date.
+
+    Same text as ``read_all_journals(...)[-max_chars:]``, but only the
+    tail of each file is read — journals grow all day and prompts only
+    ever show the most recent part.
+
+    Returns:
+        ``(content, truncated)`` — *truncated* is True when older
+        content was left out.
+    """
+    sources = _journal_sources(instance_dir, target_date)
+    parts: List[str] = []
+    remaining = max_chars
+    for index in range(len(sources) - 1, -1, -1):
+        prefix, path = sources[index]
+        if remaining <= 0:
+            return "".join(reversed(parts)), True
+        text, truncated = read_tail_text(path, remaining)
+        parts.append(text)
+        remaining -= len(text)
+        if truncated:
+            return "".join(reversed(parts)), True
+        chunk = (_JOURNAL_SEPARATOR if index else "") + prefix
+        if len(chunk) > remaining:
+            parts.append(chunk[-remaining:] if remaining else "")
+            return "".join(reversed(parts)), True
+        parts.append(chunk)
+        remaining -= len(chunk)
+    return "".join(reversed(parts)), False
 
 
 def get_latest_journal(instance_dir: Path, project: Optional[str] = None,
@@ -101,18 +152,20 @@ def get_latest_journal(instance_dir: Path, project: Optional[str] = None,
         journal_path = get_journal_file(instance_dir, target_date, project)
         if not journal_path.exists():
             return f"No journal for {project} on {date_str}."
-        content = journal_path.read_text().strip()
+        # Read extra so trailing whitespace does not eat into max_chars.
+        content, truncated = read_tail_text(journal_path, max_chars * 2)
+        content = content.strip()
         if not content:
             return f"Empty journal for {project} on {date_str}."
         header = f"\U0001f4d3 {project} \u2014 {date_str}"
     else:
-        content = read_all_journals(instance_dir, target_date)
+        content, truncated = read_journals_tail(instance_dir, target_date, max_chars)
         if not content:
             return f"No journal for {date_str}."
         header = f"\U0001f4d3 Journal \u2014 {date_str}"
 
     # Tail: keep last max_chars
-    if len(content) > max_chars:
+    if truncated or len(content) > max_chars:
         content = "...\n" + content[-(max_chars - 4):]
 
     return f"{header}\n\n{content}"
@@ -145,3 +198,125 @@ def append_to_journal(instance_dir: Path, project_name: str, content: str):
             f.flush()
         finally:
             fcntl.flock(f, fcntl.LOCK_UN)
+
+
+def _today_string() -> str:
+    from datetime import datetime as _dt
+    return _dt.now().strftime("%Y-%m-%d")
+
+
+class JournalAppender:
+    """Write-combining appender for one project's daily journal.
+
+    append_to_journal() resolves the path, opens, locks and closes the
+    file on every call — fine for occasional entries, wasteful for a
+    stream of CLI output.  This keeps one append handle per (project,
+    day) and coalesces writes in memory until the buffer reaches
+    *max_chars* or its oldest text is *max_delay* seconds old.  Each
+    flush is leak-scanned and appended under an exclusive flock, so it
+    interleaves safely with append_to_journal() writers.
+
+    Text is filed under the day it was written: the first write after
+    midnight flushes yesterday's buffer to yesterday's file and the
+    handle moves to today's.  A flush that fails (OSError) keeps the
+    buffer for the next attempt.  Not thread-safe — one appender per
+    thread.
+    """
+
+    def __init__(self, instance_dir: Path, project_name: str,
+                 max_chars: int = 4096, max_delay: float = 0.5):
+        self._instance_dir = Path(instance_dir)
+        self._project_name = project_name
+        self._max_chars = max_chars
+        self._max_delay = max_delay
+        self._parts: List[str] = []
+        self._size = 0
+        self._buffer_date = ""
+        self._first_write = 0.0
+        self._file = None
+        self._file_date = ""
+        self._file_path: Optional[Path] = None
+
+    def write(self, text: str):
+        """Buffer *text*; flushes when the size threshold is reached."""
+        if not text:
+            return
+        date_str = _today_string()
+        if self._parts and date_str != self._buffer_date:
+            self.flush()
+        if not self._parts:
+            self._buffer_date = date_str
+            self._first_write = time.monotonic()
+        self._parts.append(text)
+        self._size += len(text)
+        if self._size >= self._max_chars:
+            self.flush()
+
+    def seconds_until_due(self) -> Optional[float]:
+        """Seconds until buffered text must be flushed (None if empty)."""
+        if not self._parts:
+            return None
+        return max(0.0, self._first_write + self._max_delay - time.monotonic())
+
+    def flush_if_due(self):
+        """Flush when the oldest buffered text has waited *max_delay*."""
+        if self.seconds_until_due() == 0.0:
+            self.flush()
+
+    def flush(self):
+        """Append all buffered text to the journal now."""
+        if not self._parts:
+            return
+
+        from app.leak_detector import scan_and_redact
+
+        content = scan_and_redact("".join(self._parts), context="journal")
+        try:
+            f = self._handle_for(self._buffer_date)
+            fcntl.flock(f, fcntl.LOCK_EX)
+            try:
+                f.write(content)
+                f.flush()
+            finally:
+                fcntl.flock(f, fcntl.LOCK_UN)
+        except OSError:
+            # Keep the text for the next flush; reopen the file then.
+            self._close_file()
+            raise
+        self._parts = []
+        self._size = 0
+
+    def close(self):
+        """Flush pending text and release the file handle."""
+        try:
+            self.flush()
+        finally:
+            self._close_file()
+
+    def _handle_for(self, date_str: str):
+        """Open (or reuse) the append handle for *date_str*."""
+        if self._file is not None and self._file_date == date_str \
+                and self._still_linked():
+            return self._file
+        self._close_file()
+        journal_dir = self._instance_dir / "journal" / date_str
+        journal_dir.mkdir(parents=True, exist_ok=True)
+        self._file_path = journal_dir / f"{self._project_name}.md"
+        self._file = open(self._file_path, "a", encoding="utf-8")
+        self._file_date = date_str
+        return self._file
+
+    def _still_linked(self) -> bool:
+        """False when the journal file was deleted or replaced (archiving)."""
+        try:
+            return os.stat(self._file_path).st_ino == os.fstat(self._file.fileno()).st_ino
+        except OSError:
+            return False
+
+    def _close_file(self):
+        if self._file is not None:
+            try:
+                self._file.close()
+            except OSError:
+                pass
+            self._file = None
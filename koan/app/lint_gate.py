@@ -8,6 +8,12 @@ The gate runs post-mission (before auto-merge) and optionally in skill
 runners (rebase, recreate). It validates that Claude's changes pass
 the project's linting rules before code reaches the main branch.
 
+`command` may be a single command or a list of linters.  Commands using
+the {files} placeholder run over shards of the changed files, all jobs
+in parallel.  Passing results are cached in instance/.lint-cache.json,
+keyed by (command, linter config hash, file path, blob SHA), so repeated
+gates on the same branch only re-lint files whose content changed.
+
 Usage:
     from app.lint_gate import run_lint_gate
 
@@ -16,13 +22,17 @@ Usage:
         # block auto-merge, log to journal, etc.
 """
 
+import hashlib
+import json
 import shlex
 import subprocess
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 from datetime import datetime
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Optional
 
 from app.projects_config import (
     get_project_config,
@@ -31,6 +41,27 @@ from app.projects_config import (
 )
 
 
+# Files per {files} invocation — also keeps command lines under ARG_MAX.
+_SHARD_SIZE = 100
+_MAX_WORKERS = 4
+
+_CACHE_FILENAME = ".lint-cache.json"
+_CACHE_VERSION = 1
+_CACHE_TTL_SECONDS = 7 * 24 * 3600
+_CACHE_MAX_ENTRIES = 20000
+
+# Linter configuration files at the project root; editing any of them
+# invalidates every cached result for the project.
+_LINTER_CONFIG_FILES = (
+    "pyproject.toml", "setup.cfg", "tox.ini", ".flake8", "ruff.toml",
+    ".ruff.toml", ".pylintrc", "mypy.ini", ".pre-commit-config.yaml",
+    "package.json", ".eslintrc", ".eslintrc.js", ".eslintrc.cjs",
+    ".eslintrc.json", ".eslintrc.yml", "eslint.config.js",
+    "eslint.config.mjs", ".prettierrc", "biome.json", ".golangci.yml",
+    ".golangci.yaml", ".rubocop.yml", ".perlcriticrc",
+)
+
+
 @dataclass
 class LintResult:
     """Result of a lint gate run."""
@@ -44,6 +75,7 @@ def get_project_lint_config(config: dict, project_name: str) -> dict:
     """Get lint gate config for a project from projects.yaml.
 
     Returns a dict with keys: enabled, command, timeout, blocking.
+    ``command`` is a string or a list of commands (one per linter).
     Falls back to defaults section, then sensible defaults.
     """
     project_cfg = get_project_config(config, project_name)
@@ -92,20 +124,180 @@ def _expand_command(command: str, files: list) -> str:
     return command.replace("{files}", files_str)
 
 
+def _command_list(command) -> List[str]:
+    """Normalize the `command` setting to a list of non-empty commands."""
+    if isinstance(command, str):
+        command = [command]
+    return [c.strip() for c in command or [] if isinstance(c, str) and c.strip()]
+
+
+def _blob_sha(path: Path) -> Optional[str]:
+    """Git blob SHA of a file's content, computed in-process."""
+    try:
+        data = path.read_bytes()
+    except OSError:
+        return None
+    header = f"blob {len(data)}\0".encode()
+    return hashlib.sha1(header + data).hexdigest()
+
+
+def _config_hash(project_path: str, commands: List[str]) -> str:
+    """Hash of the lint commands and the project's linter config files."""
+    digest = hashlib.sha256("\0".join(commands).encode())
+    root = Path(project_path)
+    for name in _LINTER_CONFIG_FILES:
+        sha = _blob_sha(root / name)
+        if sha:
+            digest.update(f"\0{name}:{sha}".encode())
+    return digest.hexdigest()
+
+
+def _cache_key(*parts: str) -> str:
+    return hashlib.sha256("\0".join(parts).encode()).hexdigest()[:32]
+
+
+class _LintCache:
+    """Passing lint results, persisted under the instance dir."""
+
+    def __init__(self, instance_dir: str):
+        self.path = Path(instance_dir) / _CACHE_FILENAME
+        self.entries: Dict[str, float] = {}
+        self.dirty = False
+        try:
+            data = json.loads(self.path.read_text())
+            if isinstance(data, dict) and data.get("version") == _CACHE_VERSION:
+                self.entries = dict(data.get("entries", {}))
+        except (OSError, ValueError, TypeError):
+            pass
+
+    def __contains__(self, key: str) -> bool:
+        stamp = self.entries.get(key)
+        return stamp is not None and time.time() - stamp < _CACHE_TTL_SECONDS
+
+    def add(self, keys: List[str]) -> None:
+        now = time.time()
+        for key in keys:
+            self.entries[key] = now
+        self.dirty = self.dirty or bool(keys)
+
+    def save(self) -> None:
+        if not self.dirty:
+            return
+        from app.utils import atomic_write
+
+        cutoff = time.time() - _CACHE_TTL_SECONDS
+        live = sorted(
+            ((k, v) for k, v in self.entries.items() if v >= cutoff),
+            key=lambda kv: kv[1],
+        )[-_CACHE_MAX_ENTRIES:]
+        try:
+            atomic_write(self.path, json.dumps(
+                {"version": _CACHE_VERSION, "entries": dict(live)}
+            ))
+        except OSError as e:
+            print(f"[lint_gate] Cache write failed: {e}", file=sys.stderr)
+
+
+@dataclass
+class _LintJob:
+    command: str
+    cache_keys: List[str]
+
+
+def _plan_jobs(
+    commands: List[str],
+    project_path: str,
+    changed_files: list,
+    cache: Optional[_LintCache],
+) -> List[_LintJob]:
+    """Build the lint invocations still needed after consulting the cache.
+
+    {files} commands get one job per shard of uncached files; other
+    commands lint the whole project and are cached on the full set of
+    changed file contents.  Files that cannot be hashed are never cached.
+    """
+    config_hash = _config_hash(project_path, commands)
+    blobs = {f: _blob_sha(Path(project_path) / f) for f in changed_files}
+    jobs = []
+    for command in commands:
+        if "{files}" in command:
+            pending = []
+            for f in changed_files:
+                key = (
+                    _cache_key(command, config_hash, f, blobs[f]) if blobs[f] else ""
+                )
+                if not (cache is not None and key and key in cache):
+                    pending.append((f, key))
+            for i in range(0, len(pending), _SHARD_SIZE):
+                shard = pending[i:i + _SHARD_SIZE]
+                jobs.append(_LintJob(
+                    command=_expand_command(command, [f for f, _ in shard]),
+                    cache_keys=[k for _, k in shard if k],
+                ))
+        else:
+            key = ""
+            if all(blobs.values()):
+                key = _cache_key(
+                    command, config_hash,
+                    *(f"{f}:{blobs[f]}" for f in sorted(changed_files)),
+                )
+            if cache is not None and key and key in cache:
+                continue
+            jobs.append(_LintJob(command=command, cache_keys=[key] if key else []))
+    return jobs
+
+
+def _run_job(job: _LintJob, project_path: str, timeout: int) -> Optional[LintResult]:
+    """Run one lint invocation. Returns None if the tool could not start."""
+    try:
+        result = subprocess.run(
+            shlex.split(job.command),
+            capture_output=True, text=True,
+            timeout=timeout,
+            cwd=project_path,
+            stdin=subprocess.DEVNULL,
+        )
+        output = (result.stdout + result.stderr)[-3000:]
+        return LintResult(
+            passed=result.returncode == 0, output=output, command=job.command,
+        )
+    except subprocess.TimeoutExpired:
+        return LintResult(
+            passed=False,
+            output=f"Lint command timed out after {timeout}s",
+            command=job.command,
+        )
+    except FileNotFoundError:
+        # Lint tool not installed — treat as warning, not failure
+        print(
+            f"[lint_gate] Lint command not found: {job.command}",
+            file=sys.stderr,
+        )
+        return None
+    except OSError as e:
+        print(f"[lint_gate] Lint command failed to start: {e}", file=sys.stderr)
+        return None
+
+
 def run_lint_gate(
     project_path: str,
     project_name: str,
     instance_dir: str = "",
+    changes=None,
 ) -> Optional[LintResult]:
     """Run the lint gate for a project.
 
     Reads lint config from projects.yaml, gets changed files via git diff,
-    and runs the configured lint command.
+    and runs the configured lint commands on the files not already cached
+    as passing.
 
     Args:
         project_path: Path to the project directory.
         project_name: Project name (for config lookup).
-        instance_dir: Path to instance directory (for journal writing).
+        instance_dir: Path to instance directory (for journal writing
+            and the lint result cache).
+        changes: Optional precomputed BranchChangeSet; its file list is
+            reused when it was computed against the same base branch.
 
     Returns:
         LintResult if lint was configured and ran, None if not configured
@@ -122,48 +314,55 @@ def run_lint_gate(
         return None
 
     lint_config = get_project_lint_config(config, project_name)
-    if not lint_config["enabled"] or not lint_config["command"]:
+    commands = _command_list(lint_config["command"])
+    if not lint_config["enabled"] or not commands:
         return None
 
     # Get changed files
     base_branch = resolve_base_branch(project_name, project_path)
-    changed_files = _get_changed_files(project_path, base_branch)
+    if changes is not None and changes.base_ref == f"origin/{base_branch}":
+        changed_files = changes.existing_paths
+    else:
+        changed_files = _get_changed_files(project_path, base_branch)
     if not changed_files:
         return None  # Nothing to lint
 
-    # Expand command with file list
-    command = _expand_command(lint_config["command"], changed_files)
+    cache = _LintCache(instance_dir) if instance_dir else None
+    jobs = _plan_jobs(commands, project_path, changed_files, cache)
     timeout = lint_config["timeout"]
 
-    # Run lint command
-    try:
-        result = subprocess.run(
-            shlex.split(command),
-            capture_output=True, text=True,
-            timeout=timeout,
-            cwd=project_path,
-            stdin=subprocess.DEVNULL,
-        )
-        output = (result.stdout + result.stderr)[-3000:]
-        passed = result.returncode == 0
-
-        lint_result = LintResult(passed=passed, output=output, command=command)
-    except subprocess.TimeoutExpired:
+    if not jobs:
         lint_result = LintResult(
-            passed=False,
-            output=f"Lint command timed out after {timeout}s",
-            command=command,
+            passed=True,
+            output=f"{len(changed_files)} changed file(s) unchanged since last passing lint",
+            command="; ".join(commands),
         )
-    except FileNotFoundError:
-        # Lint tool not installed — treat as warning, not failure
-        print(
-            f"[lint_gate] Lint command not found: {command}",
-            file=sys.stderr,
+    else:
+        if len(jobs) == 1:
+            outcomes = [_run_job(jobs[0], project_path, timeout)]
+        else:
+            with ThreadPoolExecutor(max_workers=min(_MAX_WORKERS, len(jobs))) as pool:
+                outcomes = list(pool.map(
+                    lambda job: _run_job(job, project_path, timeout), jobs,
+                ))
+
+        ran = [(job, r) for job, r in zip(jobs, outcomes) if r is not None]
+        if not ran:
+            return None
+
+        if cache is not None:
+            for job, r in ran:
+                if r.passed:
+                    cache.add(job.cache_keys)
+            cache.save()
+
+        # Failures last so they survive tail truncation
+        ordered = sorted((r for _, r in ran), key=lambda r: not r.passed)
+        lint_result = LintResult(
+            passed=all(r.passed for r in ordered),
+            output="\n".join(r.output for r in ordered if r.output)[-3000:],
+            command="; ".join(r.command for r in ordered),
         )
-        return None
-    except OSError as e:
-        print(f"[lint_gate] Lint command failed to start: {e}", file=sys.stderr)
-        return None
 
     # Write result to journal
     if instance_dir:
@@ -22,14 +22,17 @@ The runner handles:
 """
 
 import argparse
-import glob as glob_module
+import http.client
 import json
 import os
 import subprocess
 import sys
+import urllib.parse
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, TextIO
 
+from app.file_index import get_index
 
 # ---------------------------------------------------------------------------
 # Tool definitions (OpenAI function calling format)
@@ -184,6 +187,7 @@ def _tool_write_file(arguments: Dict[str, Any], cwd: str) -> str:
         return f"Error: path escapes working directory: {arguments['path']}"
     os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
     Path(path).write_text(arguments["content"], encoding="utf-8")
+    get_index(cwd).add(path)
     return f"Written {len(arguments['content'])} chars to {path}"
 
 
@@ -211,7 +215,13 @@ def _tool_glob(arguments: Dict[str, Any], cwd: str) -> str:
     if base is None:
         return f"Error: path escapes working directory: {arguments.get('path', '')}"
     pattern = arguments["pattern"]
-    matches = sorted(glob_module.glob(os.path.join(base, pattern), recursive=True))
+    if os.path.isabs(pattern):
+        if not pattern.startswith(base + os.sep):
+            return f"Error: path escapes working directory: {pattern}"
+        pattern = pattern[len(base) + 1:]
+    if ".." in pattern.split("/"):
+        return f"Error: path escapes working directory: {pattern}"
+    matches = get_index(cwd).glob(pattern, base)
     if len(matches) > 200:
         total = len(matches)
         matches = matches[:200]
@@ -224,17 +234,7 @@ def _tool_grep(arguments: Dict[str, Any], cwd: str) -> str:
     path = _resolve_path(arguments.get("path", cwd), cwd)
     if path is None:
         return f"Error: path escapes working directory: {arguments.get('path', '')}"
-    file_glob = arguments.get("file_glob", "")
-    cmd = ["grep", "-rn", "--include", file_glob, pattern, path] if file_glob else [
-        "grep", "-rn", pattern, path
-    ]
-    result = subprocess.run(
-        cmd, capture_output=True, text=True, timeout=30,
-        stdin=subprocess.DEVNULL,
-    )
-    output = result.stdout
-    if len(output) > 20000:
-        output = output[:20000] + "\n... (truncated)"
+    output = get_index(cwd).grep(pattern, path, arguments.get("file_glob", ""), max_chars=20000)
     return output if output else "No matches found"
 
 
@@ -249,6 +249,8 @@ def _tool_shell(arguments: Dict[str, Any], cwd: str) -> str:
         output += "\nSTDERR:\n" + result.stderr
     if len(output) > 30000:
         output = output[:30000] + "\n... (truncated)"
+    # The command may have created or deleted anything.
+    get_index(cwd).invalidate()
     if not output.strip():
         output = f"(exit code {result.returncode})"
     return output
@@ -287,6 +289,7 @@ def _tool_skill(arguments: Dict[str, Any], cwd: str) -> str:
         args=args,
     )
     result = execute_skill(skill, ctx)
+    get_index(cwd).invalidate()
     if isinstance(result, SkillError):
         return result.message
     return result or f"Skill '{skill_name}' executed (no output)"
@@ -316,10 +319,231 @@ def _execute_tool(name: str, arguments: Dict[str, Any], cwd: str) -> str:
         return f"Error executing {name}: {e}"
 
 
+# Tools with no side effects: consecutive calls to these within one turn
+# run concurrently.  Everything else (writes, edits, shell, skills) runs
+# alone, in call order, so reads never race a mutation.
+_READ_ONLY_TOOLS = frozenset({"read_file", "glob", "grep"})
+
+# Upper bound on concurrent read-only tool calls.
+_MAX_TOOL_WORKERS = 8
+
+
+def _parse_tool_call(tc: Dict[str, Any]) -> tuple:
+    """Return ``(name, arguments)`` for one OpenAI-format tool call."""
+    func = tc.get("function", {})
+    try:
+        args = json.loads(func.get("arguments", "{}"))
+    except json.JSONDecodeError:
+        args = {}
+    return func.get("name", ""), args
+
+
+def _execute_tool_calls(tool_calls: List[Dict[str, Any]], cwd: str) -> List[str]:
+    """Execute one turn's tool calls; results come back in call order.
+
+    Runs of consecutive read-only calls are fanned out to a thread pool.
+    A mutating call is a barrier: it starts after every earlier call has
+    finished and completes before any later one starts.
+    """
+    calls = [_parse_tool_call(tc) for tc in tool_calls]
+    results: List[str] = [""] * len(calls)
+
+    def flush(batch: List[int]) -> None:
+        if len(batch) == 1:
+            results[batch[0]] = _execute_tool(*calls[batch[0]], cwd)
+        elif batch:
+            workers = min(_MAX_TOOL_WORKERS, len(batch))
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                outputs = pool.map(lambda i: _execute_tool(*calls[i], cwd), batch)
+                for i, output in zip(batch, outputs):
+                    results[i] = output
+        batch.clear()
+
+    batch: List[int] = []
+    for i, (name, args) in enumerate(calls):
+        if name in _READ_ONLY_TOOLS:
+            batch.append(i)
+            continue
+        flush(batch)
+        results[i] = _execute_tool(name, args, cwd)
+    flush(batch)
+    return results
+
+
 # ---------------------------------------------------------------------------
 # API client
 # ---------------------------------------------------------------------------
 
+# Socket timeout (seconds) for a non-streamed completion.
+_REQUEST_TIMEOUT = 300
+
+# Idle timeout (seconds) between streamed chunks when config.yaml has no
+# first_output_timeout.
+_DEFAULT_STREAM_IDLE_TIMEOUT = 600
+
+# Errors that mean a kept-alive connection was closed by the server.
+_STALE_CONNECTION_ERRORS = (
+    http.client.RemoteDisconnected,
+    http.client.CannotSendRequest,
+    http.client.BadStatusLine,
+    ConnectionResetError,
+    BrokenPipeError,
+)
+
+
+def _pool_key(url: str) -> tuple:
+    parts = urllib.parse.urlsplit(url)
+    return parts.scheme, parts.netloc
+
+
+class _ConnectionPool:
+    """Keep-alive HTTP connections to the LLM server, one per host.
+
+    The agentic loop talks to the same server every turn; reusing the
+    connection saves a TCP (and TLS) handshake per turn.  A connection
+    the server has dropped is reopened once transparently.
+    """
+
+    def __init__(self):
+        self._conns: Dict[tuple, http.client.HTTPConnection] = {}
+
+    def _connect(self, scheme: str, netloc: str, timeout: Optional[float]):
+        cls = http.client.HTTPSConnection if scheme == "https" else http.client.HTTPConnection
+        return cls(netloc, timeout=timeout)
+
+    def post(
+        self,
+        url: str,
+        body: bytes,
+        headers: Dict[str, str],
+        timeout: Optional[float],
+    ) -> http.client.HTTPResponse:
+        """Send a POST and return the response (status not checked)."""
+        parts = urllib.parse.urlsplit(url)
+        key = _pool_key(url)
+        path = parts.path or "/"
+        if parts.query:
+            path += f"?{parts.query}"
+
+        for attempt in range(2):
+            conn = self._conns.get(key)
+            reused = conn is not None
+            if conn is None:
+                conn = self._conns[key] = self._connect(parts.scheme, parts.netloc, timeout)
+            conn.timeout = timeout
+            if conn.sock is not None:
+                conn.sock.settimeout(timeout)
+            try:
+                conn.request("POST", path, body=body, headers=headers)
+                return conn.getresponse()
+            except _STALE_CONNECTION_ERRORS:
+                self.discard(key)
+                if not reused or attempt:
+                    raise
+            except (OSError, http.client.HTTPException):
+                self.discard(key)
+                raise
+        raise http.client.CannotSendRequest(url)  # pragma: no cover
+
+    def release(self, url: str, resp: http.client.HTTPResponse) -> None:
+        """Drain *resp* and keep its connection unless the server closes it."""
+        try:
+            resp.read()
+        except (OSError, http.client.HTTPException):
+            self.discard(_pool_key(url))
+            return
+        if resp.will_close:
+            self.discard(_pool_key(url))
+
+    def discard(self, key: tuple) -> None:
+        conn = self._conns.pop(key, None)
+        if conn is not None:
+            conn.close()
+
+    def close(self) -> None:
+        for key in list(self._conns):
+            self.discard(key)
+
+
+_pool = _ConnectionPool()
+
+
+def _stream_idle_timeout() -> Optional[float]:
+    """Seconds without a streamed chunk before giving up (None = never).
+
+    Uses ``first_output_timeout`` from config.yaml, the same liveness
+    budget the agent loop applies to CLI output.
+    """
+    try:
+        from app.config import get_first_output_timeout
+        value = get_first_output_timeout()
+    except (ImportError, OSError, ValueError):
+        value = _DEFAULT_STREAM_IDLE_TIMEOUT
+    return float(value) if value > 0 else None
+
+
+def _read_sse_completion(
+    resp,
+    on_text: Optional[Callable[[str], None]] = None,
+) -> Dict:
+    """Assemble a streamed (SSE) chat completion into the non-streamed shape.
+
+    Content deltas are passed to *on_text* as they arrive.  Tool-call
+    deltas are merged by index: the id and name arrive once, the JSON
+    arguments in fragments.
+    """
+    content: List[str] = []
+    tool_calls: Dict[int, Dict[str, Any]] = {}
+    finish_reason = None
+    usage: Dict[str, Any] = {}
+
+    for raw in resp:
+        line = raw.decode("utf-8", errors="replace").strip()
+        if not line.startswith("data:"):
+            continue
+        data = line[5:].strip()
+        if data == "[DONE]":
+            break
+        try:
+            chunk = json.loads(data)
+        except json.JSONDecodeError:
+            continue
+        if chunk.get("usage"):
+            usage = chunk["usage"]
+        for choice in chunk.get("choices") or []:
+            delta = choice.get("delta") or {}
+            text = delta.get("content")
+            if text:
+                content.append(text)
+                if on_text:
+                    on_text(text)
+            for tc in delta.get("tool_calls") or []:
+                index = tc.get("index", len(tool_calls))
+                slot = tool_calls.setdefault(index, {
+                    "id": "", "type": "function",
+                    "function": {"name": "", "arguments": ""},
+                })
+                if tc.get("id"):
+                    slot["id"] = tc["id"]
+                func = tc.get("function") or {}
+                if func.get("name") and not slot["function"]["name"]:
+                    slot["function"]["name"] = func["name"]
+                    if on_text:
+                        on_text(f"\n[tool] {func['name']}\n")
+                if func.get("arguments"):
+                    slot["function"]["arguments"] += func["arguments"]
+            if choice.get("finish_reason"):
+                finish_reason = choice["finish_reason"]
+
+    message: Dict[str, Any] = {"role": "assistant", "content": "".join(content)}
+    if tool_calls:
+        message["tool_calls"] = [tool_calls[i] for i in sorted(tool_calls)]
+    return {
+        "choices": [{"index": 0, "message": message, "finish_reason": finish_reason}],
+        "usage": usage,
+    }
+
+
 def _call_api(
     base_url: str,
     model: str,
@@ -327,14 +551,16 @@ def _call_api(
     tools: Optional[List[Dict]] = None,
     api_key: str = "",
     temperature: float = 0.0,
+    stream: bool = False,
+    on_text: Optional[Callable[[str], None]] = None,
 ) -> Dict:
     """Call OpenAI-compatible chat completions API.
 
-    Uses urllib to avoid requiring the openai package.
+    Uses http.client over a kept-alive connection to avoid requiring the
+    openai package.  With *stream*, the completion is requested as
+    server-sent events and text is handed to *on_text* as it is
+    generated; the return value has the same shape either way.
     """
-    import urllib.request
-    import urllib.error
-
     url = f"{base_url.rstrip('/')}/chat/completions"
 
     payload: Dict[str, Any] = {
@@ -345,6 +571,9 @@ def _call_api(
     if tools:
         payload["tools"] = tools
         payload["tool_choice"] = "auto"
+    if stream:
+        payload["stream"] = True
+        payload["stream_options"] = {"include_usage": True}
 
     headers = {
         "Content-Type": "application/json",
@@ -353,24 +582,209 @@ def _call_api(
         headers["Authorization"] = f"Bearer {api_key}"
 
     data = json.dumps(payload).encode("utf-8")
-    req = urllib.request.Request(url, data=data, headers=headers, method="POST")
+    timeout = _stream_idle_timeout() if stream else _REQUEST_TIMEOUT
 
     try:
-        with urllib.request.urlopen(req, timeout=300) as resp:
-            return json.loads(resp.read().decode("utf-8"))
-    except urllib.error.HTTPError as e:
-        body = e.read().decode("utf-8", errors="replace")
-        raise RuntimeError(f"API error {e.code}: {body}") from e
-    except urllib.error.URLError as e:
+        resp = _pool.post(url, data, headers, timeout)
+    except (OSError, http.client.HTTPException) as e:
         raise RuntimeError(
-            f"Cannot connect to {base_url}. Is the LLM server running? Error: {e.reason}"
+            f"Cannot connect to {base_url}. Is the LLM server running? Error: {e}"
         ) from e
 
+    failed = False
+    try:
+        if resp.status >= 400:
+            body = resp.read().decode("utf-8", errors="replace")
+            raise RuntimeError(f"API error {resp.status}: {body}")
+        content_type = resp.getheader("Content-Type", "")
+        if stream and "text/event-stream" in content_type:
+            return _read_sse_completion(resp, on_text)
+        # Non-streamed reply (or a server that ignored "stream")
+        result = json.loads(resp.read().decode("utf-8"))
+        if stream and on_text:
+            choices = result.get("choices") or [{}]
+            text = (choices[0].get("message") or {}).get("content")
+            if text:
+                on_text(text)
+        return result
+    except (OSError, http.client.HTTPException) as e:
+        # Timed out or dropped mid-response: the connection is unusable
+        failed = True
+        _pool.discard(_pool_key(url))
+        raise RuntimeError(f"Connection to {base_url} failed mid-response: {e}") from e
+    finally:
+        if not failed:
+            _pool.release(url, resp)
+
+
+# ---------------------------------------------------------------------------
+# Context window
+# ---------------------------------------------------------------------------
+
+# Estimated prompt tokens the conversation may reach before old turns are
+# compacted (config: local_llm.context_tokens, 0 = never compact).
+_DEFAULT_CONTEXT_TOKENS = 16384
+
+# Compaction shrinks the conversation to this fraction of the budget, so
+# it happens every few turns rather than on each one: between compactions
+# the history only grows at the end and the server's KV cache for the
+# prefix stays valid.
+_COMPACT_TARGET = 0.6
+
+# The system prompt and task are pinned, and so are the last few turns
+# (assistant message plus the tool results that follow it).
+_PINNED_HEAD = 2
+_KEEP_RECENT_TURNS = 2
+
+# Characters of an elided output kept as its summary.
+_ELIDED_PREVIEW_CHARS = 300
+_ELIDED_MARKER = "[elided "
+
+# Rough per-message overhead of the chat template, in tokens.
+_MESSAGE_OVERHEAD_TOKENS = 4
+
+
+def _message_tokens(message: Dict[str, Any]) -> int:
+    """Estimated prompt tokens taken by one chat message."""
+    from app.context_packer import estimate_tokens
+
+    text = message.get("content") or ""
+    if message.get("tool_calls"):
+        text += json.dumps(message["tool_calls"])
+    return estimate_tokens(text) + _MESSAGE_OVERHEAD_TOKENS
+
+
+def _elide_text(text: str, what: str) -> str:
+    """Replace *text* with a short stub quoting its beginning."""
+    if len(text) <= 2 * _ELIDED_PREVIEW_CHARS or text.startswith(_ELIDED_MARKER):
+        return text
+    return (
+        f"{_ELIDED_MARKER}{what}, {len(text)} chars; it began:]\n"
+        f"{text[:_ELIDED_PREVIEW_CHARS]}"
+    )
+
+
+def _elide_tool_call(tc: Dict[str, Any]) -> Dict[str, Any]:
+    """Shrink long string arguments (e.g. written file content) of a tool call."""
+    func = tc.get("function", {})
+    try:
+        args = json.loads(func.get("arguments") or "{}")
+    except json.JSONDecodeError:
+        return tc
+    if not isinstance(args, dict):
+        return tc
+    changed = False
+    for key, value in args.items():
+        if isinstance(value, str) and len(value) > 2 * _ELIDED_PREVIEW_CHARS:
+            args[key] = f"{_ELIDED_MARKER}{len(value)} chars]"
+            changed = True
+    if not changed:
+        return tc
+    return {**tc, "function": {**func, "arguments": json.dumps(args)}}
+
+
+def _compact_message(message: Dict[str, Any]) -> Dict[str, Any]:
+    """Return *message* with its bulky parts elided."""
+    if message.get("role") == "tool":
+        return {**message, "content": _elide_text(message.get("content") or "", "tool output")}
+    compacted = {**message}
+    if message.get("content"):
+        compacted["content"] = _elide_text(message["content"], "assistant message")
+    if message.get("tool_calls"):
+        compacted["tool_calls"] = [_elide_tool_call(tc) for tc in message["tool_calls"]]
+    return compacted
+
+
+def _compact_context(messages: List[Dict[str, Any]], budget: int) -> int:
+    """Elide old tool outputs in *messages* (in place) once over *budget*.
+
+    Nothing happens while the estimated size fits the budget.  Past it,
+    messages between the pinned head and the last ``_KEEP_RECENT_TURNS``
+    turns are compacted oldest first — tool outputs, then assistant
+    messages — until the estimate drops to ``_COMPACT_TARGET`` of the
+    budget.  An elided message never changes again.
+
+    Returns the number of messages compacted.
+    """
+    if budget <= 0:
+        return 0
+    sizes = [_message_tokens(m) for m in messages]
+    total = sum(sizes)
+    if total <= budget:
+        return 0
+
+    assistant_idx = [
+        i for i, m in enumerate(messages[_PINNED_HEAD:], _PINNED_HEAD)
+        if m.get("role") == "assistant"
+    ]
+    if len(assistant_idx) <= _KEEP_RECENT_TURNS:
+        return 0
+    recent_start = assistant_idx[-_KEEP_RECENT_TURNS]
+    old = range(_PINNED_HEAD, recent_start)
+    candidates = [i for i in old if messages[i].get("role") == "tool"]
+    candidates += [i for i in old if messages[i].get("role") == "assistant"]
+
+    target = int(budget * _COMPACT_TARGET)
+    compacted = 0
+    for i in candidates:
+        if total <= target:
+            break
+        replacement = _compact_message(messages[i])
+        new_size = _message_tokens(replacement)
+        if new_size >= sizes[i]:
+            continue
+        messages[i] = replacement
+        total -= sizes[i] - new_size
+        sizes[i] = new_size
+        compacted += 1
+    if compacted:
+        print(
+            f"[local_llm] Compacted {compacted} old message(s): "
+            f"~{sum(sizes)} tokens of context",
+            file=sys.stderr,
+        )
+    return compacted
+
 
 # ---------------------------------------------------------------------------
 # Agentic loop
 # ---------------------------------------------------------------------------
 
+# Side file streamed model output is appended to (under KOAN_ROOT/logs/).
+# Never stderr: callers scan it for quota errors and copy it into the
+# journal when a run fails, and model text often mentions rate limits.
+PROGRESS_LOG = "local-llm-progress.log"
+
+
+def _progress_path() -> str:
+    """Where streamed output goes by default ("" = not echoed)."""
+    path = os.environ.get("KOAN_LOCAL_LLM_PROGRESS_FILE", "")
+    if path:
+        return path
+    koan_root = os.environ.get("KOAN_ROOT", "")
+    return os.path.join(koan_root, "logs", PROGRESS_LOG) if koan_root else ""
+
+
+def _open_progress(path: str) -> Optional[TextIO]:
+    """Open the progress side file for appending (None if unusable)."""
+    if not path:
+        return None
+    try:
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        return open(path, "a", encoding="utf-8")
+    except OSError:
+        return None
+
+
+def _echo_progress(progress: TextIO, text: str) -> None:
+    """Write streamed model output to *progress* as it arrives."""
+    try:
+        progress.write(text)
+        progress.flush()
+    except (OSError, ValueError):
+        pass  # progress is best-effort; the final result is on stdout
+
+
 def _default_system_prompt() -> str:
     """Load the local LLM agent system prompt from the prompts directory."""
     try:
@@ -426,9 +840,19 @@ def run_agent(
     disallowed_tools: Optional[List[str]] = None,
     cwd: str = "",
     system_prompt: str = "",
+    stream: bool = True,
+    context_tokens: int = _DEFAULT_CONTEXT_TOKENS,
+    progress: Optional[TextIO] = None,
 ) -> Dict[str, Any]:
     """Run the agentic loop.
 
+    With *stream*, completions are streamed and, when *progress* is
+    given, their text is echoed to it as it is generated (stdout stays
+    reserved for the final result, which callers parse).
+
+    Old tool outputs are elided once the conversation outgrows
+    *context_tokens* (see ``_compact_context``); 0 keeps the full history.
+
     Returns a dict with:
         result: Final text response from the LLM
         input_tokens: Total input tokens used
@@ -450,8 +874,10 @@ def run_agent(
 
     total_input_tokens = 0
     total_output_tokens = 0
+    echo = progress is not None and stream
 
     for turn in range(max_turns):
+        _compact_context(messages, context_tokens)
         try:
             response = _call_api(
                 base_url=base_url,
@@ -459,7 +885,11 @@ def run_agent(
                 messages=messages,
                 tools=tools if use_tools else None,
                 api_key=api_key,
+                stream=stream,
+                on_text=(lambda text: _echo_progress(progress, text)) if echo else None,
             )
+            if echo:
+                _echo_progress(progress, "\n")
         except RuntimeError as e:
             return {
                 "result": f"Error: {e}",
@@ -488,16 +918,9 @@ def run_agent(
             # Add assistant message with tool calls to history
             messages.append(message)
 
-            for tc in tool_calls:
-                func = tc.get("function", {})
-                func_name = func.get("name", "")
-                try:
-                    func_args = json.loads(func.get("arguments", "{}"))
-                except json.JSONDecodeError:
-                    func_args = {}
-
-                tool_result = _execute_tool(func_name, func_args, cwd)
-
+            tool_results = _execute_tool_calls(tool_calls, cwd)
+            for tc, tool_result in zip(tool_calls, tool_results):
+                func_name = tc.get("function", {}).get("name", "")
                 messages.append({
                     "role": "tool",
                     "tool_call_id": tc.get("id", f"call_{turn}_{func_name}"),
@@ -546,6 +969,13 @@ def main():
     parser.add_argument("--output-format", default="", help="Output format (json or empty for text)")
     parser.add_argument("--cwd", default="", help="Working directory")
     parser.add_argument("--system-prompt", default="", help="Custom system prompt")
+    parser.add_argument("--no-stream", action="store_true",
+                        help="Wait for whole completions instead of streaming them")
+    parser.add_argument("--progress-file", default="",
+                        help="Append streamed model output to this file "
+                             "(default: $KOAN_ROOT/logs/local-llm-progress.log)")
+    parser.add_argument("--context-tokens", type=int, default=_DEFAULT_CONTEXT_TOKENS,
+                        help="Compact old tool outputs past this many prompt tokens (0 = never)")
 
     args = parser.parse_args()
 
@@ -565,6 +995,7 @@ def main():
     allowed = [t.strip() for t in args.allowed_tools.split(",") if t.strip()] if args.allowed_tools else None
     disallowed = [t.strip() for t in args.disallowed_tools.split(",") if t.strip()] if args.disallowed_tools else None
 
+    progress = _open_progress(args.progress_file or _progress_path())
     result = run_agent(
         prompt=args.prompt,
         base_url=base_url,
@@ -575,7 +1006,13 @@ def main():
         disallowed_tools=disallowed,
         cwd=args.cwd or os.getcwd(),
         system_prompt=args.system_prompt,
+        stream=not args.no_stream,
+        context_tokens=args.context_tokens,
+        progress=progress,
     )
+    _pool.close()
+    if progress is not None:
+        progress.close()
 
     if args.output_format == "json":
         print(json.dumps(result, ensure_ascii=False))
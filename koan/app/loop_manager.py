@@ -1098,15 +1098,20 @@ def process_jira_notifications(
                 f"(max_age={max_age}h lookback)"
             )
 
-        from app.jira_notifications import fetch_jira_mentions
-
-        result = fetch_jira_mentions(config, project_map, since_iso=since_value)
-
         from datetime import datetime as _dt
 
+        from app.jira_notifications import (
+            check_jira_already_processed,
+            commit_jira_watermarks,
+            fetch_jira_mentions,
+        )
+
         new_iso = _dt.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
-        with _jira_state_lock:
-            _last_jira_check_iso = new_iso
+        watermark_path = Path(instance_dir) / ".jira-watermarks.json"
+        result = fetch_jira_mentions(
+            config, project_map, since_iso=since_value,
+            watermark_path=watermark_path,
+        )
 
         mentions = result.mentions
 
@@ -1124,11 +1129,20 @@ def process_jira_notifications(
         from app.jira_command_handler import process_jira_mention
 
         missions_created = 0
+        unhandled = []
         for mention in mentions:
-            success, error_msg = process_jira_mention(
-                mention, registry, config, processed_set,
-                branch_map=branch_map,
-            )
+            try:
+                success, error_msg = process_jira_mention(
+                    mention, registry, config, processed_set,
+                    branch_map=branch_map,
+                )
+            except Exception as e:
+                log.warning("Jira: failed to process mention %s: %s",
+                            mention.get("comment_id", "?"), e)
+                success, error_msg = False, None
+            comment_id = mention.get("comment_id", "")
+            if comment_id and not check_jira_already_processed(comment_id, processed_set):
+                unhandled.append(mention)
             if success:
                 missions_created += 1
                 issue_key = mention.get("issue_key", "?")
@@ -1136,10 +1150,16 @@ def process_jira_notifications(
             elif error_msg:
                 log.debug("Jira: mention skipped: %s", error_msg)
 
-        # Persist updated tracker
+        # Persist updated tracker, then move the watermarks and the poll
+        # window past what was handled — never past a failed mention.
         if mentions:
             from app.jira_notifications import _save_processed_tracker
             _save_processed_tracker(tracker_path, processed_set)
+        commit_jira_watermarks(watermark_path, result, unhandled)
+        if unhandled:
+            new_iso = since_value
+        with _jira_state_lock:
+            _last_jira_check_iso = new_iso
 
         # Update backoff
         with _jira_state_lock:
@@ -1221,6 +1241,12 @@ def interruptible_sleep(
         if _check_signal_file(koan_root, ".koan-shutdown"):
             return "shutdown"
 
+        # Local models: load the mission model just before the next
+        # iteration (wait states that won't run one are skipped).
+        if wake_on_mission:
+            from app.model_warmup import warm_before_iteration
+            warm_before_iteration(interval - elapsed)
+
         # Write run-loop heartbeat during sleep to signal liveness
         from app.health_check import write_run_heartbeat
         write_run_heartbeat(koan_root)
@@ -22,6 +22,39 @@ from app.messaging import register_provider
 FLOOD_WINDOW_SECONDS = 300  # 5 minutes
 MAX_MESSAGE_SIZE = DEFAULT_MAX_MESSAGE_SIZE
 
+# Upper bound on a honoured 429 retry_after, so one throttled send can't
+# stall its sender indefinitely.
+MAX_RETRY_AFTER_SECONDS = 60
+
+
+class TelegramRateLimited(requests.RequestException):
+    """Telegram answered 429 Too Many Requests.
+
+    ``retry_after`` is the wait (seconds) Telegram asked for.
+    """
+
+    def __init__(self, retry_after: float):
+        super().__init__(f"Telegram rate limit: retry after {retry_after}s")
+        self.retry_after = retry_after
+
+
+def check_rate_limit(data: dict) -> None:
+    """Raise TelegramRateLimited if an API response is a 429."""
+    if data.get("error_code") == 429:
+        params = data.get("parameters") or {}
+        try:
+            retry_after = float(params.get("retry_after", 1))
+        except (TypeError, ValueError):
+            retry_after = 1.0
+        raise TelegramRateLimited(retry_after)
+
+
+def rate_limit_delay(exc: BaseException) -> Optional[float]:
+    """``retry_with_backoff`` delay hook: honour Telegram's retry_after."""
+    if isinstance(exc, TelegramRateLimited):
+        return min(exc.retry_after, MAX_RETRY_AFTER_SECONDS)
+    return None
+
 # Pattern for markdown code blocks: ```optional_lang\ncode\n```
 _CODE_BLOCK_RE = re.compile(r'```(?:[a-zA-Z]*\n)?(.*?)```', re.DOTALL)
 
@@ -84,6 +117,10 @@ class TelegramProvider(MessagingProvider):
         # Message ID tracking — populated by _send_chunk(), cleared by _send_raw()
         self._last_message_ids: List[int] = []
 
+        # Keep-alive connection pool to api.telegram.org, shared by sends,
+        # typing indicators and long-polling.
+        self._session = requests.Session()
+
     # -- MessagingProvider interface ------------------------------------------
 
     def configure(self) -> bool:
@@ -165,7 +202,7 @@ class TelegramProvider(MessagingProvider):
         if offset is not None:
             params["offset"] = offset
         try:
-            resp = requests.get(
+            resp = self._session.get(
                 f"{self._api_base}/getUpdates",
                 params=params,
                 timeout=35,
@@ -245,7 +282,8 @@ class TelegramProvider(MessagingProvider):
         """Send text to the Telegram API (no flood check).
 
         Retries each chunk up to 3 times with exponential backoff (1s/2s/4s)
-        on transient network failures (connection errors, timeouts).
+        on transient network failures (connection errors, timeouts), or
+        after Telegram's retry_after when rate limited (429).
 
         If the text contains markdown code blocks (```), they are converted to
         HTML <pre> tags and sent with parse_mode=HTML so Telegram renders them
@@ -276,6 +314,7 @@ class TelegramProvider(MessagingProvider):
                 if retry_with_backoff(
                     lambda c=chunk, pm=parse_mode: self._send_chunk(c, pm),
                     retryable=(requests.RequestException, ValueError),
+                    get_retry_delay=rate_limit_delay,
                     label="telegram send",
                 ):
                     sent += 1
@@ -298,16 +337,20 @@ class TelegramProvider(MessagingProvider):
         return failed == 0
 
     def _send_chunk(self, chunk: str, parse_mode: str = None) -> bool:
-        """Send a single chunk via Telegram API. Raises on network error."""
+        """Send a single chunk via Telegram API.
+
+        Raises on network error, and TelegramRateLimited on a 429.
+        """
         payload = {"chat_id": self._chat_id, "text": chunk}
         if parse_mode:
             payload["parse_mode"] = parse_mode
-        resp = requests.post(
+        resp = self._session.post(
             f"{self._api_base}/sendMessage",
             json=payload,
             timeout=10,
         )
         data = resp.json()
+        check_rate_limit(data)
         if not data.get("ok"):
             print(
                 f"[telegram] API error: {resp.text[:200]}",
@@ -326,7 +369,7 @@ class TelegramProvider(MessagingProvider):
         if not self._bot_token or not self._chat_id:
             return False
         try:
-            resp = requests.post(
+            resp = self._session.post(
                 f"{self._api_base}/sendChatAction",
                 json={"chat_id": self._chat_id, "action": "typing"},
                 timeout=5,
@@ -6,6 +6,9 @@ keyword match AND description length threshold (same pattern as
 post_mission_reflection.is_significant_mission).
 
 Simple missions ("fix typo", "/plan something") skip spec generation.
+
+The opposite end of the scale, :func:`is_simple_mission`, lets model
+routing (app/model_router.py) send small chores to a lighter model.
 """
 
 import re
@@ -25,6 +28,37 @@ COMPLEXITY_KEYWORDS = [
     "integration",
 ]
 
+# Keywords marking small, mechanical chores a lighter model handles well
+# (plurals match too: "typos", "docstrings")
+SIMPLE_KEYWORDS = [
+    "typo",
+    "spelling",
+    "changelog",
+    "readme",
+    "docstring",
+    "bump",
+    "wording",
+    "docs",
+]
+
+# Broader words that only mark a chore in these phrasings: "fix lint
+# warnings" is a chore, "fix lint gate crash" a bug; "update comments" is
+# a chore, "PR comment is dropped" a bug.
+_SIMPLE_PHRASE_RE = re.compile(
+    r"\b(?:fix|update|add|remove|clarify|improve|reword)\w*\s+"
+    r"(?:(?:the|a|an|code|inline|outdated|stale|misleading)\s+)?comments?\b"
+    r"|\blint(?:ing)?\s+(?:warnings?|errors?|issues?|fixes|failures?)\b"
+    r"|^rename\b"
+)
+
+# A rename reaching these is a refactor, not a chore
+_WIDE_RENAME_WORDS = {
+    "all", "callers", "across", "every", "everywhere", "usages", "references",
+}
+
+# Longest description still considered a simple chore
+SIMPLE_MAX_LENGTH = 120
+
 # Default minimum description length (after stripping project prefix)
 DEFAULT_COMPLEXITY_THRESHOLD = 80
 
@@ -86,3 +120,43 @@ def is_complex_mission(title: str) -> bool:
     # Check keywords
     lower = stripped.lower()
     return any(kw in lower for kw in COMPLEXITY_KEYWORDS)
+
+
+def is_simple_mission(title: str) -> bool:
+    """Determine if a mission is a small chore fit for a lighter model.
+
+    Dual heuristic, mirroring :func:`is_complex_mission`:
+    - Simple keyword match (typo, changelog, readme, bump, etc.), or a
+      chore phrasing of a broader word ("update comments", "fix lint
+      warnings", a rename that doesn't touch all callers)
+    - Description shorter than SIMPLE_MAX_LENGTH and free of
+      complexity keywords
+
+    Skill missions (starting with /) and multi-line missions are never
+    simple.
+
+    Args:
+        title: The mission title text (may include [project:name] tag).
+
+    Returns:
+        True if the mission can run on the light model tier.
+    """
+    if not title or "\n" in title.strip():
+        return False
+
+    stripped = _strip_project_tag(title)
+    if not stripped or stripped.startswith("/"):
+        return False
+    if len(stripped) > SIMPLE_MAX_LENGTH:
+        return False
+
+    lower = stripped.lower()
+    words = set(re.findall(r"[a-z]+", lower))
+    if any(kw in words for kw in COMPLEXITY_KEYWORDS):
+        return False
+    if any(kw in words or kw + "s" in words for kw in SIMPLE_KEYWORDS):
+        return True
+    match = _SIMPLE_PHRASE_RE.search(lower)
+    if match and match.group(0).startswith("rename"):
+        return not words & _WIDE_RENAME_WORDS
+    return bool(match)
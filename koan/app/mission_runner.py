@@ -65,12 +65,16 @@ class _PipelineTracker:
 
     Each step is recorded as success/fail/skipped/timeout with optional
     detail (e.g. error message or elapsed time).
+
+    ``changes`` holds the branch's BranchChangeSet once computed, so the
+    verification, quality, lint and auto-merge steps share one git read.
     """
 
     VALID_STATUSES = ("success", "fail", "skipped", "timeout")
 
     def __init__(self):
         self.steps: Dict[str, dict] = {}
+        self.changes = None
 
     def record(self, step: str, status: str, detail: str = "") -> None:
         if status not in self.VALID_STATUSES:
@@ -180,6 +184,8 @@ def build_mission_command(
     project_name: str = "",
     plugin_dirs: Optional[List[str]] = None,
     system_prompt: str = "",
+    model_override: str = "",
+    max_turns: int = 0,
 ) -> List[str]:
     """Build the CLI command for mission execution (provider-agnostic).
 
@@ -190,6 +196,9 @@ def build_mission_command(
         project_name: Optional project name for per-project tool overrides.
         plugin_dirs: Optional list of plugin directory paths to load.
         system_prompt: Optional system prompt for cache-friendly positioning.
+        model_override: Model chosen by model routing (replaces the
+            mission/review model when set).
+        max_turns: Turn cap (0 = none).
 
     Returns:
         Complete command list ready for subprocess.
@@ -210,7 +219,11 @@ def build_mission_command(
     model = models["mission"]
     if autonomous_mode == "review" and models["review_mode"]:
         model = models["review_mode"]
+    if model_override:
+        model = model_override
     fallback = models["fallback"]
+    if fallback == model:
+        fallback = ""
 
     # Get MCP server configs
     mcp_configs = get_mcp_configs(project_name)
@@ -222,6 +235,7 @@ def build_mission_command(
         model=model,
         fallback=fallback,
         output_format="json",
+        max_turns=max_turns,
         mcp_configs=mcp_configs,
         plugin_dirs=plugin_dirs,
         system_prompt=system_prompt,
@@ -349,6 +363,7 @@ def _record_session_outcome(
     duration_minutes: int,
     journal_content: str,
     mission_title: str = "",
+    model_tier: str = "",
 ) -> None:
     """Record session outcome for staleness tracking (fire-and-forget)."""
     try:
@@ -360,6 +375,7 @@ def _record_session_outcome(
             duration_minutes=duration_minutes,
             journal_content=journal_content,
             mission_title=mission_title,
+            model_tier=model_tier,
         )
     except Exception as e:
         _log_runner("error", f"Session outcome recording failed: {e}")
@@ -548,11 +564,22 @@ def _get_quality_gate_mode(instance_dir: str, project_name: str) -> str:
     return "warn"
 
 
+def _load_branch_changes(project_path: str):
+    """Compute the branch's BranchChangeSet, or None if unavailable."""
+    try:
+        from app.branch_changes import compute_changeset
+        return compute_changeset(project_path)
+    except Exception as e:
+        _log_runner("error", f"Branch change snapshot failed: {e}")
+        return None
+
+
 def _run_quality_pipeline(
     instance_dir: str,
     project_name: str,
     project_path: str,
     report_fn,
+    changes=None,
 ) -> dict:
     """Run the post-mission quality pipeline.
 
@@ -572,18 +599,20 @@ def _run_quality_pipeline(
         test_timeout=120,
         gate_mode=gate_mode,
         status_callback=report_fn,
+        project_name=project_name,
+        changes=changes,
     )
 
 
 def _run_lint_gate(
-    instance_dir: str, project_name: str, project_path: str
+    instance_dir: str, project_name: str, project_path: str, changes=None,
 ):
     """Run lint gate, returning LintResult or None.
 
     Raises on error — caller (_PipelineTracker.run_step) handles recording.
     """
     from app.lint_gate import run_lint_gate
-    return run_lint_gate(project_path, project_name, instance_dir)
+    return run_lint_gate(project_path, project_name, instance_dir, changes=changes)
 
 
 def _is_lint_blocking(instance_dir: str, project_name: str) -> bool:
@@ -607,6 +636,7 @@ def _run_mission_verification(
     mission_title: str,
     exit_code: int,
     instance_dir: str,
+    changes=None,
 ):
     """Run post-mission semantic verification.
 
@@ -621,6 +651,7 @@ def _run_mission_verification(
         mission_title=mission_title,
         exit_code=exit_code,
         branch_prefix=branch_prefix,
+        changes=changes,
     )
     # Log result to console
     print(f"[mission_runner] {format_verify_result(result)}")
@@ -634,6 +665,7 @@ def check_auto_merge(
     quality_report: Optional[dict] = None,
     lint_blocked: bool = False,
     verify_blocked: bool = False,
+    changes=None,
 ) -> Optional[str]:
     """Check if current branch should be auto-merged.
 
@@ -644,13 +676,17 @@ def check_auto_merge(
         quality_report: Optional quality pipeline results for gating.
         lint_blocked: Whether lint gate is blocking auto-merge.
         verify_blocked: Whether verification failure is blocking auto-merge.
+        changes: Optional precomputed BranchChangeSet (for the branch name).
 
     Returns:
         Branch name if auto-merge was attempted, None otherwise.
     """
     try:
-        from app.git_sync import run_git
-        branch = run_git(project_path, "rev-parse", "--abbrev-ref", "HEAD")
+        if changes is not None:
+            branch = changes.branch
+        else:
+            from app.git_sync import run_git
+            branch = run_git(project_path, "rev-parse", "--abbrev-ref", "HEAD")
         if not branch:
             return None
         from app.config import get_branch_prefix
@@ -779,6 +815,7 @@ def run_post_mission(
     autonomous_mode: str = "",
     start_time: int = 0,
     status_callback: Optional[Callable[[str], None]] = None,
+    model_tier: str = "",
 ) -> dict:
     """Run the complete post-mission processing pipeline.
 
@@ -797,6 +834,8 @@ def run_post_mission(
         start_time: Mission start time as unix timestamp.
         status_callback: Optional callable to report progress during finalization.
             Called with a short description of the current step.
+        model_tier: Model routing tier the mission ran on (recorded in
+            session outcomes; empty when routing is off).
 
     Returns:
         Dict with keys:
@@ -902,7 +941,7 @@ def run_post_mission(
             _record_session_outcome(
                 instance_dir, project_name, autonomous_mode,
                 duration_minutes, pending_content,
-                mission_title=mission_title,
+                mission_title=mission_title, model_tier=model_tier,
             )
             # Fire post_mission hooks before early return so hooks see quota events
             _fire_post_mission_hook(
@@ -932,12 +971,16 @@ def run_post_mission(
             quality_report = {}
             lint_result = None
 
+            # One snapshot of the branch diff, shared by the steps below
+            tracker.changes = _load_branch_changes(project_path)
+
             # Mission verification (RARV Verify phase — semantic checks)
             _report("verifying mission output")
             verify_result = tracker.run_step(
                 "verification",
                 _run_mission_verification,
                 project_path, mission_title, exit_code, instance_dir,
+                changes=tracker.changes,
                 pipeline_expired=_pipeline_expired,
             )
             if verify_result is not None:
@@ -957,6 +1000,7 @@ def run_post_mission(
                 "quality_pipeline",
                 _run_quality_pipeline,
                 instance_dir, project_name, project_path, _report,
+                changes=tracker.changes,
                 pipeline_expired=_pipeline_expired,
             )
             if quality_report is None:
@@ -969,6 +1013,7 @@ def run_post_mission(
                 "lint_gate",
                 _run_lint_gate,
                 instance_dir, project_name, project_path,
+                changes=tracker.changes,
                 pipeline_expired=_pipeline_expired,
             )
             if lint_result is not None:
@@ -998,6 +1043,7 @@ def run_post_mission(
                 quality_report=quality_report,
                 lint_blocked=lint_blocking,
                 verify_blocked=verify_blocking,
+                changes=tracker.changes,
                 pipeline_expired=_pipeline_expired,
             )
             result["auto_merge_branch"] = merge_result
@@ -1012,7 +1058,7 @@ def run_post_mission(
         _record_session_outcome(
             instance_dir, project_name, autonomous_mode,
             duration_minutes, pending_content,
-            mission_title=mission_title,
+            mission_title=mission_title, model_tier=model_tier,
         )
         tracker.record("session_outcome", "success")
 
@@ -1051,6 +1097,9 @@ def run_post_mission(
         return result
     finally:
         _deadline_timer.cancel()
+        # The mission may have pushed a branch or opened a PR
+        from app.branch_limiter import invalidate_branch_state
+        invalidate_branch_state(project_name, _get_koan_root(instance_dir))
 
 
 def commit_instance(instance_dir: str, message: str = "") -> bool:
@@ -21,6 +21,8 @@ from dataclasses import dataclass, field
 from enum import Enum
 from typing import List, Optional
 
+from app.branch_changes import BASE_REF_CANDIDATES, BranchChangeSet
+from app.git_service import get_git_service
 from app.git_utils import run_git, run_git_strict
 
 
@@ -102,19 +104,20 @@ def expects_tests(title: str) -> bool:
 
 def _get_base_ref(project_path: str) -> Optional[str]:
     """Determine the base ref for diffing."""
-    for ref in ("upstream/main", "origin/main", "upstream/master", "origin/master"):
-        rc, _, _ = run_git("rev-parse", "--verify", ref, cwd=project_path)
-        if rc == 0:
-            return ref
-    return None
+    return get_git_service(project_path).first_existing(BASE_REF_CANDIDATES)
 
 
-def check_diff_coherence(project_path: str, branch_prefix: str) -> Check:
+def check_diff_coherence(
+    project_path: str, branch_prefix: str, changes: Optional[BranchChangeSet] = None,
+) -> Check:
     """Verify the branch has meaningful changes (not empty or trivially small).
 
     An empty branch after a code mission is a strong signal of failure.
     """
-    rc, branch, _ = run_git("rev-parse", "--abbrev-ref", "HEAD", cwd=project_path)
+    if changes is not None:
+        rc, branch = 0, changes.branch
+    else:
+        rc, branch, _ = run_git("rev-parse", "--abbrev-ref", "HEAD", cwd=project_path)
     if rc != 0 or not branch:
         return Check("diff_coherence", CheckStatus.SKIP, "Could not determine branch")
 
@@ -124,6 +127,17 @@ def check_diff_coherence(project_path: str, branch_prefix: str) -> Check:
     if not branch.startswith(branch_prefix):
         return Check("diff_coherence", CheckStatus.SKIP, f"Not on {branch_prefix}* branch")
 
+    if changes is not None:
+        if not changes.files:
+            return Check(
+                "diff_coherence", CheckStatus.FAIL,
+                "Branch has no changes compared to base"
+            )
+        return Check(
+            "diff_coherence", CheckStatus.PASS,
+            f"{len(changes.files)} file(s) changed"
+        )
+
     base_ref = _get_base_ref(project_path)
     if not base_ref:
         return Check("diff_coherence", CheckStatus.SKIP, "No base ref found")
@@ -159,7 +173,9 @@ def check_diff_coherence(project_path: str, branch_prefix: str) -> Check:
     )
 
 
-def check_test_coverage(project_path: str, mission_title: str) -> Check:
+def check_test_coverage(
+    project_path: str, mission_title: str, changes: Optional[BranchChangeSet] = None,
+) -> Check:
     """Verify that test files were modified for missions that should have tests.
 
     Only checks if test files were touched in the diff — does not run tests.
@@ -170,17 +186,20 @@ def check_test_coverage(project_path: str, mission_title: str) -> Check:
             "Mission type does not typically require tests"
         )
 
-    base_ref = _get_base_ref(project_path)
-    if not base_ref:
-        return Check("test_coverage", CheckStatus.SKIP, "No base ref found")
+    if changes is not None:
+        files = changes.paths
+    else:
+        base_ref = _get_base_ref(project_path)
+        if not base_ref:
+            return Check("test_coverage", CheckStatus.SKIP, "No base ref found")
 
-    rc, changed_files, _ = run_git(
-        "diff", "--name-only", f"{base_ref}...HEAD", cwd=project_path
-    )
-    if rc != 0 or not changed_files.strip():
+        rc, changed_files, _ = run_git(
+            "diff", "--name-only", f"{base_ref}...HEAD", cwd=project_path
+        )
+        files = changed_files.strip().splitlines() if rc == 0 else []
+    if not files:
         return Check("test_coverage", CheckStatus.SKIP, "Could not get changed files")
 
-    files = changed_files.strip().splitlines()
     test_files = [
         f for f in files
         if re.search(r'(?:^|/)tests?/', f)
@@ -199,7 +218,9 @@ def check_test_coverage(project_path: str, mission_title: str) -> Check:
     )
 
 
-def check_pr_created(project_path: str, mission_title: str) -> Check:
+def check_pr_created(
+    project_path: str, mission_title: str, changes: Optional[BranchChangeSet] = None,
+) -> Check:
     """Verify that a draft PR was created for code-changing missions.
 
     Uses `gh pr view` to check for an existing PR on the current branch.
@@ -211,7 +232,10 @@ def check_pr_created(project_path: str, mission_title: str) -> Check:
         )
 
     # Check if we're on a feature branch
-    rc, branch, _ = run_git("rev-parse", "--abbrev-ref", "HEAD", cwd=project_path)
+    if changes is not None:
+        rc, branch = 0, changes.branch
+    else:
+        rc, branch, _ = run_git("rev-parse", "--abbrev-ref", "HEAD", cwd=project_path)
     if rc != 0 or branch in ("main", "master", ""):
         return Check("pr_created", CheckStatus.SKIP, "Not on feature branch")
 
@@ -247,7 +271,9 @@ def check_pr_created(project_path: str, mission_title: str) -> Check:
         )
 
 
-def check_commit_quality(project_path: str) -> Check:
+def check_commit_quality(
+    project_path: str, changes: Optional[BranchChangeSet] = None,
+) -> Check:
     """Verify commit messages are clean and well-formed.
 
     Checks for:
@@ -255,17 +281,20 @@ def check_commit_quality(project_path: str) -> Check:
     - Leftover fixup/squash commits
     - Very short messages (< 10 chars)
     """
-    base_ref = _get_base_ref(project_path)
-    if not base_ref:
-        return Check("commit_quality", CheckStatus.SKIP, "No base ref found")
-
-    rc, log_output, _ = run_git(
-        "log", "--format=%s", f"{base_ref}..HEAD", cwd=project_path
-    )
-    if rc != 0 or not log_output.strip():
+    if changes is not None:
+        messages = changes.subjects
+    else:
+        base_ref = _get_base_ref(project_path)
+        if not base_ref:
+            return Check("commit_quality", CheckStatus.SKIP, "No base ref found")
+
+        rc, log_output, _ = run_git(
+            "log", "--format=%s", f"{base_ref}..HEAD", cwd=project_path
+        )
+        messages = log_output.strip().splitlines() if rc == 0 else []
+    if not messages:
         return Check("commit_quality", CheckStatus.SKIP, "No commits to check")
 
-    messages = log_output.strip().splitlines()
     issues = []
 
     for msg in messages:
@@ -289,7 +318,7 @@ def check_commit_quality(project_path: str) -> Check:
 
 
 def check_mission_alignment(
-    project_path: str, mission_title: str
+    project_path: str, mission_title: str, changes: Optional[BranchChangeSet] = None,
 ) -> Check:
     """Heuristic check that changed files/commits relate to the mission title.
 
@@ -321,17 +350,21 @@ def check_mission_alignment(
             "No meaningful keywords in mission title"
         )
 
-    base_ref = _get_base_ref(project_path)
-    if not base_ref:
-        return Check("mission_alignment", CheckStatus.SKIP, "No base ref found")
-
     # Get changed files and commit messages
-    rc, changed_files, _ = run_git(
-        "diff", "--name-only", f"{base_ref}...HEAD", cwd=project_path
-    )
-    rc2, commits, _ = run_git(
-        "log", "--format=%s", f"{base_ref}..HEAD", cwd=project_path
-    )
+    if changes is not None:
+        changed_files = "\n".join(changes.paths)
+        commits = "\n".join(changes.subjects)
+    else:
+        base_ref = _get_base_ref(project_path)
+        if not base_ref:
+            return Check("mission_alignment", CheckStatus.SKIP, "No base ref found")
+
+        rc, changed_files, _ = run_git(
+            "diff", "--name-only", f"{base_ref}...HEAD", cwd=project_path
+        )
+        rc2, commits, _ = run_git(
+            "log", "--format=%s", f"{base_ref}..HEAD", cwd=project_path
+        )
 
     corpus = (changed_files + " " + commits).lower()
 
@@ -365,6 +398,7 @@ def verify_mission(
     mission_title: str = "",
     exit_code: int = 0,
     branch_prefix: str = "koan/",
+    changes: Optional[BranchChangeSet] = None,
 ) -> VerifyResult:
     """Run the full post-mission verification pipeline.
 
@@ -373,6 +407,8 @@ def verify_mission(
         mission_title: Mission description (empty for autonomous sessions).
         exit_code: Claude CLI exit code.
         branch_prefix: Expected branch prefix.
+        changes: Optional precomputed BranchChangeSet; the checks read
+            from it instead of running their own git commands.
 
     Returns:
         VerifyResult with all check outcomes.
@@ -387,7 +423,7 @@ def verify_mission(
         ))
         # Still check diff coherence to see if partial work was done
         try:
-            checks.append(check_diff_coherence(project_path, branch_prefix))
+            checks.append(check_diff_coherence(project_path, branch_prefix, changes))
         except Exception as e:
             print(f"[verifier] diff_coherence failed: {e}", file=sys.stderr)
         result = VerifyResult(
@@ -401,11 +437,11 @@ def verify_mission(
     checks.append(Check("exit_code", CheckStatus.PASS, "Claude CLI exited successfully"))
 
     check_fns = [
-        lambda: check_diff_coherence(project_path, branch_prefix),
-        lambda: check_test_coverage(project_path, mission_title),
-        lambda: check_pr_created(project_path, mission_title),
-        lambda: check_commit_quality(project_path),
-        lambda: check_mission_alignment(project_path, mission_title),
+        lambda: check_diff_coherence(project_path, branch_prefix, changes),
+        lambda: check_test_coverage(project_path, mission_title, changes),
+        lambda: check_pr_created(project_path, mission_title, changes),
+        lambda: check_commit_quality(project_path, changes),
+        lambda: check_mission_alignment(project_path, mission_title, changes),
     ]
 
     for fn in check_fns:
@@ -1655,11 +1655,13 @@ def add_ci_item(
     branch: str,
     full_repo: str,
     max_attempts: int,
+    attempt: int = 0,
 ) -> str:
     """Add or refresh a CI monitoring entry in the ## CI section.
 
-    Deduplicates by pr_url — if already present, resets the attempt counter
-    to 0 (fresh CI run, e.g. after a rebase force-push).
+    Deduplicates by pr_url — if already present, the entry is replaced and
+    its attempt counter set to *attempt*: 0 for a fresh CI run (e.g. after
+    a rebase force-push), the current count when a CI fix is re-parked.
 
     Returns the updated content string.
     """
@@ -1672,7 +1674,7 @@ def add_ci_item(
     tag = f"[project:{project_name}] " if project_name else ""
     new_line = (
         f"- {tag}{pr_url} branch:{branch} repo:{full_repo}"
-        f" queued:{queued} (attempt 0/{max_attempts})"
+        f" queued:{queued} (attempt {attempt}/{max_attempts})"
     )
 
     # Remove any existing entry for this PR URL (dedup / reset)
@@ -0,0 +1,123 @@
+"""
+Kōan -- Complexity-based model routing for missions.
+
+Every mission used to run on ``models.mission``.  With ``model_routing``
+enabled in config.yaml, small chores — typo fixes, changelog entries,
+README tweaks (see ``mission_complexity.is_simple_mission``) — run on the
+lighter ``light_model`` with a turn cap, which finishes them faster and
+spends less quota.
+
+History keeps the heuristic honest: light-tier sessions are recorded in
+``session_outcomes.json`` with their ``model_tier`` and ``work_type``
+(``mission_classifier.classify_mission``).  When the light tier keeps
+failing a work type on a project, that type goes back to the mission
+model.  A failed light-tier run is re-run once on the mission model by
+``run._maybe_retry_mission`` and recorded as ``"escalated"``.
+
+Pure decision logic apart from reading the outcomes file.
+"""
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+TIER_LIGHT = "light"
+TIER_STANDARD = "standard"
+TIER_ESCALATED = "escalated"
+
+# Light-tier history needed before it can veto the light tier
+MIN_HISTORY = 3
+
+# Light-tier productive rate below which a work type stops routing light
+MIN_LIGHT_SUCCESS_RATE = 0.5
+
+# Most recent light-tier sessions considered per (project, work type)
+HISTORY_WINDOW = 10
+
+
+@dataclass
+class ModelRoute:
+    """Model choice for one mission run."""
+
+    tier: str
+    model: str = ""  # "" = keep models.mission
+    max_turns: int = 0  # 0 = no cap
+    reason: str = ""
+
+    @property
+    def is_light(self) -> bool:
+        return self.tier == TIER_LIGHT
+
+
+def _light_success_rate(
+    instance_dir: str,
+    project_name: str,
+    work_type: str,
+) -> Optional[float]:
+    """Productive rate of recent light-tier runs, None without enough history."""
+    from app.session_tracker import load_outcomes
+
+    outcomes = load_outcomes(Path(instance_dir) / "session_outcomes.json")
+    runs = [
+        o for o in outcomes
+        if o.get("project") == project_name
+        and o.get("work_type") == work_type
+        and o.get("model_tier") in (TIER_LIGHT, TIER_ESCALATED)
+    ][-HISTORY_WINDOW:]
+    if len(runs) < MIN_HISTORY:
+        return None
+    productive = sum(
+        1 for o in runs
+        if o.get("model_tier") == TIER_LIGHT and o.get("outcome") == "productive"
+    )
+    return productive / len(runs)
+
+
+def route_mission(
+    instance_dir: str,
+    project_name: str,
+    mission_title: str,
+    autonomous_mode: str = "implement",
+) -> Optional[ModelRoute]:
+    """Pick the model tier for a mission.
+
+    Returns None when routing is disabled.  Autonomous runs, review mode
+    and anything not recognised as a simple chore stay on the standard
+    tier.
+    """
+    from app.config import get_model_routing_config
+
+    cfg = get_model_routing_config()
+    if not cfg["enabled"] or not cfg["light_model"]:
+        return None
+    if not mission_title or autonomous_mode == "review":
+        return ModelRoute(TIER_STANDARD, reason="not a mission")
+
+    from app.mission_complexity import is_simple_mission
+    if not is_simple_mission(mission_title):
+        return ModelRoute(TIER_STANDARD, reason="not a simple mission")
+
+    from app.mission_classifier import classify_mission
+    work_type = classify_mission(mission_title)
+    rate = _light_success_rate(instance_dir, project_name, work_type)
+    if rate is not None and rate < MIN_LIGHT_SUCCESS_RATE:
+        return ModelRoute(
+            TIER_STANDARD,
+            reason=f"light tier {rate:.0%} productive on {work_type} missions",
+        )
+
+    return ModelRoute(
+        TIER_LIGHT,
+        model=cfg["light_model"],
+        max_turns=cfg["light_max_turns"],
+        reason=f"simple {work_type} mission",
+    )
+
+
+def should_escalate(route: ModelRoute) -> bool:
+    """Whether a failed run on *route* gets one retry on the mission model."""
+    if not route.is_light:
+        return False
+    from app.config import get_model_routing_config
+
+    return get_model_routing_config()["escalate_on_failure"]
@@ -0,0 +1,204 @@
+"""
+Kōan -- Keep local models loaded when they are about to be used.
+
+With ``cli_provider: local`` or ``ollama-launch``, Ollama unloads a model
+after a few idle minutes, and the run loop's sleeps between iterations
+are usually longer than that — so the first call of each iteration, and
+any chat message after a quiet spell, waited 10-60s for the model to be
+read back into memory.
+
+This module asks the Ollama server to load a model (``/api/generate``
+with no prompt) ahead of use, with a ``keep_alive`` matching the
+schedule:
+
+- ``warm_before_iteration`` — called on every ``interruptible_sleep``
+  tick; once the next iteration is ``lead_seconds`` away, the mission
+  model is loaded and kept until shortly after the iteration starts.
+- ``warm_for_mission`` — called when a mission or autonomous run is
+  about to start (e.g. woken early by a new mission).
+- ``warm_for_chat`` — called when a chat message arrives, and again
+  after the reply (the chat's own requests reset Ollama's idle timer to
+  its default), keeping the chat model loaded for ``chat_keep_alive``
+  seconds so follow-up messages answer immediately.
+
+Loads run on a daemon thread and are throttled per (server, model): a
+model already kept warm long enough is not requested again, and a server
+that rejects the request is left alone.  Other providers are untouched.
+"""
+
+import http.client
+import json
+import os
+import threading
+import time
+import urllib.error
+import urllib.request
+from typing import Dict, Set, Tuple
+
+WARMUP_PROVIDERS = ("local", "ollama-launch")
+
+# Seconds a preloaded mission model stays loaded past the expected start
+# of the iteration (preflight, git sync and prompt building come first).
+MISSION_MARGIN = 300
+
+# A model already warm until this close to the wanted time is not reloaded.
+REFRESH_SLACK = 60
+
+# Wait before retrying a server that failed to answer.
+FAILURE_BACKOFF = 300
+
+# Loading a large model from disk can take over a minute.
+LOAD_TIMEOUT = 180
+
+DEFAULT_OLLAMA_HOST = "http://127.0.0.1:11434"
+
+_lock = threading.Lock()
+_warm_until: Dict[Tuple[str, str], float] = {}
+_retry_after: Dict[Tuple[str, str], float] = {}
+_unsupported: Set[Tuple[str, str]] = set()
+_in_flight: Set[Tuple[str, str]] = set()
+
+
+def _log(message: str) -> None:
+    try:
+        from app.run_log import log
+        log("warmup", message)
+    except ImportError:
+        print(f"[warmup] {message}")
+
+
+def _server_url(provider_name: str) -> str:
+    """Root URL of the Ollama server behind *provider_name*."""
+    if provider_name == "local":
+        from app.provider.local import LocalLLMProvider
+
+        base = LocalLLMProvider()._get_base_url().rstrip("/")
+        return base[:-3] if base.endswith("/v1") else base
+    host = os.environ.get("OLLAMA_HOST", "") or DEFAULT_OLLAMA_HOST
+    if "://" not in host:
+        host = f"http://{host}"
+    return host.rstrip("/")
+
+
+def _model_for(purpose: str, provider_name: str) -> str:
+    """Model the provider will run for *purpose* ("mission" or "chat")."""
+    from app.config import get_model_config
+    from app.provider import get_provider_by_name
+
+    configured = get_model_config().get(purpose, "")
+    if configured:
+        return configured
+    return get_provider_by_name(provider_name)._get_default_model()
+
+
+def _load(key: Tuple[str, str], keep_alive: int) -> None:
+    """Load the model on the server and record how long it stays warm."""
+    server, model = key
+    body = json.dumps({"model": model, "keep_alive": keep_alive}).encode()
+    request = urllib.request.Request(
+        f"{server}/api/generate", data=body,
+        headers={"Content-Type": "application/json"},
+    )
+    started = time.time()
+    try:
+        with urllib.request.urlopen(request, timeout=LOAD_TIMEOUT) as resp:
+            resp.read()
+        with _lock:
+            _warm_until[key] = time.time() + keep_alive
+        elapsed = time.time() - started
+        if elapsed >= 1:
+            _log(f"Loaded {model} in {elapsed:.0f}s (kept {keep_alive}s)")
+    except urllib.error.HTTPError as e:
+        # Not an Ollama server (no /api/generate) or unknown model:
+        # retrying won't help until the config changes.
+        with _lock:
+            _unsupported.add(key)
+        _log(f"Preloading {model} not supported by {server} (HTTP {e.code})")
+    except (urllib.error.URLError, http.client.HTTPException, OSError) as e:
+        with _lock:
+            _retry_after[key] = time.time() + FAILURE_BACKOFF
+        _log(f"Could not preload {model} from {server}: {e}")
+    finally:
+        with _lock:
+            _in_flight.discard(key)
+
+
+def preload(
+    purpose: str,
+    keep_alive: int,
+    background: bool = True,
+    force: bool = False,
+    model: str = "",
+) -> bool:
+    """Load the *purpose* model and keep it for *keep_alive* seconds.
+
+    *model* overrides the model configured for *purpose* (e.g. the light
+    model picked by model routing).  No-op (returns False) unless the
+    current provider is local or ollama-launch, warm-keeping is enabled,
+    and — without *force* — the model isn't already kept warm that long.
+    Returns True when a load was issued.
+    """
+    from app.provider import get_provider_name
+
+    if keep_alive <= 0:
+        return False
+    provider_name = get_provider_name()
+    if provider_name not in WARMUP_PROVIDERS:
+        return False
+    from app.config import get_model_warmup_config
+
+    if not get_model_warmup_config()["enabled"]:
+        return False
+    model = model or _model_for(purpose, provider_name)
+    if not model:
+        return False
+
+    key = (_server_url(provider_name), model)
+    keep_alive = int(keep_alive)
+    now = time.time()
+    with _lock:
+        if key in _unsupported or key in _in_flight:
+            return False
+        if _retry_after.get(key, 0) > now:
+            return False
+        if not force and _warm_until.get(key, 0) >= now + keep_alive - REFRESH_SLACK:
+            return False
+        _in_flight.add(key)
+
+    if background:
+        threading.Thread(
+            target=_load, args=(key, keep_alive), name="model-warmup", daemon=True,
+        ).start()
+    else:
+        _load(key, keep_alive)
+    return True
+
+
+def warm_before_iteration(seconds_left: float) -> bool:
+    """Preload the mission model once the next iteration is close."""
+    from app.config import get_model_warmup_config
+
+    if seconds_left > get_model_warmup_config()["lead_seconds"]:
+        return False
+    return preload("mission", int(seconds_left) + MISSION_MARGIN)
+
+
+def warm_for_mission(model: str = "") -> bool:
+    """Preload the model for a run that is starting now.
+
+    *model* is the model the run was routed to; "" means ``models.mission``.
+    """
+    return preload("mission", MISSION_MARGIN, model=model)
+
+
+def warm_for_chat(after_reply: bool = False) -> bool:
+    """Keep the chat model loaded for the chat keep-alive window.
+
+    *after_reply* re-sends the keep-alive even if the model was warmed
+    when the message arrived, since the chat itself shortened it.
+    """
+    from app.config import get_model_warmup_config
+
+    return preload(
+        "chat", get_model_warmup_config()["chat_keep_alive"], force=after_reply,
+    )
@@ -13,11 +13,14 @@ Usage from Python:
     send_telegram("Mission completed: security audit")
 """
 
+import atexit
 import logging
 import os
+import queue
 import subprocess
 import sys
 import threading
+import time
 from enum import Enum
 from pathlib import Path
 from typing import Dict, Optional, Tuple
@@ -198,13 +201,29 @@ def _send_raw_bypass_flood(text: str) -> bool:
         return _direct_send(text)
 
 
+_direct_session = None
+_direct_session_lock = threading.Lock()
+
+
+def _get_direct_session():
+    """Return the keep-alive requests.Session used by the direct send path."""
+    global _direct_session
+    with _direct_session_lock:
+        if _direct_session is None:
+            import requests
+            _direct_session = requests.Session()
+        return _direct_session
+
+
 def _direct_send(text: str) -> bool:
     """Direct Telegram API send (standalone fallback when provider unavailable).
 
     Retries each chunk up to 3 times with exponential backoff (1s/2s/4s)
-    on transient network failures.
+    on transient network failures, or after Telegram's retry_after when
+    rate limited.
     """
     import requests
+    from app.messaging.telegram import rate_limit_delay
     from app.retry import retry_with_backoff
 
     load_dotenv()
@@ -238,6 +257,7 @@ def _direct_send(text: str) -> bool:
             if retry_with_backoff(
                 lambda c=chunk, pm=parse_mode: _direct_send_chunk(api_base, chat_id, c, pm),
                 retryable=(requests.RequestException, ValueError),
+                get_retry_delay=rate_limit_delay,
                 label="telegram direct send",
             ):
                 sent += 1
@@ -261,18 +281,22 @@ def _direct_send(text: str) -> bool:
 
 def _direct_send_chunk(api_base: str, chat_id: str, chunk: str,
                        parse_mode: str = None) -> bool:
-    """Send a single message chunk via Telegram API. Raises on network error."""
-    import requests
+    """Send a single message chunk via Telegram API.
+
+    Raises on network error, and TelegramRateLimited on a 429.
+    """
+    from app.messaging.telegram import check_rate_limit
 
     payload = {"chat_id": chat_id, "text": chunk}
     if parse_mode:
         payload["parse_mode"] = parse_mode
-    resp = requests.post(
+    resp = _get_direct_session().post(
         f"{api_base}/sendMessage",
         json=payload,
         timeout=10,
     )
     data = resp.json()
+    check_rate_limit(data)
     if not data.get("ok"):
         print(f"[notify] Telegram API error: {resp.text[:200]}",
               file=sys.stderr)
@@ -280,6 +304,130 @@ def _direct_send_chunk(api_base: str, chat_id: str, chunk: str,
     return True
 
 
+# ---------------------------------------------------------------------------
+# Background send queue
+# ---------------------------------------------------------------------------
+#
+# Delivering a notification can take seconds (Claude formatting, network,
+# 429 waits).  The run loop starts a single background sender so its
+# notifications are queued and the loop moves on; delivery order is kept.
+# Processes that never start it (bridge, CLI, workers) send inline.
+
+class _SendQueue:
+    """Single-thread FIFO executor for notification calls."""
+
+    def __init__(self):
+        self._queue: "queue.Queue" = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+
+    @property
+    def running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        with self._lock:
+            if self.running:
+                return
+            self._thread = threading.Thread(
+                target=self._run, name="notify-sender", daemon=True,
+            )
+            self._thread.start()
+
+    def submit(self, fn, args, kwargs) -> bool:
+        """Queue a call. Returns False if the sender is not running."""
+        if not self.running:
+            return False
+        self._queue.put((fn, args, kwargs))
+        return True
+
+    def _run(self) -> None:
+        while True:
+            item = self._queue.get()
+            try:
+                if item is None:
+                    return
+                fn, args, kwargs = item
+                fn(*args, **kwargs)
+            except Exception as e:
+                log.warning("Queued notification failed: %s", e)
+            finally:
+                self._queue.task_done()
+
+    def flush(self, timeout: float) -> bool:
+        """Wait until every queued call has run. Returns False on timeout."""
+        deadline = time.monotonic() + timeout
+        with self._queue.all_tasks_done:
+            while self._queue.unfinished_tasks:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0 or not self.running:
+                    return False
+                self._queue.all_tasks_done.wait(remaining)
+        return True
+
+    def stop(self, timeout: float) -> bool:
+        """Flush, then stop the sender thread."""
+        flushed = self.flush(timeout)
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is not None and thread.is_alive():
+            self._queue.put(None)
+            thread.join(timeout=1)
+        return flushed
+
+
+_send_queue = _SendQueue()
+
+# Default wait for queued notifications at shutdown.
+SEND_QUEUE_FLUSH_TIMEOUT = 30.0
+
+
+def start_send_queue() -> None:
+    """Start the background sender; later send_async() calls are queued.
+
+    Queued notifications are flushed at interpreter exit.
+    """
+    _send_queue.start()
+
+
+def send_async(fn, *args, **kwargs) -> bool:
+    """Run a notification call on the background sender.
+
+    ``fn`` is e.g. ``send_telegram`` or ``format_and_send``.  When the
+    sender is not running the call happens inline (and its exceptions
+    propagate), so callers work the same in every process.
+
+    Returns:
+        True if queued; otherwise the inline call's result.
+    """
+    if _send_queue.submit(fn, args, kwargs):
+        return True
+    return fn(*args, **kwargs)
+
+
+def flush_send_queue(timeout: float = SEND_QUEUE_FLUSH_TIMEOUT) -> bool:
+    """Wait for queued notifications to be delivered.
+
+    Returns False if some were still pending after *timeout* seconds.
+    """
+    return _send_queue.flush(timeout)
+
+
+def stop_send_queue(timeout: float = SEND_QUEUE_FLUSH_TIMEOUT) -> bool:
+    """Flush queued notifications and stop the background sender."""
+    return _send_queue.stop(timeout)
+
+
+def _reset_send_queue_after_fork() -> None:
+    """Give a forked child its own (stopped) send queue."""
+    global _send_queue
+    _send_queue = _SendQueue()
+
+
+atexit.register(flush_send_queue)
+os.register_at_fork(after_in_child=_reset_send_queue_after_fork)
+
+
 def _apply_priority_emoji(text: str, priority: NotificationPriority) -> str:
     """Prepend priority emoji to text for urgent and warning messages.
 
@@ -12,6 +12,8 @@ import subprocess
 import sys
 from typing import Optional
 
+from app.branch_changes import BASE_REF_CANDIDATES
+from app.git_service import get_git_service
 from app.git_utils import run_git_strict
 
 
@@ -47,15 +49,25 @@ SECRETS_PATTERNS = [
 ]
 
 
+# All scan rules as (compiled pattern, issue type, message).  Added lines
+# are matched against _ANY_RULE first — one regex pass for the (common)
+# clean line — and only lines that hit something run the individual rules.
+_SCAN_RULES = (
+    [(re.compile(p), "debug", m) for p, m in DEBUG_PATTERNS]
+    + [(re.compile(p), "marker", m) for p, m in MARKER_PATTERNS]
+    + [(re.compile(p, re.IGNORECASE), "secret", m) for p, m in SECRETS_PATTERNS]
+)
+_ANY_RULE = re.compile("|".join(
+    [f"(?:{p})" for p, _ in DEBUG_PATTERNS + MARKER_PATTERNS]
+    + [f"(?i:{p})" for p, _ in SECRETS_PATTERNS]
+))
+
+# Files with more added lines than this are flagged for review.
+LARGE_CHANGE_LINES = 500
+
 def _get_base_ref(project_path: str) -> Optional[str]:
     """Determine the base ref for diffing (upstream/main or origin/main)."""
-    for ref in ("upstream/main", "origin/main", "upstream/master", "origin/master"):
-        try:
-            run_git_strict("rev-parse", "--verify", ref, cwd=project_path)
-            return ref
-        except (RuntimeError, subprocess.CalledProcessError):
-            continue
-    return None
+    return get_git_service(project_path).first_existing(BASE_REF_CANDIDATES)
 
 
 def _parse_diff_added_lines(diff_text: str) -> list:
@@ -92,9 +104,14 @@ def _parse_diff_added_lines(diff_text: str) -> list:
     return results
 
 
-def scan_changes(project_path: str) -> dict:
+def scan_changes(project_path: str, changes=None) -> dict:
     """Scan diff between base branch and HEAD for quality issues.
 
+    Args:
+        project_path: Path to the project root.
+        changes: Optional precomputed BranchChangeSet; when given, no git
+            commands are run.
+
     Returns:
         Dict with keys:
             issues: list of {type, file, line, message}
@@ -102,6 +119,18 @@ def scan_changes(project_path: str) -> dict:
     """
     result = {"issues": [], "clean": True}
 
+    if changes is not None:
+        if changes.branch in ("main", "master") or not changes.files:
+            return result
+        issues = _scan_added_lines(changes.iter_added_lines())
+        issues.extend(
+            _large_change_issue(f.path, f.added)
+            for f in changes.files if f.added > LARGE_CHANGE_LINES
+        )
+        result["issues"] = issues
+        result["clean"] = len(issues) == 0
+        return result
+
     base_ref = _get_base_ref(project_path)
     if not base_ref:
         return result
@@ -128,50 +157,32 @@ def scan_changes(project_path: str) -> dict:
     if not diff.strip():
         return result
 
-    added_lines = _parse_diff_added_lines(diff)
-    issues = []
+    issues = _scan_added_lines(_parse_diff_added_lines(diff))
 
-    for filepath, line_num, content in added_lines:
-        # Skip binary files, test files, and config files
-        if _should_skip_file(filepath):
-            continue
+    # Check for large file changes
+    issues.extend(_check_large_changes(diff))
 
-        # Check debug patterns
-        for pattern, message in DEBUG_PATTERNS:
-            if re.search(pattern, content):
-                issues.append({
-                    "type": "debug",
-                    "file": filepath,
-                    "line": line_num,
-                    "message": message,
-                })
+    result["issues"] = issues
+    result["clean"] = len(issues) == 0
+    return result
 
-        # Check TODO/FIXME markers
-        for pattern, message in MARKER_PATTERNS:
-            if re.search(pattern, content):
-                issues.append({
-                    "type": "marker",
-                    "file": filepath,
-                    "line": line_num,
-                    "message": message,
-                })
 
-        # Check secrets patterns
-        for pattern, message in SECRETS_PATTERNS:
-            if re.search(pattern, content, re.IGNORECASE):
+def _scan_added_lines(added_lines) -> list:
+    """Run the scan rules over ``(file, line_number, content)`` tuples."""
+    issues = []
+    for filepath, line_num, content in added_lines:
+        # Most lines match nothing; skip test, config and generated files
+        if not _ANY_RULE.search(content) or _should_skip_file(filepath):
+            continue
+        for pattern, issue_type, message in _SCAN_RULES:
+            if pattern.search(content):
                 issues.append({
-                    "type": "secret",
+                    "type": issue_type,
                     "file": filepath,
                     "line": line_num,
                     "message": message,
                 })
-
-    # Check for large file changes
-    issues.extend(_check_large_changes(diff))
-
-    result["issues"] = issues
-    result["clean"] = len(issues) == 0
-    return result
+    return issues
 
 
 def _should_skip_file(filepath: str) -> bool:
@@ -188,6 +199,15 @@ def _should_skip_file(filepath: str) -> bool:
     return False
 
 
+def _large_change_issue(filepath: str, added_count: int) -> dict:
+    return {
+        "type": "large_change",
+        "file": filepath,
+        "line": 0,
+        "message": f"{added_count} lines added",
+    }
+
+
 def _check_large_changes(diff_text: str) -> list:
     """Check for files with unusually large changes (>500 lines added)."""
     issues = []
@@ -197,26 +217,16 @@ def _check_large_changes(diff_text: str) -> list:
     for line in diff_text.splitlines():
         if line.startswith("+++ b/"):
             # Emit issue for previous file if large
-            if current_file and added_count > 500:
-                issues.append({
-                    "type": "large_change",
-                    "file": current_file,
-                    "line": 0,
-                    "message": f"{added_count} lines added",
-                })
+            if current_file and added_count > LARGE_CHANGE_LINES:
+                issues.append(_large_change_issue(current_file, added_count))
             current_file = line[6:]
             added_count = 0
         elif line.startswith("+") and not line.startswith("+++"):
             added_count += 1
 
     # Check last file
-    if current_file and added_count > 500:
-        issues.append({
-            "type": "large_change",
-            "file": current_file,
-            "line": 0,
-            "message": f"{added_count} lines added",
-        })
+    if current_file and added_count > LARGE_CHANGE_LINES:
+        issues.append(_large_change_issue(current_file, added_count))
 
     return issues
 
@@ -225,12 +235,14 @@ def _check_large_changes(diff_text: str) -> list:
 # Phase 3: Branch hygiene validation
 # ---------------------------------------------------------------------------
 
-def validate_branch(project_path: str, branch_prefix: str) -> dict:
+def validate_branch(project_path: str, branch_prefix: str, changes=None) -> dict:
     """Validate branch naming, commit messages, and git hygiene.
 
     Args:
         project_path: Path to the project root.
         branch_prefix: Expected branch prefix (e.g. "koan/").
+        changes: Optional precomputed BranchChangeSet (branch, base ref
+            and commit subjects are taken from it).
 
     Returns:
         Dict with keys:
@@ -239,17 +251,20 @@ def validate_branch(project_path: str, branch_prefix: str) -> dict:
     """
     result = {"valid": True, "issues": []}
 
-    try:
-        branch = run_git_strict(
-            "rev-parse", "--abbrev-ref", "HEAD", cwd=project_path
-        )
-    except (RuntimeError, subprocess.CalledProcessError):
-        result["valid"] = False
-        result["issues"].append({
-            "type": "branch",
-            "message": "Could not determine current branch",
-        })
-        return result
+    if changes is not None:
+        branch = changes.branch
+    else:
+        try:
+            branch = run_git_strict(
+                "rev-parse", "--abbrev-ref", "HEAD", cwd=project_path
+            )
+        except (RuntimeError, subprocess.CalledProcessError):
+            result["valid"] = False
+            result["issues"].append({
+                "type": "branch",
+                "message": "Could not determine current branch",
+            })
+            return result
 
     if branch in ("main", "master"):
         # Not on a feature branch — nothing to validate
@@ -263,7 +278,7 @@ def validate_branch(project_path: str, branch_prefix: str) -> dict:
         })
 
     # Get base ref
-    base_ref = _get_base_ref(project_path)
+    base_ref = changes.base_ref if changes is not None else _get_base_ref(project_path)
     if not base_ref:
         result["issues"].append({
             "type": "base",
@@ -273,14 +288,22 @@ def validate_branch(project_path: str, branch_prefix: str) -> dict:
         return result
 
     # Check if branch has commits ahead of base
-    try:
-        log_output = run_git_strict(
-            "log", "--oneline", f"{base_ref}..HEAD", cwd=project_path
-        )
-    except (RuntimeError, subprocess.CalledProcessError):
-        log_output = ""
+    if changes is not None:
+        messages = changes.subjects
+    else:
+        try:
+            log_output = run_git_strict(
+                "log", "--oneline", f"{base_ref}..HEAD", cwd=project_path
+            )
+        except (RuntimeError, subprocess.CalledProcessError):
+            log_output = ""
+        # Format: "abc1234 commit message"
+        messages = [
+            line.split(" ", 1)[1] if " " in line else line
+            for line in log_output.strip().splitlines()
+        ]
 
-    if not log_output.strip():
+    if not messages:
         result["issues"].append({
             "type": "empty",
             "message": "Branch has no commits ahead of base",
@@ -288,12 +311,8 @@ def validate_branch(project_path: str, branch_prefix: str) -> dict:
         result["valid"] = False
         return result
 
-    commits = log_output.strip().splitlines()
-
     # Check for leftover fixup/squash commits
-    for commit_line in commits:
-        # Format: "abc1234 commit message"
-        msg = commit_line.split(" ", 1)[1] if " " in commit_line else commit_line
+    for msg in messages:
         if msg.startswith(("fixup!", "squash!", "amend!")):
             result["issues"].append({
                 "type": "fixup",
@@ -317,8 +336,7 @@ def validate_branch(project_path: str, branch_prefix: str) -> dict:
             r'^(?:feat|fix|docs|style|refactor|perf|test|build|ci|chore|revert)'
             r'(?:\([^)]+\))?!?:\s'
         )
-        for commit_line in commits:
-            msg = commit_line.split(" ", 1)[1] if " " in commit_line else commit_line
+        for msg in messages:
             # Skip fixup/squash (already flagged)
             if msg.startswith(("fixup!", "squash!", "amend!")):
                 continue
@@ -359,12 +377,15 @@ def _project_uses_conventional_commits(project_path: str, base_ref: str) -> bool
 # Phase 4: PR description enrichment
 # ---------------------------------------------------------------------------
 
-def enrich_pr_description(project_path: str, quality_report: dict) -> Optional[str]:
+def enrich_pr_description(
+    project_path: str, quality_report: dict, changes=None,
+) -> Optional[str]:
     """Update existing draft PR with quality report footer.
 
     Args:
         project_path: Path to the project root.
         quality_report: Combined results from all quality phases.
+        changes: Optional precomputed BranchChangeSet.
 
     Returns:
         PR URL if enriched, None if no PR found or enrichment skipped.
@@ -372,12 +393,15 @@ def enrich_pr_description(project_path: str, quality_report: dict) -> Optional[s
     from app.github import run_gh
 
     # Check if a PR exists for the current branch
-    try:
-        branch = run_git_strict(
-            "rev-parse", "--abbrev-ref", "HEAD", cwd=project_path
-        )
-    except (RuntimeError, subprocess.CalledProcessError):
-        return None
+    if changes is not None:
+        branch = changes.branch
+    else:
+        try:
+            branch = run_git_strict(
+                "rev-parse", "--abbrev-ref", "HEAD", cwd=project_path
+            )
+        except (RuntimeError, subprocess.CalledProcessError):
+            return None
 
     if branch in ("main", "master"):
         return None
@@ -405,7 +429,7 @@ def enrich_pr_description(project_path: str, quality_report: dict) -> Optional[s
         return None
 
     # Build quality report section
-    report_section = _build_quality_report_section(quality_report, project_path)
+    report_section = _build_quality_report_section(quality_report, project_path, changes)
 
     # Remove any previous quality report from the body
     separator = "---\n### Quality Report"
@@ -426,19 +450,21 @@ def enrich_pr_description(project_path: str, quality_report: dict) -> Optional[s
         return None
 
 
-def _build_quality_report_section(report: dict, project_path: str) -> str:
+def _build_quality_report_section(report: dict, project_path: str, changes=None) -> str:
     """Build the markdown quality report section for PR body."""
     from app.claude_step import _get_diffstat
 
     lines = ["---", "### Quality Report", ""]
 
     # Diffstat
-    base_ref = _get_base_ref(project_path)
-    if base_ref:
-        diffstat = _get_diffstat(base_ref, project_path)
-        if diffstat:
-            lines.append(f"**Changes**: {diffstat}")
-            lines.append("")
+    if changes is not None:
+        diffstat = changes.diffstat()
+    else:
+        base_ref = _get_base_ref(project_path)
+        diffstat = _get_diffstat(base_ref, project_path) if base_ref else ""
+    if diffstat:
+        lines.append(f"**Changes**: {diffstat}")
+        lines.append("")
 
     # Code scan results
     scan = report.get("scan", {})
@@ -580,6 +606,8 @@ def run_quality_pipeline(
     test_timeout: int = 120,
     gate_mode: str = "warn",
     status_callback=None,
+    project_name: str = "",
+    changes=None,
 ) -> dict:
     """Run the full post-mission quality pipeline.
 
@@ -590,6 +618,11 @@ def run_quality_pipeline(
         test_timeout: Timeout for test execution in seconds.
         gate_mode: Quality gate mode (strict/warn/off).
         status_callback: Optional callable for status updates.
+        project_name: Project name for test impact config lookup
+            (defaults to the directory name).
+        changes: Optional precomputed BranchChangeSet shared with the
+            other post-mission steps; the scan, branch validation and
+            PR enrichment read from it instead of re-running git.
 
     Returns:
         Dict with keys: scan, tests, branch, pr_enriched, gate_blocked, gate_comment.
@@ -608,12 +641,15 @@ def run_quality_pipeline(
     }
 
     # Early exit: check if we're on a feature branch
-    try:
-        branch = run_git_strict(
-            "rev-parse", "--abbrev-ref", "HEAD", cwd=project_path
-        )
-    except (RuntimeError, subprocess.CalledProcessError):
-        return result
+    if changes is not None:
+        branch = changes.branch
+    else:
+        try:
+            branch = run_git_strict(
+                "rev-parse", "--abbrev-ref", "HEAD", cwd=project_path
+            )
+        except (RuntimeError, subprocess.CalledProcessError):
+            return result
 
     if branch in ("main", "master"):
         return result
@@ -624,7 +660,7 @@ def run_quality_pipeline(
     # Phase 1: Code quality scan
     _report("scanning changes")
     try:
-        result["scan"] = scan_changes(project_path)
+        result["scan"] = scan_changes(project_path, changes=changes)
     except Exception as e:
         print(f"[pr_quality] Code scan failed: {e}", file=sys.stderr)
         result["scan"] = {"issues": [], "clean": True}
@@ -634,12 +670,13 @@ def run_quality_pipeline(
         _report("running tests")
         try:
             from app.pr_review import detect_test_command
-            from app.claude_step import run_project_tests
+            from app.test_impact import run_impacted_tests
 
             test_cmd = detect_test_command(project_path)
             if test_cmd:
-                test_result = run_project_tests(
-                    project_path, test_cmd=test_cmd, timeout=test_timeout,
+                test_result = run_impacted_tests(
+                    project_path, test_cmd, timeout=test_timeout,
+                    project_name=project_name,
                 )
                 result["tests"] = {
                     "passed": test_result["passed"],
@@ -659,7 +696,7 @@ def run_quality_pipeline(
     # Phase 3: Branch hygiene
     _report("validating branch")
     try:
-        result["branch"] = validate_branch(project_path, branch_prefix)
+        result["branch"] = validate_branch(project_path, branch_prefix, changes=changes)
     except Exception as e:
         print(f"[pr_quality] Branch validation failed: {e}", file=sys.stderr)
         result["branch"] = {"valid": True, "issues": []}
@@ -667,7 +704,7 @@ def run_quality_pipeline(
     # Phase 4: PR enrichment
     _report("enriching PR description")
     try:
-        result["pr_enriched"] = enrich_pr_description(project_path, result)
+        result["pr_enriched"] = enrich_pr_description(project_path, result, changes=changes)
     except Exception as e:
         print(f"[pr_quality] PR enrichment failed: {e}", file=sys.stderr)
 
@@ -22,12 +22,12 @@ from app.claude_step import (
     _run_git,
     _rebase_onto_target,
     run_claude_step as _run_claude_step,
-    run_project_tests,
 )
 from app.config import get_skill_max_turns
 from app.github import run_gh, sanitize_github_comment
 from app.prompts import load_prompt_or_skill
 from app.rebase_pr import fetch_pr_context, _find_remote_for_repo
+from app.test_impact import run_impacted_tests
 
 # Matches skill names like `team.refactor` or my.review (with or without backticks)
 _SKILL_RE = re.compile(r'`?([a-zA-Z0-9_-]+\.(?:refactor|review))\b`?')
@@ -289,7 +289,7 @@ def run_pr_review(
     test_cmd = detect_test_command(project_path)
     if test_cmd:
         notify_fn("Running tests...")
-        test_result = run_project_tests(project_path, test_cmd=test_cmd)
+        test_result = run_impacted_tests(project_path, test_cmd)
         if test_result["passed"]:
             actions_log.append(
                 f"Tests passing ({test_result.get('details', 'OK')})"
@@ -315,7 +315,7 @@ def run_pr_review(
             )
 
             # Re-run tests to confirm
-            retest = run_project_tests(project_path, test_cmd=test_cmd)
+            retest = run_impacted_tests(project_path, test_cmd)
             if retest["passed"]:
                 actions_log.append("Tests fixed and passing")
             else:
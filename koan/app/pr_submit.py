@@ -183,6 +183,9 @@ def submit_draft_pr(
         logger.warning("Failed to create PR: %s", e)
         return None
 
+    from app.branch_limiter import invalidate_branch_state
+    invalidate_branch_state(project_name)
+
     # Comment on the issue with the PR link
     if issue_url:
         try:
@@ -244,6 +244,8 @@ def merge_pr(
             cwd=project_path, timeout=30,
         )
         _invalidate_cache(project_name)
+        from app.branch_limiter import invalidate_branch_state
+        invalidate_branch_state(project_name, koan_root)
         return {"ok": True, "error": None, "url": output}
     except (RuntimeError, subprocess.TimeoutExpired, OSError) as e:
         return {"ok": False, "error": str(e), "url": ""}
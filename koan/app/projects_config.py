@@ -258,9 +258,8 @@ def get_project_cli_provider(config: dict, project_name: str) -> str:
     Returns the provider name ("claude", "copilot", "local") or empty string
     if not configured (meaning: use the global provider).
 
-    Note: Data accessor only — the provider resolution in cli_provider.py
-    does not yet call this. Per-project provider switching requires changes
-    to get_provider() to accept a project_name parameter.
+    Honoured by the provider pool (app/provider_pool.py), which pins the
+    project's missions to this provider.
     """
     project_cfg = get_project_config(config, project_name)
     return str(project_cfg.get("cli_provider", "")).strip().lower()
@@ -306,6 +306,75 @@ def _get_security_flagging_section(mission_title: str, autonomous_mode: str) ->
     return load_prompt("security-flagging")
 
 
+def _get_autonomous_context(
+    instance: str,
+    project_name: str,
+    project_path: str,
+    autonomous_mode: str,
+    mission_title: str,
+) -> dict:
+    """Collect the optional context sections for an autonomous run.
+
+    Returns an ordered dict of section name → text (empty for
+    mission-driven runs, where none of these sections apply).
+    """
+    context = {}
+    if mission_title:
+        return context
+
+    # Staleness warning (all autonomous modes — cheap local read)
+    context["staleness"] = _get_staleness_section(instance, project_name)
+
+    # Drift detection (shows what changed on main)
+    context["drift"] = _get_drift_section(instance, project_name, project_path)
+
+    # PR merge feedback (helps topic alignment)
+    if autonomous_mode in ("deep", "implement"):
+        context["pr_feedback"] = _get_pr_feedback_section(project_path)
+
+    # Deep research suggestions (DEEP mode only)
+    if autonomous_mode == "deep":
+        context["deep_research"] = _get_deep_research(instance, project_name, project_path)
+
+    return context
+
+
+# Cut order when the mission budget is tight: research first, staleness last.
+_CONTEXT_PRIORITIES = {
+    "staleness": 1,
+    "drift": 2,
+    "pr_feedback": 3,
+    "deep_research": 4,
+}
+
+
+def _pack_autonomous_context(context: dict, fixed_text: str) -> str:
+    """Fit autonomous context sections into the mission token budget.
+
+    The template, spec and policy sections in *fixed_text* are pinned;
+    the optional sections share whatever budget they leave, trimmed by
+    ``_CONTEXT_PRIORITIES``.
+    """
+    if not any(context.values()):
+        return ""
+
+    from app.config import get_context_budget
+    from app.context_packer import Section, estimate_tokens, pack_sections
+
+    budget = get_context_budget("mission") - estimate_tokens(fixed_text)
+    packed = pack_sections(
+        [
+            Section(name, text.strip(), priority=_CONTEXT_PRIORITIES[name], keep="head")
+            for name, text in context.items()
+        ],
+        budget=max(0, budget),
+        label="mission",
+    )
+    return "".join(
+        f"\n\n{packed.get(name)}\n" for name in context if packed.get(name)
+    )
+
+
 def _build_mission_instruction(mission_title: str, project_name: str) -> str:
     """Build the mission instruction text for the agent prompt."""
     if mission_title:
@@ -485,41 +554,32 @@ def build_agent_prompt(
     # Append submit-pull-request section
     prompt += _get_submit_pr_section(project_path)
 
-    # Append staleness warning (all autonomous modes — cheap local read)
-    if not mission_title:
-        prompt += _get_staleness_section(instance, project_name)
-
-    # Append drift detection (autonomous only — shows what changed on main)
-    if not mission_title:
-        prompt += _get_drift_section(instance, project_name, project_path)
-
-    # Append PR merge feedback (autonomous only — helps topic alignment)
-    if not mission_title and autonomous_mode in ("deep", "implement"):
-        prompt += _get_pr_feedback_section(project_path)
-
-    # Append deep research suggestions (DEEP mode, autonomous only)
-    if autonomous_mode == "deep" and not mission_title:
-        prompt += _get_deep_research(instance, project_name, project_path)
+    # Autonomous-only context (staleness, drift, PR feedback, deep research),
+    # packed into the mission token budget below
+    context = _get_autonomous_context(
+        instance, project_name, project_path, autonomous_mode, mission_title,
+    )
 
-    # Append TDD mode section if mission is tagged [tdd]
-    prompt += _get_tdd_section(mission_title)
+    # TDD mode section if mission is tagged [tdd]
+    tail = _get_tdd_section(mission_title)
 
-    # Append testing anti-patterns reference for [tdd] or test-expecting missions
-    prompt += _get_testing_antipatterns_section(mission_title)
+    # Testing anti-patterns reference for [tdd] or test-expecting missions
+    tail += _get_testing_antipatterns_section(mission_title)
 
-    # Append verification gate for mission-driven runs
-    prompt += _get_verification_gate_section(mission_title)
+    # Verification gate for mission-driven runs
+    tail += _get_verification_gate_section(mission_title)
 
-    # Append focus mode section if active
-    prompt += _get_focus_section(instance)
+    # Focus mode section if active
+    tail += _get_focus_section(instance)
 
-    # Append verbose mode section if active
-    prompt += _get_verbose_section(instance)
+    # Verbose mode section if active
+    tail += _get_verbose_section(instance)
 
-    # Append language preference (overrides soul.md default)
-    prompt += _get_language_section()
+    # Language preference (overrides soul.md default)
+    tail += _get_language_section()
 
-    return prompt
+    prompt += _pack_autonomous_context(context, prompt + tail)
+    return prompt + tail
 
 
 def build_agent_prompt_parts(
@@ -556,21 +616,11 @@ def build_agent_prompt_parts(
     # Append mission type guidance (mission-driven runs only)
     user_prompt += _get_mission_type_section(mission_title)
 
-    # Append staleness warning (all autonomous modes — cheap local read)
-    if not mission_title:
-        user_prompt += _get_staleness_section(instance, project_name)
-
-    # Append drift detection (autonomous only — shows what changed on main)
-    if not mission_title:
-        user_prompt += _get_drift_section(instance, project_name, project_path)
-
-    # Append PR merge feedback (autonomous only — helps topic alignment)
-    if not mission_title and autonomous_mode in ("deep", "implement"):
-        user_prompt += _get_pr_feedback_section(project_path)
-
-    # Append deep research suggestions (DEEP mode, autonomous only)
-    if autonomous_mode == "deep" and not mission_title:
-        user_prompt += _get_deep_research(instance, project_name, project_path)
+    # Autonomous-only context (staleness, drift, PR feedback, deep research),
+    # packed into the mission token budget once the system prompt is known
+    context = _get_autonomous_context(
+        instance, project_name, project_path, autonomous_mode, mission_title,
+    )
 
     # --- System prompt: stable sections (best for cache prefix matching) ---
     # These rarely change between consecutive missions on the same project.
@@ -610,6 +660,8 @@ def build_agent_prompt_parts(
 
     system_prompt = "\n\n".join(part for part in sys_parts if part)
 
+    user_prompt += _pack_autonomous_context(context, user_prompt + system_prompt)
+
     return system_prompt, user_prompt
 
 
@@ -10,6 +10,10 @@ Configuration:
     config.yaml:  cli_provider: "claude"   (default)
     env var:      KOAN_CLI_PROVIDER=codex  (overrides config.yaml)
 
+When the provider pool is enabled (see app/provider_pool.py), the agent
+loop selects a provider per mission and activates it with
+set_provider_override() inside a provider_scope().
+
 Package structure:
     provider/base.py         — CLIProvider base class + tool constants
     provider/claude.py       — ClaudeProvider implementation
@@ -23,6 +27,8 @@ Package structure:
 import os
 import subprocess
 import sys
+from contextlib import contextmanager
+from contextvars import ContextVar
 from typing import List, Optional
 
 # Re-export base class and constants for convenience
@@ -56,22 +62,57 @@ _PROVIDERS = {
 _cached_provider: Optional[CLIProvider] = None
 _cached_provider_name: str = ""
 
+# Provider chosen for the current mission by the provider pool.  A
+# ContextVar so background threads (deferred startup, git sync) keep
+# resolving the configured provider.
+_provider_override: ContextVar[str] = ContextVar("koan_provider_override", default="")
+
 
 def reset_provider():
     """Reset the cached provider (for testing)."""
     global _cached_provider, _cached_provider_name
     _cached_provider = None
     _cached_provider_name = ""
+    _provider_override.set("")
+
+
+def set_provider_override(name: str) -> None:
+    """Route CLI calls in the current context to provider *name*.
+
+    Unknown names and "" clear the override.  Call inside
+    :func:`provider_scope` so the override ends with the mission.
+    """
+    _provider_override.set(name if name in _PROVIDERS else "")
+
+
+def get_provider_override() -> str:
+    """Provider pool override for the current context ("" = none)."""
+    return _provider_override.get()
+
+
+@contextmanager
+def provider_scope():
+    """Restore the previous provider override when the block exits."""
+    token = _provider_override.set(_provider_override.get())
+    try:
+        yield
+    finally:
+        _provider_override.reset(token)
 
 
 def get_provider_name() -> str:
     """Determine which CLI provider to use.
 
     Resolution order:
-    1. KOAN_CLI_PROVIDER env var (with CLI_PROVIDER fallback; highest priority)
-    2. config.yaml cli_provider key
-    3. Default: "claude"
+    1. Provider pool override for the current mission
+    2. KOAN_CLI_PROVIDER env var (with CLI_PROVIDER fallback)
+    3. config.yaml cli_provider key
+    4. Default: "claude"
     """
+    override = _provider_override.get()
+    if override:
+        return override
+
     # Lazy import to avoid circular dependency
     from app.utils import get_cli_provider_env, load_config
 
@@ -90,6 +131,16 @@ def get_provider_name() -> str:
     return "claude"
 
 
+def is_known_provider(name: str) -> bool:
+    """Check if *name* is a registered provider."""
+    return name in _PROVIDERS
+
+
+def get_provider_by_name(name: str) -> CLIProvider:
+    """Instantiate provider *name* (KeyError if unknown)."""
+    return _PROVIDERS[name]()
+
+
 def get_provider() -> CLIProvider:
     """Get the configured CLI provider instance (cached singleton)."""
     global _cached_provider, _cached_provider_name
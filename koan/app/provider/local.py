@@ -20,6 +20,7 @@ class LocalLLMProvider(CLIProvider):
             base_url: "http://localhost:11434/v1"  # Ollama default
             model: "glm4:latest"
             api_key: ""  # Usually empty for local servers
+            stream: true  # Stream completions (progress on stderr)
 
     Key differences from Claude/Copilot:
         - No external binary: runs local_llm_runner.py via Python
@@ -109,4 +110,9 @@ class LocalLLMProvider(CLIProvider):
         api_key = self._get_api_key()
         if api_key:
             cmd.extend(["--api-key", api_key])
+        if self._get_config().get("stream", True) is False:
+            cmd.append("--no-stream")
+        context_tokens = self._get_config().get("context_tokens")
+        if isinstance(context_tokens, int) and not isinstance(context_tokens, bool):
+            cmd.extend(["--context-tokens", str(context_tokens)])
         return cmd
@@ -0,0 +1,253 @@
+"""
+Kōan -- CLI provider pool.
+
+With several provider subscriptions configured (``provider_pool`` in
+config.yaml), each mission runs on the best eligible provider instead of
+the single global ``cli_provider``, and a quota hit on one provider fails
+over to the next instead of pausing the whole agent.
+
+A provider is eligible when its CLI is installed (``is_available()``)
+and it is not marked exhausted.  Eligible providers are ranked by::
+
+    cost weight x rolling mission duration / smoothed success rate
+
+with ties broken by the order of ``provider_pool.providers``.  A project
+that sets ``cli_provider`` in projects.yaml is pinned to that provider.
+
+Per-provider state lives in ``instance/.provider-pool.json``::
+
+    {
+        "codex": {
+            "exhausted_until": 1760000000,
+            "durations": [312, 95, ...],     # seconds, last WINDOW missions
+            "outcomes": [1, 1, 0, ...]       # 1 = success
+        }
+    }
+
+Writes go through an fcntl lock, like ``ci_queue.py``.
+"""
+
+import fcntl
+import json
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional
+
+# Missions kept per provider for the rolling latency/success stats.
+WINDOW = 20
+
+
+@dataclass
+class ProviderStatus:
+    """Pool view of one provider."""
+
+    name: str
+    cost: float = 1.0
+    available: bool = True
+    exhausted_until: int = 0
+    durations: List[int] = field(default_factory=list)
+    outcomes: List[int] = field(default_factory=list)
+
+    def is_exhausted(self, now: Optional[float] = None) -> bool:
+        return self.exhausted_until > (time.time() if now is None else now)
+
+    @property
+    def avg_duration(self) -> Optional[float]:
+        if not self.durations:
+            return None
+        return sum(self.durations) / len(self.durations)
+
+    @property
+    def success_rate(self) -> float:
+        """Success rate with a +1/+2 prior, so one failure isn't fatal."""
+        return (sum(self.outcomes) + 1) / (len(self.outcomes) + 2)
+
+
+def _state_path(instance_dir) -> Path:
+    return Path(instance_dir) / ".provider-pool.json"
+
+
+def _lock_path(instance_dir) -> Path:
+    return Path(instance_dir) / ".provider-pool.lock"
+
+
+def _load(instance_dir) -> Dict[str, dict]:
+    path = _state_path(instance_dir)
+    if not path.exists():
+        return {}
+    try:
+        data = json.loads(path.read_text())
+        return data if isinstance(data, dict) else {}
+    except (json.JSONDecodeError, OSError):
+        return {}
+
+
+def _save(instance_dir, state: Dict[str, dict]) -> None:
+    from app.utils import atomic_write
+
+    atomic_write(_state_path(instance_dir), json.dumps(state, indent=2) + "\n")
+
+
+def _update(instance_dir, name: str, fn) -> None:
+    """Apply *fn* to provider *name*'s entry under the state lock."""
+    with open(_lock_path(instance_dir), "a") as lf:
+        fcntl.flock(lf, fcntl.LOCK_EX)
+        try:
+            state = _load(instance_dir)
+            entry = state.get(name)
+            if not isinstance(entry, dict):
+                entry = {}
+            fn(entry)
+            state[name] = entry
+            _save(instance_dir, state)
+        finally:
+            fcntl.flock(lf, fcntl.LOCK_UN)
+
+
+def _is_enabled(pool_cfg: dict) -> bool:
+    if not pool_cfg["enabled"]:
+        return False
+    # An explicit KOAN_CLI_PROVIDER wins over the pool.
+    from app.utils import get_cli_provider_env
+
+    return not get_cli_provider_env()
+
+
+# ---------------------------------------------------------------------------
+# Status and selection
+# ---------------------------------------------------------------------------
+
+def get_pool_status(instance_dir) -> List[ProviderStatus]:
+    """Return the status of every pooled provider, in config order.
+
+    Empty when the pool is disabled.
+    """
+    from app.config import get_provider_pool_config
+    from app.provider import get_provider_by_name, is_known_provider
+
+    pool_cfg = get_provider_pool_config()
+    if not _is_enabled(pool_cfg):
+        return []
+    state = _load(instance_dir)
+    statuses = []
+    for name in pool_cfg["providers"]:
+        if not is_known_provider(name):
+            continue
+        entry = state.get(name) if isinstance(state.get(name), dict) else {}
+        try:
+            available = get_provider_by_name(name).is_available()
+        except Exception as e:
+            print(f"[provider_pool] Availability check failed for {name}: {e}")
+            available = False
+        statuses.append(ProviderStatus(
+            name=name,
+            cost=pool_cfg["costs"].get(name, 1.0),
+            available=available,
+            exhausted_until=int(entry.get("exhausted_until", 0) or 0),
+            durations=[int(d) for d in entry.get("durations", [])][-WINDOW:],
+            outcomes=[1 if o else 0 for o in entry.get("outcomes", [])][-WINDOW:],
+        ))
+    return statuses
+
+
+def rank_providers(
+    statuses: List[ProviderStatus],
+    now: Optional[float] = None,
+) -> List[ProviderStatus]:
+    """Order eligible providers best first.
+
+    Providers without duration samples are scored with the mean duration
+    of the others, so a new provider is tried on cost alone.
+    """
+    eligible = [s for s in statuses if s.available and not s.is_exhausted(now)]
+    known = [s.avg_duration for s in eligible if s.avg_duration is not None]
+    default_duration = sum(known) / len(known) if known else 1.0
+
+    def score(status: ProviderStatus) -> float:
+        duration = status.avg_duration
+        if duration is None:
+            duration = default_duration
+        return status.cost * max(duration, 1.0) / status.success_rate
+
+    order = {s.name: i for i, s in enumerate(statuses)}
+    return sorted(eligible, key=lambda s: (score(s), order[s.name]))
+
+
+def select_provider(instance_dir, project_name: str = "") -> str:
+    """Pick the provider for the next mission.
+
+    Returns the provider name, or "" when the pool is disabled or no
+    pooled provider is eligible (the caller then keeps the configured
+    provider).
+    """
+    from app.config import get_project_cli_provider
+    from app.provider import is_known_provider
+
+    statuses = get_pool_status(instance_dir)
+    if not statuses:
+        return ""
+    pinned = get_project_cli_provider(project_name)
+    if pinned and is_known_provider(pinned):
+        return pinned
+    ranked = rank_providers(statuses)
+    return ranked[0].name if ranked else ""
+
+
+# ---------------------------------------------------------------------------
+# Feedback
+# ---------------------------------------------------------------------------
+
+def record_outcome(instance_dir, name: str, duration: float, success: bool) -> None:
+    """Add one mission's duration and result to *name*'s rolling stats."""
+    if not name:
+        return
+
+    def apply(entry: dict) -> None:
+        entry["durations"] = (list(entry.get("durations", [])) + [int(duration)])[-WINDOW:]
+        entry["outcomes"] = (list(entry.get("outcomes", [])) + [1 if success else 0])[-WINDOW:]
+
+    try:
+        _update(instance_dir, name, apply)
+    except OSError as e:
+        print(f"[provider_pool] Could not record outcome for {name}: {e}")
+
+
+def mark_exhausted(instance_dir, name: str, until_ts: int) -> None:
+    """Take *name* out of the pool until *until_ts* (UNIX seconds)."""
+
+    def apply(entry: dict) -> None:
+        entry["exhausted_until"] = int(until_ts)
+
+    _update(instance_dir, name, apply)
+
+
+def fail_over(koan_root: str, instance_dir, name: str, project_name: str = "") -> str:
+    """Handle quota exhaustion of pooled provider *name*.
+
+    Call after the quota pause has been created: the pause's reset time
+    becomes *name*'s exhaustion window.  If another pooled provider is
+    still eligible (and the project isn't pinned to *name*), the quota
+    pause is lifted and that provider's name is returned; otherwise ""
+    and the pause stays — every subscription is dry.
+    """
+    from app.pause_manager import QUOTA_RETRY_SECONDS, get_pause_state, remove_pause
+
+    if not name or not get_pool_status(instance_dir):
+        return ""
+    pause = get_pause_state(koan_root)
+    until_ts = int(time.time()) + QUOTA_RETRY_SECONDS
+    if pause is not None and pause.is_quota and pause.timestamp > time.time():
+        until_ts = pause.timestamp
+    try:
+        mark_exhausted(instance_dir, name, until_ts)
+    except OSError as e:
+        print(f"[provider_pool] Could not mark {name} exhausted: {e}")
+        return ""
+
+    next_name = select_provider(instance_dir, project_name)
+    if not next_name or next_name == name:
+        return ""
+    if pause is not None and pause.is_quota:
+        remove_pause(koan_root)
+    return next_name
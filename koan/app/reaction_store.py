@@ -7,10 +7,13 @@ correlating them with conversation history messages.
 
 import fcntl
 import json
+from contextlib import closing
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional
 
+from app.tail_reader import iter_lines_reverse, tail_jsonl
+
 
 def save_reaction(
     reactions_file: Path,
@@ -70,26 +73,10 @@ def load_recent_reactions(
         return []
 
     try:
-        with open(reactions_file, "r", encoding="utf-8") as f:
-            fcntl.flock(f, fcntl.LOCK_SH)
-            try:
-                lines = f.readlines()
-            finally:
-                fcntl.flock(f, fcntl.LOCK_UN)
+        return tail_jsonl(reactions_file, max_reactions)
     except OSError:
         return []
 
-    reactions = []
-    for line in lines:
-        line = line.strip()
-        if line:
-            try:
-                reactions.append(json.loads(line))
-            except json.JSONDecodeError:
-                continue
-
-    return reactions[-max_reactions:] if len(reactions) > max_reactions else reactions
-
 
 def lookup_message_context(
     history_file: Path,
@@ -107,27 +94,22 @@ def lookup_message_context(
     if not history_file.exists():
         return None
 
+    # Reactions target recent messages: scan newest-first and stop early.
     try:
-        with open(history_file, "r", encoding="utf-8") as f:
-            fcntl.flock(f, fcntl.LOCK_SH)
-            try:
-                lines = f.readlines()
-            finally:
-                fcntl.flock(f, fcntl.LOCK_UN)
+        with closing(iter_lines_reverse(history_file)) as lines:
+            for line in lines:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    msg = json.loads(line)
+                except json.JSONDecodeError:
+                    continue
+                if msg.get("message_id") == message_id:
+                    return msg
     except OSError:
         return None
 
-    for line in reversed(lines):
-        line = line.strip()
-        if not line:
-            continue
-        try:
-            msg = json.loads(line)
-            if msg.get("message_id") == message_id:
-                return msg
-        except json.JSONDecodeError:
-            continue
-
     return None
 
 
@@ -0,0 +1,235 @@
+"""
+Kōan -- Map-reduce helpers for reviewing large PRs.
+
+A multi-thousand-line diff does not fit in one review call: it hits
+context limits and the single CLI run takes many minutes.  The review
+runner instead splits the diff into chunks under a token budget
+(:func:`partition_diff`), reviews the chunks concurrently, and folds the
+per-chunk JSON reviews back into one ``review_schema`` document
+(:func:`merge_reviews`).
+
+Partitioning keeps files of the same directory together so each chunk
+reviews a coherent module; a single file larger than the budget is split
+at hunk boundaries, repeating its ``diff --git`` header in each piece.
+"""
+
+import re
+from typing import Dict, List, Optional, Tuple
+
+from app.context_packer import CHARS_PER_TOKEN, estimate_tokens
+
+_FILE_SPLIT_RE = re.compile(r"(?=^diff --git )", re.MULTILINE)
+_HUNK_SPLIT_RE = re.compile(r"(?=^@@ )", re.MULTILINE)
+_DIFF_PATH_RE = re.compile(r"^diff --git a/(.+?) b/(.+)$", re.MULTILINE)
+
+_SEVERITY_RANK = {"critical": 0, "warning": 1, "suggestion": 2}
+
+
+# ---------------------------------------------------------------------------
+# Map: diff partitioning
+# ---------------------------------------------------------------------------
+
+def split_diff_files(diff: str) -> List[Tuple[str, str]]:
+    """Split a unified diff into ``(path, block)`` pairs, in diff order.
+
+    Text before the first ``diff --git`` line (if any) is dropped.
+    Returns an empty list when the diff has no file headers.
+    """
+    files = []
+    for block in _FILE_SPLIT_RE.split(diff):
+        match = _DIFF_PATH_RE.match(block)
+        if match:
+            files.append((match.group(2), block))
+    return files
+
+
+def _split_oversized(block: str, max_chars: int) -> List[str]:
+    """Split one file block at hunk boundaries into pieces under max_chars.
+
+    Each piece carries the file header.  A single hunk larger than the
+    budget is kept whole — truncating it would hide code from the review.
+    """
+    parts = _HUNK_SPLIT_RE.split(block)
+    header, hunks = parts[0], parts[1:]
+    if not hunks:
+        return [block]
+    pieces: List[str] = []
+    current = header
+    for hunk in hunks:
+        if current != header and len(current) + len(hunk) > max_chars:
+            pieces.append(current)
+            current = header
+        current += hunk
+    pieces.append(current)
+    return pieces
+
+
+def _module_of(path: str) -> str:
+    return path.rsplit("/", 1)[0] if "/" in path else ""
+
+
+def partition_diff(diff: str, max_tokens: int) -> List[str]:
+    """Partition *diff* into chunks of at most ~max_tokens each.
+
+    Files are grouped by directory (module) and packed in diff order;
+    a module that does not fit the remaining budget starts a new chunk.
+    Returns ``[diff]`` unchanged when it already fits or cannot be split.
+    """
+    if estimate_tokens(diff) <= max_tokens:
+        return [diff]
+    files = split_diff_files(diff)
+    if len(files) == 0:
+        return [diff]
+
+    max_chars = max_tokens * CHARS_PER_TOKEN
+
+    # Group blocks by module, preserving first-seen order.
+    modules: Dict[str, List[str]] = {}
+    for path, block in files:
+        pieces = _split_oversized(block, max_chars) if len(block) > max_chars else [block]
+        modules.setdefault(_module_of(path), []).extend(pieces)
+
+    chunks: List[str] = []
+    current = ""
+    for blocks in modules.values():
+        module_text = "".join(blocks)
+        if current and len(current) + len(module_text) > max_chars:
+            chunks.append(current)
+            current = ""
+        for block in blocks:
+            if current and len(current) + len(block) > max_chars:
+                chunks.append(current)
+                current = ""
+            current += block
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def chunk_files(chunk: str) -> List[str]:
+    """File paths touched by a diff chunk, without duplicates."""
+    seen: List[str] = []
+    for path, _ in split_diff_files(chunk):
+        if path not in seen:
+            seen.append(path)
+    return seen
+
+
+# ---------------------------------------------------------------------------
+# Reduce: merging per-chunk reviews
+# ---------------------------------------------------------------------------
+
+def _finding_key(comment: dict) -> Tuple[str, int, str]:
+    title = re.sub(r"\W+", " ", str(comment.get("title", ""))).strip().lower()
+    return (comment.get("file", ""), int(comment.get("line_start", 0) or 0), title)
+
+
+def _merge_file_comments(reviews: List[dict]) -> List[dict]:
+    """Concatenate findings, keeping the most severe copy of duplicates.
+
+    Duplicates arise when a file was split across chunks, or when two
+    chunks flag the same cross-cutting issue at the same location.
+    """
+    merged: Dict[Tuple[str, int, str], dict] = {}
+    for review in reviews:
+        for comment in review.get("file_comments", []):
+            key = _finding_key(comment)
+            kept = merged.get(key)
+            if kept is None or (
+                _SEVERITY_RANK.get(comment.get("severity"), 3)
+                < _SEVERITY_RANK.get(kept.get("severity"), 3)
+            ):
+                merged[key] = comment
+    return sorted(
+        merged.values(),
+        key=lambda c: (_SEVERITY_RANK.get(c.get("severity"), 3), c.get("file", "")),
+    )
+
+
+def _merge_checklist(reviews: List[dict]) -> List[dict]:
+    """Merge checklists by item: an item passes only if it passed everywhere."""
+    merged: Dict[str, dict] = {}
+    for review in reviews:
+        for entry in review.get("review_summary", {}).get("checklist", []):
+            key = str(entry.get("item", "")).strip().lower()
+            kept = merged.get(key)
+            if kept is None:
+                merged[key] = dict(entry)
+            elif kept.get("passed") and not entry.get("passed"):
+                merged[key] = dict(entry)
+    return list(merged.values())
+
+
+def _merge_plan_alignment(reviews: List[dict]) -> Optional[dict]:
+    alignments = [r["plan_alignment"] for r in reviews if isinstance(r.get("plan_alignment"), dict)]
+    if not alignments:
+        return None
+
+    def union(key: str) -> List[str]:
+        items: List[str] = []
+        for alignment in alignments:
+            for item in alignment.get(key, []):
+                if item not in items:
+                    items.append(item)
+        return items
+
+    met = union("requirements_met")
+    # Each chunk sees part of the diff: a requirement is missing only if
+    # no chunk found it implemented.
+    missing = [item for item in union("requirements_missing") if item not in met]
+    return {
+        "requirements_met": met,
+        "requirements_missing": missing,
+        "out_of_scope": union("out_of_scope"),
+    }
+
+
+def merge_reviews(reviews: List[dict], failed_parts: Optional[List[int]] = None) -> dict:
+    """Reduce per-chunk reviews into a single ``review_schema`` document.
+
+    Args:
+        reviews: Validated review dicts, in chunk order.
+        failed_parts: 1-based chunk numbers that produced no review; they
+            are called out in the summary and make the review non-LGTM.
+    """
+    failed_parts = failed_parts or []
+    total = len(reviews) + len(failed_parts)
+    file_comments = _merge_file_comments(reviews)
+
+    summaries = [
+        r.get("review_summary", {}).get("summary", "").strip() for r in reviews
+    ]
+    summary = "\n\n".join(s for s in summaries if s)
+    if total > 1:
+        summary = f"Reviewed in {total} parts.\n\n{summary}".strip()
+    if failed_parts:
+        parts = ", ".join(str(n) for n in failed_parts)
+        summary += f"\n\nPart(s) {parts} could not be reviewed — coverage is incomplete."
+
+    blocking = any(c.get("severity") in ("critical", "warning") for c in file_comments)
+    lgtm = (
+        not failed_parts
+        and not blocking
+        and all(r.get("review_summary", {}).get("lgtm") for r in reviews)
+    )
+
+    merged: dict = {
+        "file_comments": file_comments,
+        "review_summary": {
+            "lgtm": lgtm,
+            "summary": summary,
+            "checklist": _merge_checklist(reviews),
+        },
+    }
+
+    replies: Dict[int, dict] = {}
+    for review in reviews:
+        for reply in review.get("comment_replies", []):
+            replies.setdefault(reply.get("comment_id"), reply)
+    if replies:
+        merged["comment_replies"] = list(replies.values())
+
+    alignment = _merge_plan_alignment(reviews)
+    if alignment is not None:
+        merged["plan_alignment"] = alignment
+    return merged
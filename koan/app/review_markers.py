@@ -11,6 +11,8 @@ GitHub's 65536-char comment limit constrains total comment size; keep
 marker strings short.  No ``--`` inside comment bodies (invalid HTML).
 """
 
+import base64
+import binascii
 from typing import Optional
 
 
@@ -27,7 +29,9 @@ COMMIT_IDS_END = "<!-- koan-commits-end -->"
 
 RAW_SUMMARY_START = "<!-- koan-raw-summary-start -->"
 RAW_SUMMARY_END = "<!-- koan-raw-summary-end -->"
-"""Hidden block caching the raw changeset summary for prompt injection."""
+"""Hidden block caching the raw changeset summary for prompt injection.
+
+Content is stored with :func:`hide_text` so it does not render."""
 
 SHORT_SUMMARY_START = "<!-- koan-short-summary-start -->"
 SHORT_SUMMARY_END = "<!-- koan-short-summary-end -->"
@@ -130,3 +134,29 @@ def replace_section(body: str, start: str, end: str, new_content: str) -> str:
         # Malformed (start present, end absent) — append block, leave orphan
         return body + new_block
     return body[:start_idx] + new_block + body[end_idx + len(end):]
+
+
+def hide_text(text: str) -> str:
+    """Encode ``text`` as an HTML comment that GitHub does not render.
+
+    The payload is base64 so arbitrary text (including ``--``) is safe
+    inside the comment.
+    """
+    encoded = base64.b64encode(text.encode("utf-8")).decode("ascii")
+    return f"<!-- {encoded} -->"
+
+
+def reveal_text(hidden: Optional[str]) -> Optional[str]:
+    """Decode a block written by :func:`hide_text`.
+
+    Returns ``None`` for a missing or malformed block.
+    """
+    if not hidden:
+        return None
+    payload = hidden.strip()
+    if not (payload.startswith("<!--") and payload.endswith("-->")):
+        return None
+    try:
+        return base64.b64decode(payload[4:-3].strip(), validate=True).decode("utf-8")
+    except (binascii.Error, UnicodeDecodeError, ValueError):
+        return None
@@ -12,6 +12,15 @@ Pipeline:
 4. Parse Claude's review output
 5. Post the review as a GitHub comment
 
+Large diffs (over review_concurrency.chunk_tokens) are reviewed map-reduce
+style: the diff is partitioned by module, chunks are reviewed concurrently
+and the per-chunk JSON reviews are merged (see app.review_chunks).
+
+Re-reviews are incremental: when the summary comment records the reviewed
+commit SHAs and a cached raw summary, only the commits pushed since are
+diffed and reviewed, with the cached summary as context.  A force-push
+that rewrites reviewed commits falls back to a full review.
+
 CLI:
     python3 -m app.review_runner <github-pr-url> --project-path <path>
 """
@@ -33,15 +42,48 @@ from app.review_markers import (
     COMMIT_IDS_END,
     IN_PROGRESS_START,
     IN_PROGRESS_END,
+    RAW_SUMMARY_START,
+    RAW_SUMMARY_END,
     extract_between_markers,
+    hide_text,
     remove_section,
+    reveal_text,
     wrap_section,
     replace_section,
 )
+from app.review_chunks import chunk_files, merge_reviews, partition_diff
 from app.review_schema import validate_review
 
 _ISSUE_URL_RE = re.compile(ISSUE_URL_PATTERN)
 
+_JSON_RETRY_SUFFIX = (
+    "\n\nIMPORTANT: Your previous response was not valid JSON. "
+    "You MUST respond with ONLY a valid JSON object matching the "
+    "schema described above. No markdown, no text, just JSON."
+)
+
+_CHUNK_NOTE = (
+    "\n\nNOTE: This PR is too large for a single review, so its diff was "
+    "split into {total} parts. You are reviewing part {index} of {total}, "
+    "covering: {files}. Review only the changes shown above (read other "
+    "files for context as needed). The other parts are reviewed separately "
+    "and the findings merged, so do not comment on files outside this part."
+)
+
+# Max file names listed in a chunk note.
+_CHUNK_NOTE_MAX_FILES = 30
+
+_INCREMENTAL_NOTE = (
+    "\n\nNOTE: This is an incremental re-review. The diff above contains only "
+    "the commits pushed since this PR was last reviewed. Summary of the "
+    "previous review:\n\n{previous}\n\nReview the new changes. Say which "
+    "earlier findings they resolve; repeat an earlier finding only if the "
+    "new commits leave it unresolved or make it worse."
+)
+
+# Cap on the raw summary cached in the review comment for the next run.
+_RAW_SUMMARY_MAX_CHARS = 4000
+
 
 def _resolve_bot_username() -> str:
     """Read the bot's GitHub nickname from config.yaml.
@@ -281,12 +323,15 @@ def build_review_prompt(
     architecture: bool = False,
     repliable_comments: Optional[List[dict]] = None,
     plan_body: Optional[str] = None,
+    previous_review: Optional[str] = None,
 ) -> str:
     """Build a prompt for Claude to review a PR.
 
     When plan_body is provided, selects the plan-aware prompt variant
     (review-with-plan) regardless of the architecture flag. When architecture
     is True but no plan is present, uses the architecture prompt.
+    When previous_review is provided, context["diff"] holds only the new
+    commits and the prompt asks for an incremental review.
     """
     if plan_body:
         if architecture:
@@ -322,7 +367,10 @@ def build_review_prompt(
             plan_body = _truncate_plan(plan_body)
         kwargs["PLAN"] = plan_body
 
-    return load_prompt_or_skill(skill_dir, prompt_name, **kwargs)
+    prompt = load_prompt_or_skill(skill_dir, prompt_name, **kwargs)
+    if previous_review:
+        prompt += _INCREMENTAL_NOTE.format(previous=previous_review)
+    return prompt
 
 
 def _run_claude_review(
@@ -665,11 +713,13 @@ def _post_review_comment(
     # (e.g. COMMIT_IDS block written by a previous run).
     if existing_comment:
         existing_body = existing_comment.get("body", "")
-        commits_block = extract_between_markers(
-            existing_body, COMMIT_IDS_START, COMMIT_IDS_END,
-        )
-        if commits_block is not None:
-            body = replace_section(body, COMMIT_IDS_START, COMMIT_IDS_END, commits_block)
+        for start, end in (
+            (COMMIT_IDS_START, COMMIT_IDS_END),
+            (RAW_SUMMARY_START, RAW_SUMMARY_END),
+        ):
+            block = extract_between_markers(existing_body, start, end)
+            if block is not None:
+                body = replace_section(body, start, end, block)
 
     try:
         sanitized = sanitize_github_comment(body)
@@ -845,6 +895,146 @@ def _fetch_pr_commit_shas(owner: str, repo: str, pr_number: str) -> List[str]:
         return []
 
 
+def _fetch_compare_diff(owner: str, repo: str, base_sha: str, head_sha: str) -> str:
+    """Return the unified diff between two commits, or "" on error."""
+    try:
+        return run_gh(
+            "api",
+            f"repos/{owner}/{repo}/compare/{base_sha}...{head_sha}",
+            "-H", "Accept: application/vnd.github.v3.diff",
+            timeout=60,
+        )
+    except RuntimeError as e:
+        print(f"[review_runner] compare diff failed: {e}", file=sys.stderr)
+        return ""
+
+
+def _compare_has_merge_commit(
+    owner: str, repo: str, base_sha: str, head_sha: str,
+) -> bool:
+    """Return True if any commit between two SHAs is a merge commit.
+
+    Errors count as True so the caller falls back to a full review.
+    """
+    try:
+        raw = run_gh(
+            "api",
+            f"repos/{owner}/{repo}/compare/{base_sha}...{head_sha}",
+            "--jq", "[.commits[] | select(.parents | length > 1)] | length",
+            timeout=60,
+        )
+    except RuntimeError as e:
+        print(f"[review_runner] compare commits failed: {e}", file=sys.stderr)
+        return True
+    return raw.strip() not in ("", "0")
+
+
+def _apply_review_ignore(diff: str) -> str:
+    """Drop files matching the review_ignore patterns (config.yaml) from a diff."""
+    from app.config import get_review_ignore_config
+    from app.utils import filter_diff_by_ignore
+
+    review_ignore = get_review_ignore_config()
+    glob_pats = review_ignore.get("glob", [])
+    regex_pats = review_ignore.get("regex", [])
+    if not (glob_pats or regex_pats):
+        return diff
+    filtered_diff, skipped = filter_diff_by_ignore(diff, glob_pats, regex_pats)
+    if skipped:
+        print(
+            f"[review_runner] Ignoring {len(skipped)} file(s): {skipped}",
+            file=sys.stderr,
+        )
+    return filtered_diff
+
+
+def _prepare_incremental(
+    owner: str,
+    repo: str,
+    existing_comment: dict,
+    prior_shas: List[str],
+    current_shas: List[str],
+) -> Optional[dict]:
+    """Set up an incremental re-review covering only unreviewed commits.
+
+    Returns ``{"diff", "previous_review", "new_commits", "since"}``, or
+    None when a full review is needed: history was rewritten (a reviewed
+    commit is no longer on the PR), a new commit is a merge (e.g. the base
+    branch merged in via "Update branch", whose changes the delta would
+    wrongly attribute to the PR), no summary was cached by the last run,
+    or the delta diff is unavailable.
+    """
+    current = set(current_shas)
+    if any(sha not in current for sha in prior_shas):
+        print(
+            "[review_runner] PR history rewritten since last review — full review",
+            file=sys.stderr,
+        )
+        return None
+
+    previous_review = reveal_text(extract_between_markers(
+        existing_comment.get("body", ""), RAW_SUMMARY_START, RAW_SUMMARY_END,
+    ))
+    if not previous_review:
+        return None
+
+    prior = set(prior_shas)
+    last_reviewed = [sha for sha in current_shas if sha in prior][-1]
+    new_commits = [sha for sha in current_shas if sha not in prior]
+    if _compare_has_merge_commit(owner, repo, last_reviewed, current_shas[-1]):
+        print(
+            "[review_runner] Merge commit since last review — full review",
+            file=sys.stderr,
+        )
+        return None
+    diff = _apply_review_ignore(
+        _fetch_compare_diff(owner, repo, last_reviewed, current_shas[-1])
+    )
+    if not diff.strip():
+        return None
+    return {
+        "diff": diff,
+        "previous_review": previous_review,
+        "new_commits": new_commits,
+        "since": last_reviewed,
+    }
+
+
+def _build_raw_summary(
+    review_data: Optional[dict], review_body: str, previous: Optional[str] = None,
+) -> str:
+    """Condense a review into the raw summary cached for the next re-review.
+
+    For an incremental review the previous summary is kept after the new
+    one (trimmed first) so unresolved earlier findings stay in context.
+    """
+    if review_data is not None:
+        lines = [review_data.get("review_summary", {}).get("summary", "").strip()]
+        for comment in review_data.get("file_comments", []):
+            lines.append(
+                f"- [{comment.get('severity', '')}] {comment.get('file', '')}:"
+                f"{comment.get('line_start', 0)} {comment.get('title', '')}"
+            )
+        text = "\n".join(line for line in lines if line)
+    else:
+        text = review_body.strip()
+    text = text[:_RAW_SUMMARY_MAX_CHARS]
+    if previous:
+        room = _RAW_SUMMARY_MAX_CHARS - len(text) - 40
+        if room > 200:
+            text += "\n\nEarlier reviews:\n" + previous[:room]
+    return text
+
+
+def _mark_incremental(review_body: str, new_commits: int, since: str) -> str:
+    """Add an 'incremental review' note under the review heading."""
+    note = f"_Incremental review of {new_commits} new commit(s) since `{since[:7]}`._"
+    if review_body.startswith("## "):
+        heading, _, rest = review_body.partition("\n")
+        return f"{heading}\n\n{note}\n{rest}"
+    return f"{note}\n\n{review_body}"
+
+
 def _set_in_progress_marker(
     owner: str, repo: str, pr_number: str, existing_comment: Optional[dict],
 ) -> Optional[dict]:
@@ -913,6 +1103,82 @@ def _patch_comment_body(
         return False
 
 
+def _review_chunk(prompt: str, project_path: str) -> Optional[dict]:
+    """Run one chunk review; returns the validated JSON review or None."""
+    raw_output, _ = _run_claude_review(prompt, project_path)
+    if not raw_output:
+        return None
+    review_data = _parse_review_json(raw_output)
+    if review_data is None:
+        retry_output, _ = _run_claude_review(prompt + _JSON_RETRY_SUFFIX, project_path)
+        if retry_output:
+            review_data = _parse_review_json(retry_output)
+    return review_data
+
+
+def _run_chunked_review(
+    chunks: List[str],
+    context: dict,
+    project_path: str,
+    skill_dir: Optional[Path] = None,
+    architecture: bool = False,
+    repliable_comments: Optional[List[dict]] = None,
+    plan_body: Optional[str] = None,
+    workers: int = 1,
+    previous_review: Optional[str] = None,
+) -> Optional[dict]:
+    """Review diff chunks concurrently and merge them into one review.
+
+    Each chunk gets the full PR context with its slice of the diff.
+    Repliable comments go to the first chunk only, so each comment gets
+    at most one reply.  Latency is bounded by the slowest chunk, not by
+    the size of the whole PR.
+
+    Returns the merged review dict, or None if no chunk produced one.
+    """
+    total = len(chunks)
+    prompts = []
+    for index, chunk in enumerate(chunks, 1):
+        files = chunk_files(chunk)
+        listed = ", ".join(files[:_CHUNK_NOTE_MAX_FILES])
+        if len(files) > _CHUNK_NOTE_MAX_FILES:
+            listed += f" and {len(files) - _CHUNK_NOTE_MAX_FILES} more"
+        prompt = build_review_prompt(
+            {**context, "diff": chunk},
+            skill_dir=skill_dir, architecture=architecture,
+            repliable_comments=repliable_comments if index == 1 else None,
+            plan_body=plan_body, previous_review=previous_review,
+        )
+        prompts.append(prompt + _CHUNK_NOTE.format(index=index, total=total, files=listed))
+
+    results: List[Optional[dict]] = [None] * total
+    if workers > 1:
+        with ThreadPoolExecutor(max_workers=min(workers, total)) as pool:
+            futures = {
+                pool.submit(_review_chunk, prompt, project_path): i
+                for i, prompt in enumerate(prompts)
+            }
+            for future in as_completed(futures):
+                try:
+                    results[futures[future]] = future.result()
+                except Exception as e:
+                    print(
+                        f"[review_runner] chunk {futures[future] + 1}/{total} failed: {e}",
+                        file=sys.stderr,
+                    )
+    else:
+        for i, prompt in enumerate(prompts):
+            results[i] = _review_chunk(prompt, project_path)
+
+    reviews = [r for r in results if r is not None]
+    if not reviews:
+        return None
+    failed = [i + 1 for i, r in enumerate(results) if r is None]
+    if failed:
+        print(f"[review_runner] chunk(s) {failed} of {total} produced no review", file=sys.stderr)
+    return merge_reviews(reviews, failed_parts=failed)
+
+
 def run_review(
     owner: str,
     repo: str,
@@ -922,6 +1188,7 @@ def run_review(
     skill_dir: Optional[Path] = None,
     architecture: bool = False,
     plan_url: Optional[str] = None,
+    full: bool = False,
 ) -> Tuple[bool, str, Optional[dict]]:
     """Execute a read-only code review on a PR.
 
@@ -935,6 +1202,8 @@ def run_review(
         architecture: If True, use architecture-focused review prompt.
         plan_url: Optional explicit GitHub issue URL for the plan to check
             alignment against. When None, auto-detection from PR body is used.
+        full: If True, review the whole diff even when an incremental
+            re-review of the new commits is possible.
 
     Returns:
         (success, summary, review_data) tuple. review_data is the validated
@@ -977,24 +1246,7 @@ def run_review(
         )
 
     # Step 1a: Apply review_ignore filters to the diff (from config.yaml)
-    from app.config import get_review_ignore_config
-    from app.utils import filter_diff_by_ignore
-
-    _review_ignore = get_review_ignore_config()
-    _glob_pats = _review_ignore.get("glob", [])
-    _regex_pats = _review_ignore.get("regex", [])
-    if _glob_pats or _regex_pats:
-        filtered_diff, skipped = filter_diff_by_ignore(
-            context.get("diff", ""),
-            _glob_pats,
-            _regex_pats,
-        )
-        if skipped:
-            print(
-                f"[review_runner] Ignoring {len(skipped)} file(s): {skipped}",
-                file=sys.stderr,
-            )
-        context = {**context, "diff": filtered_diff}
+    context = {**context, "diff": _apply_review_ignore(context.get("diff", ""))}
 
     if not context.get("diff"):
         return False, f"PR #{pr_number} has no diff — nothing to review.", None
@@ -1027,50 +1279,81 @@ def run_review(
             None,
         )
 
+    # Step 1f: Incremental re-review of the new commits only (Phase 6)
+    incremental = None
+    if not full and existing_comment and prior_shas and current_shas:
+        incremental = _prepare_incremental(
+            owner, repo, existing_comment, prior_shas, current_shas,
+        )
+        if incremental:
+            context = {**context, "diff": incremental["diff"]}
+    previous_review = incremental["previous_review"] if incremental else None
+
     # Phase 4: Post in-progress marker before doing any heavy work.
     # Removed in the finally block below regardless of success or failure.
     live_comment = _set_in_progress_marker(owner, repo, pr_number, existing_comment)
 
     try:
-        # Step 2: Build review prompt
-        prompt = build_review_prompt(
-            context, skill_dir=skill_dir, architecture=architecture,
-            repliable_comments=repliable_comments, plan_body=plan_body or None,
-        )
-
-        # Step 3: Run Claude review (read-only)
-        notify_fn(f"Analyzing code changes on `{context['branch']}`...")
-        raw_output, error = _run_claude_review(prompt, project_path)
-        if not raw_output:
-            detail = f" ({error})" if error else ""
-            return False, f"Claude review failed for PR #{pr_number}{detail}.", None
-
-        # Step 4: Parse structured JSON review (with retry)
-        review_data = _parse_review_json(raw_output)
-        if review_data is None:
-            # Retry once with explicit JSON instruction
-            retry_prompt = (
-                prompt
-                + "\n\nIMPORTANT: Your previous response was not valid JSON. "
-                "You MUST respond with ONLY a valid JSON object matching the "
-                "schema described above. No markdown, no text, just JSON."
+        # Large PRs: map-reduce over diff chunks (Steps 2-5 per chunk)
+        chunks = partition_diff(context["diff"], concurrency_cfg["chunk_tokens"])
+        if len(chunks) > 1:
+            notify_fn(
+                f"Analyzing code changes on `{context['branch']}` "
+                f"in {len(chunks)} parts..."
             )
-            retry_output, _ = _run_claude_review(retry_prompt, project_path)
-            if retry_output:
-                review_data = _parse_review_json(retry_output)
-
-        # Step 5: Convert to markdown for posting
-        if review_data is not None:
+            review_data = _run_chunked_review(
+                chunks, context, project_path,
+                skill_dir=skill_dir, architecture=architecture,
+                repliable_comments=repliable_comments, plan_body=plan_body or None,
+                workers=concurrency_cfg["review_workers"] if concurrency_enabled else 1,
+                previous_review=previous_review,
+            )
+            if review_data is None:
+                return False, f"Claude review failed for PR #{pr_number} (all parts failed).", None
             review_body = _format_review_as_markdown(
                 review_data, title=context.get("title", ""),
             )
         else:
-            # Fallback: use regex extraction for non-JSON responses
-            print(
-                "[review_runner] JSON parsing failed, falling back to regex extraction",
-                file=sys.stderr,
+            # Step 2: Build review prompt
+            prompt = build_review_prompt(
+                context, skill_dir=skill_dir, architecture=architecture,
+                repliable_comments=repliable_comments, plan_body=plan_body or None,
+                previous_review=previous_review,
+            )
+
+            # Step 3: Run Claude review (read-only)
+            notify_fn(f"Analyzing code changes on `{context['branch']}`...")
+            raw_output, error = _run_claude_review(prompt, project_path)
+            if not raw_output:
+                detail = f" ({error})" if error else ""
+                return False, f"Claude review failed for PR #{pr_number}{detail}.", None
+
+            # Step 4: Parse structured JSON review (with retry)
+            review_data = _parse_review_json(raw_output)
+            if review_data is None:
+                # Retry once with explicit JSON instruction
+                retry_prompt = prompt + _JSON_RETRY_SUFFIX
+                retry_output, _ = _run_claude_review(retry_prompt, project_path)
+                if retry_output:
+                    review_data = _parse_review_json(retry_output)
+
+            # Step 5: Convert to markdown for posting
+            if review_data is not None:
+                review_body = _format_review_as_markdown(
+                    review_data, title=context.get("title", ""),
+                )
+            else:
+                # Fallback: use regex extraction for non-JSON responses
+                print(
+                    "[review_runner] JSON parsing failed, falling back to regex extraction",
+                    file=sys.stderr,
+                )
+                review_body = _extract_review_body(raw_output)
+
+        if incremental:
+            review_body = _mark_incremental(
+                review_body, len(incremental["new_commits"]), incremental["since"],
             )
-            review_body = _extract_review_body(raw_output)
 
         # Step 6: Post (or update) review comment (Phase 3 — idempotent upsert)
         notify_fn(f"Posting review on PR #{pr_number}...")
@@ -1079,7 +1362,8 @@ def run_review(
         comment_to_update = live_comment or existing_comment
         posted = _post_review_comment(owner, repo, pr_number, review_body, comment_to_update)
 
-        # Step 6b: Embed reviewed commit SHAs (Phase 5)
+        # Step 6b: Embed reviewed commit SHAs (Phase 5) and the raw summary
+        # used as context by the next incremental re-review (Phase 6).
         # Runs whether we updated an existing comment or created a new one.
         if posted and current_shas:
             # Fetch the updated comment body to avoid clobbering the review text
@@ -1091,6 +1375,10 @@ def run_review(
                     COMMIT_IDS_END,
                     "\n".join(current_shas),
                 )
+                raw_summary = _build_raw_summary(review_data, review_body, previous_review)
+                new_body = replace_section(
+                    new_body, RAW_SUMMARY_START, RAW_SUMMARY_END, hide_text(raw_summary),
+                )
                 _patch_comment_body(owner, repo, updated_comment["id"], new_body)
                 # Mark live_comment as settled so finally block skips extra PATCH
                 live_comment = None
@@ -1111,6 +1399,11 @@ def run_review(
 
         if posted:
             summary = f"Review posted on PR #{pr_number} ({full_repo})."
+            if incremental:
+                summary = (
+                    f"Incremental review of {len(incremental['new_commits'])} new "
+                    f"commit(s) posted on PR #{pr_number} ({full_repo})."
+                )
             if reply_count:
                 summary += f" Replied to {reply_count} comment(s)."
             return True, summary, review_data
@@ -1158,6 +1451,10 @@ def main(argv=None):
         help="GitHub issue URL for the plan to check alignment against. "
              "When omitted, auto-detects from the PR body.",
     )
+    parser.add_argument(
+        "--full", action="store_true",
+        help="Review the whole diff even if only new commits need review",
+    )
     cli_args = parser.parse_args(argv)
 
     try:
@@ -1173,6 +1470,7 @@ def main(argv=None):
         skill_dir=skill_dir,
         architecture=cli_args.architecture,
         plan_url=cli_args.plan_url,
+        full=cli_args.full,
     )
     print(summary)
     return 0 if success else 1
@@ -442,10 +442,14 @@ def run_startup(koan_root: str, instance: str, projects: list):
 # ---------------------------------------------------------------------------
 
 def _notify(instance: str, message: str):
-    """Send a formatted notification to Telegram."""
+    """Send a formatted notification to Telegram.
+
+    Queued on the background sender once main_loop() has started it, so
+    the Claude formatting call and network I/O don't stall the loop.
+    """
     try:
-        from app.notify import format_and_send
-        format_and_send(message, instance_dir=instance)
+        from app.notify import format_and_send, send_async
+        send_async(format_and_send, message, instance_dir=instance)
     except Exception as e:
         log("error", f"Notification failed: {e}")
 
@@ -459,8 +463,8 @@ def _notify_raw(instance: str, message: str):
     handles priority filtering, flood protection, and retries.
     """
     try:
-        from app.notify import send_telegram
-        send_telegram(message)
+        from app.notify import send_async, send_telegram
+        send_async(send_telegram, message)
     except Exception as e:
         log("error", f"Raw notification failed: {e}")
 
@@ -738,6 +742,11 @@ def main_loop():
     consecutive_errors = 0
     consecutive_idle = 0
     MAX_CONSECUTIVE_IDLE = 30  # ~30 min at 60s interval → auto-pause
+
+    # Deliver notifications from a background sender so the loop never
+    # blocks on Telegram; drained in the finally block below.
+    from app.notify import start_send_queue, stop_send_queue
+    start_send_queue()
     try:
         # Startup sequence
         max_runs, interval, branch_prefix = run_startup(koan_root, instance, projects)
@@ -795,15 +804,17 @@ def main_loop():
 
             # --- Iteration body (exception-protected) ---
             try:
-                productive = _run_iteration(
-                    koan_root=koan_root,
-                    instance=instance,
-                    projects=projects,
-                    count=count,
-                    max_runs=max_runs,
-                    interval=interval,
-                    git_sync_interval=git_sync_interval,
-                )
+                from app.provider import provider_scope
+                with provider_scope():
+                    productive = _run_iteration(
+                        koan_root=koan_root,
+                        instance=instance,
+                        projects=projects,
+                        count=count,
+                        max_runs=max_runs,
+                        interval=interval,
+                        git_sync_interval=git_sync_interval,
+                    )
                 consecutive_errors = 0
                 if productive is True:
                     count += 1
@@ -879,6 +890,8 @@ def main_loop():
         except Exception as e:
             print(f"[hooks] session_end hook error: {e}", file=sys.stderr)
         # Cleanup
+        if not stop_send_queue():
+            log("error", "Shutdown: some queued notifications were not delivered.")
         Path(koan_root, STATUS_FILE).unlink(missing_ok=True)
         release_pidfile(pidfile_lock, Path(koan_root), "run")
         log("koan", f"Shutdown. {count} runs executed.")
@@ -1050,6 +1063,9 @@ def _run_preflight_check(
             pf_reset_ts, pf_reset_display = _compute_preflight_reset_ts(pf_error)
             from app.pause_manager import create_pause
             create_pause(koan_root, "quota", pf_reset_ts, pf_reset_display)
+            _exhausted, next_provider = _pool_fail_over(koan_root, instance, project_name)
+            if next_provider:
+                return False
             label = plan["mission_title"] if plan["mission_title"] else "autonomous run"
             _notify(instance, (
                 f"⏸️ Pre-flight quota check failed before [{project_name}] {label}.\n"
@@ -1061,6 +1077,45 @@ def _run_preflight_check(
     return False
 
 
+def _select_pool_provider(instance: str, project_name: str) -> str:
+    """Route this run to the provider pool's best provider, if enabled.
+
+    Returns the selected provider name, or "" to keep the configured one.
+    """
+    try:
+        from app.provider import set_provider_override
+        from app.provider_pool import select_provider
+        name = select_provider(instance, project_name)
+    except Exception as e:
+        log("error", f"Provider pool selection error: {e}")
+        return ""
+    if name:
+        set_provider_override(name)
+        log("koan", f"Provider pool: running on {name}")
+    return name
+
+
+def _pool_fail_over(koan_root: str, instance: str, project_name: str) -> tuple:
+    """After a quota pause, switch to the next eligible pooled provider.
+
+    Returns ``(exhausted_provider, next_provider)``; *next_provider* is ""
+    when the pool is disabled or every pooled provider is exhausted, in
+    which case the quota pause stays in place.
+    """
+    from app.provider import get_provider_name, set_provider_override
+    exhausted = get_provider_name()
+    try:
+        from app.provider_pool import fail_over
+        next_name = fail_over(koan_root, instance, exhausted, project_name)
+    except Exception as e:
+        log("error", f"Provider pool failover error: {e}")
+        return exhausted, ""
+    if next_name:
+        set_provider_override(next_name)
+        log("quota", f"{exhausted} quota exhausted — failing over to {next_name}")
+    return exhausted, next_name
+
+
 def _handle_skill_dispatch(
     mission_title: str,
     project_name: str,
@@ -1240,6 +1295,10 @@ _MISSION_RETRY_DELAY = 10  # seconds
 _last_mission_timed_out = False
 _last_mission_aborted = False
 
+# Set by _maybe_retry_mission when a failed light-model run was re-run on
+# the mission model (model routing escalation).
+_last_mission_escalated = False
+
 # Tracks whether the cold-start Telegram burst (GH scan / Jira scan / first
 # mission pick) has already fired since process start or /resume. Decoupled
 # from the productive-run `count` because idle/passive/quota/sleep-wake paths
@@ -1256,6 +1315,21 @@ _startup_notified = False
 _boot_notified = False
 
 
+def _route_model(
+    instance: str, project_name: str, mission_title: str, autonomous_mode: str,
+):
+    """Complexity-based model routing: simple chores run on the light model.
+
+    Returns the ModelRoute, or None when routing is disabled or fails.
+    """
+    try:
+        from app.model_router import route_mission
+        return route_mission(instance, project_name, mission_title, autonomous_mode)
+    except Exception as e:
+        log("error", f"Model routing error (using mission model): {e}")
+        return None
+
+
 def _get_git_head(project_path: str) -> str:
     """Get current git HEAD SHA for retry safety check."""
     try:
@@ -1280,6 +1354,7 @@ def _maybe_retry_mission(
     project_name: str,
     run_num: int,
     has_mission: bool,
+    escalate_cmd: Optional[list] = None,
 ) -> tuple:
     """Attempt a single retry if the CLI error is transient.
 
@@ -1291,7 +1366,14 @@ def _maybe_retry_mission(
     - The error is classified as RETRYABLE
     - No commits were produced (HEAD didn't move)
     - This is a mission (not autonomous), since missions are higher-value
+
+    When *escalate_cmd* is given (the mission ran on the light model
+    tier), any failure other than quota/auth is retried once with that
+    command — the mission model — instead, under the same HEAD and
+    mission-only guards.
     """
+    global _last_mission_escalated
+    _last_mission_escalated = False
     from app.cli_errors import ErrorCategory, classify_cli_error
 
     # Watchdog timeouts are NOT transient — don't retry a session that ran
@@ -1321,7 +1403,8 @@ def _maybe_retry_mission(
     category = classify_cli_error(claude_exit, stdout_text, stderr_text)
     log("error", f"CLI error classified as {category.value} (exit={claude_exit})")
 
-    if category != ErrorCategory.RETRYABLE:
+    escalate = bool(escalate_cmd) and category not in (ErrorCategory.QUOTA, ErrorCategory.AUTH)
+    if category != ErrorCategory.RETRYABLE and not escalate:
         return claude_exit, stdout_file, stderr_file
 
     if not has_mission:
@@ -1334,9 +1417,14 @@ def _maybe_retry_mission(
         log("koan", "Skipping retry — commits were produced before the error")
         return claude_exit, stdout_file, stderr_file
 
-    log("koan", f"Transient CLI error — retrying mission in {_MISSION_RETRY_DELAY}s")
-    with protected_phase("Mission retry backoff"):
-        time.sleep(_MISSION_RETRY_DELAY)
+    if escalate:
+        log("koan", "Light-model run failed — escalating mission to the mission model")
+        cmd = escalate_cmd
+        _last_mission_escalated = True
+    if category == ErrorCategory.RETRYABLE:
+        log("koan", f"Transient CLI error — retrying mission in {_MISSION_RETRY_DELAY}s")
+        with protected_phase("Mission retry backoff"):
+            time.sleep(_MISSION_RETRY_DELAY)
 
     # Clear output files before retry to avoid double-counting
     try:
@@ -1600,6 +1688,19 @@ def _run_iteration(
         _handle_wait_pause(plan, count, koan_root, instance)
         return False  # budget exhausted — not productive
 
+    # --- Provider pool: pick this run's provider ---
+    pool_provider = ""
+    route = None
+    if action in ("mission", "autonomous"):
+        pool_provider = _select_pool_provider(instance, project_name)
+        # Route first so the model warmed is the one the run will use
+        route = _route_model(
+            instance, project_name, plan["mission_title"], plan["autonomous_mode"],
+        )
+        # Local models: start loading while the run is prepared
+        from app.model_warmup import warm_for_mission
+        warm_for_mission(route.model if route else "")
+
     # --- Pre-flight quota check ---
     if action in ("mission", "autonomous"):
         log("koan", "Running pre-flight quota check...")
@@ -1797,6 +1898,12 @@ def _run_iteration(
         except Exception as e:
             _debug_log(f"[run] plugin dir generation skipped: {e}")
 
+        # Skill dispatch may have translated the title: route the final one
+        if mission_title != plan["mission_title"]:
+            route = _route_model(instance, project_name, mission_title, autonomous_mode)
+        if route is not None and route.is_light:
+            log("koan", f"Model routing: {route.model} ({route.reason})")
+
         cmd = build_mission_command(
             prompt=prompt,
             autonomous_mode=autonomous_mode,
@@ -1804,7 +1911,22 @@ def _run_iteration(
             project_name=project_name,
             plugin_dirs=plugin_dirs,
             system_prompt=system_prompt,
+            model_override=route.model if route else "",
+            max_turns=route.max_turns if route else 0,
         )
+        escalate_cmd = None
+        model_tier = route.tier if route else ""
+        if route is not None:
+            from app.model_router import should_escalate
+            if should_escalate(route):
+                escalate_cmd = build_mission_command(
+                    prompt=prompt,
+                    autonomous_mode=autonomous_mode,
+                    extra_flags="",
+                    project_name=project_name,
+                    plugin_dirs=plugin_dirs,
+                    system_prompt=system_prompt,
+                )
 
         cmd_display = [c[:100] + '...' if len(c) > 100 else c for c in cmd[:6]]
         _debug_log(f"[run] cli: cmd={' '.join(cmd_display)}... cwd={project_path}")
@@ -1839,7 +1961,11 @@ def _run_iteration(
                 project_name=project_name,
                 run_num=run_num,
                 has_mission=bool(mission_title),
+                escalate_cmd=escalate_cmd,
             )
+            if _last_mission_escalated:
+                from app.model_router import TIER_ESCALATED
+                model_tier = TIER_ESCALATED
 
         # --- JSON success override ---
         # Claude CLI can return non-zero even when the session JSON shows
@@ -1924,6 +2050,14 @@ def _run_iteration(
                     reset_ts, reset_display = _compute_quota_reset_ts(instance)
                     from app.pause_manager import create_pause
                     create_pause(koan_root, "quota", reset_ts, reset_display)
+                exhausted, next_provider = _pool_fail_over(koan_root, instance, project_name)
+                if next_provider:
+                    _notify(instance, (
+                        f"🔀 {exhausted} quota exhausted.{(' ' + reset_display) if reset_display else ''}\n"
+                        f"Mission '{original_mission_title[:60]}' moved back to Pending "
+                        f"and will run on {next_provider}."
+                    ))
+                    return True  # consumed API budget before quota hit
                 _notify(instance, (
                     f"⏸️ API quota exhausted.{(' ' + reset_display) if reset_display else ''}\n"
                     f"Mission '{original_mission_title[:60]}' moved back to Pending.\n"
@@ -1931,6 +2065,18 @@ def _run_iteration(
                 ))
                 return True  # consumed API budget before quota hit
 
+        # Feed the provider pool's rolling latency/success stats
+        if pool_provider and not _last_mission_aborted:
+            try:
+                from app.provider import get_provider_name
+                from app.provider_pool import record_outcome
+                record_outcome(
+                    instance, get_provider_name(),
+                    time.time() - mission_start, claude_exit == 0,
+                )
+            except Exception as e:
+                log("error", f"Provider pool stats error: {e}")
+
         # Complete/fail mission in missions.md (safety net — idempotent if Claude already did it)
         # Done BEFORE post-mission pipeline so quota exhaustion can't skip it.
         # Use original_mission_title because that's the needle in "In Progress".
@@ -1964,6 +2110,7 @@ def _run_iteration(
                 status_callback=lambda step: set_status(
                     koan_root, f"{_status_prefix} — {step}"
                 ),
+                model_tier=model_tier,
             )
 
             if post_result.get("pending_archived"):
@@ -1993,6 +2140,14 @@ def _run_iteration(
                 create_pause(koan_root, "quota", reset_ts, reset_display or _disp)
 
                 _commit_instance(instance, f"koan: quota exhausted {time.strftime('%Y-%m-%d-%H:%M')}")
+                exhausted, next_provider = _pool_fail_over(koan_root, instance, project_name)
+                if next_provider:
+                    _notify(instance, (
+                        f"🔀 {exhausted} quota exhausted. {reset_display}\n\n"
+                        f"Mission '{original_mission_title[:60]}' moved back to Pending "
+                        f"and will run on {next_provider}."
+                    ))
+                    return True  # ran Claude before quota hit — productive
                 _notify(instance, (
                     f"⚠️ Claude quota exhausted. {reset_display}\n\n"
                     f"Mission '{original_mission_title[:60]}' moved back to Pending.\n"
@@ -2025,13 +2180,11 @@ def _run_iteration(
     if (count + 1) % git_sync_interval == 0:
         with protected_phase("Git sync"):
             log("git", f"Periodic git sync (run {count + 1})...")
-            from app.git_sync import GitSync
-            for name, path in projects:
-                try:
-                    gs = GitSync(instance, name, path)
-                    gs.sync_and_report()
-                except Exception as e:
-                    log("error", f"Periodic git sync failed for {name}: {e}")
+            from app.git_sync import sync_projects
+            try:
+                sync_projects(instance, projects)
+            except Exception as e:
+                log("error", f"Periodic git sync failed: {e}")
 
     # Periodic auto-update check
     try:
@@ -2314,6 +2467,12 @@ def _run_skill_mission(
     # app.* modules even if the working tree changes (e.g. skill does
     # a git checkout on the koan repo itself).
     skill_env = {**os.environ, "PYTHONPATH": koan_pkg_dir}
+    # The provider pool's pick lives in a ContextVar of this process;
+    # hand it to the skill through the env var it resolves first.
+    from app.provider import get_provider_override
+    provider_override = get_provider_override()
+    if provider_override:
+        skill_env["KOAN_CLI_PROVIDER"] = provider_override
 
     # Record the koan repo's HEAD before execution.  Skills like
     # /rebase and /recreate do git checkouts on project_path which
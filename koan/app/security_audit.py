@@ -6,17 +6,28 @@ operations, subprocess executions, config changes, and auth events.
 
 Uses append-only writes with fcntl.flock (matching conversation_history.py
 pattern) and reuses log_rotation.py for size-based rotation.
+
+Events are group-committed: log_event() queues the record and a
+background flusher writes every pending event with a single
+open/lock/write cycle, at most ``audit.flush_interval_ms`` later.
+Critical events (auth decisions, config changes, mission failures) and
+``sync=True`` calls are written before log_event() returns, and pending
+events are flushed at interpreter exit.
 """
 
+import atexit
 import fcntl
 import json
 import os
 import re
 import sys
+import threading
 from datetime import datetime
 from pathlib import Path
 from typing import Optional
 
+from app.tail_reader import tail_jsonl
+
 # ---------------------------------------------------------------------------
 # Event type constants
 # ---------------------------------------------------------------------------
@@ -30,6 +41,9 @@ CONFIG_CHANGE = "config_change"
 AUTH_GRANT = "auth_grant"
 AUTH_DENY = "auth_deny"
 
+# Events written synchronously: they must survive a crash right after.
+_SYNC_EVENT_TYPES = frozenset({AUTH_GRANT, AUTH_DENY, CONFIG_CHANGE, MISSION_FAIL})
+
 # ---------------------------------------------------------------------------
 # Secret redaction
 # ---------------------------------------------------------------------------
@@ -93,21 +107,52 @@ def _truncate(value, max_len: int = _MAX_DETAIL_LEN) -> str:
 # ---------------------------------------------------------------------------
 
 _DEFAULT_MAX_SIZE_MB = 10
+_DEFAULT_FLUSH_INTERVAL_MS = 500
+
+# (config.yaml stat key, parsed audit config) — avoids a YAML parse per event.
+_config_cache: Optional[tuple] = None
+
+
+def _config_stat_key() -> Optional[tuple]:
+    """Identify the current config.yaml version (None = do not cache)."""
+    koan_root = os.environ.get("KOAN_ROOT", "")
+    if not koan_root:
+        return None
+    config_path = Path(koan_root) / "instance" / "config.yaml"
+    try:
+        st = config_path.stat()
+    except OSError:
+        return (str(config_path), None)
+    return (str(config_path), st.st_mtime_ns, st.st_size)
 
 
 def _get_audit_config() -> dict:
-    """Load audit config from config.yaml. Returns defaults on any error."""
+    """Load audit config from config.yaml. Returns defaults on any error.
+
+    The result is cached until config.yaml changes.
+    """
+    global _config_cache
+    key = _config_stat_key()
+    if key is not None and _config_cache is not None and _config_cache[0] == key:
+        return _config_cache[1]
     try:
         from app.utils import load_config
         config = load_config()
     except (OSError, ValueError, KeyError):
         config = {}
     audit_cfg = config.get("audit") or {}
-    return {
+    result = {
         "enabled": bool(audit_cfg.get("enabled", True)),
         "max_size_mb": int(audit_cfg.get("max_size_mb", _DEFAULT_MAX_SIZE_MB)),
         "redact_patterns": audit_cfg.get("redact_patterns") or [],
+        "buffered": bool(audit_cfg.get("buffered", True)),
+        "flush_interval_ms": max(0, int(
+            audit_cfg.get("flush_interval_ms", _DEFAULT_FLUSH_INTERVAL_MS)
+        )),
     }
+    if key is not None:
+        _config_cache = (key, result)
+    return result
 
 
 # ---------------------------------------------------------------------------
@@ -137,14 +182,130 @@ def _rotate_if_needed(audit_path: Path, max_size_bytes: int):
         print(f"[security_audit] Rotation failed: {exc}", file=sys.stderr)
 
 
+# ---------------------------------------------------------------------------
+# Buffered writer
+# ---------------------------------------------------------------------------
+
+# Pending events above which the flusher stops waiting for the interval.
+_MAX_BATCH = 256
+
+
+class _AuditWriter:
+    """In-process queue with a background group-commit flusher.
+
+    Each flush takes every pending event, checks rotation once per file
+    and appends the batch under a single exclusive flock.  A writer-wide
+    lock serializes flushes so events land in the order they were queued.
+    """
+
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._flush_lock = threading.Lock()
+        self._pending: list = []  # (audit_path, max_size_bytes, line)
+        self._thread: Optional[threading.Thread] = None
+        self._interval = _DEFAULT_FLUSH_INTERVAL_MS / 1000
+
+    def submit(self, audit_path: Path, max_size_bytes: int, line: str,
+               *, sync: bool, interval_ms: int):
+        with self._cond:
+            self._pending.append((audit_path, max_size_bytes, line))
+            if not sync:
+                self._interval = interval_ms / 1000
+                self._ensure_thread()
+                # Wake an idle flusher, or cut its window short when full.
+                pending = len(self._pending)
+                if pending == 1 or pending >= _MAX_BATCH or not interval_ms:
+                    self._cond.notify()
+        if sync:
+            self.flush(fsync=True)
+
+    def _ensure_thread(self):
+        if self._thread is None or not self._thread.is_alive():
+            self._thread = threading.Thread(
+                target=self._run, name="koan-audit-writer", daemon=True,
+            )
+            self._thread.start()
+
+    def _run(self):
+        while True:
+            with self._cond:
+                while not self._pending:
+                    self._cond.wait()
+                # Group-commit window: bounded latency for the oldest event.
+                if len(self._pending) < _MAX_BATCH and self._interval > 0:
+                    self._cond.wait(self._interval)
+            self.flush()
+
+    def flush(self, fsync: bool = False):
+        """Write every pending event. Never raises."""
+        with self._flush_lock:
+            with self._cond:
+                batch, self._pending = self._pending, []
+            if not batch:
+                return
+            by_path: dict = {}
+            for audit_path, max_size_bytes, line in batch:
+                entry = by_path.setdefault(audit_path, [max_size_bytes, []])
+                entry[1].append(line)
+            for audit_path, (max_size_bytes, lines) in by_path.items():
+                try:
+                    _write_batch(audit_path, max_size_bytes, lines, fsync)
+                except Exception as exc:
+                    print(
+                        f"[security_audit] Failed to write {len(lines)} event(s): {exc}",
+                        file=sys.stderr,
+                    )
+
+
+def _write_batch(audit_path: Path, max_size_bytes: int, lines: list, fsync: bool):
+    """Append *lines* to the audit log in one open/lock/write cycle."""
+    _rotate_if_needed(audit_path, max_size_bytes)
+
+    # Append with flock (same pattern as conversation_history.py)
+    with open(audit_path, "a", encoding="utf-8") as f:
+        fcntl.flock(f, fcntl.LOCK_EX)
+        try:
+            f.write("".join(lines))
+            f.flush()
+            if fsync:
+                os.fsync(f.fileno())
+        finally:
+            fcntl.flock(f, fcntl.LOCK_UN)
+
+
+_writer = _AuditWriter()
+
+
+def _reset_writer_after_fork():
+    """Give a forked child its own writer (the parent's thread is gone)."""
+    global _writer
+    _writer = _AuditWriter()
+
+
+os.register_at_fork(after_in_child=_reset_writer_after_fork)
+
+
+def flush_events():
+    """Write all queued audit events now. Never raises.
+
+    Registered with atexit; call it explicitly before os._exit() or
+    before reading the audit log from another process.
+    """
+    _writer.flush(fsync=True)
+
+
+atexit.register(flush_events)
+
+
 def log_event(
     event_type: str,
     *,
     actor: Optional[dict] = None,
     details: Optional[dict] = None,
     result: str = "success",
+    sync: Optional[bool] = None,
 ):
-    """Append a single audit event to the JSONL log.
+    """Queue a single audit event for the JSONL log.
 
     This function never raises — errors are printed to stderr.
 
@@ -153,6 +314,8 @@ def log_event(
         actor: Optional dict with "type" and "id" keys.
         details: Optional dict with event-specific data.
         result: Outcome string (default "success").
+        sync: Write (and fsync) before returning. Defaults to True for
+            critical event types and when ``audit.buffered`` is off.
     """
     try:
         audit_cfg = _get_audit_config()
@@ -181,18 +344,16 @@ def log_event(
                     safe_details[k] = v
             event["details"] = safe_details
 
-        # Check rotation before appending
-        max_size_bytes = audit_cfg["max_size_mb"] * 1024 * 1024
-        _rotate_if_needed(audit_path, max_size_bytes)
+        if sync is None:
+            sync = event_type in _SYNC_EVENT_TYPES or not audit_cfg.get("buffered", True)
 
-        # Append with flock (same pattern as conversation_history.py)
-        with open(audit_path, "a", encoding="utf-8") as f:
-            fcntl.flock(f, fcntl.LOCK_EX)
-            try:
-                f.write(json.dumps(event, ensure_ascii=False) + "\n")
-                f.flush()
-            finally:
-                fcntl.flock(f, fcntl.LOCK_UN)
+        _writer.submit(
+            audit_path,
+            audit_cfg["max_size_mb"] * 1024 * 1024,
+            json.dumps(event, ensure_ascii=False) + "\n",
+            sync=sync,
+            interval_ms=audit_cfg.get("flush_interval_ms", _DEFAULT_FLUSH_INTERVAL_MS),
+        )
 
     except Exception as exc:
         print(f"[security_audit] Failed to log event: {exc}", file=sys.stderr)
@@ -202,26 +363,16 @@ def read_recent_events(count: int = 50) -> list:
     """Read the last N events from the audit log.
 
     Returns a list of dicts (newest last). Returns [] on any error.
+    Events still queued in this process are written first — without an
+    fsync: a reader only needs them in the file, durability is left to
+    the writer and shutdown paths.
     """
+    _writer.flush()
     try:
         audit_path = _get_audit_path()
         if not audit_path.exists():
             return []
-        with open(audit_path, "r", encoding="utf-8") as f:
-            fcntl.flock(f, fcntl.LOCK_SH)
-            try:
-                lines = f.readlines()
-            finally:
-                fcntl.flock(f, fcntl.LOCK_UN)
-        events = []
-        for line in lines[-count:]:
-            line = line.strip()
-            if line:
-                try:
-                    events.append(json.loads(line))
-                except json.JSONDecodeError:
-                    continue
-        return events
+        return tail_jsonl(audit_path, count)
     except (OSError, json.JSONDecodeError) as exc:
         print(f"[security_audit] Failed to read events: {exc}", file=sys.stderr)
         return []
@@ -22,6 +22,8 @@ from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 
+from app.git_service import get_git_service
+
 
 # Maximum entries to keep in session_outcomes.json (rolling window)
 MAX_OUTCOMES = 2000
@@ -259,6 +261,7 @@ def record_outcome(
     duration_minutes: int,
     journal_content: str,
     mission_title: str = "",
+    model_tier: str = "",
 ) -> dict:
     """Record a session outcome to session_outcomes.json.
 
@@ -269,6 +272,9 @@ def record_outcome(
         duration_minutes: Session duration in minutes.
         journal_content: The session's journal/pending content for classification.
         mission_title: The mission title for skill-aware classification.
+        model_tier: Model routing tier (light/standard/escalated). When set,
+            the entry also records the mission's work type so routing can
+            learn per-type light-tier success rates.
 
     Returns:
         The recorded outcome dict.
@@ -287,6 +293,10 @@ def record_outcome(
         "has_pr": _detect_pr_created(journal_content),
         "has_branch": _detect_branch_pushed(journal_content),
     }
+    if model_tier:
+        from app.mission_classifier import classify_mission
+        entry["model_tier"] = model_tier
+        entry["work_type"] = classify_mission(mission_title)
 
     outcomes_path = Path(instance_dir) / "session_outcomes.json"
 
@@ -514,8 +524,8 @@ def get_last_session_timestamp(
 def _count_commits_since(project_path: str, since_iso: str) -> int:
     """Count commits on the default branch since a given ISO timestamp.
 
-    Uses ``git log --oneline --since`` to count new commits. Runs in
-    the project directory. Returns -1 on error (missing repo, bad path).
+    Uses ``git rev-list --count --since`` through the project's shared
+    git service. Returns -1 on error (missing repo, bad path).
 
     Results are cached for 5 minutes (``_COMMITS_CACHE_TTL``) since commit
     counts change rarely but are queried on every autonomous iteration.
@@ -536,22 +546,7 @@ def _count_commits_since(project_path: str, since_iso: str) -> int:
         if now - cached_at < _COMMITS_CACHE_TTL:
             return value
 
-    try:
-        result = subprocess.run(
-            ["git", "log", "--oneline", f"--since={since_iso}"],
-            cwd=project_path,
-            capture_output=True,
-            text=True,
-            timeout=10,
-        )
-        if result.returncode != 0:
-            count = -1
-        else:
-            lines = [l for l in result.stdout.strip().splitlines() if l.strip()]
-            count = len(lines)
-    except (subprocess.TimeoutExpired, OSError, ValueError):
-        count = -1
-
+    count = get_git_service(project_path).count_commits(since=since_iso)
     _commits_cache[cache_key] = (count, now)
     return count
 
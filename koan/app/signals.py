@@ -37,6 +37,7 @@ VERBOSE_FILE = ".koan-verbose"
 # -- Project tracking ----------------------------------------------------------
 
 PROJECT_FILE = ".koan-project"
+BRANCH_STATE_DIR = ".koan-branch-state"  # per-project stamps, see branch_limiter
 
 # -- Reports / logs ------------------------------------------------------------
 
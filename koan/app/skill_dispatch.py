@@ -499,13 +499,15 @@ def _build_pr_url_cmd(
 def _build_review_cmd(
     base_cmd: List[str], args: str, project_path: str,
 ) -> Optional[List[str]]:
-    """Build review_runner command, passing --architecture and --plan-url if present."""
+    """Build review_runner command, passing --architecture, --full and --plan-url if present."""
     url_match = _PR_URL_RE.search(args)
     if not url_match:
         return None
     cmd = base_cmd + [url_match.group(0), "--project-path", project_path]
     if "--architecture" in args:
         cmd.append("--architecture")
+    if re.search(r"(?<!\S)--full\b", args):
+        cmd.append("--full")
     plan_url, _ = _extract_flag(args, _PLAN_URL_RE)
     if plan_url:
         cmd.extend(["--plan-url", plan_url])
@@ -1,15 +1,21 @@
 """Startup orchestration for the Koan agent loop.
 
-Decomposes the startup sequence into independently testable steps.
-Each step is wrapped in try/except to prevent one failure from
-blocking the entire startup.
+Decomposes the startup sequence into independently testable steps,
+declared as a dependency graph (see build_startup_steps).  Independent
+steps run concurrently; steps not needed before the first iteration are
+deferred to a background thread.  Each step is wrapped in try/except to
+prevent one failure from blocking the entire startup.
 
 Called from run.py's main_loop() during process initialization.
 """
 
 import os
+import threading
 import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
 from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 
 from app.run_log import log
 
@@ -356,13 +362,8 @@ def setup_github_auth():
 def run_git_sync(instance: str, projects: list):
     """Sync all project branches with their remotes."""
     log("git", "Running git sync...")
-    from app.git_sync import GitSync
-    for name, path in projects:
-        try:
-            gs = GitSync(instance, name, path)
-            gs.sync_and_report()
-        except Exception as e:
-            log("error", f"Git sync failed for {name}: {e}")
+    from app.git_sync import sync_projects
+    sync_projects(instance, projects)
 
 
 def run_daily_report():
@@ -400,6 +401,197 @@ def _safe_run(step_name: str, fn, *args, **kwargs):
         return None
 
 
+# ---------------------------------------------------------------------------
+# Step graph
+# ---------------------------------------------------------------------------
+
+# Worker threads for independent startup steps.  Most steps wait on disk,
+# git or the network, so a handful of threads is enough.
+STARTUP_WORKERS = 4
+
+
+@dataclass
+class StartupStep:
+    """One node of the startup graph.
+
+    ``deps`` names steps that must finish first (ordering only — a failed
+    dependency does not skip its dependents).  ``deferred`` steps are not
+    needed before the first iteration and may run in the background.
+    """
+
+    name: str
+    fn: Callable[[], Any]
+    deps: Tuple[str, ...] = ()
+    deferred: bool = False
+
+
+def _run_timed(step: StartupStep) -> Tuple[Any, float]:
+    started = time.monotonic()
+    result = _safe_run(step.name, step.fn)
+    return result, time.monotonic() - started
+
+
+def run_steps(
+    steps: List[StartupStep],
+    max_workers: int = STARTUP_WORKERS,
+    done: Iterable[str] = (),
+) -> Tuple[Dict[str, Any], Dict[str, float]]:
+    """Run *steps*, starting each as soon as its dependencies are done.
+
+    *done* names steps that already ran (e.g. the critical steps, when
+    running the deferred ones), so dependencies on them are satisfied.
+
+    Independent steps run concurrently.  Failures are logged and don't
+    stop other steps; BaseExceptions (SystemExit, KeyboardInterrupt)
+    propagate.  Returns ``(results, timings)`` keyed by step name, with
+    timings in seconds.
+
+    Raises ValueError on unknown dependencies or a dependency cycle.
+    """
+    done = set(done)
+    names = {s.name for s in steps} | done
+    for step in steps:
+        unknown = [d for d in step.deps if d not in names]
+        if unknown:
+            raise ValueError(f"Startup step {step.name!r} depends on unknown {unknown}")
+
+    pending = list(steps)
+    running: Dict[Future, StartupStep] = {}
+    results: Dict[str, Any] = {}
+    timings: Dict[str, float] = {}
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="startup") as pool:
+        while pending or running:
+            ready = [s for s in pending if all(d in done for d in s.deps)]
+            for step in ready:
+                pending.remove(step)
+                running[pool.submit(_run_timed, step)] = step
+            if not running:
+                stuck = ", ".join(s.name for s in pending)
+                raise ValueError(f"Startup steps have a dependency cycle: {stuck}")
+            finished, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in finished:
+                step = running.pop(future)
+                results[step.name], timings[step.name] = future.result()
+                done.add(step.name)
+    return results, timings
+
+
+def _log_timings(label: str, timings: Dict[str, float], elapsed: float):
+    """Log wall-clock time and the slowest steps of a startup phase."""
+    slowest = sorted(timings.items(), key=lambda kv: kv[1], reverse=True)[:3]
+    detail = ", ".join(f"{name} {secs:.1f}s" for name, secs in slowest)
+    log("init", f"{label}: {len(timings)} steps in {elapsed:.1f}s (slowest: {detail})")
+
+
+_deferred_thread: Optional[threading.Thread] = None
+
+
+def _run_deferred(steps: List[StartupStep], done: Iterable[str]):
+    started = time.monotonic()
+    _, timings = run_steps(steps, done=done)
+    _log_timings("Deferred startup", timings, time.monotonic() - started)
+
+
+def start_deferred_steps(steps: List[StartupStep], done: Iterable[str] = ()) -> threading.Thread:
+    """Run deferred steps in a background daemon thread."""
+    global _deferred_thread
+    _deferred_thread = threading.Thread(
+        target=_run_deferred, args=(steps, tuple(done)), name="startup-deferred", daemon=True,
+    )
+    _deferred_thread.start()
+    return _deferred_thread
+
+
+def wait_for_deferred_steps(timeout: Optional[float] = None) -> bool:
+    """Join the background deferred steps. Returns True once they're done."""
+    thread = _deferred_thread
+    if thread is None:
+        return True
+    thread.join(timeout)
+    return not thread.is_alive()
+
+
+def _morning_ritual_with_notifications(instance: str):
+    """Morning ritual bracketed by start/outcome Telegram pings."""
+    from app.run import _notify_raw
+
+    # Startup-status pings use _notify_raw so the 🌅/⚠️ markers and exact
+    # wording reach Telegram intact (no Claude CLI rewrite).
+    _notify_raw(instance, "🌅 Running morning ritual (Claude CLI, up to ~90s)...")
+    ritual_error = ""
+    try:
+        ritual_ok = run_morning_ritual(instance)
+    except Exception as e:
+        log("error", f"Morning ritual failed: {e}")
+        ritual_ok = None
+        ritual_error = str(e)
+    # Deferred: the first iteration may already be running, so the
+    # pings only report the ritual's own outcome.
+    if ritual_ok:
+        _notify_raw(instance, "🌅 Morning ritual complete.")
+    elif ritual_ok is None:
+        reason = f" ({ritual_error})" if ritual_error else ""
+        _notify_raw(instance, f"⚠️ Morning ritual failed{reason}.")
+    else:
+        _notify_raw(instance, "⏭️ Morning ritual skipped.")
+    return ritual_ok
+
+
+def build_startup_steps(koan_root: str, instance: str, state: dict) -> List[StartupStep]:
+    """Declare the startup graph.
+
+    *state* carries values produced by one step and read by later ones
+    (``state["projects"]`` is refreshed by workspace discovery).
+    Dependencies mostly serialize steps that write the same file:
+    projects.yaml (migration → GitHub URLs → discovery) and missions.md
+    (crash recovery → sanity checks → pruning).  Git sync moves project
+    branches, so it finishes before the first mission prepares its own;
+    only steps that are safe alongside a running mission are deferred.
+    """
+    def discover():
+        result = discover_workspace(koan_root, state["projects"])
+        if result is not None:
+            state["projects"] = result
+        return result
+
+    steps = [
+        StartupStep("Config validation", lambda: validate_config(koan_root)),
+        StartupStep("Crash recovery", lambda: recover_crashed_missions(instance)),
+        StartupStep("Projects migration", lambda: run_migrations(koan_root)),
+        StartupStep("GitHub URL population", lambda: populate_github_urls(koan_root),
+                    deps=("Projects migration",)),
+        StartupStep("Workspace discovery", discover, deps=("GitHub URL population",)),
+        StartupStep("Sanity checks", lambda: run_sanity_checks(instance),
+                    deps=("Crash recovery", "Workspace discovery")),
+        StartupStep("Memory cleanup", lambda: cleanup_memory(instance)),
+        StartupStep("Missions pruning", lambda: prune_missions_done(instance),
+                    deps=("Sanity checks",)),
+        StartupStep("Mission history cleanup", lambda: cleanup_mission_history(instance)),
+        StartupStep("Health check", lambda: check_health(koan_root)),
+        StartupStep("Self-reflection check", lambda: check_self_reflection(instance),
+                    deps=("Memory cleanup",)),
+        StartupStep("Start on pause", lambda: handle_start_on_pause(koan_root)),
+        StartupStep("Start passive", lambda: handle_start_passive(koan_root)),
+        StartupStep("Git identity", setup_git_identity),
+        StartupStep("GitHub auth", setup_github_auth),
+        StartupStep("Git sync", lambda: run_git_sync(instance, state["projects"]),
+                    deps=("Workspace discovery", "Git identity", "GitHub auth")),
+    ]
+    # Auto-update pulls new code and may restart the agent: run it alone,
+    # once every other critical step is done.
+    steps.append(StartupStep(
+        "Auto-update check", lambda: check_auto_update(koan_root, instance),
+        deps=tuple(s.name for s in steps),
+    ))
+    # Not needed before the first mission
+    steps += [
+        StartupStep("Daily report", run_daily_report, deferred=True),
+        StartupStep("Morning ritual", lambda: _morning_ritual_with_notifications(instance),
+                    deferred=True),
+    ]
+    return steps
+
+
 # ---------------------------------------------------------------------------
 # Main orchestrator
 # ---------------------------------------------------------------------------
@@ -407,9 +599,14 @@ def _safe_run(step_name: str, fn, *args, **kwargs):
 def run_startup(koan_root: str, instance: str, projects: list):
     """Run all startup tasks (crash recovery, health, sync, etc.).
 
+    Critical steps run as a dependency graph before returning; deferred
+    steps (daily report, morning ritual) run in a
+    background thread unless ``defer_startup_tasks`` is false.
+
     Returns (max_runs, interval, branch_prefix) configuration tuple.
     """
     from app.banners import print_agent_banner
+    from app.config import get_defer_startup_tasks
     from app.utils import (
         get_branch_prefix,
         get_cli_binary_for_shell,
@@ -429,43 +626,37 @@ def run_startup(koan_root: str, instance: str, projects: list):
     except Exception as e:
         log("error", f"Banner display failed: {e}")
 
-    # --- Protected startup checks ---
     # Import protected_phase lazily to avoid circular import
     # (run.py imports startup_manager, signal handling lives in run.py)
     from app.run import protected_phase
 
-    with protected_phase("Startup checks"):
-        _safe_run("Config validation", validate_config, koan_root)
-        _safe_run("Crash recovery", recover_crashed_missions, instance)
-        _safe_run("Projects migration", run_migrations, koan_root)
-        _safe_run("GitHub URL population", populate_github_urls, koan_root)
-
-        result = _safe_run("Workspace discovery", discover_workspace, koan_root, projects)
-        if result is not None:
-            projects = result
-
-        _safe_run("Sanity checks", run_sanity_checks, instance)
-        _safe_run("Memory cleanup", cleanup_memory, instance)
-        _safe_run("Missions pruning", prune_missions_done, instance)
-        _safe_run("Mission history cleanup", cleanup_mission_history, instance)
-        _safe_run("Health check", check_health, koan_root)
-
-    with protected_phase("Self-reflection check"):
-        _safe_run("Self-reflection check", check_self_reflection, instance)
+    state = {"projects": projects}
+    steps = build_startup_steps(koan_root, instance, state)
+    critical = [s for s in steps if not s.deferred]
+    deferred = [s for s in steps if s.deferred]
 
-    # Start on pause / passive
-    _safe_run("Start on pause", handle_start_on_pause, koan_root)
-    _safe_run("Start passive", handle_start_passive, koan_root)
+    started = time.monotonic()
+    with protected_phase("Startup checks"):
+        results, timings = run_steps(critical)
+    _log_timings("Startup", timings, time.monotonic() - started)
+    projects = state["projects"]
 
-    # Git identity and GitHub auth
-    _safe_run("Git identity", setup_git_identity)
-    _safe_run("GitHub auth", setup_github_auth)
+    if results.get("Auto-update check"):
+        # Restart signal has been set — notify so the human knows the agent
+        # is restarting under newer code, then exit to let wrapper restart us.
+        # Use _notify_raw so the verbatim text + 🔄 marker survive (skipping
+        # the Claude-CLI personality reformatter).
+        from app.run import _notify_raw
+        _notify_raw(instance, "🔄 Auto-update pulled new commits — restarting under updated code...")
+        import sys
+        from app.restart_manager import RESTART_EXIT_CODE
+        sys.exit(RESTART_EXIT_CODE)
 
     # Startup notification
     log("init", f"Starting. Max runs: {max_runs}, interval: {interval}s")
 
     # Import status/notify helpers lazily from run
-    from app.run import set_status, _build_startup_status, _notify, _notify_raw
+    from app.run import set_status, _build_startup_status, _notify
 
     project_list = "\n".join(f"  • {n}" for n, _ in sorted(projects))
     current_project = projects[0][0] if projects else "none"
@@ -478,42 +669,14 @@ def run_startup(koan_root: str, instance: str, projects: list):
         f"Status: {status_line}"
     ))
 
-    with protected_phase("Git sync"):
-        run_git_sync(instance, projects)
-
-    # Auto-update check (before daily report / morning ritual)
-    updated = _safe_run("Auto-update check", check_auto_update, koan_root, instance)
-    if updated:
-        # Restart signal has been set — notify so the human knows the agent
-        # is restarting under newer code, then exit to let wrapper restart us.
-        # Use _notify_raw so the verbatim text + 🔄 marker survive (skipping
-        # the Claude-CLI personality reformatter).
-        _notify_raw(instance, "🔄 Auto-update pulled new commits — restarting under updated code...")
-        import sys
-        from app.restart_manager import RESTART_EXIT_CODE
-        sys.exit(RESTART_EXIT_CODE)
-
-    # Daily report
-    _safe_run("Daily report", run_daily_report)
-
-    # Startup-status pings use _notify_raw so the 🌅/⚠️ markers and exact
-    # wording reach Telegram intact (no Claude CLI rewrite).
-    _notify_raw(instance, "🌅 Running morning ritual (Claude CLI, up to ~90s)...")
-    ritual_error = ""
-    with protected_phase("Morning ritual"):
-        try:
-            ritual_ok = run_morning_ritual(instance)
-        except Exception as e:
-            log("error", f"Morning ritual failed: {e}")
-            ritual_ok = None
-            ritual_error = str(e)
-    if ritual_ok:
-        _notify_raw(instance, "🌅 Morning ritual complete — preparing first iteration.")
-    elif ritual_ok is None:
-        reason = f" ({ritual_error})" if ritual_error else ""
-        _notify_raw(instance, f"⚠️ Morning ritual failed{reason} — preparing first iteration anyway.")
+    if get_defer_startup_tasks():
+        log("init", "Running " + ", ".join(s.name.lower() for s in deferred) + " in background")
+        start_deferred_steps(deferred, done=results)
     else:
-        _notify_raw(instance, "⏭️ Morning ritual skipped — preparing first iteration.")
+        started = time.monotonic()
+        with protected_phase("Deferred startup"):
+            _, timings = run_steps(deferred, done=results)
+        _log_timings("Deferred startup", timings, time.monotonic() - started)
 
     # Initialize hook system and fire session_start
     from app.hooks import fire_hook, init_hooks
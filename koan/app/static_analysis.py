@@ -0,0 +1,627 @@
+"""
+Kōan -- Local static-analysis pre-pass for codebase scanners.
+
+The dead_code, tech_debt and audit runners hand a whole project to the
+CLI with read-only tools.  Without hints, the model spends most of its
+turns grepping around to find unreferenced symbols and hotspots.  This
+module builds a cheap local index first and renders it as ranked
+candidates the prompt can start from:
+
+- Symbol definitions and references (Python, via ``ast``)
+- Module import graph (fan-in per module, orphan modules)
+- Cyclomatic complexity per function
+- File churn from ``git log``
+
+The index is cached per commit, so repeated scans of an unchanged repo
+cost a single ``git rev-parse``.
+
+Usage:
+    from app.static_analysis import load_or_build_index, format_dead_code_candidates
+
+    index = load_or_build_index(project_path, cache_path)
+    section = format_dead_code_candidates(index)
+"""
+
+import ast
+import json
+import os
+import re
+import sys
+from collections import Counter
+from pathlib import Path
+from typing import Dict, List, Optional, Set
+
+from app.git_utils import run_git
+
+# Bump when the index layout changes so stale caches are rebuilt.
+INDEX_VERSION = 2
+
+# Guard rails for very large repositories.
+MAX_FILES = 5000
+MAX_FILE_BYTES = 1_000_000
+
+# Churn window passed to ``git log``.
+CHURN_SINCE = "180 days ago"
+CHURN_MAX_COMMITS = 1000
+
+_SKIP_DIRS = {
+    ".git", ".venv", "venv", "node_modules", "vendor", "dist", "build",
+    "__pycache__", ".tox", ".mypy_cache", ".pytest_cache", ".worktrees",
+}
+
+# Names that are invoked implicitly (protocols, entry points, test hooks).
+_IMPLICIT_NAMES = {
+    "main", "setUp", "tearDown", "setUpClass", "tearDownClass",
+    "setup_module", "teardown_module", "setup_method", "teardown_method",
+    "conftest",
+}
+
+_IDENT_RE = re.compile(r"\b[A-Za-z_][A-Za-z0-9_]*\b")
+
+# AST nodes that add one decision point to cyclomatic complexity.
+_BRANCH_NODES = (
+    ast.If, ast.For, ast.AsyncFor, ast.While, ast.ExceptHandler,
+    ast.IfExp, ast.Assert, ast.comprehension,
+) + ((ast.match_case,) if hasattr(ast, "match_case") else ())
+
+
+# ---------------------------------------------------------------------------
+# File discovery
+# ---------------------------------------------------------------------------
+
+def _is_test_path(rel_path: str) -> bool:
+    """Check if a relative path looks like a test module."""
+    parts = rel_path.split("/")
+    name = parts[-1]
+    return (
+        "tests" in parts[:-1]
+        or "test" in parts[:-1]
+        or name.startswith("test_")
+        or name.endswith("_test.py")
+        or name == "conftest.py"
+    )
+
+
+def _list_files(project_path: str) -> List[str]:
+    """List tracked Python files (relative paths), honoring .gitignore when possible.
+
+    Non-Python files are dropped before the MAX_FILES cap so they don't use
+    up its slots.
+    """
+    rc, stdout, _ = run_git("ls-files", cwd=project_path, timeout=30)
+    if rc == 0 and stdout:
+        files = [
+            f for f in stdout.splitlines()
+            if f.endswith(".py") and not any(p in _SKIP_DIRS for p in f.split("/")[:-1])
+        ]
+        return files[:MAX_FILES]
+
+    files = []
+    root = Path(project_path)
+    for dirpath, dirnames, filenames in os.walk(project_path):
+        dirnames[:] = [d for d in dirnames if d not in _SKIP_DIRS]
+        for name in filenames:
+            if not name.endswith(".py"):
+                continue
+            files.append(str((Path(dirpath) / name).relative_to(root)))
+            if len(files) >= MAX_FILES:
+                return files
+    return files
+
+
+def _module_name(rel_path: str) -> str:
+    """Convert ``pkg/sub/mod.py`` to ``pkg.sub.mod`` (packages drop __init__)."""
+    parts = rel_path[:-3].split("/")
+    if parts[-1] == "__init__":
+        parts = parts[:-1]
+    return ".".join(parts)
+
+
+# ---------------------------------------------------------------------------
+# Per-file analysis
+# ---------------------------------------------------------------------------
+
+def _resolve_import(module: str, node: ast.ImportFrom) -> List[str]:
+    """Return candidate absolute module names for a ``from ... import``."""
+    base = node.module or ""
+    if node.level:
+        pkg = module.split(".")
+        pkg = pkg[:len(pkg) - node.level] if len(pkg) >= node.level else []
+        base = ".".join(p for p in pkg + ([base] if base else []) if p)
+    targets = [base] if base else []
+    for alias in node.names:
+        if alias.name != "*":
+            targets.append(f"{base}.{alias.name}" if base else alias.name)
+    return targets
+
+
+class _FileVisitor:
+    """Single-pass AST walker collecting everything the index needs.
+
+    Cyclomatic complexity is attributed to the innermost enclosing
+    function, so nested helpers are measured on their own.
+    """
+
+    def __init__(self, rel_path: str, module: str):
+        self.rel_path = rel_path
+        self.module = module
+        # Packages resolve relative imports against themselves.
+        self.anchor = f"{module}.__init__" if rel_path.endswith("__init__.py") else module
+        self.definitions: List[dict] = []
+        self.references: Counter = Counter()
+        self.local_uses: Set[str] = set()
+        self.string_idents: Set[str] = set()
+        self.imported: Dict[str, int] = {}
+        self.imports: List[str] = []
+        self.from_imports: Dict[str, List[str]] = {}
+        self.exported: List[str] = []
+
+    def visit(self, node: ast.AST, owner: str = "", func: Optional[dict] = None):
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef, ast.ClassDef)):
+            is_class = isinstance(node, ast.ClassDef)
+            definition = {
+                "name": node.name,
+                "kind": "class" if is_class else ("method" if owner else "function"),
+                "owner": owner,
+                "line": node.lineno,
+                "end_line": getattr(node, "end_lineno", node.lineno),
+                "decorated": bool(node.decorator_list),
+                "complexity": 0 if is_class else 1,
+            }
+            # Only module- and class-level symbols are indexed; nested
+            # helpers still get their own complexity counter.
+            if func is None:
+                self.definitions.append(definition)
+            for child in ast.iter_child_nodes(node):
+                if is_class:
+                    self.visit(child, owner=node.name, func=func)
+                else:
+                    self.visit(child, owner="", func=definition)
+            return
+
+        if func is not None:
+            if isinstance(node, _BRANCH_NODES):
+                func["complexity"] += 1
+            elif isinstance(node, ast.BoolOp):
+                func["complexity"] += len(node.values) - 1
+
+        if isinstance(node, ast.Name):
+            self.references[node.id] += 1
+            if not isinstance(node.ctx, ast.Store):
+                self.local_uses.add(node.id)
+        elif isinstance(node, ast.Attribute):
+            self.references[node.attr] += 1
+        elif isinstance(node, ast.Constant) and isinstance(node.value, str):
+            if len(node.value) <= 200:
+                self.string_idents.update(_IDENT_RE.findall(node.value))
+        elif isinstance(node, ast.Import):
+            for alias in node.names:
+                self.imports.append(alias.name)
+                local = alias.asname or alias.name.split(".")[0]
+                self.imported.setdefault(local, node.lineno)
+        elif isinstance(node, ast.ImportFrom) and node.module != "__future__":
+            targets = _resolve_import(self.anchor, node)
+            self.imports.extend(targets)
+            names = [a.name for a in node.names if a.name != "*"]
+            if targets:
+                self.from_imports.setdefault(targets[0], []).extend(names)
+            for alias in node.names:
+                # Importing a name elsewhere counts as using it.
+                self.references[alias.name] += 1
+                if alias.name != "*":
+                    self.imported.setdefault(alias.asname or alias.name, node.lineno)
+        elif isinstance(node, ast.Assign):
+            for target in node.targets:
+                if (
+                    isinstance(target, ast.Name) and target.id == "__all__"
+                    and isinstance(node.value, (ast.List, ast.Tuple))
+                ):
+                    self.exported.extend(
+                        e.value for e in node.value.elts
+                        if isinstance(e, ast.Constant) and isinstance(e.value, str)
+                    )
+
+        for child in ast.iter_child_nodes(node):
+            self.visit(child, owner=owner, func=func)
+
+
+def _analyze_source(rel_path: str, source: str) -> Optional[dict]:
+    """Parse one Python file into definitions, references and imports.
+
+    Returns None when the file cannot be parsed.
+    """
+    try:
+        tree = ast.parse(source, filename=rel_path)
+    except (SyntaxError, ValueError, RecursionError):
+        return None
+
+    visitor = _FileVisitor(rel_path, _module_name(rel_path))
+    try:
+        visitor.visit(tree)
+    except RecursionError:
+        return None
+
+    unused_imports = []
+    if not rel_path.endswith("__init__.py"):
+        for name, line in visitor.imported.items():
+            if (
+                name != "_"
+                and name not in visitor.local_uses
+                and name not in visitor.exported
+                and name not in visitor.string_idents
+            ):
+                unused_imports.append({"name": name, "line": line})
+
+    return {
+        "module": visitor.module,
+        "lines": source.count("\n") + 1,
+        "definitions": visitor.definitions,
+        "references": dict(visitor.references),
+        "string_idents": sorted(visitor.string_idents),
+        "imports": sorted(set(visitor.imports)),
+        "from_imports": visitor.from_imports,
+        "exported": visitor.exported,
+        "unused_imports": unused_imports,
+        "is_script": "__main__" in visitor.string_idents,
+    }
+
+
+# ---------------------------------------------------------------------------
+# Git churn
+# ---------------------------------------------------------------------------
+
+def _git_churn(project_path: str) -> Dict[str, int]:
+    """Count commits touching each file over the churn window."""
+    rc, stdout, _ = run_git(
+        "log", f"--since={CHURN_SINCE}", f"-n{CHURN_MAX_COMMITS}",
+        "--no-merges", "--name-only", "--relative", "--format=", "--", ".",
+        cwd=project_path, timeout=60,
+    )
+    if rc != 0:
+        return {}
+    return dict(Counter(line for line in stdout.splitlines() if line.strip()))
+
+
+def _head_commit(project_path: str) -> str:
+    """Return the HEAD SHA, or empty string outside a git repo."""
+    rc, stdout, _ = run_git("rev-parse", "HEAD", cwd=project_path, timeout=10)
+    return stdout if rc == 0 else ""
+
+
+# ---------------------------------------------------------------------------
+# Index
+# ---------------------------------------------------------------------------
+
+def build_index(project_path: str) -> dict:
+    """Build the static-analysis index for a project.
+
+    Returns a JSON-serializable dict with per-file analysis, project-wide
+    reference counts, module fan-in and churn.
+    """
+    files = _list_files(project_path)
+    root = Path(project_path)
+
+    per_file: Dict[str, dict] = {}
+    references: Counter = Counter()
+    string_idents: Set[str] = set()
+
+    for rel_path in files:
+        full = root / rel_path
+        try:
+            if full.stat().st_size > MAX_FILE_BYTES:
+                continue
+            source = full.read_text(encoding="utf-8", errors="replace")
+        except OSError:
+            continue
+        info = _analyze_source(rel_path, source)
+        if info is None:
+            continue
+        per_file[rel_path] = info
+        references.update(info["references"])
+        string_idents.update(info["string_idents"])
+
+    modules = {info["module"]: path for path, info in per_file.items()}
+
+    # Names other modules pull from each module: an "unused" import that
+    # somebody imports back is a re-export, not dead code.  Names quoted
+    # anywhere (mock.patch targets, getattr) are kept for the same reason.
+    reexported: Dict[str, Set[str]] = {}
+    for info in per_file.values():
+        for target, names in info["from_imports"].items():
+            reexported.setdefault(target, set()).update(names)
+
+    fan_in: Counter = Counter()
+    for path, info in per_file.items():
+        seen = set()
+        for target in info["imports"]:
+            # Match the longest project module prefix of the import target.
+            parts = target.split(".")
+            for i in range(len(parts), 0, -1):
+                candidate = ".".join(parts[:i])
+                if candidate in modules and modules[candidate] != path:
+                    seen.add(candidate)
+                    break
+        fan_in.update(seen)
+
+    return {
+        "version": INDEX_VERSION,
+        "commit": _head_commit(project_path),
+        "files": {
+            path: {
+                "module": info["module"],
+                "lines": info["lines"],
+                "definitions": info["definitions"],
+                "exported": info["exported"],
+                "unused_imports": [
+                    imp for imp in info["unused_imports"]
+                    if imp["name"] not in reexported.get(info["module"], ())
+                    and imp["name"] not in string_idents
+                ],
+                "is_script": info["is_script"],
+            }
+            for path, info in per_file.items()
+        },
+        "references": dict(references),
+        "string_idents": sorted(string_idents),
+        "fan_in": dict(fan_in),
+        "churn": _git_churn(project_path),
+        "file_count": len(files),
+    }
+
+
+def load_or_build_index(project_path: str, cache_path: Optional[Path] = None) -> dict:
+    """Return the index for *project_path*, reusing the cache for the same commit.
+
+    The cache is only trusted when both the index version and HEAD match.
+    Any cache I/O error silently falls back to a fresh build.
+    """
+    commit = _head_commit(project_path)
+    if cache_path is not None and commit and cache_path.exists():
+        try:
+            cached = json.loads(cache_path.read_text())
+            if cached.get("version") == INDEX_VERSION and cached.get("commit") == commit:
+                return cached
+        except (OSError, ValueError):
+            pass
+
+    index = build_index(project_path)
+
+    if cache_path is not None and index.get("commit"):
+        try:
+            from app.utils import atomic_write
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            atomic_write(cache_path, json.dumps(index))
+        except OSError as e:
+            print(f"[static_analysis] Cache write failed: {e}", file=sys.stderr)
+
+    return index
+
+
+def get_cache_path(instance_dir: Path, project_name: str) -> Path:
+    """Location of the cached index for a project under the instance dir."""
+    return Path(instance_dir) / ".static-analysis" / f"{project_name}.json"
+
+
+# ---------------------------------------------------------------------------
+# Candidate ranking
+# ---------------------------------------------------------------------------
+
+def find_dead_code_candidates(index: dict) -> List[dict]:
+    """Rank definitions that have no reference anywhere in the project.
+
+    Certainty:
+    - ``high``: private or module-level symbol with zero references
+    - ``medium``: public method or symbol with zero references
+    - ``low``: only referenced from string literals (possible dynamic
+      dispatch) or decorated (possible framework registration)
+    """
+    references = index.get("references", {})
+    string_idents = set(index.get("string_idents", []))
+    candidates = []
+
+    for path, info in index.get("files", {}).items():
+        if _is_test_path(path):
+            continue
+        exported = set(info.get("exported", []))
+        for d in info.get("definitions", []):
+            name = d["name"]
+            if (name.startswith("__") and name.endswith("__")) or name in _IMPLICIT_NAMES:
+                continue
+            if name in exported or references.get(name, 0) > 0:
+                continue
+            if d["decorated"] or name in string_idents:
+                certainty = "low"
+            elif d["kind"] == "method" and not name.startswith("_"):
+                certainty = "medium"
+            else:
+                certainty = "high"
+            candidates.append({
+                "certainty": certainty,
+                "path": path,
+                "line": d["line"],
+                "name": f"{d['owner']}.{name}" if d["owner"] else name,
+                "kind": d["kind"],
+                "size": d["end_line"] - d["line"] + 1,
+            })
+
+        for imp in info.get("unused_imports", []):
+            candidates.append({
+                "certainty": "high",
+                "path": path,
+                "line": imp["line"],
+                "name": imp["name"],
+                "kind": "import",
+                "size": 1,
+            })
+
+    for path, info in index.get("files", {}).items():
+        module = info["module"]
+        if (
+            _is_test_path(path) or info["is_script"] or not module
+            or path.endswith("__init__.py") or path.endswith("setup.py")
+            or path.endswith("__main__.py")
+            or index.get("fan_in", {}).get(module, 0) > 0
+        ):
+            continue
+        candidates.append({
+            "certainty": "low",
+            "path": path,
+            "line": 1,
+            "name": module,
+            "kind": "module",
+            "size": info["lines"],
+        })
+
+    order = {"high": 0, "medium": 1, "low": 2}
+    candidates.sort(key=lambda c: (order[c["certainty"]], -c["size"], c["path"], c["line"]))
+    return candidates
+
+
+def find_hotspots(index: dict) -> List[dict]:
+    """Rank files by churn x complexity (hotspots worth a closer look)."""
+    churn = index.get("churn", {})
+    files = index.get("files", {})
+    hotspots = []
+
+    # Only files that still exist and were analyzed: churn also counts
+    # deleted and non-Python paths, which have no complexity to weigh.
+    for path, info in files.items():
+        defs = info["definitions"]
+        complexity = sum(d["complexity"] for d in defs)
+        max_fn = max(defs, key=lambda d: d["complexity"], default=None)
+        commits = churn.get(path, 0)
+        score = commits * max(complexity, 1)
+        if score <= 1 or _is_test_path(path):
+            continue
+        hotspots.append({
+            "path": path,
+            "churn": commits,
+            "complexity": complexity,
+            "lines": info["lines"],
+            "fan_in": index.get("fan_in", {}).get(info["module"], 0),
+            "worst_function": (
+                f"{max_fn['name']} (CC {max_fn['complexity']}, line {max_fn['line']})"
+                if max_fn and max_fn["complexity"] > 1 else ""
+            ),
+            "score": score,
+        })
+
+    hotspots.sort(key=lambda h: (-h["score"], h["path"]))
+    return hotspots
+
+
+def find_complex_functions(index: dict, threshold: int = 10) -> List[dict]:
+    """Return functions whose cyclomatic complexity reaches *threshold*."""
+    results = []
+    for path, info in index.get("files", {}).items():
+        if _is_test_path(path):
+            continue
+        for d in info["definitions"]:
+            if d["complexity"] >= threshold:
+                name = f"{d['owner']}.{d['name']}" if d["owner"] else d["name"]
+                results.append({
+                    "path": path, "line": d["line"], "name": name,
+                    "complexity": d["complexity"],
+                    "length": d["end_line"] - d["line"] + 1,
+                })
+    results.sort(key=lambda r: (-r["complexity"], r["path"]))
+    return results
+
+
+# ---------------------------------------------------------------------------
+# Prompt formatting
+# ---------------------------------------------------------------------------
+
+_PREAMBLE = (
+    "## Static Analysis Pre-pass\n\n"
+    "A local static analysis of commit `{commit}` produced the ranked "
+    "candidates below. Start from them: verify each with a targeted Grep "
+    "instead of re-scanning the whole tree, and only explore further when "
+    "the list runs dry. The analysis cannot see dynamic dispatch, "
+    "framework registration or non-Python callers — confirm before "
+    "reporting.\n"
+)
+
+
+def _preamble(index: dict) -> str:
+    return _PREAMBLE.format(commit=(index.get("commit") or "working tree")[:12])
+
+
+def format_dead_code_candidates(index: dict, limit: int = 40) -> str:
+    """Render dead code candidates as a prompt section (empty if none)."""
+    candidates = find_dead_code_candidates(index)
+    if not candidates:
+        return ""
+
+    lines = [_preamble(index), "### Unreferenced Symbols\n"]
+    for c in candidates[:limit]:
+        lines.append(
+            f"- [{c['certainty']}] `{c['path']}:{c['line']}` "
+            f"{c['kind']} `{c['name']}`"
+            + (f" ({c['size']} lines)" if c["size"] > 1 else "")
+        )
+    if len(candidates) > limit:
+        lines.append(f"- … {len(candidates) - limit} more not shown")
+    return "\n".join(lines) + "\n"
+
+
+def format_hotspots(index: dict, limit: int = 15) -> str:
+    """Render churn/complexity hotspots as a prompt section (empty if none)."""
+    hotspots = find_hotspots(index)
+    complex_fns = find_complex_functions(index)
+    if not hotspots and not complex_fns:
+        return ""
+
+    lines = [_preamble(index)]
+    if hotspots:
+        lines.append(
+            "### Hotspots (commits in the last 180 days × total complexity)\n"
+        )
+        for h in hotspots[:limit]:
+            detail = f"{h['churn']} commits"
+            if h["complexity"]:
+                detail += f", CC {h['complexity']}, {h['lines']} lines"
+            if h["fan_in"]:
+                detail += f", imported by {h['fan_in']} modules"
+            if h["worst_function"]:
+                detail += f", worst: {h['worst_function']}"
+            lines.append(f"- `{h['path']}` — {detail}")
+    if complex_fns:
+        lines.append("\n### Most Complex Functions\n")
+        for f in complex_fns[:limit]:
+            lines.append(
+                f"- `{f['path']}:{f['line']}` `{f['name']}` — "
+                f"CC {f['complexity']}, {f['length']} lines"
+            )
+    return "\n".join(lines) + "\n"
+
+
+def build_static_context(
+    project_path: str,
+    instance_dir: Path,
+    project_name: str,
+    kind: str,
+) -> str:
+    """Build the pre-pass prompt section for a scanner runner.
+
+    Args:
+        project_path: Local path to the project.
+        instance_dir: Instance directory (for the per-commit cache).
+        project_name: Project name (cache key).
+        kind: ``"dead_code"`` for unreferenced symbols, anything else for
+            hotspots and complex functions.
+
+    Returns:
+        Markdown section, or empty string when analysis fails or finds
+        nothing — the scan then proceeds exactly as before.
+    """
+    try:
+        index = load_or_build_index(
+            project_path, get_cache_path(instance_dir, project_name),
+        )
+        if kind == "dead_code":
+            return format_dead_code_candidates(index)
+        return format_hotspots(index)
+    except Exception as e:
+        print(f"[static_analysis] Pre-pass failed: {e}", file=sys.stderr)
+        return ""
@@ -0,0 +1,211 @@
+"""
+Kōan -- Tail readers for append-only history files.
+
+Conversation history, reactions and the security audit log are JSONL
+files that only ever grow; journals are append-only markdown.  Callers
+almost always want the *last* N entries, yet reading them with
+``readlines()`` costs the whole file — tens of MB for a busy audit log —
+on every chat turn.
+
+These helpers seek from the end of the file in fixed-size blocks and
+stop as soon as they have enough data:
+
+- ``iter_lines_reverse()`` — lazy newest-first line iterator
+- ``tail_lines()`` — last N lines, oldest first
+- ``tail_jsonl()`` — last N valid JSON objects, oldest first
+- ``read_tail_text()`` / ``tail_text()`` — last N characters
+
+Readers take a shared ``flock`` (writers in this codebase take an
+exclusive one), so they never observe a half-written record from a
+cooperating writer.  A trailing line without a newline — an
+uncooperative writer mid-append — can be skipped with
+``include_partial=False``; ``tail_jsonl()`` drops it naturally when it
+does not parse.
+"""
+
+import fcntl
+import json
+import os
+from pathlib import Path
+from typing import Callable, Dict, Iterator, List, Optional, Tuple
+
+DEFAULT_BLOCK_SIZE = 8192
+
+# UTF-8 encodes any character in at most 4 bytes.
+_MAX_BYTES_PER_CHAR = 4
+
+
+def _reverse_raw_lines(f, block_size: int) -> Iterator[bytes]:
+    """Yield raw lines from a binary file handle, newest first.
+
+    The first value is whatever follows the final newline: ``b""`` when
+    the file ends with a newline, otherwise the partial trailing line.
+    """
+    f.seek(0, os.SEEK_END)
+    pos = f.tell()
+    remainder = b""
+    while pos > 0:
+        size = min(block_size, pos)
+        pos -= size
+        f.seek(pos)
+        parts = (f.read(size) + remainder).split(b"\n")
+        remainder = parts[0]
+        for line in reversed(parts[1:]):
+            yield line
+    yield remainder
+
+
+def iter_lines_reverse(
+    path: Path,
+    *,
+    include_partial: bool = True,
+    lock: bool = True,
+    block_size: int = DEFAULT_BLOCK_SIZE,
+) -> Iterator[str]:
+    """Iterate over the lines of *path*, newest first.
+
+    Lines are decoded as UTF-8 (invalid bytes replaced) without their
+    line terminator.  The file stays open — and share-locked when *lock*
+    is True — until the iterator is exhausted or closed, so callers that
+    stop early should use ``contextlib.closing()`` or let it go out of
+    scope promptly.
+
+    Args:
+        path: File to read. A missing file yields nothing.
+        include_partial: Yield a trailing line that has no newline yet.
+        lock: Hold a shared flock while reading.
+        block_size: Bytes read per seek.
+    """
+    try:
+        f = open(path, "rb")
+    except FileNotFoundError:
+        return
+    with f:
+        if lock:
+            fcntl.flock(f, fcntl.LOCK_SH)
+        try:
+            first = True
+            for raw in _reverse_raw_lines(f, block_size):
+                if first:
+                    first = False
+                    # Empty means the file ends with a newline — nothing pending.
+                    if not raw or not include_partial:
+                        continue
+                yield raw.rstrip(b"\r").decode("utf-8", errors="replace")
+        finally:
+            if lock:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+
+def tail_lines(
+    path: Path,
+    count: int,
+    *,
+    include_partial: bool = True,
+    skip_blank: bool = False,
+    lock: bool = True,
+    block_size: int = DEFAULT_BLOCK_SIZE,
+) -> List[str]:
+    """Return the last *count* lines of *path*, oldest first.
+
+    Args:
+        path: File to read. A missing file returns ``[]``.
+        count: Maximum number of lines.
+        include_partial: Include a trailing line that has no newline yet.
+        skip_blank: Ignore whitespace-only lines (not counted).
+        lock: Hold a shared flock while reading.
+        block_size: Bytes read per seek.
+    """
+    if count <= 0:
+        return []
+    lines: List[str] = []
+    for line in iter_lines_reverse(
+        path, include_partial=include_partial, lock=lock, block_size=block_size,
+    ):
+        if skip_blank and not line.strip():
+            continue
+        lines.append(line)
+        if len(lines) >= count:
+            break
+    lines.reverse()
+    return lines
+
+
+def tail_jsonl(
+    path: Path,
+    count: int,
+    *,
+    predicate: Optional[Callable[[Dict], bool]] = None,
+    lock: bool = True,
+    block_size: int = DEFAULT_BLOCK_SIZE,
+) -> List[Dict]:
+    """Return the last *count* JSON objects of a JSONL file, oldest first.
+
+    Blank lines, unparseable lines (including a half-written trailing
+    record) and records rejected by *predicate* are skipped and do not
+    count toward *count*.
+    """
+    if count <= 0:
+        return []
+    records: List[Dict] = []
+    for line in iter_lines_reverse(path, lock=lock, block_size=block_size):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError:
+            continue
+        if predicate is not None and not predicate(record):
+            continue
+        records.append(record)
+        if len(records) >= count:
+            break
+    records.reverse()
+    return records
+
+
+def read_tail_text(
+    path: Path,
+    max_chars: int,
+    *,
+    lock: bool = True,
+) -> Tuple[str, bool]:
+    """Read the last *max_chars* characters of a UTF-8 text file.
+
+    Only the final ``max_chars * 4`` bytes are read, which always covers
+    *max_chars* characters.
+
+    Returns:
+        ``(text, truncated)`` — *truncated* is True when the file holds
+        more than *max_chars* characters (so *text* is a suffix).
+        A missing file returns ``("", False)``.
+    """
+    if max_chars <= 0:
+        return "", False
+    try:
+        f = open(path, "rb")
+    except FileNotFoundError:
+        return "", False
+    with f:
+        if lock:
+            fcntl.flock(f, fcntl.LOCK_SH)
+        try:
+            size = os.fstat(f.fileno()).st_size
+            start = max(0, size - max_chars * _MAX_BYTES_PER_CHAR)
+            f.seek(start)
+            data = f.read()
+        finally:
+            if lock:
+                fcntl.flock(f, fcntl.LOCK_UN)
+
+    # A mid-file start may split a multi-byte character: drop the fragment.
+    text = data.decode("utf-8", errors="ignore" if start else "replace")
+    if len(text) > max_chars:
+        return text[-max_chars:], True
+    return text, start > 0
+
+
+def tail_text(path: Path, max_chars: int, *, lock: bool = True) -> str:
+    """Return the last *max_chars* characters of *path* ("" if missing)."""
+    return read_tail_text(path, max_chars, lock=lock)[0]
@@ -0,0 +1,574 @@
+"""
+Kōan -- Test impact selection
+
+Maps the files changed on a branch to the tests that exercise them, so the
+post-mission quality gate (and the PR review runner) can run the affected
+subset instead of the whole suite.  Configured per-project via
+projects.yaml `test_impact` key.
+
+Two sources of truth, unioned:
+
+- **Import graph** (Python): every tracked ``.py`` file is parsed with
+  ``ast`` and its imports — including lazy, function-level imports and
+  dotted module strings such as ``patch("app.utils.load_config")`` — are
+  resolved to files in the repo.  A test is affected when it transitively
+  imports a changed file, or when a ``conftest.py`` above it does.
+  Parsed imports are cached by git blob SHA, so only files that changed
+  since the last run are re-parsed.
+- **Coverage map** (optional): a coverage.py data file recorded with
+  per-test contexts (``pytest --cov-context=test``).  The derived
+  source-file → test-file map is cached per data file.
+
+The full suite runs whenever the selection is unknown or empty: changes
+to non-Python files other than docs, deleted modules, packaging/pytest
+config, or no test reaching any changed file.
+
+Usage:
+    from app.test_impact import run_impacted_tests
+
+    result = run_impacted_tests(project_path, test_cmd, timeout=120,
+                                project_name="koan")
+"""
+
+import ast
+import hashlib
+import json
+import os
+import re
+import shlex
+import sqlite3
+import subprocess
+import sys
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Set
+
+from app.projects_config import (
+    get_project_config,
+    load_projects_config,
+    resolve_base_branch,
+)
+
+# Default subset command — {tests} expands to the selected test files,
+# relative to the project root.
+DEFAULT_COMMAND = "python -m pytest -q {tests}"
+
+_CACHE_DIRNAME = "koan-test-impact"
+_CACHE_VERSION = 1
+
+# Changed files matching these never affect test outcomes.  Markdown is
+# only ignored at the top level: prompt templates elsewhere are code.
+_IGNORED_TOP_LEVEL_SUFFIXES = (".md", ".rst")
+_IGNORED_NAMES = ("LICENSE", "AUTHORS", "CHANGELOG", "CODEOWNERS", ".gitignore")
+_IGNORED_DIRS = ("docs/",)
+
+# Files whose change can alter how every test runs.
+_GLOBAL_FILES = (
+    "pyproject.toml", "setup.py", "setup.cfg", "pytest.ini", "tox.ini",
+    "requirements.txt", "Makefile",
+)
+
+# A string literal that looks like a dotted module path (patch targets,
+# importlib.import_module arguments).
+_DOTTED_NAME_RE = re.compile(r"^[A-Za-z_]\w*(?:\.[A-Za-z_]\w*)+$")
+
+
+@dataclass
+class ImpactSelection:
+    """Tests selected for a set of changed files.
+
+    ``tests`` is None when the impact is unknown, and empty when no test
+    is affected; either way the full suite must run.
+    """
+
+    tests: Optional[List[str]]
+    reason: str
+    changed: List[str] = field(default_factory=list)
+
+
+def get_project_test_impact_config(config: dict, project_name: str) -> dict:
+    """Get test impact config for a project from projects.yaml.
+
+    Returns a dict with keys: enabled, command, full_suite, coverage_file.
+    Falls back to defaults section, then sensible defaults.
+    """
+    project_cfg = get_project_config(config, project_name)
+    impact = project_cfg.get("test_impact", {}) or {}
+
+    return {
+        "enabled": impact.get("enabled", False),
+        "command": impact.get("command", DEFAULT_COMMAND) or DEFAULT_COMMAND,
+        "full_suite": bool(impact.get("full_suite", False)),
+        "coverage_file": impact.get("coverage_file", ""),
+    }
+
+
+# ---------------------------------------------------------------------------
+# Git helpers
+# ---------------------------------------------------------------------------
+
+def _git(project_path: str, *args: str) -> Optional[str]:
+    try:
+        result = subprocess.run(
+            ["git", *args],
+            capture_output=True, text=True, timeout=30,
+            cwd=project_path, stdin=subprocess.DEVNULL,
+        )
+    except (subprocess.TimeoutExpired, FileNotFoundError, OSError):
+        return None
+    if result.returncode != 0:
+        return None
+    return result.stdout
+
+
+def get_changed_files(project_path: str, base_branch: str) -> Optional[List[str]]:
+    """List files changed since the branch forked from ``origin/<base>``.
+
+    Includes uncommitted and untracked files (the gate may run before the
+    final commit).  Returns None when the merge base cannot be determined.
+    """
+    merge_base = _git(project_path, "merge-base", f"origin/{base_branch}", "HEAD")
+    if not merge_base or not merge_base.strip():
+        return None
+    diff = _git(project_path, "diff", "--name-only", merge_base.strip())
+    untracked = _git(project_path, "ls-files", "--others", "--exclude-standard")
+    if diff is None:
+        return None
+    files = [f for f in diff.splitlines() if f.strip()]
+    for f in (untracked or "").splitlines():
+        if f.strip() and f not in files:
+            files.append(f)
+    return files
+
+
+def _cache_dir(project_path: str) -> Optional[Path]:
+    """Cache directory inside the (common) git dir — never in the worktree."""
+    git_dir = _git(project_path, "rev-parse", "--git-common-dir")
+    if not git_dir or not git_dir.strip():
+        return None
+    path = Path(git_dir.strip())
+    if not path.is_absolute():
+        path = Path(project_path) / path
+    return path / _CACHE_DIRNAME
+
+
+def _load_json(path: Path) -> dict:
+    try:
+        data = json.loads(path.read_text())
+        return data if isinstance(data, dict) else {}
+    except (OSError, ValueError):
+        return {}
+
+
+def _save_json(path: Path, data: dict) -> None:
+    from app.utils import atomic_write
+
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        atomic_write(path, json.dumps(data))
+    except OSError as e:
+        print(f"[test_impact] Cache write failed: {e}", file=sys.stderr)
+
+
+# ---------------------------------------------------------------------------
+# Import graph
+# ---------------------------------------------------------------------------
+
+def is_test_file(path: str) -> bool:
+    """True for pytest-style test modules (test_*.py / *_test.py)."""
+    name = path.rsplit("/", 1)[-1]
+    return name.endswith(".py") and (
+        name.startswith("test_") or name.endswith("_test.py")
+    )
+
+
+def extract_imports(source: str) -> List[str]:
+    """Return the module references made by a Python source file.
+
+    Absolute references are dotted names; relative ones keep their leading
+    dots (``..pkg.mod``) and are resolved against the file's location by
+    :func:`build_import_graph`.  ``from a import b`` yields both ``a`` and
+    ``a.b`` since ``b`` may be a submodule.  Returns an empty list for
+    files that do not parse.
+    """
+    try:
+        tree = ast.parse(source)
+    except (SyntaxError, ValueError):
+        return []
+
+    refs: Set[str] = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            refs.update(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom):
+            base = "." * node.level + (node.module or "")
+            if node.module or node.level:
+                refs.add(base)
+            for alias in node.names:
+                if alias.name == "*":
+                    continue
+                sep = "" if base.endswith(".") or not base else "."
+                refs.add(f"{base}{sep}{alias.name}")
+        elif isinstance(node, ast.Constant) and isinstance(node.value, str):
+            if len(node.value) < 200 and _DOTTED_NAME_RE.match(node.value):
+                refs.add(node.value)
+    return sorted(refs)
+
+
+def _module_parts(path: str) -> List[str]:
+    parts = path[:-3].split("/")
+    if parts[-1] == "__init__":
+        parts = parts[:-1]
+    return parts
+
+
+def _build_module_index(py_files: Iterable[str]) -> Dict[str, List[str]]:
+    """Map every dotted suffix of each file's module path to the file.
+
+    The import root is unknown (``koan/app/utils.py`` is imported as
+    ``app.utils``), so every suffix is registered; an ambiguous name maps
+    to all candidates, which only ever widens the selection.
+    """
+    index: Dict[str, List[str]] = {}
+    for path in py_files:
+        parts = _module_parts(path)
+        for i in range(len(parts)):
+            index.setdefault(".".join(parts[i:]), []).append(path)
+    return index
+
+
+def _resolve(ref: str, path: str, index: Dict[str, List[str]]) -> Set[str]:
+    """Resolve one module reference made by *path* to repo files."""
+    if ref.startswith("."):
+        level = len(ref) - len(ref.lstrip("."))
+        package = path.split("/")[:-1]
+        if level > 1:
+            package = package[: len(package) - (level - 1)]
+        rest = ref[level:]
+        dotted = ".".join(package + (rest.split(".") if rest else []))
+        candidates = index.get(dotted, [])
+        # Relative imports name exactly one file: the one under *path*'s root.
+        full = "/".join(dotted.split("."))
+        return {c for c in candidates if c in (f"{full}.py", f"{full}/__init__.py")}
+
+    # Importing a.b.c also runs a/__init__ and a/b/__init__.
+    resolved: Set[str] = set()
+    parts = ref.split(".")
+    for i in range(len(parts), 0, -1):
+        resolved.update(index.get(".".join(parts[:i]), ()))
+    return resolved
+
+
+def _conftests_for(path: str, conftests: Set[str]) -> Set[str]:
+    dirs = path.split("/")[:-1]
+    found = set()
+    for i in range(len(dirs) + 1):
+        candidate = "/".join(dirs[:i] + ["conftest.py"])
+        if candidate in conftests:
+            found.add(candidate)
+    return found
+
+
+def _list_python_files(project_path: str) -> Optional[Dict[str, str]]:
+    """Map tracked and untracked .py files to their cache key.
+
+    Tracked, unmodified files are keyed by blob SHA; modified or untracked
+    files get an empty key (parsed fresh, never cached).
+    """
+    staged = _git(project_path, "ls-files", "-s", "--", "*.py")
+    if staged is None:
+        return None
+    files: Dict[str, str] = {}
+    for line in staged.splitlines():
+        meta, _, path = line.partition("\t")
+        fields = meta.split()
+        if len(fields) >= 2 and path:
+            files[path] = fields[1]
+    modified = _git(project_path, "ls-files", "-m", "--", "*.py") or ""
+    for path in modified.splitlines():
+        if path in files:
+            files[path] = ""
+    untracked = _git(
+        project_path, "ls-files", "--others", "--exclude-standard", "--", "*.py",
+    ) or ""
+    for path in untracked.splitlines():
+        if path.strip():
+            files[path] = ""
+    return files
+
+
+def build_import_graph(project_path: str) -> Optional[Dict[str, Set[str]]]:
+    """Map each Python file in the repo to the repo files it imports.
+
+    Test files are also linked to every ``conftest.py`` that applies to
+    them.  Returns None when the project is not a git repository.
+    """
+    files = _list_python_files(project_path)
+    if files is None:
+        return None
+
+    cache_dir = _cache_dir(project_path)
+    cache_path = cache_dir / "imports.json" if cache_dir else None
+    cached = _load_json(cache_path) if cache_path else {}
+    if cached.get("version") != _CACHE_VERSION:
+        cached = {}
+    cached_imports = cached.get("imports", {})
+
+    refs_by_file: Dict[str, List[str]] = {}
+    fresh: Dict[str, List[str]] = {}
+    for path, blob in files.items():
+        if blob and blob in cached_imports:
+            refs_by_file[path] = cached_imports[blob]
+            fresh[blob] = cached_imports[blob]
+            continue
+        try:
+            source = (Path(project_path) / path).read_text(errors="replace")
+        except OSError:
+            continue  # deleted in the worktree
+        refs = extract_imports(source)
+        refs_by_file[path] = refs
+        if blob:
+            fresh[blob] = refs
+
+    if cache_path and fresh != cached_imports:
+        _save_json(cache_path, {"version": _CACHE_VERSION, "imports": fresh})
+
+    index = _build_module_index(refs_by_file)
+    conftests = {p for p in refs_by_file if p.rsplit("/", 1)[-1] == "conftest.py"}
+    graph: Dict[str, Set[str]] = {}
+    for path, refs in refs_by_file.items():
+        deps: Set[str] = set()
+        for ref in refs:
+            deps.update(_resolve(ref, path, index))
+        if is_test_file(path):
+            deps.update(_conftests_for(path, conftests))
+        deps.discard(path)
+        graph[path] = deps
+    return graph
+
+
+def _affected_by_imports(graph: Dict[str, Set[str]], changed: Iterable[str]) -> Set[str]:
+    """Files that transitively import any of *changed* (including themselves)."""
+    importers: Dict[str, Set[str]] = {}
+    for path, deps in graph.items():
+        for dep in deps:
+            importers.setdefault(dep, set()).add(path)
+
+    affected = set()
+    stack = [p for p in changed if p in graph]
+    while stack:
+        path = stack.pop()
+        if path in affected:
+            continue
+        affected.add(path)
+        stack.extend(importers.get(path, ()))
+    return affected
+
+
+# ---------------------------------------------------------------------------
+# Coverage map
+# ---------------------------------------------------------------------------
+
+def _read_coverage_contexts(db_path: Path, project_path: str) -> Dict[str, List[str]]:
+    """Read a coverage.py SQLite data file into {source file: [test files]}.
+
+    Only contexts in pytest-cov's ``--cov-context=test`` format
+    (``tests/test_x.py::TestY::test_z|run``) are used.
+    """
+    root = os.path.realpath(project_path)
+    coverage: Dict[str, Set[str]] = {}
+    conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+    try:
+        tables = {
+            row[0] for row in
+            conn.execute("SELECT name FROM sqlite_master WHERE type='table'")
+        }
+        for table in ("line_bits", "arc"):
+            if table not in tables:
+                continue
+            rows = conn.execute(
+                f"SELECT DISTINCT file.path, context.context FROM {table} "
+                f"JOIN file ON {table}.file_id = file.id "
+                f"JOIN context ON {table}.context_id = context.id"
+            )
+            for source, context in rows:
+                test = (context or "").split("::", 1)[0]
+                if not test or test == context:
+                    continue
+                rel = os.path.relpath(os.path.realpath(source), root)
+                if rel.startswith(".."):
+                    continue
+                coverage.setdefault(rel, set()).add(test)
+    finally:
+        conn.close()
+    return {src: sorted(tests) for src, tests in coverage.items()}
+
+
+def load_coverage_map(project_path: str, coverage_file: str) -> Dict[str, List[str]]:
+    """Load the per-test coverage map, cached per coverage data file.
+
+    The cache is keyed by the data file's size and mtime, so it is rebuilt
+    whenever coverage is re-recorded (typically once per commit on main).
+    Returns an empty map when the file is missing or unreadable.
+    """
+    db_path = Path(project_path) / coverage_file
+    try:
+        st = db_path.stat()
+    except OSError:
+        return {}
+    key = hashlib.sha256(
+        f"{db_path.resolve()}:{st.st_size}:{st.st_mtime_ns}".encode()
+    ).hexdigest()[:16]
+
+    cache_dir = _cache_dir(project_path)
+    cache_path = cache_dir / "coverage.json" if cache_dir else None
+    if cache_path:
+        cached = _load_json(cache_path)
+        if cached.get("key") == key and isinstance(cached.get("map"), dict):
+            return cached["map"]
+
+    try:
+        coverage = _read_coverage_contexts(db_path, project_path)
+    except sqlite3.Error as e:
+        print(f"[test_impact] Coverage map unreadable: {e}", file=sys.stderr)
+        return {}
+    if cache_path:
+        _save_json(cache_path, {"key": key, "map": coverage})
+    return coverage
+
+
+def _resolve_test_path(test: str, test_files: Set[str]) -> Optional[str]:
+    """Map a pytest node path (relative to pytest's rootdir) to a repo path."""
+    if test in test_files:
+        return test
+    matches = [p for p in test_files if p.endswith("/" + test)]
+    return matches[0] if len(matches) == 1 else None
+
+
+# ---------------------------------------------------------------------------
+# Selection
+# ---------------------------------------------------------------------------
+
+def _is_ignored(path: str) -> bool:
+    name = path.rsplit("/", 1)[-1]
+    return (
+        path.startswith(_IGNORED_DIRS)
+        or ("/" not in path and name.endswith(_IGNORED_TOP_LEVEL_SUFFIXES))
+        or name.split(".", 1)[0] in _IGNORED_NAMES
+    )
+
+
+def select_tests(
+    project_path: str,
+    changed_files: List[str],
+    coverage_file: str = "",
+) -> ImpactSelection:
+    """Select the test files affected by *changed_files*.
+
+    Returns an :class:`ImpactSelection` whose ``tests`` is None when the
+    impact cannot be determined, and empty when no test is affected; the
+    caller runs the full suite in both cases.
+    """
+    relevant = [f for f in changed_files if not _is_ignored(f)]
+    if not relevant:
+        return ImpactSelection([], "only docs changed", changed_files)
+
+    for path in relevant:
+        if path.rsplit("/", 1)[-1] in _GLOBAL_FILES:
+            return ImpactSelection(None, f"{path} affects every test", changed_files)
+        if not path.endswith(".py"):
+            return ImpactSelection(None, f"untraceable change: {path}", changed_files)
+        if not (Path(project_path) / path).exists():
+            return ImpactSelection(None, f"module removed: {path}", changed_files)
+
+    graph = build_import_graph(project_path)
+    if graph is None:
+        return ImpactSelection(None, "not a git repository", changed_files)
+
+    # A test_*.py module that other files import is library code.
+    imported = set().union(*graph.values()) if graph else set()
+    test_files = {p for p in graph if is_test_file(p) and p not in imported}
+    selected = {p for p in _affected_by_imports(graph, relevant) if p in test_files}
+
+    if coverage_file:
+        coverage = load_coverage_map(project_path, coverage_file)
+        for path in relevant:
+            for test in coverage.get(path, ()):
+                resolved = _resolve_test_path(test, test_files)
+                if resolved:
+                    selected.add(resolved)
+
+    if not selected:
+        return ImpactSelection([], "no tests reach the changed files", changed_files)
+    return ImpactSelection(sorted(selected), "import graph", changed_files)
+
+
+# ---------------------------------------------------------------------------
+# Runner
+# ---------------------------------------------------------------------------
+
+def _load_config(project_name: str) -> Optional[dict]:
+    koan_root = os.environ.get("KOAN_ROOT", "")
+    if not koan_root:
+        return None
+    try:
+        config = load_projects_config(koan_root)
+    except Exception as e:
+        print(f"[test_impact] Config error: {e}", file=sys.stderr)
+        return None
+    if not config:
+        return None
+    return get_project_test_impact_config(config, project_name)
+
+
+def run_impacted_tests(
+    project_path: str,
+    test_cmd: str,
+    timeout: int = 300,
+    project_name: str = "",
+) -> dict:
+    """Run the tests affected by the branch, falling back to the full suite.
+
+    With test impact disabled (the default) this is exactly
+    ``claude_step.run_project_tests()``.  Otherwise the affected subset
+    runs first; the full *test_cmd* runs only when the selection is
+    empty or unknown, or after a passing subset when ``full_suite`` is set.
+
+    Returns:
+        Dict with keys: passed, output, details (as run_project_tests),
+        plus ``selected`` — the subset that ran, or None for the full suite.
+    """
+    from app.claude_step import run_project_tests
+
+    project_name = project_name or Path(project_path).name
+    impact_config = _load_config(project_name)
+    if not impact_config or not impact_config["enabled"]:
+        return {**run_project_tests(project_path, test_cmd=test_cmd, timeout=timeout),
+                "selected": None}
+
+    base_branch = resolve_base_branch(project_name, project_path)
+    changed = get_changed_files(project_path, base_branch)
+    if changed is None:
+        selection = ImpactSelection(None, f"no merge base with origin/{base_branch}")
+    else:
+        selection = select_tests(
+            project_path, changed, coverage_file=impact_config["coverage_file"],
+        )
+
+    if not selection.tests:
+        print(f"[test_impact] Full suite: {selection.reason}", file=sys.stderr)
+        return {**run_project_tests(project_path, test_cmd=test_cmd, timeout=timeout),
+                "selected": None}
+
+    tests_arg = " ".join(shlex.quote(t) for t in selection.tests)
+    subset_cmd = impact_config["command"].replace("{tests}", tests_arg)
+    result = run_project_tests(project_path, test_cmd=subset_cmd, timeout=timeout)
+    result["details"] = (
+        f"{result['details']} ({len(selection.tests)} impacted test files)"
+    )
+    result["selected"] = selection.tests
+
+    if result["passed"] and impact_config["full_suite"]:
+        full = run_project_tests(project_path, test_cmd=test_cmd, timeout=timeout)
+        return {**full, "selected": None}
+    return result
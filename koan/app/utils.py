@@ -147,13 +147,16 @@ def detect_project_from_text(text: str) -> Tuple[Optional[str], str]:
 _GITHUB_REMOTE_RE = re.compile(r'github\.com[:/]([^/]+)/([^/\s.]+?)(?:\.git)?$')
 
 
-def get_github_remote(project_path: str) -> Optional[str]:
+def get_github_remote(
+    project_path: str,
+    remotes: Tuple[str, ...] = ("origin", "upstream"),
+) -> Optional[str]:
     """Extract owner/repo from a project's git remote.
 
-    Tries 'origin' first, falls back to 'upstream'.
+    Tries *remotes* in order ('origin' first, falling back to 'upstream').
     Returns "owner/repo" as a normalized lowercase string, or None on failure.
     """
-    for remote in ("origin", "upstream"):
+    for remote in remotes:
         try:
             result = subprocess.run(
                 ["git", "remote", "get-url", remote],
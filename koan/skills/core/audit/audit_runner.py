@@ -5,7 +5,8 @@ Performs a read-only audit of a project codebase, parses the structured
 findings, and creates individual GitHub issues for each one.
 
 Pipeline:
-1. Build audit prompt with project context and optional extra guidance
+1. Build audit prompt with project context, optional extra guidance and
+   a local static-analysis pre-pass (app.static_analysis)
 2. Run Claude Code CLI (read-only tools) to analyze the codebase
 3. Parse Claude's structured findings (---FINDING--- blocks)
 4. Enforce max_issues limit (keep only top N by severity)
@@ -76,8 +77,13 @@ def build_audit_prompt(
     extra_context: str = "",
     skill_dir: Optional[Path] = None,
     max_issues: int = DEFAULT_MAX_ISSUES,
+    static_context: str = "",
 ) -> str:
-    """Build the audit prompt with optional extra context and issue limit."""
+    """Build the audit prompt with optional extra context and issue limit.
+
+    *static_context* is an optional hotspot section rendered by
+    app.static_analysis.
+    """
     context_block = ""
     if extra_context:
         context_block = (
@@ -93,6 +99,7 @@ def build_audit_prompt(
         PROJECT_NAME=project_name,
         EXTRA_CONTEXT=context_block,
         MAX_ISSUES=str(max_issues),
+        STATIC_ANALYSIS=static_context,
     )
 
 
@@ -350,9 +357,13 @@ def run_audit(
     # Step 1: Build prompt
     context_hint = f" (focus: {extra_context})" if extra_context else ""
     notify_fn(f"\U0001f50e Auditing {project_name}{context_hint}...")
+    from app.static_analysis import build_static_context
+    static_context = build_static_context(
+        project_path, instance_path, project_name, kind="audit",
+    )
     prompt = build_audit_prompt(
         project_name, extra_context, skill_dir=skill_dir,
-        max_issues=max_issues,
+        max_issues=max_issues, static_context=static_context,
     )
 
     # Step 2: Run Claude audit (read-only)
@@ -6,7 +6,8 @@ the report to the project's learnings directory. Optionally queues
 top findings as missions.
 
 Pipeline:
-1. Build a tech debt scan prompt with project context
+1. Build a tech debt scan prompt with project context and a local
+   static-analysis pre-pass (app.static_analysis)
 2. Run Claude Code CLI (read-only tools) to analyze the codebase
 3. Parse Claude's structured report
 4. Save report to learnings
@@ -27,11 +28,19 @@ from app.prompts import load_prompt_or_skill
 def build_tech_debt_prompt(
     project_name: str,
     skill_dir: Optional[Path] = None,
+    static_context: str = "",
 ) -> str:
-    """Build a prompt for Claude to scan for tech debt."""
+    """Build a prompt for Claude to scan for tech debt.
+
+    Args:
+        project_name: Project name for labeling.
+        skill_dir: Optional path to the skill directory for prompts.
+        static_context: Optional pre-pass section from app.static_analysis.
+    """
     return load_prompt_or_skill(
         skill_dir, "tech_debt",
         PROJECT_NAME=project_name,
+        STATIC_ANALYSIS=static_context,
     )
 
 
@@ -194,7 +203,13 @@ def run_tech_debt(
 
     # Step 1: Build prompt
     notify_fn(f"\U0001f50d Scanning tech debt for {project_name}...")
-    prompt = build_tech_debt_prompt(project_name, skill_dir=skill_dir)
+    from app.static_analysis import build_static_context
+    static_context = build_static_context(
+        project_path, instance_path, project_name, kind="tech_debt",
+    )
+    prompt = build_tech_debt_prompt(
+        project_name, skill_dir=skill_dir, static_context=static_context,
+    )
 
     # Step 2: Run Claude scan (read-only)
     try:
@@ -25,6 +25,14 @@ def isolate_env(monkeypatch):
         pm._cached_workspace_mtime = None
     except Exception:
         pass
+    # Per-process GitHub/branch count caches would leak between tests.
+    try:
+        import app.branch_limiter as bl
+        import app.github as gh
+        bl._count_cache.clear()
+        gh._pr_count_cache.clear()
+    except Exception:
+        pass
 
 
 @pytest.fixture
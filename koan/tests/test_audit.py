@@ -394,6 +394,14 @@ class TestBuildPrompt:
         )
         assert "at most 12 findings" in prompt
 
+    def test_prompt_with_static_context(self):
+        prompt = build_audit_prompt(
+            "test", static_context="## Static Analysis Pre-pass\n- hotspot",
+            skill_dir=Path(__file__).parent.parent / "skills" / "core" / "audit",
+        )
+        assert "## Static Analysis Pre-pass" in prompt
+        assert "{STATIC_ANALYSIS}" not in prompt
+
 
 class TestSaveAuditReport:
     def test_creates_report_file(self, tmp_path):
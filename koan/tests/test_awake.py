@@ -3193,6 +3193,35 @@ class TestAsyncOutboxFlush:
 # Test: hard text truncation when lite mode still exceeds MAX_PROMPT_CHARS
 # ---------------------------------------------------------------------------
 
+class TestBuildChatPromptBudget:
+    """Context sections are packed into the chat token budget."""
+
+    @patch("app.awake.load_recent_history", return_value=[])
+    @patch("app.awake.format_conversation_history", return_value="Recent conversation:\nHuman: hi")
+    @patch("app.awake.get_tools_description", return_value="")
+    def test_large_memory_files_fit_budget(self, mock_tools_desc, mock_fmt, mock_hist, tmp_path):
+        from app.awake import _build_chat_prompt
+
+        (tmp_path / "memory" / "global").mkdir(parents=True)
+        (tmp_path / "memory" / "global" / "emotional-memory.md").write_text("feel\n" * 5000)
+        (tmp_path / "memory" / "global" / "human-preferences.md").write_text("pref\n" * 2000)
+
+        with patch("app.awake.INSTANCE_DIR", tmp_path), \
+             patch("app.awake.KOAN_ROOT", tmp_path), \
+             patch("app.awake.MISSIONS_FILE", tmp_path / "missions.md"), \
+             patch("app.awake.SOUL", "test soul"), \
+             patch("app.awake.SUMMARY", "summary " * 2000), \
+             patch("app.journal.read_journals_tail", return_value=("journal\n" * 500, True)), \
+             patch("app.awake.get_context_budget", return_value=2000):
+            prompt = _build_chat_prompt("hello")
+
+        assert len(prompt) <= 2000 * 4
+        # High-priority sections survive, low-priority ones go first
+        assert "Run loop status" in prompt
+        assert "Human: hi" in prompt
+        assert "Emotional memory" not in prompt
+
+
 class TestBuildChatPromptHardTruncation:
     """Tests that _build_chat_prompt truncates user text as last resort."""
 
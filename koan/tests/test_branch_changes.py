@@ -0,0 +1,100 @@
+"""Tests for branch_changes — single-pass branch diff snapshot."""
+
+import subprocess
+from unittest.mock import patch
+
+import pytest
+
+from app import git_utils
+from app.branch_changes import compute_changeset, parse_diff_output
+
+
+def _git(repo, *args):
+    return subprocess.run(
+        ["git", "-c", "user.email=t@t", "-c", "user.name=t", *args],
+        cwd=repo, check=True, capture_output=True, text=True,
+    ).stdout.strip()
+
+
+@pytest.fixture
+def repo(tmp_path):
+    """main with three files; koan/feature modifies, adds, renames, deletes."""
+    root = tmp_path / "repo"
+    root.mkdir()
+    _git(root, "init", "-q", "-b", "main")
+    (root / "app.py").write_text("a = 1\nb = 2\n")
+    (root / "logo.bin").write_bytes(b"\x00\x01\x02")
+    (root / "old.py").write_text("gone = True\n")
+    _git(root, "add", ".")
+    _git(root, "commit", "-qm", "init")
+    _git(root, "update-ref", "refs/remotes/origin/main", "HEAD")
+
+    _git(root, "checkout", "-qb", "koan/feature")
+    (root / "app.py").write_text("a = 1\nprint(a)\nb = 2\n")
+    (root / "tests").mkdir()
+    (root / "tests" / "test_app.py").write_text("def test_a():\n    assert True\n")
+    _git(root, "mv", "logo.bin", "logo2.bin")
+    _git(root, "rm", "-q", "old.py")
+    _git(root, "add", ".")
+    _git(root, "commit", "-qm", "feat: print a")
+    (root / "app.py").write_text("a = 1\nprint(a)\nb = 2\nc = 3\n")
+    _git(root, "commit", "-qam", "fixup! feat: print a")
+    return root
+
+
+class TestComputeChangeset:
+    def test_snapshot(self, repo):
+        cs = compute_changeset(str(repo))
+
+        assert cs.branch == "koan/feature"
+        assert cs.base_ref == "origin/main"
+        assert cs.subjects == ["fixup! feat: print a", "feat: print a"]
+        by_path = {f.path: f for f in cs.files}
+        assert sorted(by_path) == ["app.py", "logo2.bin", "old.py", "tests/test_app.py"]
+
+        app = by_path["app.py"]
+        assert (app.status, app.added, app.removed) == ("M", 2, 0)
+        assert app.added_lines == [(2, "print(a)"), (4, "c = 3")]
+        assert len(app.hunks) >= 1
+
+        logo = by_path["logo2.bin"]
+        assert (logo.status, logo.old_path, logo.binary) == ("R", "logo.bin", True)
+        assert by_path["old.py"].deleted
+        assert "old.py" not in cs.existing_paths
+        assert cs.diffstat() == "4 files changed, 4 insertions(+), 1 deletion(-)"
+        assert cs.patch.startswith("diff --git ")
+
+    def test_added_lines_iterate_per_file(self, repo):
+        cs = compute_changeset(str(repo))
+        assert ("app.py", 2, "print(a)") in list(cs.iter_added_lines())
+
+    def test_three_git_reads(self, repo):
+        with patch("app.branch_changes.run_git", wraps=git_utils.run_git) as spy:
+            compute_changeset(str(repo), base_ref="origin/main")
+        assert spy.call_count == 3
+
+    def test_no_base_ref(self, repo):
+        _git(repo, "update-ref", "-d", "refs/remotes/origin/main")
+        assert compute_changeset(str(repo)) is None
+
+    def test_not_a_repo(self, tmp_path):
+        assert compute_changeset(str(tmp_path)) is None
+
+
+class TestParseDiffOutput:
+    def test_quoted_paths(self):
+        output = (
+            ':100644 100644 aaa bbb M\t"tab\\there.py"\n'
+            "1\t0\t\"tab\\there.py\"\n"
+            "\n"
+            'diff --git "a/tab\\there.py" "b/tab\\there.py"\n'
+            "@@ -1 +1,2 @@\n x\n+y\n"
+        )
+        files, patch = parse_diff_output(output)
+        assert files[0].path == "tab\there.py"
+        assert files[0].added_lines == [(2, "y")]
+        assert patch.startswith("diff --git")
+
+    def test_mismatched_sections_rejected(self):
+        with pytest.raises(ValueError):
+            parse_diff_output(":100644 100644 a b M\tx.py\n1\t0\tx.py\n")
@@ -112,3 +112,66 @@ class TestIsProjectBranchSaturated:
         assert is_project_branch_saturated(
             config, "myapp", "/instance", "/code/myapp", ["owner/myapp"], "bot",
         ) is False
+
+
+class TestCachedCountPendingBranches:
+    """Cached counts are reused until an event or the TTL invalidates them."""
+
+    @pytest.fixture
+    def instance(self, tmp_path):
+        inst = tmp_path / "instance"
+        inst.mkdir()
+        return str(inst)
+
+    def _count(self, instance, urls=("owner/myapp",)):
+        from app.branch_limiter import cached_count_pending_branches
+        return cached_count_pending_branches(
+            instance, "myapp", "/code/myapp", list(urls), "bot",
+        )
+
+    @patch("app.branch_limiter.count_pending_branches", side_effect=[2, 3])
+    def test_reused_until_invalidated(self, mock_count, instance, tmp_path):
+        from app.branch_limiter import invalidate_branch_state
+
+        assert self._count(instance) == 2
+        assert self._count(instance) == 2
+        assert mock_count.call_count == 1
+
+        invalidate_branch_state("myapp", str(tmp_path))
+        assert self._count(instance) == 3
+        assert mock_count.call_count == 2
+
+    @patch("app.branch_limiter.count_pending_branches", side_effect=[2, 3])
+    def test_invalidation_from_another_process(self, mock_count, instance, tmp_path):
+        """Only the stamp file changes — as when the dashboard merges a PR."""
+        from app.branch_limiter import _stamp_path
+
+        assert self._count(instance) == 2
+        stamp = _stamp_path(str(tmp_path), "myapp")
+        stamp.parent.mkdir(parents=True, exist_ok=True)
+        stamp.write_text("elsewhere")
+
+        assert self._count(instance) == 3
+
+    @patch("app.branch_limiter.count_pending_branches", side_effect=[2, 3])
+    def test_expires_after_ttl(self, mock_count, instance):
+        import app.branch_limiter as bl
+
+        assert self._count(instance) == 2
+        with patch("app.branch_limiter.time.monotonic",
+                   return_value=bl.time.monotonic() + bl.BRANCH_STATE_TTL + 1):
+            assert self._count(instance) == 3
+
+    @patch("app.branch_limiter.count_pending_branches", side_effect=[2, 3])
+    def test_changed_urls_recount(self, mock_count, instance):
+        assert self._count(instance) == 2
+        assert self._count(instance, urls=("owner/myapp", "upstream/myapp")) == 3
+
+    @patch("app.branch_limiter.count_pending_branches", return_value=5)
+    def test_saturation_check_uses_cache(self, mock_count, instance):
+        config = {"projects": {"myapp": {"max_pending_branches": 5}}}
+        for _ in range(3):
+            assert is_project_branch_saturated(
+                config, "myapp", instance, "/code/myapp", ["owner/myapp"], "bot",
+            )
+        mock_count.assert_called_once()
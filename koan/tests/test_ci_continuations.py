@@ -0,0 +1,151 @@
+"""Tests for ci_continuations — skill runs parked until CI completes."""
+
+import json
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+import pytest
+
+from app import ci_continuations
+from app.ci_continuations import discard, has_parked, park, resume, take_resumed
+
+
+PR_URL = "https://github.com/owner/repo/pull/42"
+OTHER_PR = "https://github.com/owner/repo/pull/7"
+MISSION = f"[project:repo] /ci_check {PR_URL}"
+
+
+@pytest.fixture
+def instance_dir(tmp_path):
+    d = tmp_path / "instance"
+    d.mkdir()
+    return d
+
+
+def _store(instance_dir):
+    return json.loads((instance_dir / ".ci-continuations.json").read_text())
+
+
+class TestPark:
+    def test_park_records_continuation(self, instance_dir):
+        park(instance_dir, PR_URL, MISSION, resume_on=("failure",))
+
+        entries = _store(instance_dir)
+        assert len(entries) == 1
+        assert entries[0]["mission"] == MISSION
+        assert entries[0]["resume_on"] == ["failure"]
+        assert has_parked(instance_dir, PR_URL)
+        assert not has_parked(instance_dir, OTHER_PR)
+
+    def test_park_same_mission_replaces_record(self, instance_dir):
+        park(instance_dir, PR_URL, MISSION, resume_on=("failure",))
+        park(instance_dir, PR_URL, MISSION, resume_on=("success",))
+
+        entries = _store(instance_dir)
+        assert len(entries) == 1
+        assert entries[0]["resume_on"] == ["success"]
+
+    def test_unknown_statuses_ignored(self, instance_dir):
+        park(instance_dir, PR_URL, MISSION, resume_on=("failure", "pending"))
+
+        assert _store(instance_dir)[0]["resume_on"] == ["failure"]
+
+
+class TestResume:
+    def test_resume_returns_matching_missions(self, instance_dir):
+        park(instance_dir, PR_URL, MISSION, resume_on=("failure",))
+        park(instance_dir, OTHER_PR, f"/ci_check {OTHER_PR}", resume_on=("failure",))
+
+        assert resume(instance_dir, PR_URL, "failure", 123) == [MISSION]
+        # Only the resolved PR leaves the parked state
+        assert not has_parked(instance_dir, PR_URL)
+        assert has_parked(instance_dir, OTHER_PR)
+
+    def test_resume_drops_non_matching_status(self, instance_dir):
+        park(instance_dir, PR_URL, MISSION, resume_on=("failure",))
+
+        assert resume(instance_dir, PR_URL, "success", 123) == []
+        assert _store(instance_dir) == []
+
+    def test_resume_is_one_shot(self, instance_dir):
+        park(instance_dir, PR_URL, MISSION, resume_on=("failure",))
+
+        assert resume(instance_dir, PR_URL, "failure", 1) == [MISSION]
+        assert resume(instance_dir, PR_URL, "failure", 2) == []
+
+    def test_resume_without_store(self, instance_dir):
+        assert resume(instance_dir, PR_URL, "failure") == []
+        assert not (instance_dir / ".ci-continuations.json").exists()
+
+
+class TestTakeResumed:
+    def test_take_resumed_returns_outcome(self, instance_dir):
+        park(instance_dir, PR_URL, MISSION, resume_on=("failure",))
+        resume(instance_dir, PR_URL, "failure", 456)
+
+        resumed = take_resumed(instance_dir, PR_URL)
+
+        assert resumed == {"ci_status": "failure", "run_id": 456}
+        assert take_resumed(instance_dir, PR_URL) is None
+
+    def test_take_resumed_ignores_parked(self, instance_dir):
+        park(instance_dir, PR_URL, MISSION)
+
+        assert take_resumed(instance_dir, PR_URL) is None
+        assert has_parked(instance_dir, PR_URL)
+
+
+class TestDiscardAndExpiry:
+    def test_discard_removes_all_for_pr(self, instance_dir):
+        park(instance_dir, PR_URL, MISSION)
+        park(instance_dir, PR_URL, f"/review {PR_URL}")
+        park(instance_dir, OTHER_PR, f"/ci_check {OTHER_PR}")
+
+        assert discard(instance_dir, PR_URL) == 2
+        assert not has_parked(instance_dir, PR_URL)
+        assert has_parked(instance_dir, OTHER_PR)
+
+    def test_expired_continuations_dropped(self, instance_dir):
+        park(instance_dir, PR_URL, MISSION)
+        old = datetime.now(timezone.utc) - timedelta(hours=ci_continuations._MAX_AGE_HOURS + 1)
+        entries = _store(instance_dir)
+        entries[0]["parked_at"] = old.isoformat()
+        (instance_dir / ".ci-continuations.json").write_text(json.dumps(entries))
+
+        assert not has_parked(instance_dir, PR_URL)
+        assert resume(instance_dir, PR_URL, "failure") == []
+
+    def test_corrupt_store_treated_as_empty(self, instance_dir):
+        (instance_dir / ".ci-continuations.json").write_text("{not json")
+
+        assert not has_parked(instance_dir, PR_URL)
+        park(instance_dir, PR_URL, MISSION)
+        assert has_parked(instance_dir, PR_URL)
+
+
+class TestParkUntilCi:
+    def test_enqueues_and_parks(self, tmp_path, instance_dir):
+        from app.claude_step import park_until_ci
+
+        (instance_dir / "missions.md").write_text("# Missions\n\n## Pending\n\n## Done\n")
+        with (
+            patch.dict("os.environ", {"KOAN_ROOT": str(tmp_path)}),
+            patch("app.utils.load_config", return_value={"ci_fix_max_attempts": 3}),
+        ):
+            assert park_until_ci(
+                PR_URL, "fix-branch", "owner/repo", "42", "/tmp/repo", MISSION,
+                resume_on=("failure",),
+            )
+
+        content = (instance_dir / "missions.md").read_text()
+        assert "## CI" in content
+        assert PR_URL in content
+        assert has_parked(instance_dir, PR_URL)
+
+    def test_without_koan_root(self):
+        from app.claude_step import park_until_ci
+
+        with patch.dict("os.environ", {"KOAN_ROOT": ""}):
+            assert not park_until_ci(
+                PR_URL, "fix-branch", "owner/repo", "42", "/tmp/repo", MISSION,
+            )
@@ -10,6 +10,13 @@ PR_URL = "https://github.com/owner/repo/pull/42"
 PROJECT_PATH = "/tmp/test-project"
 
 
+@pytest.fixture(autouse=True)
+def _no_batched_ci_query():
+    """drain_one batches every queue; tests drive the per-PR fallback."""
+    with patch("app.github.batch_pr_ci_status", return_value={}):
+        yield
+
+
 @pytest.fixture
 def _mock_pr_context():
     """Patch external dependencies so run_ci_check_and_fix can run without real git/GitHub."""
@@ -323,7 +330,7 @@ class TestAttemptCiFixes:
         assert any("pushed" in a.lower() for a in actions_log)
         # Verify re-enqueue was called so drain_one monitors the new CI run
         mock_reenqueue.assert_called_once_with(
-            PR_URL, "fix-branch", "owner/repo", "42", PROJECT_PATH,
+            PR_URL, "fix-branch", "owner/repo", "42", PROJECT_PATH, attempt=1,
         )
         assert any("re-enqueued" in a.lower() for a in actions_log)
 
@@ -409,3 +416,207 @@ class TestAttemptCiFixes:
             )
 
         mock_modify.assert_called_once()
+
+
+class TestDrainOneResumesParkedRuns:
+    """drain_one resumes runs parked with ci_continuations."""
+
+    def _setup(self, tmp_path, attempt=0, max_attempts=5):
+        instance = tmp_path / "instance"
+        instance.mkdir()
+        (instance / "missions.md").write_text(
+            "# Missions\n\n## CI\n\n"
+            f"- [project:proj] {PR_URL} branch:fix-branch repo:owner/repo"
+            f" queued:2026-04-01T10:00 (attempt {attempt}/{max_attempts})\n\n"
+            "## Pending\n\n## Done\n"
+        )
+        return instance
+
+    def test_failure_resumes_parked_ci_check(self, tmp_path):
+        from app.ci_continuations import park, take_resumed
+        from app.ci_queue_runner import drain_one
+
+        instance = self._setup(tmp_path)
+        park(instance, PR_URL, f"[project:proj] /ci_check {PR_URL}", resume_on=("failure",))
+        with (
+            patch("app.ci_queue_runner.check_ci_status", return_value=("failure", 456)),
+            patch("app.ci_queue_runner._inject_ci_fix_mission") as mock_inject,
+        ):
+            drain_one(str(instance))
+
+        mock_inject.assert_not_called()
+        content = (instance / "missions.md").read_text()
+        pending = content.split("## Pending")[1]
+        assert f"/ci_check {PR_URL}" in pending
+        assert "(attempt 1/5)" in content
+        assert take_resumed(instance, PR_URL)["run_id"] == 456
+
+    def test_success_drops_failure_only_continuation(self, tmp_path):
+        from app.ci_continuations import has_parked, park
+        from app.ci_queue_runner import drain_one
+
+        instance = self._setup(tmp_path)
+        park(instance, PR_URL, f"/ci_check {PR_URL}", resume_on=("failure",))
+        with (
+            patch("app.ci_queue_runner.check_ci_status", return_value=("success", 456)),
+            patch("app.ci_queue_runner._write_outbox"),
+        ):
+            drain_one(str(instance))
+
+        assert not has_parked(instance, PR_URL)
+        assert "/ci_check" not in (instance / "missions.md").read_text()
+
+    def test_giving_up_discards_continuation(self, tmp_path):
+        from app.ci_continuations import has_parked, park
+        from app.ci_queue_runner import drain_one
+
+        instance = self._setup(tmp_path, attempt=5, max_attempts=5)
+        park(instance, PR_URL, f"/ci_check {PR_URL}", resume_on=("failure",))
+        with (
+            patch("app.ci_queue_runner.check_ci_status", return_value=("failure", 456)),
+            patch("app.ci_queue_runner._write_outbox"),
+        ):
+            drain_one(str(instance))
+
+        assert not has_parked(instance, PR_URL)
+        assert "/ci_check" not in (instance / "missions.md").read_text()
+
+
+class TestFixCycleBounded:
+    """Re-parking after a fix keeps the attempt count, so the loop ends."""
+
+    def test_gives_up_at_max_attempts(self, tmp_path, _mock_pr_context):
+        from app.ci_queue_runner import drain_one, run_ci_check_and_fix
+        from app.claude_step import park_until_ci
+        from app.missions import get_ci_items
+
+        instance = tmp_path / "instance"
+        instance.mkdir()
+        (instance / "missions.md").write_text("# Missions\n\n## Pending\n\n## Done\n")
+
+        fixes = []
+        with (
+            patch.dict("os.environ", {"KOAN_ROOT": str(tmp_path)}),
+            patch("app.utils.load_config", return_value={"ci_fix_max_attempts": 2}),
+            patch("app.commit_conventions.get_project_commit_guidance", return_value=""),
+            patch("app.rebase_pr._build_ci_fix_prompt", return_value="fix this"),
+            patch("app.claude_step.run_claude_step", return_value=True),
+            patch("app.rebase_pr._force_push"),
+            patch("app.ci_queue_runner._write_outbox") as mock_outbox,
+        ):
+            assert park_until_ci(
+                PR_URL, "fix-branch", "owner/repo", "42", PROJECT_PATH,
+                f"/ci_check {PR_URL}", resume_on=("failure",),
+            )
+            for _ in range(5):
+                message = drain_one(str(instance))  # CI fails every time
+                if "giving up" in message:
+                    break
+                success, summary = run_ci_check_and_fix(PR_URL, PROJECT_PATH)
+                assert success, summary
+                fixes.append(get_ci_items((instance / "missions.md").read_text())[0]["attempt"])
+
+        assert fixes == [1, 2]
+        assert "giving up" in message
+        assert get_ci_items((instance / "missions.md").read_text()) == []
+        assert "after 2 attempts" in mock_outbox.call_args[0][1]
+
+
+class TestRunCiCheckResumed:
+    """A resumed /ci_check run reuses the CI outcome from its continuation."""
+
+    def test_resumed_run_skips_status_check(self, tmp_path, _mock_pr_context):
+        from app.ci_continuations import park, resume
+        from app.ci_queue_runner import run_ci_check_and_fix
+
+        instance = tmp_path / "instance"
+        instance.mkdir()
+        park(instance, PR_URL, f"/ci_check {PR_URL}", resume_on=("failure",))
+        resume(instance, PR_URL, "failure", 999)
+
+        with (
+            patch.dict("os.environ", {"KOAN_ROOT": str(tmp_path)}),
+            patch("app.ci_queue_runner.check_ci_status") as mock_status,
+            patch("app.claude_step._fetch_failed_logs", return_value="boom") as mock_logs,
+            patch("app.commit_conventions.get_project_commit_guidance", return_value=""),
+            patch("app.ci_queue_runner._attempt_ci_fixes", return_value=True),
+        ):
+            success, _ = run_ci_check_and_fix(PR_URL, PROJECT_PATH)
+
+        assert success is True
+        mock_status.assert_not_called()
+        mock_logs.assert_called_once_with(999, "owner/repo")
+
+
+class TestDrainOneBatched:
+    """drain_one checks every ## CI entry with one batched status query."""
+
+    PR_2 = "https://github.com/owner/other/pull/7"
+
+    def _setup(self, tmp_path):
+        instance = tmp_path / "instance"
+        instance.mkdir()
+        (instance / "missions.md").write_text(
+            "# Missions\n\n## CI\n\n"
+            f"- [project:proj] {PR_URL} branch:fix-branch repo:owner/repo"
+            " queued:2026-04-01T10:00 (attempt 0/5)\n"
+            f"- [project:other] {self.PR_2} branch:feat repo:owner/other"
+            " queued:2026-04-01T10:05 (attempt 0/5)\n\n"
+            "## Pending\n\n## Done\n"
+        )
+        return instance
+
+    def test_all_completed_entries_handled_in_one_pass(self, tmp_path):
+        from app.ci_queue_runner import drain_one
+
+        instance = self._setup(tmp_path)
+        batch = {
+            ("owner/repo", "42"): ("success", 1),
+            ("owner/other", "7"): ("failure", 2),
+        }
+        with (
+            patch("app.github.batch_pr_ci_status", return_value=batch) as mock_batch,
+            patch("app.ci_queue_runner.check_ci_status") as mock_single,
+            patch("app.ci_queue_runner._write_outbox"),
+            patch("app.ci_queue_runner._inject_ci_fix_mission") as mock_inject,
+        ):
+            result = drain_one(str(instance))
+
+        mock_batch.assert_called_once_with([("owner/repo", "42"), ("owner/other", "7")])
+        mock_single.assert_not_called()
+        assert "passed" in result and "failed" in result
+        mock_inject.assert_called_once()
+        assert mock_inject.call_args[0][1] == self.PR_2
+        content = (instance / "missions.md").read_text()
+        assert PR_URL not in content
+        assert "(attempt 1/5)" in content
+
+    def test_falls_back_per_entry_when_batch_misses(self, tmp_path):
+        from app.ci_queue_runner import drain_one
+
+        instance = self._setup(tmp_path)
+        with (
+            patch("app.github.batch_pr_ci_status",
+                  return_value={("owner/repo", "42"): ("pending", 1)}),
+            patch("app.ci_queue_runner.check_ci_status",
+                  return_value=("pending", 3)) as mock_single,
+        ):
+            assert drain_one(str(instance)) is None
+
+        mock_single.assert_called_once_with("feat", "owner/other")
+
+    def test_single_entry_uses_batch(self, tmp_path):
+        """A lone PR gets the same (batched) verdict as in a longer queue."""
+        from app.ci_queue_runner import check_ci_statuses
+
+        item = {"pr_url": PR_URL, "full_repo": "owner/repo", "pr_number": "42",
+                "branch": "fix-branch"}
+        with (
+            patch("app.github.batch_pr_ci_status",
+                  return_value={("owner/repo", "42"): ("success", 1)}) as mock_batch,
+            patch("app.ci_queue_runner.check_ci_status") as mock_single,
+        ):
+            assert check_ci_statuses([item]) == {PR_URL: ("success", 1)}
+
+        mock_batch.assert_called_once_with([("owner/repo", "42")])
+        mock_single.assert_not_called()
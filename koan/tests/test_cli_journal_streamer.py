@@ -1,6 +1,7 @@
 """Tests for cli_journal_streamer — tail thread, stderr append, lifecycle."""
 
 import os
+import sys
 import threading
 import time
 from pathlib import Path
@@ -401,6 +402,119 @@ class TestTailLoop:
         assert "valid text" in content
 
 
+# ---------------------------------------------------------------------------
+# Event-driven reads and write coalescing
+# ---------------------------------------------------------------------------
+
+class TestFileWatcher:
+    @pytest.mark.skipif(not sys.platform.startswith("linux"), reason="inotify is Linux-only")
+    def test_wakes_on_write(self, stdout_file):
+        from app.cli_journal_streamer import _FileWatcher
+
+        watcher = _FileWatcher.open(stdout_file)
+        assert watcher is not None
+        try:
+            threading.Timer(0.05, Path(stdout_file).write_text, args=("x",)).start()
+            start = time.monotonic()
+            watcher.wait(5.0)
+            assert time.monotonic() - start < 2.0
+        finally:
+            watcher.close()
+
+    def test_missing_file_returns_none(self, tmp_path):
+        from app.cli_journal_streamer import _FileWatcher
+        assert _FileWatcher.open(str(tmp_path / "nope")) is None
+
+    @pytest.mark.skipif(not sys.platform.startswith("linux"), reason="inotify is Linux-only")
+    def test_stop_event_wakes_watcher(self, stdout_file):
+        from app.cli_journal_streamer import _FileWatcher, _StopEvent
+
+        stop_event = _StopEvent()
+        watcher = _FileWatcher.open(stdout_file, stop_event.fileno())
+        try:
+            threading.Timer(0.05, stop_event.set).start()
+            start = time.monotonic()
+            watcher.wait(5.0)
+            assert time.monotonic() - start < 2.0
+        finally:
+            watcher.close()
+            stop_event.close()
+
+    def test_set_after_close_is_safe(self):
+        from app.cli_journal_streamer import _StopEvent
+
+        stop_event = _StopEvent()
+        stop_event.close()
+        stop_event.set()
+        assert stop_event.is_set()
+
+
+class TestWriteCoalescing:
+    def test_many_small_writes_coalesced(self, tmp_env, stdout_file):
+        from app.cli_journal_streamer import start_tail_thread, stop_tail_thread
+
+        with patch("app.journal.JournalAppender.flush", autospec=True,
+                   side_effect=_real_flush()) as mock_flush:
+            thread, stop_event = start_tail_thread(
+                stdout_file, tmp_env["instance_dir"], tmp_env["project_name"], run_num=1,
+            )
+            with open(stdout_file, "a") as f:
+                for i in range(200):
+                    f.write(f"line {i}\n")
+                    f.flush()
+            stop_tail_thread(thread, stop_event)
+
+        content = _journal_content(tmp_env)
+        assert "line 0\n" in content and "line 199\n" in content
+        # 200 chunks landed in a handful of journal flushes, not 200
+        assert mock_flush.call_count < 20
+
+    @pytest.mark.skipif(not sys.platform.startswith("linux"), reason="inotify is Linux-only")
+    def test_large_output_read_in_one_wakeup(self, tmp_env, stdout_file):
+        from app.cli_journal_streamer import start_tail_thread, stop_tail_thread
+
+        with patch("app.cli_journal_streamer._POLL_INTERVAL", 30.0):
+            thread, stop_event = start_tail_thread(
+                stdout_file, tmp_env["instance_dir"], tmp_env["project_name"], run_num=1,
+            )
+            time.sleep(0.1)  # let the watcher attach
+            payload = "y" * 100_000
+            with open(stdout_file, "a") as f:
+                f.write(payload)
+            deadline = time.monotonic() + 3
+            while payload not in _journal_content(tmp_env) and time.monotonic() < deadline:
+                time.sleep(0.05)
+            assert payload in _journal_content(tmp_env)
+            stop_tail_thread(thread, stop_event)
+
+
+class TestReadNew:
+    def test_write_error_pauses_reading_without_losing_text(self, tmp_env, stdout_file):
+        """A failed journal flush keeps the text buffered for the next one."""
+        from app.cli_journal_streamer import _read_new
+        from app.journal import JournalAppender
+
+        Path(stdout_file).write_text("a" * 30 + "b" * 30)
+        appender = JournalAppender(
+            Path(tmp_env["instance_dir"]), tmp_env["project_name"], max_chars=10,
+        )
+        with patch("app.cli_journal_streamer._CHUNK_SIZE", 30), \
+                patch.object(appender, "_handle_for", side_effect=OSError("disk full")):
+            pos, leftover = _read_new(stdout_file, 0, b"", appender)
+        assert pos == 30  # stopped after the chunk that failed to flush
+
+        pos, leftover = _read_new(stdout_file, pos, leftover, appender)
+        appender.close()
+        assert pos == 60
+        assert "a" * 30 + "b" * 30 in _journal_content(tmp_env)
+
+
+def _real_flush():
+    from app.journal import JournalAppender
+    original = JournalAppender.flush
+    return lambda self: original(self)
+
+
 # ---------------------------------------------------------------------------
 # append_stderr_to_journal — edge cases
 # ---------------------------------------------------------------------------
@@ -825,6 +825,39 @@ class TestGetMcpConfigs:
                 assert get_mcp_configs("myproject") == []
 
 
+# --- get_context_budget ---
+
+
+class TestGetContextBudget:
+    def test_defaults(self):
+        from app.config import get_context_budget
+        with _mock_config({}):
+            assert get_context_budget("chat") == 3000
+            assert get_context_budget("dashboard") == 3000
+            assert get_context_budget("mission") == 16000
+
+    def test_custom_value(self):
+        from app.config import get_context_budget
+        with _mock_config({"context_budget": {"chat": 6000}}):
+            assert get_context_budget("chat") == 6000
+            assert get_context_budget("mission") == 16000
+
+    def test_invalid_value_falls_back(self):
+        from app.config import get_context_budget
+        with _mock_config({"context_budget": {"chat": "lots"}}):
+            assert get_context_budget("chat") == 3000
+
+    def test_non_dict_section(self):
+        from app.config import get_context_budget
+        with _mock_config({"context_budget": 42}):
+            assert get_context_budget("chat") == 3000
+
+    def test_floor(self):
+        from app.config import get_context_budget
+        with _mock_config({"context_budget": {"chat": 10}}):
+            assert get_context_budget("chat") == 500
+
+
 class TestBackwardCompat:
     """Verify that importing from app.utils still works."""
 
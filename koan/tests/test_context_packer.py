@@ -0,0 +1,117 @@
+"""Tests for app.context_packer — token-budgeted prompt section packing."""
+
+from app.context_packer import (
+    Section,
+    estimate_tokens,
+    pack_sections,
+    truncate_to_tokens,
+)
+
+
+class TestEstimateTokens:
+    def test_empty(self):
+        assert estimate_tokens("") == 0
+
+    def test_rounds_up(self):
+        assert estimate_tokens("a") == 1
+        assert estimate_tokens("abcd") == 1
+        assert estimate_tokens("abcde") == 2
+
+
+class TestTruncateToTokens:
+    def test_short_text_unchanged(self):
+        assert truncate_to_tokens("hello", 10) == "hello"
+
+    def test_tail_keeps_end(self):
+        text = "\n".join(f"line {i}" for i in range(100))
+        result = truncate_to_tokens(text, 20)
+        assert result.startswith("...\n")
+        assert result.endswith("line 99")
+        assert "line 0\n" not in result
+
+    def test_tail_cuts_on_line_boundary(self):
+        text = "\n".join(f"line {i}" for i in range(100))
+        body = truncate_to_tokens(text, 20)[len("...\n"):]
+        assert body.startswith("line ")
+
+    def test_head_keeps_beginning(self):
+        text = "A" * 3000
+        result = truncate_to_tokens(text, 375, keep="head")
+        assert result == "A" * 1500 + "\n..."
+
+    def test_zero_budget(self):
+        assert truncate_to_tokens("some text", 0) == ""
+
+
+class TestPackSections:
+    def test_under_budget_untouched(self):
+        packed = pack_sections([
+            Section("a", "alpha", header="A: "),
+            Section("b", "beta", priority=2),
+        ], budget=100)
+        assert packed.get("a") == "A: alpha"
+        assert packed.get("b") == "beta"
+        assert packed.cuts == []
+        assert not packed.over_budget
+
+    def test_empty_sections_render_empty(self):
+        packed = pack_sections([Section("a", "", header="A: ")], budget=100)
+        assert packed.get("a") == ""
+        assert packed.get("missing") == ""
+
+    def test_max_tokens_cap_is_not_a_cut(self):
+        packed = pack_sections([Section("j", "x" * 4000, max_tokens=100)], budget=10000)
+        assert estimate_tokens(packed.get("j")) <= 102
+        assert packed.cuts == []
+        assert packed.capped and packed.capped[0].startswith("j capped")
+
+    def test_lowest_priority_cut_first(self, capsys):
+        packed = pack_sections([
+            Section("important", "i" * 400, priority=1),
+            Section("filler", "f\n" * 400, priority=5),
+        ], budget=150, label="chat")
+        assert packed.get("important") == "i" * 400
+        assert 0 < estimate_tokens(packed.get("filler")) < 200
+        assert packed.used_tokens <= 150
+        assert packed.cuts[0].startswith("filler")
+        assert "[context_packer] chat: filler" in capsys.readouterr().err
+
+    def test_section_dropped_below_min_tokens(self):
+        packed = pack_sections([
+            Section("keep", "k" * 400, priority=1),
+            Section("emotional", "e" * 400, priority=6, min_tokens=50),
+        ], budget=120)
+        assert packed.get("emotional") == ""
+        assert packed.cuts == ["emotional dropped (100)"]
+
+    def test_cascade_to_next_priority(self):
+        packed = pack_sections([
+            Section("a", "a\n" * 400, priority=1),
+            Section("b", "b" * 800, priority=2),
+            Section("c", "c" * 800, priority=3),
+        ], budget=150)
+        assert packed.get("c") == ""
+        assert packed.get("b") == ""
+        assert packed.get("a")
+        assert packed.used_tokens <= 150
+
+    def test_pinned_never_cut(self, capsys):
+        packed = pack_sections([
+            Section("soul", "s" * 4000, priority=0),
+            Section("extra", "e" * 40, priority=1),
+        ], budget=100, label="t")
+        assert packed.get("soul") == "s" * 4000
+        assert packed.get("extra") == ""
+        assert packed.over_budget
+        assert "1000/100 tokens" in capsys.readouterr().err
+
+    def test_pinned_ignores_max_tokens(self):
+        packed = pack_sections([Section("p", "p" * 400, priority=0, max_tokens=10)], budget=1000)
+        assert packed.get("p") == "p" * 400
+
+    def test_header_survives_truncation(self):
+        packed = pack_sections([
+            Section("j", "line\n" * 200, header="Journal:\n", priority=1),
+        ], budget=60)
+        assert packed.get("j").startswith("Journal:\n...")
+        assert packed.used_tokens <= 60
@@ -179,6 +179,22 @@ class TestBuildPrompt:
         assert "Low Certainty" in prompt
 
 
+    def test_prompt_includes_static_context(self):
+        prompt = build_dead_code_prompt(
+            "test",
+            skill_dir=Path(__file__).parent.parent / "skills" / "core" / "dead_code",
+            static_context="## Static Analysis Pre-pass\n- candidate",
+        )
+        assert "## Static Analysis Pre-pass" in prompt
+        assert "{STATIC_ANALYSIS}" not in prompt
+
+    def test_prompt_without_static_context_has_no_placeholder(self):
+        prompt = build_dead_code_prompt(
+            "test",
+            skill_dir=Path(__file__).parent.parent / "skills" / "core" / "dead_code",
+        )
+        assert "{STATIC_ANALYSIS}" not in prompt
+
 class TestExtractReportBody:
     def test_extracts_from_dead_code_header(self):
         raw = "Some preamble\n\nDead Code Report — myproject\n\n## Summary\nClean project."
@@ -0,0 +1,195 @@
+"""Tests for file_index — cached, gitignore-aware search for the local LLM tools."""
+
+import os
+import subprocess
+
+import pytest
+
+from app import file_index
+from app.file_index import FileIndex, get_index, glob_to_regex
+from app.local_llm_runner import _execute_tool
+
+
+def _git(repo, *args):
+    subprocess.run(
+        ["git", "-c", "user.email=t@t", "-c", "user.name=t", *args],
+        cwd=repo, check=True, capture_output=True,
+    )
+
+
+@pytest.fixture
+def tree(tmp_path):
+    root = tmp_path / "proj"
+    (root / "src" / "pkg").mkdir(parents=True)
+    (root / "node_modules" / "dep").mkdir(parents=True)
+    (root / "build").mkdir()
+    (root / "src" / "main.py").write_text("import pkg\n# TODO: main\n")
+    (root / "src" / "pkg" / "util.py").write_text("def helper():\n    pass  # TODO\n")
+    (root / "src" / "notes.txt").write_text("TODO later\n")
+    (root / "node_modules" / "dep" / "index.js").write_text("// TODO dep\n")
+    (root / "build" / "out.py").write_text("# TODO generated\n")
+    (root / "setup.py").write_text("")
+    return root
+
+
+@pytest.fixture
+def repo(tree):
+    _git(tree, "init", "-q")
+    (tree / ".gitignore").write_text("build/\n")
+    _git(tree, "add", ".gitignore", "src/main.py")
+    return tree
+
+
+class TestGlobToRegex:
+    @pytest.mark.parametrize("pattern,path,expected", [
+        ("*.py", "setup.py", True),
+        ("*.py", "src/main.py", False),
+        ("**/*.py", "setup.py", True),
+        ("**/*.py", "src/pkg/util.py", True),
+        ("src/**", "src/pkg/util.py", True),
+        ("src/*/util.py", "src/pkg/util.py", True),
+        ("src/?ain.py", "src/main.py", True),
+        ("[!m]*.py", "main.py", False),
+        ("[ms]*.py", "setup.py", True),
+        ("./src/*.py", "src/main.py", True),
+    ])
+    def test_matches(self, pattern, path, expected):
+        assert bool(glob_to_regex(pattern).match(path)) is expected
+
+
+class TestBuild:
+    def test_git_checkout_respects_gitignore(self, repo):
+        files = FileIndex(str(repo)).files_under(str(repo))
+        assert "src/main.py" in files          # tracked
+        assert "src/pkg/util.py" in files      # untracked, not ignored
+        assert "build/out.py" not in files     # gitignored
+        assert not any(f.startswith("node_modules/") for f in files)
+
+    def test_plain_directory_skips_known_dirs(self, tree):
+        files = FileIndex(str(tree)).files_under(str(tree))
+        assert "build/out.py" in files
+        assert not any(f.startswith("node_modules/") for f in files)
+
+    def test_walk_happens_once(self, tree, monkeypatch):
+        index = FileIndex(str(tree))
+        index.glob("*.py", str(tree))
+        monkeypatch.setattr(index, "_list_walk", lambda: pytest.fail("re-walked"))
+        index.glob("**/*.py", str(tree))
+        index.grep("TODO", str(tree))
+
+    def test_add_and_invalidate(self, tree):
+        index = FileIndex(str(tree))
+        index.glob("*.py", str(tree))
+        (tree / "new.py").write_text("")
+        (tree / "other.py").write_text("")
+        index.add(str(tree / "new.py"))
+        names = [os.path.basename(p) for p in index.glob("*.py", str(tree))]
+        assert "new.py" in names and "other.py" not in names
+
+        index.invalidate()
+        names = [os.path.basename(p) for p in index.glob("*.py", str(tree))]
+        assert "other.py" in names
+
+
+class TestGlob:
+    def test_subdirectory_base_and_directories(self, tree):
+        index = FileIndex(str(tree))
+        assert index.glob("*.py", str(tree / "src")) == [str(tree / "src" / "main.py")]
+        assert str(tree / "src" / "pkg") in index.glob("src/*", str(tree))
+
+    def test_deleted_files_dropped(self, tree):
+        index = FileIndex(str(tree))
+        index.glob("*.py", str(tree))
+        (tree / "setup.py").unlink()
+        assert index.glob("*.py", str(tree)) == []
+
+
+class TestNativeGrep:
+    @pytest.fixture(autouse=True)
+    def no_ripgrep(self, monkeypatch):
+        monkeypatch.setattr(file_index.shutil, "which", lambda name: None)
+
+    def test_matches_with_line_numbers(self, repo):
+        out = FileIndex(str(repo)).grep("TODO", str(repo))
+        assert f"{repo}/src/main.py:2:# TODO: main" in out
+        assert "util.py:2:" in out
+        assert "out.py" not in out and "index.js" not in out
+
+    def test_file_glob_filter(self, tree):
+        out = FileIndex(str(tree)).grep("TODO", str(tree / "src"), file_glob="*.txt")
+        assert out == f"{tree}/src/notes.txt:1:TODO later\n"
+
+    def test_single_file_path(self, tree):
+        out = FileIndex(str(tree)).grep("helper", str(tree / "src" / "pkg" / "util.py"))
+        assert out.endswith("util.py:1:def helper():\n")
+
+    def test_invalid_regex_searched_literally(self, tree):
+        (tree / "src" / "calls.py").write_text("run(x\n")
+        assert "calls.py:1:run(x" in FileIndex(str(tree)).grep("run(", str(tree))
+
+    def test_binary_files_skipped(self, tree):
+        (tree / "blob.bin").write_bytes(b"TODO\x00\x01")
+        assert "blob.bin" not in FileIndex(str(tree)).grep("TODO", str(tree))
+
+    def test_output_capped_while_scanning(self, tree):
+        for i in range(50):
+            (tree / f"big{i}.txt").write_text("match\n" * 200)
+        out = FileIndex(str(tree)).grep("match", str(tree), max_chars=1000)
+        assert out.endswith(file_index.TRUNCATED)
+        assert len(out) <= 1000 + len(file_index.TRUNCATED)
+
+
+class TestRipgrep:
+    @pytest.fixture
+    def fake_rg(self, tmp_path, monkeypatch):
+        """Install a shell script as ``rg``; returns a writer for its body."""
+        bin_dir = tmp_path / "bin"
+        bin_dir.mkdir()
+        monkeypatch.setenv("PATH", f"{bin_dir}{os.pathsep}{os.environ['PATH']}")
+
+        def install(body):
+            script = bin_dir / "rg"
+            script.write_text("#!/bin/sh\n" + body)
+            script.chmod(0o755)
+        return install
+
+    def test_stops_reading_at_cap(self, tree, fake_rg):
+        """A never-ending rg is cut off once the cap is reached."""
+        fake_rg('while :; do echo "src/main.py:1:match"; done\n')
+        out = FileIndex(str(tree)).grep("match", str(tree), max_chars=500)
+        assert out.startswith("src/main.py:1:match\n")
+        assert out.endswith(file_index.TRUNCATED)
+
+    def test_searches_hidden_files_but_not_skip_dirs(self, tree, fake_rg, tmp_path):
+        args_file = tmp_path / "args"
+        fake_rg(f'printf "%s\\n" "$@" > {args_file}\nexit 1\n')
+        FileIndex(str(tree)).grep("x", str(tree), file_glob="*.py")
+        args = args_file.read_text().splitlines()
+        assert "--hidden" in args
+        assert "!.git" in args and "!node_modules" in args
+        assert args.index("*.py") < args.index("!.git")
+
+    def test_invalid_regex_searched_literally(self, tree, fake_rg):
+        """rg rejects the pattern (exit 2): retried as a fixed string."""
+        fake_rg(
+            'for a in "$@"; do [ "$a" = --fixed-strings ] && '
+            '{ echo "src/calls.py:1:run(x"; exit 0; }; done\nexit 2\n'
+        )
+        assert FileIndex(str(tree)).grep("run(", str(tree)) == "src/calls.py:1:run(x\n"
+
+
+class TestRunnerTools:
+    def test_written_file_visible_to_glob(self, tree):
+        cwd = str(tree / "src")
+        assert "fresh.py" not in _execute_tool("glob", {"pattern": "*.py"}, cwd)
+        _execute_tool("write_file", {"path": "fresh.py", "content": "x = 1\n"}, cwd)
+        assert "fresh.py" in _execute_tool("glob", {"pattern": "*.py"}, cwd)
+
+    def test_shell_invalidates_index(self, tree):
+        cwd = str(tree)
+        get_index(cwd).glob("*.py", cwd)
+        _execute_tool("shell", {"command": "touch made_by_shell.py"}, cwd)
+        assert "made_by_shell.py" in _execute_tool("glob", {"pattern": "*.py"}, cwd)
+
+    def test_absolute_pattern_outside_cwd_rejected(self, tree):
+        assert "Error" in _execute_tool("glob", {"pattern": "/etc/*"}, str(tree))
@@ -0,0 +1,137 @@
+"""Tests for git_service — long-lived cat-file reader per repository."""
+
+import subprocess
+from unittest.mock import patch
+
+import pytest
+
+from app import git_service
+from app.git_service import GitService, get_git_service
+
+
+def _git(repo, *args):
+    return subprocess.run(
+        ["git", *args], cwd=repo, check=True, capture_output=True, text=True,
+    ).stdout.strip()
+
+
+def _commit(repo, name, content):
+    (repo / name).write_text(content)
+    _git(repo, "add", name)
+    _git(repo, "-c", "user.email=t@t", "-c", "user.name=t", "commit", "-qm", name)
+    return _git(repo, "rev-parse", "HEAD")
+
+
+@pytest.fixture
+def repo(tmp_path):
+    root = tmp_path / "repo"
+    root.mkdir()
+    _git(root, "init", "-q", "-b", "main")
+    _commit(root, "README.md", "hello\n")
+    return root
+
+
+@pytest.fixture
+def service(repo):
+    svc = GitService(str(repo))
+    yield svc
+    svc.close()
+
+
+class TestResolve:
+    def test_resolves_existing_and_missing_names(self, repo, service):
+        head = _git(repo, "rev-parse", "HEAD")
+
+        assert service.resolve(["HEAD", "main", "origin/main"]) == {
+            "HEAD": head, "main": head, "origin/main": None,
+        }
+
+    def test_first_existing_keeps_candidate_order(self, service):
+        assert service.first_existing(["upstream/main", "main", "HEAD"]) == "main"
+        assert service.first_existing(["upstream/main", "origin/main"]) is None
+
+    def test_object_info_reports_type_and_size(self, service):
+        sha, kind, size = service.object_info(["HEAD:README.md"])["HEAD:README.md"]
+        assert kind == "blob"
+        assert size == len("hello\n")
+
+    def test_process_reused_and_sees_new_refs(self, repo, service):
+        assert service.ref_exists("main")
+        proc = service._check.proc
+
+        sha = _commit(repo, "a.txt", "a\n")
+        _git(repo, "branch", "feature")
+
+        assert service.resolve(["feature", "HEAD"]) == {"feature": sha, "HEAD": sha}
+        assert service._check.proc is proc
+
+    def test_large_batch(self, service):
+        names = [f"missing-{i}" for i in range(600)] + ["HEAD"]
+        resolved = service.resolve(names)
+        assert len(resolved) == 601
+        assert resolved["HEAD"]
+        assert resolved["missing-0"] is None
+
+
+class TestReadObject:
+    def test_reads_blob_content(self, repo, service):
+        _commit(repo, "b.bin", "line1\nline2\n")
+        assert service.read_object("HEAD:b.bin") == b"line1\nline2\n"
+        assert service.read_object("HEAD:README.md") == b"hello\n"
+        assert service.read_object("HEAD:nope") is None
+
+
+class TestRecovery:
+    def test_dead_process_is_restarted(self, service):
+        assert service.ref_exists("HEAD")
+        service._check.proc.kill()
+        service._check.proc.wait()
+
+        assert service.ref_exists("HEAD")
+
+    def test_idle_process_is_restarted(self, service):
+        assert service.ref_exists("HEAD")
+        old = service._check.proc
+        service._check.last_used -= git_service.IDLE_TIMEOUT + 1
+
+        assert service.ref_exists("HEAD")
+        assert service._check.proc is not old
+        assert old.poll() is not None
+
+    def test_falls_back_to_run_git_when_cat_file_unusable(self, repo, service):
+        head = _git(repo, "rev-parse", "HEAD")
+        with patch.object(service._check, "_ensure", side_effect=OSError("no fork")):
+            assert service.resolve(["HEAD", "nope"]) == {"HEAD": head, "nope": None}
+
+    def test_not_a_repo(self, tmp_path):
+        svc = GitService(str(tmp_path))
+        assert svc.resolve(["HEAD"]) == {"HEAD": None}
+        assert svc.count_commits() == -1
+        svc.close()
+
+
+class TestCountCommits:
+    def test_counts_reachable_commits(self, repo, service):
+        _commit(repo, "a.txt", "a\n")
+        assert service.count_commits() == 2
+        assert service.count_commits("HEAD~1..HEAD") == 1
+        assert service.count_commits(since="2099-01-01T00:00:00") == 0
+
+
+class TestRegistry:
+    def test_one_service_per_repo(self, repo):
+        try:
+            assert get_git_service(str(repo)) is get_git_service(str(repo) + "/")
+        finally:
+            git_service.close_all()
+
+    def test_close_all_clears_registry(self, repo):
+        svc = get_git_service(str(repo))
+        svc.ref_exists("HEAD")
+        proc = svc._check.proc
+
+        git_service.close_all()
+
+        assert proc.poll() is not None
+        assert get_git_service(str(repo)) is not svc
+        git_service.close_all()
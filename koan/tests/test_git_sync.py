@@ -7,7 +7,7 @@ from unittest.mock import patch, MagicMock
 
 import pytest
 
-from app.git_sync import run_git, GitSync, RECENT_BRANCH_DAYS
+from app.git_sync import run_git, GitSync, RECENT_BRANCH_DAYS, sync_projects
 
 # Patch path for the lazy import of run_gh inside get_github_merged_branches.
 _RUN_GH_PATH = "app.github.run_gh"
@@ -936,6 +936,83 @@ class TestWriteSyncToJournal:
         assert "New sync" in content
 
 
+class TestSyncProjects:
+    def test_projects_synced_concurrently(self):
+        import threading
+        all_started = threading.Barrier(3, timeout=5)
+
+        def fake_sync(self, github_merged=None):
+            all_started.wait()  # deadlocks unless the three run at once
+            return f"report {self.project_name}"
+
+        projects = [("a", "/a"), ("b", "/b"), ("c", "/c")]
+        with patch.object(GitSync, "sync_and_report", fake_sync), \
+                patch("app.git_sync._prefetch_github_merged", return_value={}):
+            reports = sync_projects("/inst", projects, max_workers=3)
+
+        assert reports == {"a": "report a", "b": "report b", "c": "report c"}
+
+    def test_github_merged_query_shared(self):
+        remotes = {"/a": "owner/a", "/b": "owner/b", "/c": None}
+        with patch("app.git_sync._gh_base_repo", side_effect=remotes.get), \
+                patch("app.github.batch_merged_pr_branches",
+                      return_value={"owner/a": ["feature", "koan/x"]}) as mock_batch, \
+                patch.object(GitSync, "sync_and_report", autospec=True,
+                             return_value="ok") as mock_sync:
+            sync_projects("/inst", [("a", "/a"), ("b", "/b"), ("c", "/c")], max_workers=2)
+
+        mock_batch.assert_called_once_with(["owner/a", "owner/b"])
+        passed = {
+            c.args[0].project_name: c.kwargs["github_merged"]
+            for c in mock_sync.call_args_list
+        }
+        # Only prefixed branches; repos the batch missed query on their own
+        assert passed == {"a": ["koan/x"], "b": None, "c": None}
+
+    def test_batch_queries_the_repo_gh_resolves(self, tmp_path):
+        """In a fork checkout, the batch asks about upstream like gh does."""
+        import subprocess
+        from app.git_sync import _gh_base_repo
+
+        repo = str(tmp_path)
+        subprocess.run(["git", "init", "-q", repo], check=True)
+
+        def git(*args):
+            subprocess.run(["git", "-C", repo, *args], check=True)
+
+        git("remote", "add", "origin", "git@github.com:me/proj.git")
+        assert _gh_base_repo(repo) == "me/proj"
+        git("remote", "add", "upstream", "https://github.com/Org/Proj.git")
+        assert _gh_base_repo(repo) == "org/proj"
+        # `gh repo set-default` wins over the remote names
+        git("config", "remote.origin.gh-resolved", "base")
+        assert _gh_base_repo(repo) == "me/proj"
+
+    def test_failed_project_omitted(self, capsys):
+        def fake_sync(self, github_merged=None):
+            if self.project_name == "bad":
+                raise RuntimeError("boom")
+            return "ok"
+
+        with patch.object(GitSync, "sync_and_report", fake_sync), \
+                patch("app.git_sync._prefetch_github_merged", return_value={}):
+            reports = sync_projects("/inst", [("bad", "/x"), ("good", "/y")], max_workers=2)
+
+        assert reports == {"good": "ok"}
+        assert "Git sync failed for bad: boom" in capsys.readouterr().out
+
+    def test_prefetched_list_skips_per_repo_query(self):
+        sync = _sync()
+        with patch("app.git_sync.run_git", return_value=""), \
+                patch.object(sync, "get_github_merged_branches") as mock_gh, \
+                patch("app.git_sync.get_branch_cleanup_config",
+                      return_value={"enabled": False, "delete_remote_branches": False}):
+            report = sync.build_sync_report(github_merged=["koan/done"])
+
+        mock_gh.assert_not_called()
+        assert "koan/done" in report
+
+
 class TestGitSyncCLI:
     """Tests for git_sync.py __main__ block."""
 
@@ -10,7 +10,7 @@ from app.github import (
     SSOAuthRequired, _is_sso_error,
     run_gh, pr_create, issue_create, api,
     get_gh_username, count_open_prs, cached_count_open_prs,
-    batch_count_open_prs, fetch_issue_state, fetch_issue_with_comments,
+    batch_count_open_prs, batch_merged_pr_branches, batch_pr_ci_status, fetch_issue_state, fetch_issue_with_comments,
     detect_parent_repo, resolve_target_repo, _upstream_remote_repo,
     _parse_remote_url,
     sanitize_github_comment,
@@ -542,6 +542,154 @@ class TestBatchCountOpenPrs:
         assert result == {"owner/a": 3}
 
 
+# ---------------------------------------------------------------------------
+# batch_pr_ci_status
+# ---------------------------------------------------------------------------
+
+
+def _pr_node(suites=(), rollup=None):
+    """Build a repository alias node for the CI status query."""
+    return {"pullRequest": {"commits": {"nodes": [{"commit": {
+        "statusCheckRollup": {"state": rollup} if rollup else None,
+        "checkSuites": {"nodes": [
+            {"status": st, "conclusion": concl,
+             "workflowRun": {"databaseId": rid} if rid else None}
+            for st, concl, rid in suites
+        ]},
+    }}]}}}
+
+
+class TestBatchPrCiStatus:
+
+    @patch("app.github.run_gh")
+    def test_maps_workflow_runs(self, mock_gh):
+        mock_gh.return_value = json.dumps({"data": {
+            "p0": _pr_node([("COMPLETED", "SUCCESS", 11), ("COMPLETED", "SKIPPED", 12)]),
+            "p1": _pr_node([("COMPLETED", "FAILURE", 21), ("COMPLETED", "SUCCESS", 22)]),
+            "p2": _pr_node([("COMPLETED", "SUCCESS", 31), ("IN_PROGRESS", None, 32)]),
+            "p3": _pr_node(),
+        }})
+        result = batch_pr_ci_status([
+            ("owner/a", "1"), ("owner/b", "2"), ("owner/c", "3"), ("owner/d", "4"),
+        ])
+
+        assert result == {
+            ("owner/a", "1"): ("success", 12),
+            ("owner/b", "2"): ("failure", 21),
+            ("owner/c", "3"): ("pending", 32),
+            ("owner/d", "4"): ("none", None),
+        }
+        mock_gh.assert_called_once()
+        assert mock_gh.call_args[0][:2] == ("api", "graphql")
+
+    @patch("app.github.run_gh")
+    def test_non_actions_checks_ignored(self, mock_gh):
+        """A failing codecov/review status doesn't fail green Actions runs."""
+        mock_gh.return_value = json.dumps({"data": {
+            "p0": _pr_node([("COMPLETED", "FAILURE", None), ("COMPLETED", "SUCCESS", 7)],
+                           rollup="FAILURE"),
+            "p1": _pr_node([("COMPLETED", "FAILURE", None)], rollup="FAILURE"),
+        }})
+        result = batch_pr_ci_status([("owner/a", "1"), ("owner/b", "2")])
+        assert result == {
+            ("owner/a", "1"): ("success", 7),
+            ("owner/b", "2"): ("none", None),
+        }
+        assert "statusCheckRollup" not in mock_gh.call_args[0][3]
+
+    @patch("app.github.run_gh")
+    def test_queued_runs_are_pending(self, mock_gh):
+        mock_gh.return_value = json.dumps({"data": {
+            "p0": _pr_node([("QUEUED", None, 5)]),
+        }})
+        assert batch_pr_ci_status([("owner/a", "1")]) == {("owner/a", "1"): ("pending", 5)}
+
+    @patch("app.github.run_gh")
+    def test_missing_pr_omitted(self, mock_gh):
+        mock_gh.return_value = json.dumps({"data": {
+            "p0": _pr_node([("COMPLETED", "SUCCESS", 1)]),
+            "p1": None,
+        }})
+        result = batch_pr_ci_status([("owner/a", "1"), ("owner/gone", "2")])
+        assert result == {("owner/a", "1"): ("success", 1)}
+
+    @patch("app.github.run_gh")
+    def test_chunks_large_batches(self, mock_gh):
+        mock_gh.return_value = json.dumps({"data": {}})
+        prs = [("owner/repo", str(n)) for n in range(github_module._CI_STATUS_BATCH_SIZE + 1)]
+        batch_pr_ci_status(prs)
+        assert mock_gh.call_count == 2
+
+    @patch("app.github.run_gh", side_effect=RuntimeError("gh failed"))
+    def test_failure_returns_empty(self, mock_gh):
+        assert batch_pr_ci_status([("owner/a", "1")]) == {}
+
+    @patch("app.github.run_gh")
+    def test_invalid_entries_skipped(self, mock_gh):
+        assert batch_pr_ci_status([("no-slash", "1"), ("owner/a", "?")]) == {}
+        mock_gh.assert_not_called()
+
+
+class TestBatchMergedPrBranches:
+
+    @patch("app.github.run_gh")
+    def test_maps_repos_to_branches(self, mock_gh):
+        mock_gh.return_value = json.dumps({"data": {
+            "r0": {"pullRequests": {"nodes": [
+                {"headRefName": "koan/b"}, {"headRefName": "koan/a"}, {"headRefName": "koan/a"},
+            ]}},
+            "r1": None,
+        }})
+        result = batch_merged_pr_branches(["owner/a", "owner/gone", "owner/a"])
+
+        assert result == {"owner/a": ["koan/a", "koan/b"]}
+        mock_gh.assert_called_once()
+        assert mock_gh.call_args[0][:2] == ("api", "graphql")
+
+    @patch("app.github.run_gh")
+    def test_second_page_for_busy_repos(self, mock_gh):
+        """Up to 200 merged PRs are read, like the per-repo gh pr list."""
+        def page(prefix, has_next):
+            return {"pullRequests": {
+                "nodes": [{"headRefName": f"{prefix}{n}"} for n in range(100 if has_next else 1)],
+                "pageInfo": {"hasNextPage": has_next, "endCursor": f"c-{prefix}"},
+            }}
+
+        mock_gh.side_effect = [
+            json.dumps({"data": {"r0": page("a", True), "r1": page("b", False)}}),
+            json.dumps({"data": {"r0": page("a2-", True)}}),
+        ]
+        result = batch_merged_pr_branches(["owner/a", "owner/b"])
+
+        assert len(result["owner/a"]) == 200
+        assert result["owner/b"] == ["b0"]
+        assert mock_gh.call_count == 2  # stops at the limit despite hasNextPage
+        second = mock_gh.call_args_list[1][0][3]
+        assert 'after: "c-a"' in second and 'name: "b"' not in second
+
+    @patch("app.github.run_gh")
+    def test_failed_second_page_drops_repo(self, mock_gh):
+        mock_gh.side_effect = [
+            json.dumps({"data": {"r0": {"pullRequests": {
+                "nodes": [{"headRefName": "koan/a"}],
+                "pageInfo": {"hasNextPage": True, "endCursor": "c1"},
+            }}}}),
+            RuntimeError("gh failed"),
+        ]
+        assert batch_merged_pr_branches(["owner/a"]) == {}
+
+    @patch("app.github.run_gh")
+    def test_chunks_large_batches(self, mock_gh):
+        mock_gh.return_value = json.dumps({"data": {}})
+        repos = [f"owner/r{n}" for n in range(github_module._MERGED_BRANCHES_BATCH_SIZE + 1)]
+        batch_merged_pr_branches(repos)
+        assert mock_gh.call_count == 2
+
+    @patch("app.github.run_gh", side_effect=RuntimeError("gh failed"))
+    def test_failure_returns_empty(self, mock_gh):
+        assert batch_merged_pr_branches(["owner/a", "not-a-repo"]) == {}
+
+
 # ---------------------------------------------------------------------------
 # run_gh — stdin_data
 # ---------------------------------------------------------------------------
@@ -1903,6 +1903,33 @@ projects:
         assert result.pr_limited == ["koan"]
         mock_cached.assert_called_once_with("owner/koan", "koan-bot")
 
+    @patch("app.github.get_gh_username", return_value="koan-bot")
+    @patch("app.github.batch_count_open_prs")
+    def test_fresh_cached_counts_skip_batch(self, mock_batch, mock_user, koan_root):
+        """Counts cached within the TTL are reused — no GitHub call."""
+        import time
+        from app.github import _pr_count_cache
+        _pr_count_cache["owner/koan:koan-bot"] = (2, time.monotonic())
+        mock_batch.return_value = {"upstream/koan": 4}
+        (koan_root / "projects.yaml").write_text("""
+projects:
+  koan:
+    path: /path/to/koan
+    github_url: owner/koan
+    max_open_prs: 10
+    github_urls:
+    - owner/koan
+    - upstream/koan
+""")
+        _filter_exploration_projects([("koan", "/path/to/koan")], str(koan_root))
+        mock_batch.assert_called_once_with(["upstream/koan"], "koan-bot")
+
+        _pr_count_cache["upstream/koan:koan-bot"] = (4, time.monotonic())
+        mock_batch.reset_mock()
+        result = _filter_exploration_projects([("koan", "/path/to/koan")], str(koan_root))
+        mock_batch.assert_not_called()
+        assert len(result.projects) == 1
+
     @patch("app.github.get_gh_username", return_value="koan-bot")
     @patch("app.github.batch_count_open_prs")
     def test_batch_receives_all_repos(self, mock_batch, mock_user, koan_root):
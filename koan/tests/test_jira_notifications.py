@@ -14,7 +14,9 @@ from app.jira_notifications import (
     _get_comment_age_hours,
     _load_processed_tracker,
     _save_processed_tracker,
+    _parse_jira_time,
     check_jira_already_processed,
+    commit_jira_watermarks,
     fetch_jira_mentions,
     mark_jira_comment_processed,
     parse_jira_mention_command,
@@ -372,3 +374,266 @@ class TestFetchJiraMentions:
         config = self._make_config()
         result = fetch_jira_mentions(config, {"FOO": "myproject"})
         assert result.mentions == []
+
+
+class TestFetchJiraMentionsBatched:
+    """Inline comments, concurrent fallback fetches and watermarks."""
+
+    CONFIG = {
+        "jira": {
+            "enabled": True,
+            "base_url": "https://test.atlassian.net",
+            "email": "bot@example.com",
+            "api_token": "secret",
+            "nickname": "koan-bot",
+            "max_age_hours": 24,
+        }
+    }
+
+    @staticmethod
+    def _comment(comment_id, body, updated=None):
+        from datetime import datetime, timezone
+
+        updated = updated or datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%S.000+0000")
+        return {
+            "id": comment_id,
+            "body": body,
+            "author": {"emailAddress": "user@example.com", "displayName": "Test User"},
+            "updated": updated,
+        }
+
+    def _issue(self, key, comments, total=None, updated="2026-10-18T10:00:00.000+0000"):
+        return {
+            "key": key,
+            "fields": {
+                "summary": key,
+                "updated": updated,
+                "comment": {
+                    "comments": comments,
+                    "total": len(comments) if total is None else total,
+                },
+            },
+        }
+
+    def test_inline_comments_need_no_extra_requests(self):
+        issues = [
+            self._issue(f"FOO-{i}", [self._comment(str(i), f"@koan-bot fix {i}")])
+            for i in range(30)
+        ]
+        with patch("app.jira_notifications._jira_post",
+                   return_value={"issues": issues, "isLast": True}) as mock_post, \
+             patch("app.jira_notifications._jira_get") as mock_get:
+            result = fetch_jira_mentions(self.CONFIG, {"FOO": "myproject"})
+
+        # No 20-issue cap: every changed issue is processed
+        assert len(result.mentions) == 30
+        mock_post.assert_called_once()
+        assert "comment" in mock_post.call_args[0][3]["fields"]
+        mock_get.assert_not_called()
+
+    def test_truncated_inline_comments_fetched_separately(self):
+        issues = [
+            self._issue("FOO-1", [self._comment("1", "@koan-bot plan")]),
+            self._issue("FOO-2", [], total=150),
+        ]
+        with patch("app.jira_notifications._jira_post",
+                   return_value={"issues": issues, "isLast": True}), \
+             patch("app.jira_notifications._jira_get", return_value={
+                 "comments": [self._comment("2", "@koan-bot review")], "total": 1,
+             }) as mock_get:
+            result = fetch_jira_mentions(self.CONFIG, {"FOO": "myproject"})
+
+        assert sorted(m["comment_id"] for m in result.mentions) == ["1", "2"]
+        mock_get.assert_called_once()
+        assert "FOO-2" in mock_get.call_args[0][2]
+
+    def test_old_inline_comments_filtered(self):
+        issues = [self._issue("FOO-1", [
+            self._comment("1", "@koan-bot plan", updated="2020-01-01T00:00:00.000+0000"),
+        ])]
+        with patch("app.jira_notifications._jira_post",
+                   return_value={"issues": issues, "isLast": True}):
+            result = fetch_jira_mentions(self.CONFIG, {"FOO": "myproject"})
+
+        assert result.mentions == []
+
+    def test_watermark_persisted_and_used(self, tmp_path):
+        watermark_path = tmp_path / ".jira-watermarks.json"
+        issues = [self._issue("FOO-1", [], updated="2099-01-02T03:04:05.000+0000")]
+        with patch("app.jira_notifications._jira_post",
+                   return_value={"issues": issues, "isLast": True}):
+            result = fetch_jira_mentions(self.CONFIG, {"FOO": "a", "BAR": "b"},
+                                         watermark_path=watermark_path)
+
+        assert not watermark_path.exists()  # saved only after processing
+        commit_jira_watermarks(watermark_path, result)
+        marks = json.loads(watermark_path.read_text())
+        assert marks == {"FOO": "2099-01-02T03:04:05+00:00"}
+
+        with patch("app.jira_notifications._jira_post",
+                   return_value={"issues": [], "isLast": True}) as mock_post:
+            fetch_jira_mentions(self.CONFIG, {"FOO": "a", "BAR": "b"},
+                                watermark_path=watermark_path)
+
+        jql = mock_post.call_args[0][3]["jql"]
+        assert '(project = "FOO" AND updated >= "2099-01-02 03:04")' in jql
+        assert '(project = "BAR" AND updated >= ' in jql
+
+    def test_watermark_kept_when_comment_fetch_fails(self, tmp_path):
+        watermark_path = tmp_path / ".jira-watermarks.json"
+        issues = [self._issue("FOO-1", [], total=500)]
+        with patch("app.jira_notifications._jira_post",
+                   return_value={"issues": issues, "isLast": True}), \
+             patch("app.jira_notifications._jira_get", return_value=None):
+            result = fetch_jira_mentions(self.CONFIG, {"FOO": "a"}, watermark_path=watermark_path)
+
+        assert result.watermarks is None
+
+    def test_watermark_kept_when_search_incomplete(self, tmp_path):
+        watermark_path = tmp_path / ".jira-watermarks.json"
+        pages = [
+            {"issues": [self._issue("FOO-1", [])], "isLast": False, "nextPageToken": "t2"},
+            None,
+        ]
+        with patch("app.jira_notifications._jira_post", side_effect=pages):
+            result = fetch_jira_mentions(self.CONFIG, {"FOO": "a"}, watermark_path=watermark_path)
+
+        assert result.watermarks is None
+
+    def test_watermark_stops_at_unhandled_mention(self, tmp_path):
+        watermark_path = tmp_path / ".jira-watermarks.json"
+        issues = [
+            self._issue("FOO-1", [self._comment("1", "@koan-bot plan")],
+                        updated="2099-01-02T03:04:05.000+0000"),
+            self._issue("BAR-1", [], updated="2099-01-02T03:04:05.000+0000"),
+        ]
+        with patch("app.jira_notifications._jira_post",
+                   return_value={"issues": issues, "isLast": True}):
+            result = fetch_jira_mentions(self.CONFIG, {"FOO": "a", "BAR": "b"},
+                                         watermark_path=watermark_path)
+
+        failed = result.mentions[0]
+        commit_jira_watermarks(watermark_path, result, unhandled=[failed])
+
+        marks = json.loads(watermark_path.read_text())
+        assert marks["BAR"] == "2099-01-02T03:04:05+00:00"
+        # FOO stays at the failed comment, so the next poll fetches it again
+        assert _parse_jira_time(marks["FOO"]) == _parse_jira_time(failed["updated"])
+
+
+class TestProcessJiraNotifications:
+    """Watermarks and the poll window move only past handled mentions."""
+
+    @pytest.fixture
+    def loop_state(self):
+        from app import loop_manager
+        from app.bounded_set import BoundedSet
+        with patch.multiple(loop_manager, _last_jira_check=0, _last_jira_check_iso="",
+                            _jira_interval_loaded=True, _jira_config_logged=True), \
+                patch("app.jira_notifications._processed_comments", BoundedSet(maxlen=10)):
+            yield loop_manager
+
+    def _run(self, loop_manager, tmp_path, process):
+        from datetime import datetime, timezone
+        from app.jira_notifications import JiraFetchResult
+
+        mention = {"comment_id": "loop-retry-1", "issue_key": "FOO-1",
+                   "updated": "2099-01-01T00:00:00.000+0000"}
+        result = JiraFetchResult([mention], {"FOO": datetime(2099, 1, 2, tzinfo=timezone.utc)})
+        with patch("app.utils.load_config", return_value=TestFetchJiraMentionsBatched.CONFIG), \
+                patch("app.jira_config.validate_jira_config", return_value=None), \
+                patch("app.jira_config.get_jira_project_map", return_value={"FOO": "a"}), \
+                patch("app.jira_notifications.fetch_jira_mentions", return_value=result), \
+                patch("app.loop_manager._build_skill_registry"), \
+                patch("app.jira_command_handler.process_jira_mention", side_effect=process):
+            loop_manager.process_jira_notifications(str(tmp_path), str(tmp_path))
+        marks_file = tmp_path / ".jira-watermarks.json"
+        return json.loads(marks_file.read_text()) if marks_file.exists() else {}
+
+    def test_handled_mention_advances_watermark(self, loop_state, tmp_path):
+        def process(mention, registry, config, processed, branch_map=None):
+            processed.add(mention["comment_id"])
+            return True, None
+
+        marks = self._run(loop_state, tmp_path, process)
+        assert marks == {"FOO": "2099-01-02T00:00:00+00:00"}
+        assert loop_state._last_jira_check_iso != ""
+
+    def test_failed_mention_not_skipped_next_poll(self, loop_state, tmp_path):
+        from datetime import datetime, timedelta, timezone
+
+        marks = self._run(loop_state, tmp_path, RuntimeError("mission insert failed"))
+        assert marks == {"FOO": "2099-01-01T00:00:00+00:00"}
+        # The in-memory poll window stays at the cold-start lookback too
+        window = _parse_jira_time(loop_state._last_jira_check_iso)
+        assert window < datetime.now(timezone.utc) - timedelta(hours=23)
+
+
+class TestJiraConnectionPool:
+    """_jira_request reuses keep-alive connections."""
+
+    @pytest.fixture
+    def server(self):
+        import threading
+        from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+        peers = []
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def do_GET(self):
+                peers.append(self.client_address[1])
+                status = 404 if self.path.startswith("/missing") else 200
+                payload = json.dumps({"path": self.path}).encode()
+                self.send_response(status)
+                self.send_header("Content-Type", "application/json")
+                self.send_header("Content-Length", str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+                # Drop the connection without telling the client
+                self.close_connection = self.path.startswith("/drop")
+
+            def log_message(self, *args):
+                pass
+
+        httpd = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+        thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+        thread.start()
+        from app.jira_notifications import close_jira_connections
+        close_jira_connections()
+        yield f"http://127.0.0.1:{httpd.server_address[1]}", peers
+        close_jira_connections()
+        httpd.shutdown()
+        httpd.server_close()
+
+    def test_connection_reused(self, server):
+        from app.jira_notifications import _jira_get
+
+        base_url, peers = server
+        with patch.dict(os.environ, {"NO_PROXY": "*"}):
+            first = _jira_get(base_url, "Basic x", "/rest/a", {"q": "1"})
+            second = _jira_get(base_url, "Basic x", "/rest/b")
+
+        assert first == {"path": "/rest/a?q=1"}
+        assert second == {"path": "/rest/b"}
+        assert len(peers) == 2 and peers[0] == peers[1]
+
+    def test_http_error_returns_none(self, server):
+        from app.jira_notifications import _jira_get
+
+        base_url, _ = server
+        with patch.dict(os.environ, {"NO_PROXY": "*"}):
+            assert _jira_get(base_url, "Basic x", "/missing") is None
+            # The connection survives an error status
+            assert _jira_get(base_url, "Basic x", "/rest/ok") == {"path": "/rest/ok"}
+
+    def test_stale_idle_connection_retried(self, server):
+        from app.jira_notifications import _jira_get
+
+        base_url, peers = server
+        with patch.dict(os.environ, {"NO_PROXY": "*"}):
+            _jira_get(base_url, "Basic x", "/drop")
+            assert _jira_get(base_url, "Basic x", "/rest/b") == {"path": "/rest/b"}
+
+        assert len(peers) == 2 and peers[0] != peers[1]
@@ -1,6 +1,7 @@
 """Tests for app.journal — journal file management."""
 
 import pytest
+from unittest.mock import patch
 from datetime import date
 from pathlib import Path
 
@@ -109,6 +110,35 @@ class TestReadAllJournals:
         assert "Nested content" in result
 
 
+class TestReadJournalsTail:
+    @pytest.fixture
+    def day(self, instance_dir):
+        (instance_dir / "journal" / "2026-02-07.md").write_text("Flat é content\n")
+        day_dir = instance_dir / "journal" / "2026-02-07"
+        day_dir.mkdir()
+        (day_dir / "alpha.md").write_text("Alpha journal\n" * 5)
+        (day_dir / "beta.md").write_text("Beta journal\n")
+        return instance_dir
+
+    def test_matches_suffix_of_full_read(self, day):
+        from app.journal import read_all_journals, read_journals_tail
+        full = read_all_journals(day, "2026-02-07")
+        for max_chars in (1, 5, 13, 20, 27, 40, 90, 100, len(full) - 1):
+            content, truncated = read_journals_tail(day, "2026-02-07", max_chars)
+            assert content == full[-max_chars:], max_chars
+            assert truncated
+
+    def test_whole_content_not_truncated(self, day):
+        from app.journal import read_all_journals, read_journals_tail
+        full = read_all_journals(day, "2026-02-07")
+        assert read_journals_tail(day, "2026-02-07", len(full)) == (full, False)
+        assert read_journals_tail(day, "2026-02-07", 10_000) == (full, False)
+
+    def test_empty(self, instance_dir):
+        from app.journal import read_journals_tail
+        assert read_journals_tail(instance_dir, "2026-02-07", 100) == ("", False)
+
+
 # --- get_latest_journal ---
 
 
@@ -145,6 +175,16 @@ class TestGetLatestJournal:
         assert "..." in result
         assert len(result) < 200
 
+    def test_truncation_all_projects(self, instance_dir):
+        from app.journal import get_latest_journal
+        day_dir = instance_dir / "journal" / "2026-02-07"
+        day_dir.mkdir(parents=True)
+        (day_dir / "koan.md").write_text("old\n" * 500 + "latest entry")
+        result = get_latest_journal(instance_dir, target_date="2026-02-07", max_chars=100)
+        assert "\n\n...\n" in result
+        assert result.endswith("latest entry")
+        assert "[koan]" not in result
+
     def test_all_projects(self, instance_dir):
         from app.journal import get_latest_journal
         day_dir = instance_dir / "journal" / "2026-02-07"
@@ -186,6 +226,79 @@ class TestAppendToJournal:
 # --- backward compatibility ---
 
 
+class TestJournalAppender:
+    @pytest.fixture
+    def appender(self, instance_dir):
+        from app.journal import JournalAppender
+        with patch("app.journal._today_string", return_value="2026-02-07"):
+            a = JournalAppender(instance_dir, "koan", max_chars=20, max_delay=60)
+            yield a
+            a.close()
+
+    def _path(self, instance_dir, day="2026-02-07"):
+        return instance_dir / "journal" / day / "koan.md"
+
+    def test_coalesces_until_size_threshold(self, instance_dir, appender):
+        appender.write("short ")
+        assert not self._path(instance_dir).exists()
+        appender.write("and now over twenty chars")
+        assert self._path(instance_dir).read_text() == "short and now over twenty chars"
+
+    def test_close_flushes(self, instance_dir, appender):
+        appender.write("pending")
+        appender.close()
+        assert self._path(instance_dir).read_text() == "pending"
+
+    def test_flush_if_due(self, instance_dir):
+        from app.journal import JournalAppender
+        a = JournalAppender(instance_dir, "koan", max_delay=0)
+        a.write("due")
+        assert a.seconds_until_due() == 0.0
+        a.flush_if_due()
+        from datetime import datetime
+        today = datetime.now().strftime("%Y-%m-%d")
+        assert self._path(instance_dir, today).read_text() == "due"
+        assert a.seconds_until_due() is None
+        a.close()
+
+    def test_reuses_handle_across_flushes(self, instance_dir, appender):
+        appender.write("a" * 25)
+        first = appender._file
+        appender.write("b" * 25)
+        assert appender._file is first
+        assert self._path(instance_dir).read_text() == "a" * 25 + "b" * 25
+
+    def test_midnight_rotation(self, instance_dir, appender):
+        appender.write("late")
+        with patch("app.journal._today_string", return_value="2026-02-08"):
+            appender.write("early")
+            appender.flush()
+        assert self._path(instance_dir).read_text() == "late"
+        assert self._path(instance_dir, "2026-02-08").read_text() == "early"
+
+    def test_reopens_deleted_file(self, instance_dir, appender):
+        appender.write("x" * 25)
+        self._path(instance_dir).unlink()
+        appender.write("y" * 25)
+        assert self._path(instance_dir).read_text() == "y" * 25
+
+    def test_failed_flush_keeps_buffer(self, instance_dir, appender):
+        appender.write("kept")
+        with patch.object(appender, "_handle_for", side_effect=OSError("disk full")):
+            with pytest.raises(OSError):
+                appender.flush()
+        appender.write(" and more")
+        appender.flush()
+        assert self._path(instance_dir).read_text() == "kept and more"
+
+    def test_interleaves_with_other_writers(self, instance_dir, appender):
+        appender.write("x" * 25)
+        with open(self._path(instance_dir), "a") as f:
+            f.write("[other]")
+        appender.write("y" * 25)
+        assert self._path(instance_dir).read_text() == "x" * 25 + "[other]" + "y" * 25
+
+
 class TestBackwardCompat:
     def test_journal_functions_accessible_from_utils(self):
         from app.utils import get_journal_file, read_all_journals, append_to_journal
@@ -340,6 +340,122 @@ class TestRunLintGate:
         assert "b.py" in result.command
 
 
+# ---------------------------------------------------------------------------
+# Incremental lint cache and parallel shards
+# ---------------------------------------------------------------------------
+
+class TestIncrementalLint:
+    @pytest.fixture
+    def project(self, tmp_path):
+        proj = tmp_path / "proj"
+        proj.mkdir()
+        for name in ("a.py", "b.py"):
+            (proj / name).write_text(f"# {name}\n")
+        (proj / "pyproject.toml").write_text("[tool.ruff]\n")
+        instance = tmp_path / "instance"
+        instance.mkdir()
+        return proj, instance
+
+    def _run(self, project, lint, changed=("a.py", "b.py"), returncode=0):
+        proj, instance = project
+        config = {"defaults": {}, "projects": {"proj": {"lint": {"enabled": True, **lint}}}}
+        with (
+            patch.dict("os.environ", {"KOAN_ROOT": "/tmp/koan"}),
+            patch("app.lint_gate.load_projects_config", return_value=config),
+            patch("app.lint_gate.resolve_base_branch", return_value="main"),
+            patch("app.lint_gate._get_changed_files", return_value=list(changed)),
+            patch("app.lint_gate._write_journal_entry"),
+            patch("app.lint_gate.subprocess.run") as mock_run,
+        ):
+            mock_run.return_value = MagicMock(
+                returncode=returncode, stdout="out\n", stderr="",
+            )
+            result = run_lint_gate(str(proj), "proj", instance_dir=str(instance))
+        return result, [c.args[0] for c in mock_run.call_args_list]
+
+    def test_unchanged_files_skipped_after_pass(self, project):
+        lint = {"command": "ruff check {files}"}
+        _, calls = self._run(project, lint)
+        assert calls == [["ruff", "check", "a.py", "b.py"]]
+
+        (project[0] / "b.py").write_text("# edited\n")
+        result, calls = self._run(project, lint)
+        assert calls == [["ruff", "check", "b.py"]]
+        assert result.passed is True
+
+        result, calls = self._run(project, lint)
+        assert calls == []
+        assert result.passed is True
+
+    def test_reuses_changeset_for_same_base(self, project):
+        from app.branch_changes import BranchChangeSet, FileChange
+
+        proj, instance = project
+        config = {"defaults": {}, "projects": {"proj": {"lint": {
+            "enabled": True, "command": "ruff check {files}",
+        }}}}
+        changes = BranchChangeSet(
+            project_path=str(proj), branch="koan/x", base_ref="origin/main",
+            files=[FileChange("a.py", "M"), FileChange("gone.py", "D")],
+        )
+        with (
+            patch.dict("os.environ", {"KOAN_ROOT": "/tmp/koan"}),
+            patch("app.lint_gate.load_projects_config", return_value=config),
+            patch("app.lint_gate.resolve_base_branch", return_value="main"),
+            patch("app.lint_gate._get_changed_files") as mock_changed,
+            patch("app.lint_gate._write_journal_entry"),
+            patch("app.lint_gate.subprocess.run") as mock_run,
+        ):
+            mock_run.return_value = MagicMock(returncode=0, stdout="", stderr="")
+            run_lint_gate(str(proj), "proj", instance_dir=str(instance), changes=changes)
+
+            mock_changed.assert_not_called()
+            assert mock_run.call_args.args[0] == ["ruff", "check", "a.py"]
+
+            # A snapshot against another base is not reused
+            changes.base_ref = "upstream/main"
+            mock_changed.return_value = ["b.py"]
+            run_lint_gate(str(proj), "proj", instance_dir=str(instance), changes=changes)
+            mock_changed.assert_called_once()
+
+    def test_failures_are_not_cached(self, project):
+        lint = {"command": "ruff check {files}"}
+        self._run(project, lint, returncode=1)
+        _, calls = self._run(project, lint)
+        assert calls == [["ruff", "check", "a.py", "b.py"]]
+
+    def test_linter_config_change_invalidates(self, project):
+        lint = {"command": "ruff check {files}"}
+        self._run(project, lint)
+        (project[0] / "pyproject.toml").write_text("[tool.ruff]\nline-length = 80\n")
+        _, calls = self._run(project, lint)
+        assert calls == [["ruff", "check", "a.py", "b.py"]]
+
+    def test_whole_project_command_cached_on_changed_set(self, project):
+        lint = {"command": "make lint"}
+        self._run(project, lint)
+        _, calls = self._run(project, lint)
+        assert calls == []
+
+        (project[0] / "a.py").write_text("# edited\n")
+        _, calls = self._run(project, lint)
+        assert calls == [["make", "lint"]]
+
+    def test_multiple_linters_and_shards_run(self, project):
+        proj, _ = project
+        changed = [f"f{i}.py" for i in range(150)]
+        for name in changed:
+            (proj / name).write_text(name)
+        lint = {"command": ["ruff check {files}", "mypy {files}"]}
+
+        result, calls = self._run(project, lint, changed=changed)
+
+        assert len(calls) == 4  # 2 linters x 2 shards
+        assert sorted(len(c) - 2 for c in calls if c[0] == "ruff") == [50, 100]
+        assert result.passed is True
+        assert "ruff check" in result.command and "mypy" in result.command
+
+
 # ---------------------------------------------------------------------------
 # _write_journal_entry
 # ---------------------------------------------------------------------------
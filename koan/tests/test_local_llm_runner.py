@@ -1,14 +1,20 @@
 """Tests for local_llm_runner.py — local LLM agentic loop."""
 
+import io
 import json
 import os
+import socket
 import subprocess
+import sys
 import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from pathlib import Path
 from unittest.mock import patch, MagicMock
 
 import pytest
 
+from app import local_llm_runner as llm_runner
 from app.local_llm_runner import (
     _call_api,
     _default_system_prompt,
@@ -464,6 +470,136 @@ class TestRunAgent:
         assert result["result"] == "Recovered."
 
 
+class TestParallelToolCalls:
+    """Read-only tool calls in one turn run concurrently, mutations in order."""
+
+    def test_reads_overlap(self, tmp_path):
+        # Both reads must be inside the handler at once to pass the barrier.
+        barrier = threading.Barrier(2, timeout=5)
+
+        def handler(arguments, cwd):
+            barrier.wait()
+            return arguments["pattern"]
+
+        calls = [
+            _make_tool_call("read_file", {"pattern": "a"}, "call_a"),
+            _make_tool_call("grep", {"pattern": "b"}, "call_b"),
+        ]
+        handlers = {"read_file": handler, "grep": handler}
+        with patch.dict(llm_runner._TOOL_HANDLERS, handlers):
+            results = llm_runner._execute_tool_calls(calls, str(tmp_path))
+        assert results == ["a", "b"]
+
+    def test_write_is_a_barrier(self, tmp_path):
+        (tmp_path / "f.txt").write_text("old")
+        calls = [
+            _make_tool_call("read_file", {"path": "f.txt"}, "c1"),
+            _make_tool_call("write_file", {"path": "f.txt", "content": "new"}, "c2"),
+            _make_tool_call("read_file", {"path": "f.txt"}, "c3"),
+            _make_tool_call("glob", {"pattern": "*.txt"}, "c4"),
+        ]
+        results = llm_runner._execute_tool_calls(calls, str(tmp_path))
+        assert results[0] == "old"
+        assert results[1].startswith("Written")
+        assert results[2] == "new"
+        assert "f.txt" in results[3]
+
+    @patch("app.local_llm_runner._call_api")
+    def test_results_appended_in_call_order(self, mock_api, tmp_path):
+        for name in "abc":
+            (tmp_path / f"{name}.txt").write_text(f"file {name}")
+        mock_api.side_effect = [
+            _make_api_response(tool_calls=[
+                _make_tool_call("read_file", {"path": f"{name}.txt"}, f"call_{name}")
+                for name in "abc"
+            ]),
+            _make_api_response(content="done"),
+        ]
+        run_agent(prompt="p", base_url="http://x/v1", model="m", cwd=str(tmp_path))
+
+        messages = mock_api.call_args_list[1].kwargs["messages"]
+        tool_msgs = [m for m in messages if m["role"] == "tool"]
+        assert [m["tool_call_id"] for m in tool_msgs] == ["call_a", "call_b", "call_c"]
+        assert [m["content"] for m in tool_msgs] == ["file a", "file b", "file c"]
+
+
+class TestContextCompaction:
+    """Old tool outputs are elided once the conversation outgrows its budget."""
+
+    @staticmethod
+    def _conversation(turns, output_chars=8000):
+        messages = [
+            {"role": "system", "content": "system prompt"},
+            {"role": "user", "content": "task"},
+        ]
+        for t in range(turns):
+            messages.append({"role": "assistant", "content": "", "tool_calls": [
+                _make_tool_call("write_file", {"path": f"f{t}", "content": "x" * 2000}, f"w{t}"),
+            ]})
+            messages.append({"role": "tool", "tool_call_id": f"w{t}", "content": "y" * output_chars})
+        return messages
+
+    def _total(self, messages):
+        return sum(llm_runner._message_tokens(m) for m in messages)
+
+    def test_under_budget_untouched(self):
+        messages = self._conversation(3)
+        before = [dict(m) for m in messages]
+        assert llm_runner._compact_context(messages, 100_000) == 0
+        assert messages == before
+
+    def test_old_outputs_elided_recent_turns_pinned(self):
+        messages = self._conversation(6)
+        original = [dict(m) for m in messages]
+        budget = self._total(messages) * 3 // 4
+
+        assert llm_runner._compact_context(messages, budget) > 0
+        assert self._total(messages) <= budget * llm_runner._COMPACT_TARGET
+        assert messages[:2] == original[:2]
+        assert messages[-4:] == original[-4:]
+        assert messages[3]["content"].startswith("[elided tool output, 8000 chars")
+
+    def test_prefix_stable_between_compactions(self):
+        messages = self._conversation(6)
+        budget = self._total(messages) // 2
+        llm_runner._compact_context(messages, budget)
+        snapshot = [dict(m) for m in messages]
+
+        messages.append({"role": "assistant", "content": "a short note"})
+        assert llm_runner._compact_context(messages, budget) == 0
+        assert messages[:-1] == snapshot
+
+    def test_tool_call_arguments_shrunk_but_valid(self):
+        messages = self._conversation(6, output_chars=100)
+        llm_runner._compact_context(messages, self._total(messages) // 2)
+        args = json.loads(messages[2]["tool_calls"][0]["function"]["arguments"])
+        assert args["path"] == "f0"
+        assert args["content"].startswith("[elided 2000 chars")
+
+    def test_disabled_with_zero_budget(self):
+        messages = self._conversation(6)
+        assert llm_runner._compact_context(messages, 0) == 0
+
+    @patch("app.local_llm_runner._call_api")
+    def test_run_agent_compacts_before_each_call(self, mock_api, tmp_path):
+        (tmp_path / "big.txt").write_text("z" * 20000)
+        read = _make_api_response(tool_calls=[_make_tool_call("read_file", {"path": "big.txt"})])
+        responses = iter([read, read, read, _make_api_response(content="done")])
+        sent = []
+
+        def fake_call(**kwargs):
+            sent.append([dict(m) for m in kwargs["messages"]])
+            return next(responses)
+
+        mock_api.side_effect = fake_call
+        result = run_agent(prompt="p", base_url="http://x/v1", model="m",
+                           cwd=str(tmp_path), context_tokens=8000)
+
+        assert result["result"] == "done"
+        assert sent[-1][3]["content"].startswith("[elided tool output")
+        assert sent[-1][-1]["content"] == "z" * 20000
+
+
 # ---------------------------------------------------------------------------
 # CLI entry point tests
 # ---------------------------------------------------------------------------
@@ -791,14 +927,14 @@ class TestToolEdgeCases:
             "grep", {"pattern": "x", "path": self.tmpdir}, self.tmpdir
         )
         # Should work fine, but test the timeout path via mock
-        with patch("app.local_llm_runner.subprocess.run", side_effect=subprocess.TimeoutExpired("grep", 30)):
-            result = _execute_tool("grep", {"pattern": "x"}, self.tmpdir)
+        with patch("app.local_llm_runner.subprocess.run", side_effect=subprocess.TimeoutExpired("sh", 120)):
+            result = _execute_tool("shell", {"command": "sleep 1"}, self.tmpdir)
             assert "timed out" in result.lower()
 
     def test_execute_tool_general_exception(self):
         """General exception in tool produces error message."""
         with patch("app.local_llm_runner.subprocess.run", side_effect=PermissionError("denied")):
-            result = _execute_tool("grep", {"pattern": "x"}, self.tmpdir)
+            result = _execute_tool("shell", {"command": "true"}, self.tmpdir)
             assert "Error" in result
 
 
@@ -806,122 +942,221 @@ class TestToolEdgeCases:
 # API client tests
 # ---------------------------------------------------------------------------
 
+class _FakeLLMHandler(BaseHTTPRequestHandler):
+    """Serves queued replies; records requests and connections."""
+
+    protocol_version = "HTTP/1.1"
+
+    def setup(self):
+        super().setup()
+        self.server.connections += 1
+
+    def log_message(self, *args):
+        pass
+
+    def do_POST(self):
+        body = self.rfile.read(int(self.headers["Content-Length"]))
+        self.server.requests.append((self.path, dict(self.headers), json.loads(body)))
+        status, content_type, payload = self.server.replies.pop(0)
+        self.send_response(status)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+
+@pytest.fixture
+def llm_server():
+    """Local OpenAI-compatible server; yields it with its /v1 base URL."""
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _FakeLLMHandler)
+    server.requests, server.replies, server.connections = [], [], 0
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    server.base_url = f"http://127.0.0.1:{server.server_port}/v1"
+    yield server
+    llm_runner._pool.close()
+    server.shutdown()
+    server.server_close()
+
+
+def _json_reply(data, status=200):
+    return status, "application/json", json.dumps(data).encode()
+
+
+def _sse_reply(*chunks):
+    events = "".join(f"data: {json.dumps(c)}\n\n" for c in chunks) + "data: [DONE]\n\n"
+    return 200, "text/event-stream", events.encode()
+
+
 class TestCallApi:
     """Tests for _call_api() — the HTTP client layer."""
 
-    @patch("urllib.request.urlopen")
-    def test_successful_api_call(self, mock_urlopen):
+    def test_successful_api_call(self, llm_server):
         """Successful API call returns parsed JSON."""
         response_data = {"choices": [{"message": {"content": "hi"}}]}
-        mock_resp = MagicMock()
-        mock_resp.read.return_value = json.dumps(response_data).encode()
-        mock_resp.__enter__ = lambda s: s
-        mock_resp.__exit__ = MagicMock(return_value=False)
-        mock_urlopen.return_value = mock_resp
+        llm_server.replies.append(_json_reply(response_data))
 
         result = _call_api(
-            base_url="http://localhost:11434/v1",
+            base_url=llm_server.base_url,
             model="test",
             messages=[{"role": "user", "content": "hello"}],
         )
         assert result == response_data
 
-    @patch("urllib.request.urlopen")
-    def test_api_includes_tools_when_provided(self, mock_urlopen):
+    def test_api_includes_tools_when_provided(self, llm_server):
         """Tools are included in the request payload."""
-        mock_resp = MagicMock()
-        mock_resp.read.return_value = b'{"choices": []}'
-        mock_resp.__enter__ = lambda s: s
-        mock_resp.__exit__ = MagicMock(return_value=False)
-        mock_urlopen.return_value = mock_resp
+        llm_server.replies.append(_json_reply({"choices": []}))
 
         _call_api(
-            base_url="http://localhost:11434/v1",
+            base_url=llm_server.base_url,
             model="test",
             messages=[],
             tools=[{"type": "function", "function": {"name": "test"}}],
         )
-        # Verify the request body includes tools
-        call_args = mock_urlopen.call_args
-        req = call_args[0][0]
-        body = json.loads(req.data.decode())
+        body = llm_server.requests[0][2]
         assert "tools" in body
         assert body["tool_choice"] == "auto"
+        assert "stream" not in body
 
-    @patch("urllib.request.urlopen")
-    def test_api_key_in_header(self, mock_urlopen):
+    def test_api_key_in_header(self, llm_server):
         """API key is sent in Authorization header."""
-        mock_resp = MagicMock()
-        mock_resp.read.return_value = b'{"choices": []}'
-        mock_resp.__enter__ = lambda s: s
-        mock_resp.__exit__ = MagicMock(return_value=False)
-        mock_urlopen.return_value = mock_resp
-
-        _call_api(
-            base_url="http://localhost:11434/v1",
-            model="test",
-            messages=[],
-            api_key="secret-key",
-        )
-        req = mock_urlopen.call_args[0][0]
-        assert req.get_header("Authorization") == "Bearer secret-key"
+        llm_server.replies.append(_json_reply({"choices": []}))
+        _call_api(base_url=llm_server.base_url, model="test", messages=[], api_key="secret-key")
+        assert llm_server.requests[0][1]["Authorization"] == "Bearer secret-key"
 
-    @patch("urllib.request.urlopen")
-    def test_no_auth_header_without_key(self, mock_urlopen):
+    def test_no_auth_header_without_key(self, llm_server):
         """No Authorization header when api_key is empty."""
-        mock_resp = MagicMock()
-        mock_resp.read.return_value = b'{"choices": []}'
-        mock_resp.__enter__ = lambda s: s
-        mock_resp.__exit__ = MagicMock(return_value=False)
-        mock_urlopen.return_value = mock_resp
-
-        _call_api(
-            base_url="http://localhost:11434/v1",
-            model="test",
-            messages=[],
-        )
-        req = mock_urlopen.call_args[0][0]
-        assert req.get_header("Authorization") is None
-
-    def test_http_error_raises_runtime(self):
-        """HTTPError is wrapped in RuntimeError with body."""
-        import urllib.error
-        with patch("urllib.request.urlopen") as mock:
-            error = urllib.error.HTTPError(
-                "http://localhost/v1/chat/completions",
-                500, "Server Error", {},
-                MagicMock(read=lambda: b"internal error"),
-            )
-            mock.side_effect = error
-            with pytest.raises(RuntimeError, match="API error 500"):
-                _call_api("http://localhost/v1", "model", [])
-            error.close()
-
-    def test_url_error_raises_runtime(self):
-        """URLError is wrapped in RuntimeError with connection hint."""
-        import urllib.error
-        with patch("urllib.request.urlopen") as mock:
-            mock.side_effect = urllib.error.URLError("Connection refused")
-            with pytest.raises(RuntimeError, match="Cannot connect"):
-                _call_api("http://localhost:99999/v1", "model", [])
-
-    @patch("urllib.request.urlopen")
-    def test_base_url_trailing_slash_stripped(self, mock_urlopen):
+        llm_server.replies.append(_json_reply({"choices": []}))
+        _call_api(base_url=llm_server.base_url, model="test", messages=[])
+        assert "Authorization" not in llm_server.requests[0][1]
+
+    def test_http_error_raises_runtime(self, llm_server):
+        """Error statuses are wrapped in RuntimeError with body."""
+        llm_server.replies.append((500, "text/plain", b"internal error"))
+        with pytest.raises(RuntimeError, match="API error 500: internal error"):
+            _call_api(llm_server.base_url, "model", [])
+
+    def test_connection_refused_raises_runtime(self):
+        """Connection failures are wrapped in RuntimeError with connection hint."""
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            port = sock.getsockname()[1]
+        with pytest.raises(RuntimeError, match="Cannot connect"):
+            _call_api(f"http://127.0.0.1:{port}/v1", "model", [])
+
+    def test_base_url_trailing_slash_stripped(self, llm_server):
         """Trailing slash on base_url is handled."""
-        mock_resp = MagicMock()
-        mock_resp.read.return_value = b'{"choices": []}'
-        mock_resp.__enter__ = lambda s: s
-        mock_resp.__exit__ = MagicMock(return_value=False)
-        mock_urlopen.return_value = mock_resp
-
-        _call_api(
-            base_url="http://localhost:11434/v1/",
-            model="test",
-            messages=[],
+        llm_server.replies.append(_json_reply({"choices": []}))
+        _call_api(base_url=llm_server.base_url + "/", model="test", messages=[])
+        assert llm_server.requests[0][0] == "/v1/chat/completions"
+
+    def test_connection_reused_across_calls(self, llm_server):
+        """Consecutive turns share one kept-alive connection."""
+        for _ in range(3):
+            llm_server.replies.append(_json_reply({"choices": []}))
+            _call_api(llm_server.base_url, "model", [])
+        assert llm_server.connections == 1
+
+    def test_dropped_connection_reopened(self, llm_server):
+        """A keep-alive connection closed by the server is replaced once."""
+        llm_server.replies.append(_json_reply({"choices": []}))
+        _call_api(llm_server.base_url, "model", [])
+        conn = next(iter(llm_runner._pool._conns.values()))
+        conn.sock.shutdown(socket.SHUT_RDWR)
+
+        llm_server.replies.append(_json_reply({"choices": [{"message": {"content": "ok"}}]}))
+        result = _call_api(llm_server.base_url, "model", [])
+        assert result["choices"][0]["message"]["content"] == "ok"
+
+
+class TestStreaming:
+    """Tests for streamed (SSE) completions."""
+
+    def test_text_streamed_incrementally(self, llm_server):
+        llm_server.replies.append(_sse_reply(
+            {"choices": [{"delta": {"role": "assistant", "content": "Hel"}}]},
+            {"choices": [{"delta": {"content": "lo"}, "finish_reason": "stop"}]},
+            {"choices": [], "usage": {"prompt_tokens": 7, "completion_tokens": 2}},
+        ))
+        seen = []
+
+        result = _call_api(llm_server.base_url, "m", [], stream=True, on_text=seen.append)
+
+        assert seen == ["Hel", "lo"]
+        assert result["choices"][0]["message"]["content"] == "Hello"
+        assert result["choices"][0]["finish_reason"] == "stop"
+        assert result["usage"] == {"prompt_tokens": 7, "completion_tokens": 2}
+        body = llm_server.requests[0][2]
+        assert body["stream"] is True
+        assert body["stream_options"] == {"include_usage": True}
+
+    def test_tool_call_deltas_assembled(self, llm_server):
+        llm_server.replies.append(_sse_reply(
+            {"choices": [{"delta": {"tool_calls": [
+                {"index": 0, "id": "call_a", "function": {"name": "read_file", "arguments": ""}},
+            ]}}]},
+            {"choices": [{"delta": {"tool_calls": [
+                {"index": 0, "function": {"arguments": '{"path": '}},
+                {"index": 1, "id": "call_b", "function": {"name": "glob", "arguments": '{"pattern"'}},
+            ]}}]},
+            {"choices": [{"delta": {"tool_calls": [
+                {"index": 0, "function": {"arguments": '"a.py"}'}},
+                {"index": 1, "function": {"arguments": ': "*.py"}'}},
+            ]}, "finish_reason": "tool_calls"}]},
+        ))
+
+        result = _call_api(llm_server.base_url, "m", [], stream=True)
+
+        calls = result["choices"][0]["message"]["tool_calls"]
+        assert [(c["id"], c["function"]["name"]) for c in calls] == [
+            ("call_a", "read_file"), ("call_b", "glob"),
+        ]
+        assert json.loads(calls[0]["function"]["arguments"]) == {"path": "a.py"}
+        assert json.loads(calls[1]["function"]["arguments"]) == {"pattern": "*.py"}
+
+    def test_server_ignoring_stream_flag(self, llm_server):
+        """A plain JSON reply to a streamed request is still accepted."""
+        llm_server.replies.append(_json_reply({"choices": [{"message": {"content": "whole"}}]}))
+        seen = []
+        result = _call_api(llm_server.base_url, "m", [], stream=True, on_text=seen.append)
+        assert result["choices"][0]["message"]["content"] == "whole"
+        assert seen == ["whole"]
+
+    def test_run_agent_streams_to_progress_only(self, llm_server, tmp_path, capsys):
+        llm_server.replies.append(_sse_reply(
+            {"choices": [{"delta": {"content": "done"}, "finish_reason": "stop"}]},
+        ))
+        progress = io.StringIO()
+        result = run_agent(
+            prompt="p", base_url=llm_server.base_url, model="m",
+            cwd=str(tmp_path), system_prompt="s", progress=progress,
         )
-        req = mock_urlopen.call_args[0][0]
-        assert "/v1//chat" not in req.full_url
-        assert "/v1/chat/completions" in req.full_url
+        out = capsys.readouterr()
+        assert result["result"] == "done"
+        assert progress.getvalue() == "done\n"
+        assert out.out == "" and out.err == ""
+
+    def test_quota_like_model_text_kept_off_stderr(self, llm_server, tmp_path, capsys, monkeypatch):
+        """Model text about rate limits must not trigger a quota pause."""
+        from app.quota_handler import detect_quota_exhaustion
+
+        text = "Added retries: on HTTP 429 the API says rate limit exceeded, try again later."
+        llm_server.replies.append(_sse_reply(
+            {"choices": [{"delta": {"content": text}, "finish_reason": "stop"}]},
+        ))
+        monkeypatch.setenv("KOAN_ROOT", str(tmp_path))
+        monkeypatch.setattr(sys, "argv", [
+            "local_llm_runner", "-p", "p", "--model", "m",
+            "--base-url", llm_server.base_url, "--cwd", str(tmp_path),
+        ])
+
+        llm_runner.main()
+
+        out = capsys.readouterr()
+        assert out.err == ""
+        assert not detect_quota_exhaustion(out.err)
+        assert out.out.strip() == text
+        assert (tmp_path / "logs" / llm_runner.PROGRESS_LOG).read_text() == text + "\n"
 
 
 # ---------------------------------------------------------------------------
@@ -7,6 +7,7 @@ from app.mission_complexity import (
     DEFAULT_COMPLEXITY_THRESHOLD,
     _strip_project_tag,
     is_complex_mission,
+    is_simple_mission,
 )
 
 
@@ -126,3 +127,37 @@ class TestConfigThreshold:
         )
         title = "Implement a complete migration of the system architecture"
         assert is_complex_mission(title) is False
+
+
+# ---------------------------------------------------------------------------
+# Simple missions (light model tier)
+# ---------------------------------------------------------------------------
+
+class TestIsSimpleMission:
+    @pytest.mark.parametrize("title", [
+        "Fix typo in README",
+        "[project:koan] Add changelog entry for 0.4.2",
+        "Bump pytest to 8.2",
+        "Update docstring of parse_reset_time",
+        "Fix typos",
+        "Update docstrings",
+        "Update outdated comments in scheduler",
+        "Fix lint warnings in app/utils.py",
+        "Rename local variable tmp to buffer in parse_config",
+    ])
+    def test_simple_chores(self, title):
+        assert is_simple_mission(title) is True
+
+    @pytest.mark.parametrize("title", [
+        "",
+        "/plan fix typo",
+        "Refactor the readme generator",
+        "Investigate flaky scheduler tests",
+        "Fix typo in README\nand also rework the install section",
+        "Fix typo " + "x" * 200,
+        "Fix race where a PR comment is dropped by the parser",
+        "Rename get_user to fetch_user and update all callers",
+        "Fix lint gate crash when ruff missing",
+    ])
+    def test_not_simple(self, title):
+        assert is_simple_mission(title) is False
@@ -110,6 +110,60 @@ class TestMaybeRetryMission:
         mock_task.assert_not_called()
         mock_sleep.assert_not_called()
 
+    @patch("app.run.run_claude_task", return_value=0)
+    @patch("app.run._get_git_head", return_value="abc123")
+    @patch("app.run.time.sleep")
+    @patch("app.run.log")
+    def test_light_model_failure_escalates(self, mock_log, mock_sleep, mock_head, mock_task, temp_output_files):
+        import app.run as run_mod
+        stdout_file, stderr_file = temp_output_files
+        Path(stderr_file).write_text("Reached max turns")
+
+        exit_code, _, _ = _maybe_retry_mission(
+            claude_exit=1,
+            stdout_file=stdout_file,
+            stderr_file=stderr_file,
+            cmd=["claude", "--model", "haiku"],
+            project_path="/tmp/proj",
+            pre_head="abc123",
+            instance="/tmp/instance",
+            project_name="myproj",
+            run_num=1,
+            has_mission=True,
+            escalate_cmd=["claude", "--model", "opus"],
+        )
+
+        assert exit_code == 0
+        assert mock_task.call_args.args[0] == ["claude", "--model", "opus"]
+        assert run_mod._last_mission_escalated is True
+        mock_sleep.assert_not_called()
+
+    @patch("app.run.run_claude_task")
+    @patch("app.run.time.sleep")
+    @patch("app.run.log")
+    def test_quota_error_never_escalates(self, mock_log, mock_sleep, mock_task, temp_output_files):
+        import app.run as run_mod
+        stdout_file, stderr_file = temp_output_files
+        Path(stderr_file).write_text("out of extra usage quota")
+
+        exit_code, _, _ = _maybe_retry_mission(
+            claude_exit=1,
+            stdout_file=stdout_file,
+            stderr_file=stderr_file,
+            cmd=["claude", "--model", "haiku"],
+            project_path="/tmp/proj",
+            pre_head="abc123",
+            instance="/tmp/instance",
+            project_name="myproj",
+            run_num=1,
+            has_mission=True,
+            escalate_cmd=["claude", "--model", "opus"],
+        )
+
+        assert exit_code == 1
+        mock_task.assert_not_called()
+        assert run_mod._last_mission_escalated is False
+
     @patch("app.run.run_claude_task")
     @patch("app.run.time.sleep")
     @patch("app.run.log")
@@ -55,6 +55,14 @@ class TestBuildMissionCommand:
         base = build_mission_command(prompt="test")
         assert len(cmd) == len(base)
 
+    @patch("app.cli_provider.get_provider_name", return_value="claude")
+    def test_model_override_and_max_turns(self, mock_provider):
+        from app.mission_runner import build_mission_command
+
+        cmd = build_mission_command(prompt="test", model_override="haiku", max_turns=40)
+        assert cmd[cmd.index("--model") + 1] == "haiku"
+        assert cmd[cmd.index("--max-turns") + 1] == "40"
+
     @patch.dict("os.environ", {"KOAN_CLI_PROVIDER": "copilot"})
     def test_copilot_provider(self):
         # Reset cached provider to pick up env var
@@ -478,6 +486,38 @@ class TestRunPostMission:
         assert result["usage_updated"] is True
         assert result["quota_exhausted"] is False
 
+    @patch("app.mission_runner.check_auto_merge", return_value=None)
+    @patch("app.mission_runner.trigger_reflection", return_value=False)
+    @patch("app.mission_runner._run_lint_gate", return_value=None)
+    @patch("app.mission_runner._run_quality_pipeline", return_value={})
+    @patch("app.mission_runner._run_mission_verification", return_value=None)
+    @patch("app.mission_runner._load_branch_changes")
+    @patch("app.mission_runner.archive_pending", return_value=False)
+    @patch("app.quota_handler.handle_quota_exhaustion", return_value=None)
+    @patch("app.mission_runner.update_usage", return_value=True)
+    def test_branch_changes_computed_once_and_shared(
+        self, mock_usage, mock_quota, mock_archive, mock_changes, mock_verify,
+        mock_quality, mock_lint, mock_reflect, mock_merge, tmp_path,
+    ):
+        from app.mission_runner import run_post_mission
+
+        snapshot = object()
+        mock_changes.return_value = snapshot
+
+        run_post_mission(
+            instance_dir=str(tmp_path),
+            project_name="koan",
+            project_path=str(tmp_path),
+            run_num=1,
+            exit_code=0,
+            stdout_file="/tmp/out.json",
+            stderr_file="/tmp/err.txt",
+        )
+
+        mock_changes.assert_called_once_with(str(tmp_path))
+        for step in (mock_verify, mock_quality, mock_lint, mock_merge):
+            assert step.call_args.kwargs["changes"] is snapshot
+
     @patch("app.mission_runner.check_auto_merge", return_value=None)
     @patch("app.mission_runner.trigger_reflection", return_value=False)
     @patch("app.mission_runner.archive_pending", return_value=False)
@@ -1070,6 +1110,7 @@ class TestRecordSessionOutcome:
             duration_minutes=15,
             journal_content="journal content",
             mission_title="",
+            model_tier="",
         )
 
     @patch("app.session_tracker.record_outcome")
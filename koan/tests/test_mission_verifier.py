@@ -100,22 +100,22 @@ class TestVerifyResult:
 
 
 class TestCheckDiffCoherence:
+    @patch("app.mission_verifier._get_base_ref", return_value="origin/main")
     @patch("app.mission_verifier.run_git")
-    def test_pass_with_changes(self, mock_git):
+    def test_pass_with_changes(self, mock_git, _base):
         mock_git.side_effect = [
             (0, "koan/my-branch", ""),   # rev-parse
-            (0, "", ""),                  # rev-parse --verify origin/main
             (0, "file1.py | 10 +\nfile2.py | 5 -\n2 files changed", ""),  # diff --stat
         ]
         result = check_diff_coherence("/project", "koan/")
         assert result.status == CheckStatus.PASS
         assert "2 file(s)" in result.message
 
+    @patch("app.mission_verifier._get_base_ref", return_value="origin/main")
     @patch("app.mission_verifier.run_git")
-    def test_fail_no_changes(self, mock_git):
+    def test_fail_no_changes(self, mock_git, _base):
         mock_git.side_effect = [
             (0, "koan/my-branch", ""),
-            (0, "", ""),
             (0, "", ""),  # Empty diff
         ]
         result = check_diff_coherence("/project", "koan/")
@@ -133,15 +133,10 @@ class TestCheckDiffCoherence:
         result = check_diff_coherence("/project", "koan/")
         assert result.status == CheckStatus.SKIP
 
+    @patch("app.mission_verifier._get_base_ref", return_value=None)
     @patch("app.mission_verifier.run_git")
-    def test_skip_no_base_ref(self, mock_git):
-        mock_git.side_effect = [
-            (0, "koan/my-branch", ""),
-            (1, "", ""),  # upstream/main not found
-            (1, "", ""),  # origin/main not found
-            (1, "", ""),  # upstream/master not found
-            (1, "", ""),  # origin/master not found
-        ]
+    def test_skip_no_base_ref(self, mock_git, _base):
+        mock_git.return_value = (0, "koan/my-branch", "")
         result = check_diff_coherence("/project", "koan/")
         assert result.status == CheckStatus.SKIP
 
@@ -152,20 +147,20 @@ class TestCheckDiffCoherence:
 
 
 class TestCheckTestCoverage:
+    @patch("app.mission_verifier._get_base_ref", return_value="origin/main")
     @patch("app.mission_verifier.run_git")
-    def test_pass_tests_modified(self, mock_git):
+    def test_pass_tests_modified(self, mock_git, _base):
         mock_git.side_effect = [
-            (0, "", ""),  # origin/main exists
             (0, "src/auth.py\ntests/test_auth.py", ""),
         ]
         result = check_test_coverage("/project", "implement user auth")
         assert result.status == CheckStatus.PASS
         assert "1 test file(s)" in result.message
 
+    @patch("app.mission_verifier._get_base_ref", return_value="origin/main")
     @patch("app.mission_verifier.run_git")
-    def test_warn_no_tests(self, mock_git):
+    def test_warn_no_tests(self, mock_git, _base):
         mock_git.side_effect = [
-            (0, "", ""),
             (0, "src/auth.py\nsrc/models.py", ""),
         ]
         result = check_test_coverage("/project", "implement user auth")
@@ -176,10 +171,10 @@ class TestCheckTestCoverage:
         result = check_test_coverage("/project", "audit security configuration")
         assert result.status == CheckStatus.SKIP
 
+    @patch("app.mission_verifier._get_base_ref", return_value="origin/main")
     @patch("app.mission_verifier.run_git")
-    def test_detects_various_test_patterns(self, mock_git):
+    def test_detects_various_test_patterns(self, mock_git, _base):
         mock_git.side_effect = [
-            (0, "", ""),
             (0, "src/app.ts\nsrc/app.test.ts\nsrc/app.spec.tsx\ntests/unit/test_core.py", ""),
         ]
         result = check_test_coverage("/project", "add new component")
@@ -238,39 +233,38 @@ class TestCheckPrCreated:
 
 
 class TestCheckCommitQuality:
+    @patch("app.mission_verifier._get_base_ref", return_value="origin/main")
     @patch("app.mission_verifier.run_git")
-    def test_pass_clean_commits(self, mock_git):
+    def test_pass_clean_commits(self, mock_git, _base):
         mock_git.side_effect = [
-            (0, "", ""),  # origin/main exists
             (0, "feat: add user authentication\ntest: add auth tests", ""),
         ]
         result = check_commit_quality("/project")
         assert result.status == CheckStatus.PASS
         assert "2 commit(s)" in result.message
 
+    @patch("app.mission_verifier._get_base_ref", return_value="origin/main")
     @patch("app.mission_verifier.run_git")
-    def test_warn_fixup_commits(self, mock_git):
+    def test_warn_fixup_commits(self, mock_git, _base):
         mock_git.side_effect = [
-            (0, "", ""),
             (0, "feat: add auth\nfixup! feat: add auth", ""),
         ]
         result = check_commit_quality("/project")
         assert result.status == CheckStatus.WARN
         assert "Unsquashed" in result.message
 
+    @patch("app.mission_verifier._get_base_ref", return_value="origin/main")
     @patch("app.mission_verifier.run_git")
-    def test_warn_short_message(self, mock_git):
+    def test_warn_short_message(self, mock_git, _base):
         mock_git.side_effect = [
-            (0, "", ""),
             (0, "fix", ""),
         ]
         result = check_commit_quality("/project")
         assert result.status == CheckStatus.WARN
         assert "Very short" in result.message
 
-    @patch("app.mission_verifier.run_git")
-    def test_skip_no_base_ref(self, mock_git):
-        mock_git.return_value = (1, "", "not found")
+    @patch("app.mission_verifier._get_base_ref", return_value=None)
+    def test_skip_no_base_ref(self, _base):
         result = check_commit_quality("/project")
         assert result.status == CheckStatus.SKIP
 
@@ -281,10 +275,10 @@ class TestCheckCommitQuality:
 
 
 class TestCheckMissionAlignment:
+    @patch("app.mission_verifier._get_base_ref", return_value="origin/main")
     @patch("app.mission_verifier.run_git")
-    def test_pass_keywords_match(self, mock_git):
+    def test_pass_keywords_match(self, mock_git, _base):
         mock_git.side_effect = [
-            (0, "", ""),                     # origin/main exists
             (0, "src/auth.py\ntests/test_auth.py", ""),  # changed files
             (0, "feat: add user authentication", ""),     # commit messages
         ]
@@ -292,10 +286,10 @@ class TestCheckMissionAlignment:
         assert result.status == CheckStatus.PASS
         assert "authentication" in result.message
 
+    @patch("app.mission_verifier._get_base_ref", return_value="origin/main")
     @patch("app.mission_verifier.run_git")
-    def test_warn_no_keywords_match(self, mock_git):
+    def test_warn_no_keywords_match(self, mock_git, _base):
         mock_git.side_effect = [
-            (0, "", ""),
             (0, "src/billing.py", ""),
             (0, "refactor: clean up billing", ""),
         ]
@@ -314,10 +308,10 @@ class TestCheckMissionAlignment:
         result = check_mission_alignment("/project", "add the new fix")
         assert result.status == CheckStatus.SKIP
 
+    @patch("app.mission_verifier._get_base_ref", return_value="origin/main")
     @patch("app.mission_verifier.run_git")
-    def test_warn_low_overlap(self, mock_git):
+    def test_warn_low_overlap(self, mock_git, _base):
         mock_git.side_effect = [
-            (0, "", ""),
             (0, "src/auth.py", ""),
             (0, "fix: patch auth", ""),
         ]
@@ -419,6 +413,40 @@ class TestVerifyMission:
 # ---------------------------------------------------------------------------
 
 
+class TestVerifyWithChangeSet:
+    @patch("app.github.run_gh", return_value='{"number": 7, "state": "OPEN", "isDraft": true}')
+    @patch("app.mission_verifier._get_base_ref", side_effect=AssertionError("no git"))
+    @patch("app.mission_verifier.run_git", side_effect=AssertionError("no git"))
+    def test_checks_read_the_changeset(self, _git, _base, _gh):
+        from app.branch_changes import BranchChangeSet, FileChange
+
+        changes = BranchChangeSet(
+            project_path="/project", branch="koan/user-auth", base_ref="origin/main",
+            files=[FileChange("src/auth.py", "M"), FileChange("tests/test_auth.py", "A")],
+            commits=[("abc", "feat: add user authentication")],
+        )
+
+        result = verify_mission(
+            "/project", "implement user authentication",
+            branch_prefix="koan/", changes=changes,
+        )
+
+        by_name = {c.name: c for c in result.checks}
+        assert result.passed is True
+        assert by_name["diff_coherence"].message == "2 file(s) changed"
+        assert by_name["test_coverage"].status == CheckStatus.PASS
+        assert by_name["commit_quality"].status == CheckStatus.PASS
+        assert by_name["mission_alignment"].status == CheckStatus.PASS
+        assert by_name["pr_created"].status == CheckStatus.PASS
+
+    def test_empty_changeset_fails_coherence(self):
+        from app.branch_changes import BranchChangeSet
+
+        changes = BranchChangeSet(project_path="/p", branch="koan/x", base_ref="origin/main")
+        result = check_diff_coherence("/p", "koan/", changes)
+        assert result.status == CheckStatus.FAIL
+
+
 class TestFormatVerifyResult:
     def test_passing_result(self):
         result = VerifyResult(
@@ -0,0 +1,81 @@
+"""Tests for model_router — complexity-based model tier selection."""
+
+import json
+from unittest.mock import patch
+
+import pytest
+
+from app.model_router import (
+    TIER_ESCALATED,
+    TIER_LIGHT,
+    TIER_STANDARD,
+    route_mission,
+    should_escalate,
+)
+
+
+def _routing(**overrides):
+    cfg = {"enabled": True, "light_model": "haiku", "light_max_turns": 30}
+    cfg.update(overrides)
+    return {"model_routing": cfg}
+
+
+@pytest.fixture
+def routing_on():
+    with patch("app.config._load_config", return_value=_routing()):
+        yield
+
+
+def _write_outcomes(instance_dir, tiers_and_outcomes, work_type="docs"):
+    entries = [
+        {"project": "koan", "work_type": work_type, "model_tier": tier, "outcome": outcome}
+        for tier, outcome in tiers_and_outcomes
+    ]
+    (instance_dir / "session_outcomes.json").write_text(json.dumps(entries))
+
+
+class TestRouteMission:
+    def test_disabled_returns_none(self, instance_dir):
+        with patch("app.config._load_config", return_value={}):
+            assert route_mission(str(instance_dir), "koan", "Fix typo in README") is None
+
+    def test_simple_mission_goes_light(self, instance_dir, routing_on):
+        route = route_mission(str(instance_dir), "koan", "Fix typo in README")
+        assert (route.tier, route.model, route.max_turns) == (TIER_LIGHT, "haiku", 30)
+
+    @pytest.mark.parametrize("title,mode", [
+        ("Implement the new scheduler pipeline", "implement"),
+        ("", "deep"),
+        ("Fix typo in README", "review"),
+    ])
+    def test_standard_tier(self, instance_dir, routing_on, title, mode):
+        route = route_mission(str(instance_dir), "koan", title, mode)
+        assert route.tier == TIER_STANDARD
+        assert route.model == ""
+        assert route.max_turns == 0
+
+    def test_failing_history_vetoes_light(self, instance_dir, routing_on):
+        _write_outcomes(instance_dir, [
+            (TIER_ESCALATED, "empty"), (TIER_LIGHT, "empty"), (TIER_LIGHT, "productive"),
+        ])
+        route = route_mission(str(instance_dir), "koan", "Update README install steps")
+        assert route.tier == TIER_STANDARD
+        assert "33%" in route.reason
+
+    def test_history_of_other_work_types_ignored(self, instance_dir, routing_on):
+        _write_outcomes(instance_dir, [(TIER_LIGHT, "empty")] * 5, work_type="debug")
+        route = route_mission(str(instance_dir), "koan", "Update README install steps")
+        assert route.tier == TIER_LIGHT
+
+
+class TestShouldEscalate:
+    def test_only_light_routes_escalate(self, instance_dir, routing_on):
+        light = route_mission(str(instance_dir), "koan", "Fix typo in README")
+        standard = route_mission(str(instance_dir), "koan", "Implement a feature")
+        assert should_escalate(light) is True
+        assert should_escalate(standard) is False
+
+    def test_escalation_can_be_disabled(self, instance_dir):
+        with patch("app.config._load_config", return_value=_routing(escalate_on_failure=False)):
+            route = route_mission(str(instance_dir), "koan", "Fix typo in README")
+            assert should_escalate(route) is False
@@ -0,0 +1,144 @@
+"""Tests for model_warmup — preloading local models ahead of use."""
+
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest.mock import patch
+
+import pytest
+
+from app import model_warmup
+from app.model_warmup import preload, warm_before_iteration, warm_for_chat, warm_for_mission
+
+
+class _OllamaHandler(BaseHTTPRequestHandler):
+    def do_POST(self):
+        body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+        self.server.requests.append((self.path, body))
+        status = self.server.status
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.end_headers()
+        self.wfile.write(b'{"done": true}' if status == 200 else b'{"error": "nope"}')
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def ollama():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), _OllamaHandler)
+    server.requests = []
+    server.status = 200
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture(autouse=True)
+def warmup_state():
+    """Fresh throttling state; config.yaml without models overrides."""
+    for state in (model_warmup._warm_until, model_warmup._retry_after,
+                  model_warmup._unsupported, model_warmup._in_flight):
+        state.clear()
+    with patch("app.config._load_config", return_value={}):
+        yield
+
+
+@pytest.fixture
+def local_provider(monkeypatch, ollama):
+    monkeypatch.setenv("KOAN_CLI_PROVIDER", "local")
+    monkeypatch.setenv("KOAN_LOCAL_LLM_BASE_URL", f"http://127.0.0.1:{ollama.server_port}/v1")
+    monkeypatch.setenv("KOAN_LOCAL_LLM_MODEL", "qwen2.5-coder:14b")
+
+
+class TestPreload:
+    def test_loads_model_with_keep_alive(self, local_provider, ollama):
+        assert preload("mission", 360, background=False)
+        assert ollama.requests == [
+            ("/api/generate", {"model": "qwen2.5-coder:14b", "keep_alive": 360}),
+        ]
+
+    def test_warm_model_not_reloaded(self, local_provider, ollama):
+        preload("mission", 360, background=False)
+        assert not preload("mission", 330, background=False)
+        assert preload("mission", 3600, background=False)
+        assert preload("mission", 360, background=False, force=True)
+        assert len(ollama.requests) == 3
+
+    def test_chat_uses_models_chat(self, local_provider, ollama):
+        with patch("app.config._load_config", return_value={"models": {"chat": "llama3:8b"}}):
+            preload("chat", 900, background=False)
+        assert ollama.requests[0][1]["model"] == "llama3:8b"
+
+    def test_model_override(self, local_provider, ollama):
+        """A routed model (e.g. the light tier) replaces models.mission."""
+        preload("mission", 360, background=False, model="qwen2.5-coder:3b")
+        assert ollama.requests[0][1]["model"] == "qwen2.5-coder:3b"
+
+    def test_other_providers_untouched(self, monkeypatch, ollama):
+        monkeypatch.setenv("KOAN_CLI_PROVIDER", "claude")
+        assert not preload("mission", 360, background=False)
+        assert ollama.requests == []
+
+    def test_disabled(self, local_provider, ollama):
+        with patch("app.config._load_config", return_value={"model_warmup": {"enabled": False}}):
+            assert not preload("mission", 360, background=False)
+        assert ollama.requests == []
+
+    def test_zero_keep_alive_never_sent(self, local_provider, ollama):
+        """keep_alive 0 would unload the model."""
+        assert not preload("chat", 0, background=False)
+        assert ollama.requests == []
+
+    def test_rejected_request_not_retried(self, local_provider, ollama):
+        ollama.status = 404
+        assert preload("mission", 360, background=False)
+        assert not preload("mission", 360, background=False)
+        assert len(ollama.requests) == 1
+
+    def test_unreachable_server_backs_off(self, monkeypatch):
+        monkeypatch.setenv("KOAN_CLI_PROVIDER", "ollama-launch")
+        monkeypatch.setenv("KOAN_OLLAMA_LAUNCH_MODEL", "qwen3")
+        monkeypatch.setenv("OLLAMA_HOST", "127.0.0.1:9")  # discard port, refused
+        assert preload("mission", 360, background=False)
+        assert ("http://127.0.0.1:9", "qwen3") in model_warmup._retry_after
+        assert not preload("mission", 360, background=False)
+
+
+class TestSchedule:
+    def test_iteration_warmup_waits_for_lead_time(self):
+        with patch("app.model_warmup.preload", return_value=True) as spy:
+            assert not warm_before_iteration(600)
+            warm_before_iteration(45)
+        spy.assert_called_once_with("mission", 45 + model_warmup.MISSION_MARGIN)
+
+    def test_mission_warmup_uses_routed_model(self):
+        with patch("app.model_warmup.preload", return_value=True) as spy:
+            warm_for_mission("qwen2.5-coder:3b")
+        spy.assert_called_once_with(
+            "mission", model_warmup.MISSION_MARGIN, model="qwen2.5-coder:3b",
+        )
+
+    def test_chat_keep_alive_from_config(self):
+        cfg = {"model_warmup": {"chat_keep_alive": 1200}}
+        with patch("app.config._load_config", return_value=cfg), \
+                patch("app.model_warmup.preload", return_value=True) as spy:
+            warm_for_chat(after_reply=True)
+        spy.assert_called_once_with("chat", 1200, force=True)
+
+    def test_sleep_ticks_warm_only_when_a_run_follows(self, tmp_path):
+        from app.loop_manager import interruptible_sleep
+
+        with patch("app.model_warmup.warm_before_iteration") as spy, \
+                patch("app.loop_manager.process_github_notifications", return_value=0), \
+                patch("app.loop_manager.process_jira_notifications", return_value=0), \
+                patch("app.loop_manager.time.sleep"):
+            interruptible_sleep(20, str(tmp_path), str(tmp_path), check_interval=10)
+            seconds_left = [c.args[0] for c in spy.call_args_list]
+            assert seconds_left == [20, pytest.approx(10, abs=1)]
+            spy.reset_mock()
+            interruptible_sleep(20, str(tmp_path), str(tmp_path), wake_on_mission=False)
+            spy.assert_not_called()
@@ -224,7 +224,7 @@ class TestDirectSend:
         monkeypatch.setenv("KOAN_TELEGRAM_CHAT_ID", "123")
         mock_resp = MagicMock()
         mock_resp.json.return_value = {"ok": True}
-        with patch("requests.post", return_value=mock_resp) as mock_post:
+        with patch("requests.Session.post", return_value=mock_resp) as mock_post:
             assert _direct_send("hello") is True
         mock_post.assert_called_once()
         assert "bottok" in mock_post.call_args[0][0]
@@ -236,7 +236,7 @@ class TestDirectSend:
         mock_resp = MagicMock()
         mock_resp.json.return_value = {"ok": False}
         mock_resp.text = "Bad Request"
-        with patch("requests.post", return_value=mock_resp):
+        with patch("requests.Session.post", return_value=mock_resp):
             assert _direct_send("hello") is False
 
     @patch("app.retry.time.sleep")
@@ -245,7 +245,7 @@ class TestDirectSend:
         import requests as req_lib
         monkeypatch.setenv("KOAN_TELEGRAM_TOKEN", "tok")
         monkeypatch.setenv("KOAN_TELEGRAM_CHAT_ID", "123")
-        with patch("requests.post", side_effect=req_lib.RequestException("timeout")):
+        with patch("requests.Session.post", side_effect=req_lib.RequestException("timeout")):
             assert _direct_send("hello") is False
         # Retried 3 times before giving up
         assert mock_sleep.call_count == 2
@@ -259,7 +259,7 @@ class TestDirectSend:
         monkeypatch.setenv("KOAN_TELEGRAM_CHAT_ID", "123")
         mock_resp = MagicMock()
         mock_resp.json.return_value = {"ok": True}
-        with patch("requests.post", side_effect=[
+        with patch("requests.Session.post", side_effect=[
             req_lib.ConnectionError("reset"),
             mock_resp,
         ]):
@@ -275,7 +275,7 @@ class TestDirectSend:
         long_msg = "x" * (DEFAULT_MAX_MESSAGE_SIZE + 100)
         mock_resp = MagicMock()
         mock_resp.json.return_value = {"ok": True}
-        with patch("requests.post", return_value=mock_resp) as mock_post:
+        with patch("requests.Session.post", return_value=mock_resp) as mock_post:
             assert _direct_send(long_msg) is True
         assert mock_post.call_count == 2  # split into 2 chunks
 
@@ -291,7 +291,7 @@ class TestDirectSend:
             MagicMock(json=MagicMock(return_value={"ok": False}), text="err"),
             MagicMock(json=MagicMock(return_value={"ok": True})),  # notice
         ]
-        with patch("requests.post", side_effect=responses) as mock_post:
+        with patch("requests.Session.post", side_effect=responses) as mock_post:
             assert _direct_send(long_msg) is False
         assert mock_post.call_count == 3  # 2 chunks + 1 notice
         notice_text = mock_post.call_args_list[2][1]["json"]["text"]
@@ -305,7 +305,7 @@ class TestDirectSend:
         monkeypatch.setenv("KOAN_TELEGRAM_CHAT_ID", "123")
         mock_resp = MagicMock()
         mock_resp.json.return_value = {"ok": True}
-        with patch("requests.post", return_value=mock_resp) as mock_post:
+        with patch("requests.Session.post", return_value=mock_resp) as mock_post:
             assert _direct_send("") is True
         mock_post.assert_called_once()
 
@@ -723,3 +723,71 @@ class TestPriorityEmojiRendering:
 
 # Flood protection tests moved to test_telegram_provider.py
 # (flood logic lives in TelegramProvider, not notify.py facade)
+
+
+class TestSendQueue:
+    """Background sender used by the run loop."""
+
+    @pytest.fixture
+    def send_queue(self):
+        from app import notify
+        notify.start_send_queue()
+        yield notify
+        notify.stop_send_queue(timeout=5)
+
+    def test_inline_when_not_started(self):
+        from app.notify import send_async
+
+        fn = MagicMock(return_value="sent")
+        assert send_async(fn, "hello", priority=1) == "sent"
+        fn.assert_called_once_with("hello", priority=1)
+
+    def test_inline_errors_propagate(self):
+        from app.notify import send_async
+
+        with pytest.raises(RuntimeError):
+            send_async(MagicMock(side_effect=RuntimeError("boom")), "x")
+
+    def test_queued_calls_run_in_order_off_thread(self, send_queue):
+        import threading
+
+        calls = []
+        caller = threading.current_thread()
+
+        def slow_send(text):
+            time.sleep(0.05)
+            calls.append((text, threading.current_thread() is caller))
+
+        start = time.monotonic()
+        assert send_queue.send_async(slow_send, "a") is True
+        assert send_queue.send_async(slow_send, "b") is True
+        # Callers return immediately
+        assert time.monotonic() - start < 0.05
+
+        assert send_queue.flush_send_queue(timeout=5) is True
+        assert calls == [("a", False), ("b", False)]
+
+    def test_failure_does_not_stop_sender(self, send_queue):
+        done = MagicMock()
+        send_queue.send_async(MagicMock(side_effect=RuntimeError("boom")), "x")
+        send_queue.send_async(done, "y")
+        assert send_queue.flush_send_queue(timeout=5) is True
+        done.assert_called_once_with("y")
+
+    def test_flush_timeout(self, send_queue):
+        import threading
+
+        release = threading.Event()
+        send_queue.send_async(release.wait, 5)
+        assert send_queue.flush_send_queue(timeout=0.05) is False
+        release.set()
+        assert send_queue.flush_send_queue(timeout=5) is True
+
+    def test_stop_drains_and_reverts_to_inline(self, send_queue):
+        fn = MagicMock()
+        send_queue.send_async(fn, "queued")
+        assert send_queue.stop_send_queue(timeout=5) is True
+        fn.assert_called_once_with("queued")
+
+        assert send_queue.send_async(fn, "inline") is fn.return_value
+        assert fn.call_count == 2
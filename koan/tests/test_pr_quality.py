@@ -119,12 +119,16 @@ class TestShouldSkipFile:
 class TestScanChanges:
     """Test scan_changes."""
 
+    @pytest.fixture(autouse=True)
+    def _base_ref(self):
+        with patch("app.pr_quality._get_base_ref", return_value="upstream/main"):
+            yield
+
     @patch("app.pr_quality.run_git_strict")
     def test_detects_debug_prints(self, mock_git):
         from app.pr_quality import scan_changes
 
         mock_git.side_effect = [
-            None,  # rev-parse --verify upstream/main
             "koan/test-branch",  # rev-parse --abbrev-ref HEAD
             (  # git diff
                 "+++ b/src/main.py\n"
@@ -145,7 +149,6 @@ class TestScanChanges:
         from app.pr_quality import scan_changes
 
         mock_git.side_effect = [
-            None,  # base ref check
             "koan/feature",  # branch
             (
                 "+++ b/src/app.js\n"
@@ -163,7 +166,6 @@ class TestScanChanges:
         from app.pr_quality import scan_changes
 
         mock_git.side_effect = [
-            None,
             "koan/feature",
             (
                 "+++ b/src/main.py\n"
@@ -180,7 +182,6 @@ class TestScanChanges:
         from app.pr_quality import scan_changes
 
         mock_git.side_effect = [
-            None,
             "koan/feature",
             (
                 "+++ b/src/config.py\n"
@@ -197,7 +198,6 @@ class TestScanChanges:
         from app.pr_quality import scan_changes
 
         mock_git.side_effect = [
-            None,
             "koan/feature",
             (
                 "+++ b/tests/test_main.py\n"
@@ -214,7 +214,6 @@ class TestScanChanges:
         from app.pr_quality import scan_changes
 
         mock_git.side_effect = [
-            None,  # base ref check
             "main",  # branch
         ]
 
@@ -236,7 +235,6 @@ class TestScanChanges:
         from app.pr_quality import scan_changes
 
         mock_git.side_effect = [
-            None,
             "koan/feature",
             "",
         ]
@@ -245,6 +243,82 @@ class TestScanChanges:
         assert result["clean"] is True
 
 
+def _changeset(branch="koan/feature", files=(), subjects=("feat: add x",)):
+    from app.branch_changes import BranchChangeSet
+    return BranchChangeSet(
+        project_path="/project", branch=branch, base_ref="upstream/main",
+        files=list(files), commits=[(f"sha{i}", s) for i, s in enumerate(subjects)],
+    )
+
+
+class TestChangeSetInput:
+    """scan_changes / validate_branch reading a precomputed BranchChangeSet."""
+
+    @patch("app.pr_quality.run_git_strict", side_effect=AssertionError("no git"))
+    def test_scan_uses_added_lines_and_numstat(self, _git):
+        from app.branch_changes import FileChange
+        from app.pr_quality import scan_changes
+
+        changes = _changeset(files=[
+            FileChange("src/main.py", "M", added=2, added_lines=[
+                (3, "print('debug')"), (4, "token = 'abcdefghijk'"),
+            ]),
+            FileChange("tests/test_main.py", "A", added=1, added_lines=[(1, "print('ok')")]),
+            FileChange("src/big.py", "A", added=900, added_lines=[(1, "x = 1")]),
+        ])
+
+        result = scan_changes("/project", changes=changes)
+
+        found = {(i["type"], i["file"], i["line"]) for i in result["issues"]}
+        assert found == {
+            ("debug", "src/main.py", 3),
+            ("secret", "src/main.py", 4),
+            ("large_change", "src/big.py", 0),
+        }
+        assert result["clean"] is False
+
+    @patch("app.pr_quality.run_git_strict", side_effect=AssertionError("no git"))
+    def test_scan_on_main_is_clean(self, _git):
+        from app.branch_changes import FileChange
+        from app.pr_quality import scan_changes
+
+        changes = _changeset(branch="main", files=[
+            FileChange("a.py", "M", added_lines=[(1, "print(1)")]),
+        ])
+        assert scan_changes("/project", changes=changes) == {"issues": [], "clean": True}
+
+    @patch("app.pr_quality._project_uses_conventional_commits", return_value=False)
+    @patch("app.pr_quality.run_git_strict", return_value="")
+    def test_validate_branch_reads_subjects(self, mock_git, _conv):
+        from app.pr_quality import validate_branch
+
+        changes = _changeset(subjects=["fixup! feat: x", "feat: x"])
+        result = validate_branch("/project", "koan/", changes=changes)
+
+        assert [i["type"] for i in result["issues"]] == ["fixup"]
+        # Only the remote-branch check still needs git
+        mock_git.assert_called_once_with(
+            "rev-parse", "--verify", "origin/koan/feature", cwd="/project",
+        )
+
+    def test_validate_branch_empty_changeset(self):
+        from app.pr_quality import validate_branch
+
+        result = validate_branch("/project", "koan/", changes=_changeset(subjects=()))
+        assert result["valid"] is False
+        assert result["issues"][0]["type"] == "empty"
+
+    def test_report_section_uses_changeset_diffstat(self):
+        from app.branch_changes import FileChange
+        from app.pr_quality import _build_quality_report_section
+
+        changes = _changeset(files=[FileChange("a.py", "M", added=3, removed=1)])
+        with patch("app.claude_step._get_diffstat") as mock_stat:
+            section = _build_quality_report_section({}, "/project", changes)
+        mock_stat.assert_not_called()
+        assert "**Changes**: 1 file changed, 3 insertions(+), 1 deletion(-)" in section
+
+
 class TestCheckLargeChanges:
     """Test _check_large_changes."""
 
@@ -277,13 +351,17 @@ class TestCheckLargeChanges:
 class TestValidateBranch:
     """Test validate_branch."""
 
+    @pytest.fixture(autouse=True)
+    def _base_ref(self):
+        with patch("app.pr_quality._get_base_ref", return_value="upstream/main"):
+            yield
+
     @patch("app.pr_quality.run_git_strict")
     def test_valid_branch(self, mock_git):
         from app.pr_quality import validate_branch
 
         mock_git.side_effect = [
             "koan/feature-x",  # current branch
-            None,  # base ref check (upstream/main exists)
             "abc1234 feat: add feature x",  # log
             None,  # origin/koan/feature-x exists
             "def5678 feat: previous commit\nghi9012 fix: another fix",  # base commits
@@ -299,7 +377,6 @@ class TestValidateBranch:
 
         mock_git.side_effect = [
             "feature/wrong-prefix",  # branch
-            None,  # base ref
             "abc1234 some commit",  # log
             None,  # remote check
             "def5678 feat: a\nghi9012 fix: b",  # base commits
@@ -314,7 +391,6 @@ class TestValidateBranch:
 
         mock_git.side_effect = [
             "koan/empty",
-            None,  # base ref
             "",  # empty log
         ]
 
@@ -328,7 +404,6 @@ class TestValidateBranch:
 
         mock_git.side_effect = [
             "koan/feature",
-            None,
             "abc1234 fixup! feat: original commit\ndef5678 feat: original commit",
             None,  # remote check
             "111 fix: a\n222 feat: b\n333 chore: c",  # base commits (conventional)
@@ -343,7 +418,6 @@ class TestValidateBranch:
 
         mock_git.side_effect = [
             "koan/unpushed",
-            None,
             "abc1234 feat: something",
             RuntimeError("no such ref"),  # remote check fails
             "111 fix: a\n222 feat: b\n333 chore: c",
@@ -678,7 +678,7 @@ class TestRunPrReview:
 
     @patch("app.pr_review.detect_skills", return_value=("team.refactor", "team.review"))
     @patch("app.pr_review.detect_test_command", return_value="make test")
-    @patch("app.pr_review.run_project_tests")
+    @patch("app.pr_review.run_impacted_tests")
     @patch("app.pr_review.run_gh")
     @patch("app.pr_review._run_git")
     @patch("app.claude_step.run_claude")
@@ -746,7 +746,7 @@ class TestRunPrReview:
 
     @patch("app.pr_review.detect_skills", return_value=(None, None))
     @patch("app.pr_review.detect_test_command", return_value="make test")
-    @patch("app.pr_review.run_project_tests")
+    @patch("app.pr_review.run_impacted_tests")
     @patch("app.pr_review.run_gh")
     @patch("app.pr_review._run_git")
     @patch("app.claude_step.run_claude")
@@ -573,6 +573,49 @@ class TestBuildAgentPrompt:
 # --- Tests for build_contemplative_prompt ---
 
 
+class TestAutonomousContextPacking:
+    """Optional autonomous sections are packed into the mission budget."""
+
+    def _build(self, prompt_env, **budget_cfg):
+        with patch("app.prompt_builder._get_staleness_section",
+                   return_value="\n\n# Session History Feedback\n\nstale\n"), \
+             patch("app.prompt_builder._get_drift_section",
+                   return_value="\n\n# Codebase Drift\n\n" + "commit line\n" * 400), \
+             patch("app.prompt_builder._get_pr_feedback_section", return_value=""), \
+             patch("app.prompt_builder._get_deep_research",
+                   return_value="\n\n# Deep Research Analysis\n\n" + "idea\n" * 2000), \
+             patch("app.prompt_builder._get_submit_pr_section", return_value=""), \
+             patch("app.prompt_builder._get_merge_policy", return_value=""), \
+             patch("app.prompt_builder._get_branch_prefix", return_value="koan/"), \
+             patch("app.prompts.load_prompt", return_value="Template"), \
+             patch("app.config._load_config", return_value={"context_budget": budget_cfg}):
+            return build_agent_prompt(
+                instance=prompt_env["instance"],
+                project_name="testproj",
+                project_path=prompt_env["project_path"],
+                run_num=1, max_runs=20, autonomous_mode="deep",
+                focus_area="Deep work", available_pct=60, mission_title="",
+            )
+
+    def test_sections_kept_when_budget_allows(self, prompt_env):
+        result = self._build(prompt_env)
+        assert "# Session History Feedback" in result
+        assert "# Codebase Drift" in result
+        assert result.count("idea") == 2000
+
+    def test_deep_research_cut_before_drift(self, prompt_env):
+        result = self._build(prompt_env, mission=1500)
+        assert "# Session History Feedback" in result
+        assert result.count("commit line") == 400
+        assert result.count("idea") < 2000
+        assert len(result) <= 1500 * 4 + 100
+
+    def test_sections_keep_order(self, prompt_env):
+        result = self._build(prompt_env)
+        assert result.index("# Session History Feedback") < result.index("# Codebase Drift")
+        assert result.index("# Codebase Drift") < result.index("# Deep Research Analysis")
+
+
 class TestBuildContemplativePrompt:
     """Tests for contemplative prompt building."""
 
@@ -481,6 +481,23 @@ class TestLocalLLMProvider:
                     cmd = p.build_command(prompt="hello")
         assert "--api-key" not in cmd
 
+    def test_build_command_streaming_toggle(self):
+        p = LocalLLMProvider()
+        with patch.object(p, "_get_default_model", return_value="my-model"):
+            with patch.object(p, "_get_config", return_value={}):
+                assert "--no-stream" not in p.build_command(prompt="hello")
+            with patch.object(p, "_get_config", return_value={"stream": False}):
+                assert "--no-stream" in p.build_command(prompt="hello")
+
+    def test_build_command_context_tokens(self):
+        p = LocalLLMProvider()
+        with patch.object(p, "_get_default_model", return_value="my-model"):
+            with patch.object(p, "_get_config", return_value={}):
+                assert "--context-tokens" not in p.build_command(prompt="hello")
+            with patch.object(p, "_get_config", return_value={"context_tokens": 8192}):
+                cmd = p.build_command(prompt="hello")
+        assert cmd[cmd.index("--context-tokens") + 1] == "8192"
+
     @patch.dict(os.environ, {
         "KOAN_LOCAL_LLM_BASE_URL": "http://env-url:5000/v1",
         "KOAN_LOCAL_LLM_MODEL": "env-model",
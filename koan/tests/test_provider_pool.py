@@ -0,0 +1,141 @@
+"""Tests for provider_pool — per-mission provider routing and quota failover."""
+
+import json
+import time
+from unittest.mock import patch
+
+import pytest
+
+from app import provider_pool
+from app.pause_manager import create_pause, get_pause_state
+from app.provider import get_provider_name, provider_scope, set_provider_override
+from app.provider_pool import (
+    ProviderStatus,
+    fail_over,
+    get_pool_status,
+    rank_providers,
+    record_outcome,
+    select_provider,
+)
+
+
+def _pool(providers=("claude", "codex"), costs=None, enabled=True):
+    return {"provider_pool": {
+        "enabled": enabled, "providers": list(providers), "costs": costs or {},
+    }}
+
+
+@pytest.fixture
+def pool_config():
+    """Patch config.yaml with a pool; every provider binary is installed."""
+    def _apply(**kwargs):
+        cfg_patch = patch("app.config._load_config", return_value=_pool(**kwargs))
+        avail_patch = patch("app.provider.base.CLIProvider.is_available", return_value=True)
+        codex_patch = patch("app.provider.codex.CodexProvider.is_available", return_value=True)
+        for p in (cfg_patch, avail_patch, codex_patch):
+            p.start()
+
+    yield _apply
+    patch.stopall()
+
+
+class TestRankProviders:
+    def test_cost_latency_and_success_combined(self):
+        fast_flaky = ProviderStatus("claude", durations=[100] * 4, outcomes=[0, 0, 0, 1])
+        slow_solid = ProviderStatus("codex", durations=[150] * 4, outcomes=[1] * 4)
+        assert [s.name for s in rank_providers([fast_flaky, slow_solid])] == ["codex", "claude"]
+
+        cheap = ProviderStatus("codex", cost=0.5, durations=[150] * 4, outcomes=[1] * 4)
+        pricey = ProviderStatus("claude", cost=2.0, durations=[100] * 4, outcomes=[1] * 4)
+        assert rank_providers([pricey, cheap])[0].name == "codex"
+
+    def test_unavailable_and_exhausted_excluded(self):
+        statuses = [
+            ProviderStatus("claude", exhausted_until=int(time.time()) + 60),
+            ProviderStatus("codex", available=False),
+            ProviderStatus("local"),
+        ]
+        assert [s.name for s in rank_providers(statuses)] == ["local"]
+
+    def test_ties_keep_config_order(self):
+        statuses = [ProviderStatus("codex"), ProviderStatus("claude")]
+        assert [s.name for s in rank_providers(statuses)] == ["codex", "claude"]
+
+
+class TestSelectProvider:
+    def test_disabled_pool_selects_nothing(self, instance_dir, pool_config):
+        pool_config(enabled=False)
+        assert get_pool_status(instance_dir) == []
+        assert select_provider(instance_dir, "koan") == ""
+
+    def test_env_override_disables_pool(self, instance_dir, pool_config, monkeypatch):
+        pool_config()
+        monkeypatch.setenv("KOAN_CLI_PROVIDER", "claude")
+        assert select_provider(instance_dir) == ""
+
+    def test_stats_drive_selection(self, instance_dir, pool_config):
+        pool_config()
+        for _ in range(3):
+            record_outcome(instance_dir, "claude", 600, False)
+            record_outcome(instance_dir, "codex", 300, True)
+        assert select_provider(instance_dir) == "codex"
+
+    def test_project_pin_wins(self, instance_dir, pool_config):
+        pool_config()
+        with patch("app.config.get_project_cli_provider", return_value="claude"):
+            record_outcome(instance_dir, "claude", 900, False)
+            assert select_provider(instance_dir, "pinned") == "claude"
+
+    def test_stats_window_is_bounded(self, instance_dir, pool_config):
+        pool_config()
+        for i in range(provider_pool.WINDOW + 5):
+            record_outcome(instance_dir, "codex", i, True)
+        state = json.loads((instance_dir / ".provider-pool.json").read_text())
+        assert len(state["codex"]["durations"]) == provider_pool.WINDOW
+        assert state["codex"]["durations"][-1] == provider_pool.WINDOW + 4
+
+
+class TestFailOver:
+    def test_switches_provider_and_lifts_pause(self, tmp_path, instance_dir, pool_config):
+        pool_config()
+        reset_ts = int(time.time()) + 3600
+        create_pause(str(tmp_path), "quota", reset_ts, "resets in 1h")
+
+        assert fail_over(str(tmp_path), instance_dir, "claude") == "codex"
+        assert get_pause_state(str(tmp_path)) is None
+        claude = next(s for s in get_pool_status(instance_dir) if s.name == "claude")
+        assert claude.exhausted_until == reset_ts
+
+    def test_pauses_when_every_provider_exhausted(self, tmp_path, instance_dir, pool_config):
+        pool_config()
+        create_pause(str(tmp_path), "quota", int(time.time()) + 3600, "")
+        assert fail_over(str(tmp_path), instance_dir, "claude") == "codex"
+
+        create_pause(str(tmp_path), "quota", int(time.time()) + 3600, "")
+        assert fail_over(str(tmp_path), instance_dir, "codex") == ""
+        assert get_pause_state(str(tmp_path)).is_quota
+
+    def test_exhausted_provider_rejoins_after_reset(self, tmp_path, instance_dir, pool_config):
+        pool_config()
+        provider_pool.mark_exhausted(instance_dir, "claude", int(time.time()) - 1)
+        assert select_provider(instance_dir) == "claude"
+
+    def test_disabled_pool_keeps_pause(self, tmp_path, instance_dir, pool_config):
+        pool_config(enabled=False)
+        create_pause(str(tmp_path), "quota", int(time.time()) + 3600, "")
+        assert fail_over(str(tmp_path), instance_dir, "claude") == ""
+        assert get_pause_state(str(tmp_path)).is_quota
+
+
+class TestProviderOverride:
+    def test_override_scoped_to_block(self):
+        before = get_provider_name()
+        with provider_scope():
+            set_provider_override("codex")
+            assert get_provider_name() == "codex"
+        assert get_provider_name() == before
+
+    def test_unknown_override_ignored(self):
+        with provider_scope():
+            set_provider_override("nope")
+            assert get_provider_name() != "nope"
@@ -0,0 +1,128 @@
+"""Tests for review_chunks — diff partitioning and review merging."""
+
+from app.review_chunks import (
+    chunk_files,
+    merge_reviews,
+    partition_diff,
+    split_diff_files,
+)
+
+
+def _file_diff(path: str, hunks: int = 1, lines: int = 10) -> str:
+    text = f"diff --git a/{path} b/{path}\n--- a/{path}\n+++ b/{path}\n"
+    for h in range(hunks):
+        text += f"@@ -{h * 100},{lines} +{h * 100},{lines} @@\n"
+        text += "".join(f"+line {h}-{i} of {path}\n" for i in range(lines))
+    return text
+
+
+def _comment(file, severity="warning", title="Bug", line=1):
+    return {
+        "file": file, "line_start": line, "line_end": line, "severity": severity,
+        "title": title, "comment": "c", "code_snippet": "",
+    }
+
+
+def _review(comments=(), lgtm=True, summary="ok", checklist=(), **extra):
+    return {
+        "file_comments": list(comments),
+        "review_summary": {"lgtm": lgtm, "summary": summary, "checklist": list(checklist)},
+        **extra,
+    }
+
+
+class TestPartitionDiff:
+    def test_small_diff_is_one_chunk(self):
+        diff = _file_diff("a.py") + _file_diff("b.py")
+        assert partition_diff(diff, max_tokens=10_000) == [diff]
+
+    def test_files_grouped_by_module(self):
+        diff = (
+            _file_diff("src/api/a.py", lines=40)
+            + _file_diff("src/db/x.py", lines=40)
+            + _file_diff("src/api/b.py", lines=40)
+        )
+        chunks = partition_diff(diff, max_tokens=600)
+
+        assert len(chunks) == 2
+        assert chunk_files(chunks[0]) == ["src/api/a.py", "src/api/b.py"]
+        assert chunk_files(chunks[1]) == ["src/db/x.py"]
+        # Nothing lost or duplicated
+        assert sorted("".join(chunks).splitlines()) == sorted(diff.splitlines())
+
+    def test_oversized_file_split_at_hunks_with_header(self):
+        diff = _file_diff("big.py", hunks=4, lines=30)
+        chunks = partition_diff(diff, max_tokens=300)
+
+        assert len(chunks) > 1
+        for chunk in chunks:
+            assert chunk.startswith("diff --git a/big.py b/big.py\n--- a/big.py\n+++ b/big.py\n")
+            assert "@@ " in chunk
+
+    def test_unsplittable_diff_returned_whole(self):
+        diff = "not a diff\n" * 1000
+        assert partition_diff(diff, max_tokens=100) == [diff]
+
+    def test_split_diff_files(self):
+        diff = _file_diff("a.py") + _file_diff("dir/b.py")
+        assert [p for p, _ in split_diff_files(diff)] == ["a.py", "dir/b.py"]
+
+
+class TestMergeReviews:
+    def test_duplicate_findings_keep_most_severe(self):
+        merged = merge_reviews([
+            _review([_comment("a.py", "suggestion", "Missing check")]),
+            _review([_comment("a.py", "critical", "Missing  check!"), _comment("b.py")]),
+        ])
+
+        comments = merged["file_comments"]
+        assert [(c["file"], c["severity"]) for c in comments] == [
+            ("a.py", "critical"), ("b.py", "warning"),
+        ]
+
+    def test_lgtm_requires_every_part(self):
+        assert merge_reviews([_review(), _review()])["review_summary"]["lgtm"] is True
+        assert merge_reviews([_review(), _review(lgtm=False)])["review_summary"]["lgtm"] is False
+        assert merge_reviews([_review([_comment("a.py")])])["review_summary"]["lgtm"] is False
+
+    def test_failed_parts_reported(self):
+        merged = merge_reviews([_review(summary="Part one fine.")], failed_parts=[2])
+
+        summary = merged["review_summary"]
+        assert summary["lgtm"] is False
+        assert "Reviewed in 2 parts." in summary["summary"]
+        assert "Part one fine." in summary["summary"]
+        assert "Part(s) 2 could not be reviewed" in summary["summary"]
+
+    def test_checklist_item_fails_if_any_part_fails(self):
+        ok = {"item": "No secrets", "passed": True, "finding_ref": ""}
+        bad = {"item": "No secrets", "passed": False, "finding_ref": "critical #1"}
+        merged = merge_reviews([_review(checklist=[ok]), _review(checklist=[bad])])
+        assert merged["review_summary"]["checklist"] == [bad]
+
+    def test_replies_deduplicated_and_plan_alignment_merged(self):
+        merged = merge_reviews([
+            _review(
+                comment_replies=[{"comment_id": 1, "reply": "first"}],
+                plan_alignment={"requirements_met": ["A"], "requirements_missing": ["B"],
+                                "out_of_scope": []},
+            ),
+            _review(
+                comment_replies=[{"comment_id": 1, "reply": "dup"}],
+                plan_alignment={"requirements_met": ["B"], "requirements_missing": ["C"],
+                                "out_of_scope": ["refactor"]},
+            ),
+        ])
+
+        assert merged["comment_replies"] == [{"comment_id": 1, "reply": "first"}]
+        assert merged["plan_alignment"] == {
+            "requirements_met": ["A", "B"],
+            "requirements_missing": ["C"],
+            "out_of_scope": ["refactor"],
+        }
+
+    def test_merged_review_is_schema_valid(self):
+        from app.review_schema import validate_review
+
+        merged = merge_reviews([_review([_comment("a.py")]), _review()], failed_parts=[3])
+        assert validate_review(merged) == (True, [])
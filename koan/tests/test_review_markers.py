@@ -139,3 +139,21 @@ class TestReplaceSection:
         body = f"{COMMIT_IDS_START}old{COMMIT_IDS_END}"
         result = replace_section(body, COMMIT_IDS_START, COMMIT_IDS_END, "")
         assert result == f"{COMMIT_IDS_START}{COMMIT_IDS_END}"
+
+
+class TestHiddenText:
+    def test_round_trip(self):
+        from app.review_markers import hide_text, reveal_text
+
+        text = "Summary with -- dashes, <!-- markers --> and ünïcode"
+        hidden = hide_text(text)
+        assert hidden.startswith("<!-- ") and hidden.endswith(" -->")
+        assert "--" not in hidden[4:-3]
+        assert reveal_text(hidden) == text
+
+    def test_malformed_returns_none(self):
+        from app.review_markers import reveal_text
+
+        assert reveal_text(None) is None
+        assert reveal_text("plain text") is None
+        assert reveal_text("<!-- not base64! -->") is None
@@ -23,6 +23,7 @@ from app.review_runner import (
     _post_review_comment,
     _post_comment_replies,
     _fetch_pr_commit_shas,
+    _compare_has_merge_commit,
 )
 
 
@@ -841,6 +842,7 @@ class TestMainCli:
             skill_dir=Path(__file__).resolve().parent.parent / "skills" / "core" / "review",
             architecture=False,
             plan_url=None,
+            full=False,
         )
 
     @patch("app.review_runner.run_review")
@@ -1071,6 +1073,20 @@ class TestSkillDispatchIntegration:
         assert "--architecture" in result
         assert any("pull/1" in str(p) for p in result)
 
+    @patch("app.skill_dispatch.is_known_project", return_value=True)
+    def test_dispatch_passes_full_flag(self, mock_known):
+        """dispatch_skill_mission passes --full to force a non-incremental review."""
+        from app.skill_dispatch import dispatch_skill_mission
+        result = dispatch_skill_mission(
+            mission_text="/review https://github.com/o/r/pull/1 --full",
+            project_name="koan",
+            project_path="/tmp/project",
+            koan_root="/tmp/koan",
+            instance_dir="/tmp/instance",
+        )
+        assert result is not None
+        assert "--full" in result
+
 
 # ---------------------------------------------------------------------------
 # fetch_repliable_comments
@@ -1931,6 +1947,109 @@ class TestReviewConcurrencyConfig:
         assert cfg["enabled"] is True
         assert cfg["github_workers"] == 4
 
+    def test_chunking_defaults_and_overrides(self):
+        """review_workers and chunk_tokens have defaults and lower bounds."""
+        from app.config import get_review_concurrency_config
+
+        with patch("app.config._load_config", return_value={}):
+            cfg = get_review_concurrency_config()
+        assert cfg["review_workers"] == 3
+        assert cfg["chunk_tokens"] == 25000
+
+        with patch("app.config._load_config", return_value={
+            "review_concurrency": {"review_workers": 0, "chunk_tokens": 10},
+        }):
+            cfg = get_review_concurrency_config()
+        assert cfg["review_workers"] == 1
+        assert cfg["chunk_tokens"] == 1000
+
+
+# ---------------------------------------------------------------------------
+# Map-reduce review of large PRs
+# ---------------------------------------------------------------------------
+
+class TestChunkedReview:
+    CHUNKS = [
+        "diff --git a/api/a.py b/api/a.py\n+a\n",
+        "diff --git a/db/b.py b/db/b.py\n+b\n",
+    ]
+
+    @staticmethod
+    def _review(file, severity="warning"):
+        return json.dumps({
+            "file_comments": [{
+                "file": file, "line_start": 1, "line_end": 1, "severity": severity,
+                "title": f"Issue in {file}", "comment": "c", "code_snippet": "",
+            }],
+            "review_summary": {"lgtm": False, "summary": f"{file} reviewed", "checklist": []},
+        })
+
+    def test_chunks_reviewed_and_merged(self, pr_context, review_skill_dir):
+        from app.review_runner import _run_chunked_review
+
+        def fake_review(prompt, project_path):
+            file = "api/a.py" if "part 1 of 2" in prompt else "db/b.py"
+            return self._review(file), ""
+
+        with patch("app.review_runner._run_claude_review", side_effect=fake_review) as run:
+            merged = _run_chunked_review(
+                self.CHUNKS, pr_context, "/tmp/p", skill_dir=review_skill_dir,
+                repliable_comments=[{"id": 9, "user": "bob", "body": "why?", "type": "issue"}],
+                workers=2,
+            )
+
+        assert run.call_count == 2
+        prompts = [c.args[0] for c in run.call_args_list]
+        assert all("+b" not in p for p in prompts if "part 1 of 2" in p)
+        # Repliable comments only go to the first chunk
+        assert sum("why?" in p for p in prompts) == 1
+        assert [c["file"] for c in merged["file_comments"]] == ["api/a.py", "db/b.py"]
+        assert "Reviewed in 2 parts." in merged["review_summary"]["summary"]
+
+    def test_failed_chunk_reported(self, pr_context, review_skill_dir):
+        from app.review_runner import _run_chunked_review
+
+        def fake_review(prompt, project_path):
+            if "part 2 of 2" in prompt:
+                return "", "timeout"
+            return self._review("api/a.py"), ""
+
+        with patch("app.review_runner._run_claude_review", side_effect=fake_review):
+            merged = _run_chunked_review(
+                self.CHUNKS, pr_context, "/tmp/p", skill_dir=review_skill_dir,
+            )
+
+        assert "Part(s) 2 could not be reviewed" in merged["review_summary"]["summary"]
+
+    def test_all_chunks_failed(self, pr_context, review_skill_dir):
+        from app.review_runner import _run_chunked_review
+
+        with patch("app.review_runner._run_claude_review", return_value=("", "boom")):
+            assert _run_chunked_review(
+                self.CHUNKS, pr_context, "/tmp/p", skill_dir=review_skill_dir, workers=2,
+            ) is None
+
+    def test_run_review_uses_chunks_for_large_diff(self, pr_context):
+        with (
+            patch("app.review_runner.fetch_pr_context", return_value=pr_context),
+            patch("app.review_runner.fetch_repliable_comments", return_value=[]),
+            patch("app.review_runner._resolve_bot_username", return_value="bot"),
+            patch("app.review_runner.find_bot_comment", return_value=None),
+            patch("app.review_runner._fetch_pr_commit_shas", return_value=[]),
+            patch("app.review_runner._set_in_progress_marker", return_value=None),
+            patch("app.review_runner._post_review_comment", return_value=True) as post,
+            patch("app.review_runner.partition_diff", return_value=self.CHUNKS),
+            patch("app.review_runner._run_chunked_review",
+                  return_value=json.loads(self._review("api/a.py"))) as chunked,
+            patch("app.config.get_review_ignore_config", return_value={}),
+        ):
+            ok, summary, data = run_review("o", "r", "42", "/tmp/p", notify_fn=MagicMock())
+
+        assert ok is True
+        chunked.assert_called_once()
+        assert data["file_comments"][0]["file"] == "api/a.py"
+        assert "api/a.py" in post.call_args.args[3]
+
 
 # Phase 3: SUMMARY_TAG + idempotent upsert (_post_review_comment)
 # ---------------------------------------------------------------------------
@@ -2203,6 +2322,129 @@ class TestIncrementalReview:
         assert "def" in sha_body
 
 
+class TestCompareHasMergeCommit:
+    @patch("app.review_runner.run_gh", return_value="1\n")
+    def test_detects_merge_commit(self, mock_gh):
+        assert _compare_has_merge_commit("owner", "repo", "abc", "def") is True
+        assert "repos/owner/repo/compare/abc...def" in mock_gh.call_args.args
+
+    @patch("app.review_runner.run_gh", return_value="0\n")
+    def test_linear_history(self, mock_gh):
+        assert _compare_has_merge_commit("owner", "repo", "abc", "def") is False
+
+    @patch("app.review_runner.run_gh", side_effect=RuntimeError("API error"))
+    def test_error_counts_as_merge(self, mock_gh):
+        assert _compare_has_merge_commit("owner", "repo", "abc", "def") is True
+
+
+class TestIncrementalReReview:
+    """Phase 6 — re-reviews diff only the commits added since the last review."""
+
+    DELTA = "diff --git a/new.py b/new.py\n--- a/new.py\n+++ b/new.py\n@@ -0,0 +1 @@\n+x = 1\n"
+
+    def _prior_comment(self, shas, raw_summary="Earlier: missing null check in auth.py"):
+        from app.review_markers import (
+            COMMIT_IDS_END, COMMIT_IDS_START, RAW_SUMMARY_END, RAW_SUMMARY_START,
+            SUMMARY_TAG, hide_text,
+        )
+        body = f"{SUMMARY_TAG}\n## PR Review\n\nOld review\n"
+        body += f"{COMMIT_IDS_START}\n" + "\n".join(shas) + f"\n{COMMIT_IDS_END}"
+        if raw_summary:
+            body += f"{RAW_SUMMARY_START}{hide_text(raw_summary)}{RAW_SUMMARY_END}"
+        return {"id": 42, "body": body, "user": "koan-bot"}
+
+    def _run(self, pr_context, skill_dir, prior, current, compare_diff=DELTA, full=False,
+             has_merge=False):
+        updated = dict(prior)
+        with (
+            patch("app.review_runner.fetch_pr_context", return_value=pr_context),
+            patch("app.review_runner.fetch_repliable_comments", return_value=[]),
+            patch("app.review_runner._resolve_bot_username", return_value="bot"),
+            patch("app.review_runner.find_bot_comment", side_effect=[prior, updated]),
+            patch("app.review_runner._fetch_pr_commit_shas", return_value=current),
+            patch("app.review_runner._set_in_progress_marker", return_value=None),
+            patch("app.review_runner._fetch_compare_diff", return_value=compare_diff) as compare,
+            patch("app.review_runner._compare_has_merge_commit", return_value=has_merge),
+            patch("app.review_runner._run_claude_review",
+                  return_value=(json.dumps(LGTM_REVIEW_JSON), "")) as claude,
+            patch("app.review_runner.run_gh") as gh,
+        ):
+            result = run_review(
+                "owner", "repo", "42", "/tmp/project",
+                notify_fn=MagicMock(), skill_dir=skill_dir, full=full,
+            )
+        return result, claude.call_args.args[0], compare, gh
+
+    def test_reviews_only_new_commits_with_cached_summary(self, pr_context, review_skill_dir):
+        from app.review_markers import RAW_SUMMARY_END, RAW_SUMMARY_START, extract_between_markers, reveal_text
+
+        prior = self._prior_comment(["abc", "def"])
+        (ok, summary, _), prompt, compare, gh = self._run(
+            pr_context, review_skill_dir, prior, ["abc", "def", "ghi"],
+        )
+
+        assert ok is True
+        assert "Incremental review of 1 new commit(s)" in summary
+        compare.assert_called_once_with("owner", "repo", "def", "ghi")
+        assert "+x = 1" in prompt
+        assert "import jwt" not in prompt  # full PR diff not sent
+        assert "missing null check" in prompt
+        # The posted review is marked incremental; the summary cache is refreshed
+        bodies = [" ".join(map(str, c.args)) for c in gh.call_args_list]
+        assert any("Incremental review of 1 new commit(s) since `def`" in b for b in bodies)
+        final = gh.call_args_list[-1].args[-1]
+        cached = reveal_text(extract_between_markers(final, RAW_SUMMARY_START, RAW_SUMMARY_END))
+        assert "Earlier reviews:" in cached and "missing null check" in cached
+
+    def test_force_push_falls_back_to_full_review(self, pr_context, review_skill_dir):
+        prior = self._prior_comment(["abc", "old"])
+        (ok, summary, _), prompt, compare, _ = self._run(
+            pr_context, review_skill_dir, prior, ["abc", "new"],
+        )
+
+        assert ok is True
+        compare.assert_not_called()
+        assert "import jwt" in prompt
+        assert "Incremental" not in summary
+
+    def test_merge_commit_falls_back_to_full_review(self, pr_context, review_skill_dir):
+        prior = self._prior_comment(["abc", "def"])
+        (ok, summary, _), prompt, compare, _ = self._run(
+            pr_context, review_skill_dir, prior, ["abc", "def", "merge"], has_merge=True,
+        )
+
+        assert ok is True
+        compare.assert_not_called()
+        assert "import jwt" in prompt
+        assert "Incremental" not in summary
+
+    def test_missing_cached_summary_falls_back_to_full_review(self, pr_context, review_skill_dir):
+        prior = self._prior_comment(["abc"], raw_summary=None)
+        _, prompt, compare, _ = self._run(pr_context, review_skill_dir, prior, ["abc", "def"])
+
+        compare.assert_not_called()
+        assert "import jwt" in prompt
+
+    def test_full_flag_forces_full_review(self, pr_context, review_skill_dir):
+        prior = self._prior_comment(["abc"])
+        _, prompt, compare, _ = self._run(
+            pr_context, review_skill_dir, prior, ["abc", "def"], full=True,
+        )
+
+        compare.assert_not_called()
+        assert "incremental re-review" not in prompt
+
+    def test_full_review_caches_raw_summary(self, pr_context, review_skill_dir):
+        from app.review_markers import RAW_SUMMARY_END, RAW_SUMMARY_START, extract_between_markers, reveal_text
+
+        prior = self._prior_comment(["abc"], raw_summary=None)
+        _, _, _, gh = self._run(pr_context, review_skill_dir, prior, ["abc", "def"])
+
+        final = gh.call_args_list[-1].args[-1]
+        cached = reveal_text(extract_between_markers(final, RAW_SUMMARY_START, RAW_SUMMARY_END))
+        assert cached == LGTM_REVIEW_JSON["review_summary"]["summary"]
+
+
 # ---------------------------------------------------------------------------
 # Review ignore config: get_review_ignore_config
 # ---------------------------------------------------------------------------
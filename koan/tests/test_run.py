@@ -3640,6 +3640,36 @@ class TestRunSkillMissionEnv:
         assert "env" in call_kwargs
         assert call_kwargs["env"]["PYTHONPATH"] == str(tmp_path / "koan")
 
+    def test_passes_pool_provider_in_env(self, tmp_path, monkeypatch):
+        """A provider chosen by the pool reaches the skill subprocess."""
+        from app.provider import provider_scope, set_provider_override
+        from app.run import _run_skill_mission
+        (tmp_path / "instance" / "journal").mkdir(parents=True)
+        (tmp_path / "koan").mkdir()
+        monkeypatch.setenv("KOAN_CLI_PROVIDER", "claude")
+
+        mock_proc = self._make_mock_popen(stdout_lines=["ok\n"])
+
+        with patch("app.run.subprocess.Popen", side_effect=mock_proc._side_effect) as mock_popen, \
+             patch("app.run._get_koan_branch", return_value="main"), \
+             patch("app.run._restore_koan_branch"), \
+             patch("app.run._reset_terminal"), \
+             patch("app.mission_runner.run_post_mission"), \
+             provider_scope():
+            set_provider_override("local")
+            _run_skill_mission(
+                skill_cmd=["python3", "-m", "app.plan_runner", "--help"],
+                koan_root=str(tmp_path),
+                instance=str(tmp_path / "instance"),
+                project_name="test",
+                project_path=str(tmp_path),
+                run_num=1,
+                mission_title="/plan test",
+                autonomous_mode="implement",
+            )
+
+        assert mock_popen.call_args[1]["env"]["KOAN_CLI_PROVIDER"] == "local"
+
     def test_restores_branch_after_skill_execution(self, tmp_path):
         """_run_skill_mission calls _restore_koan_branch after execution."""
         from app.run import _run_skill_mission
@@ -3,6 +3,7 @@
 import json
 import os
 import threading
+import time
 from pathlib import Path
 from unittest.mock import patch
 
@@ -17,9 +18,11 @@ from app.security_audit import (
     MISSION_FAIL,
     MISSION_START,
     SUBPROCESS_EXEC,
+    _get_audit_config,
     _redact_list,
     _redact_secrets,
     _truncate,
+    flush_events,
     log_event,
     read_recent_events,
 )
@@ -130,6 +133,7 @@ class TestLogEvent:
                             lambda: {"enabled": True, "max_size_mb": 10, "redact_patterns": []})
 
         log_event(MISSION_START, details={"mission": "test task", "project": "demo"})
+        flush_events()
 
         audit_file = tmp_path / "instance" / "audit" / "security.jsonl"
         assert audit_file.exists()
@@ -156,6 +160,7 @@ class TestLogEvent:
 
         log_event(AUTH_GRANT, actor={"type": "github", "id": "user1"})
 
+        flush_events()
         audit_file = tmp_path / "instance" / "audit" / "security.jsonl"
         data = json.loads(audit_file.read_text().strip())
         assert data["actor"] == {"type": "github", "id": "user1"}
@@ -168,6 +173,7 @@ class TestLogEvent:
 
         log_event(MISSION_FAIL, details={"mission": "failed"})
 
+        flush_events()
         audit_file = tmp_path / "instance" / "audit" / "security.jsonl"
         data = json.loads(audit_file.read_text().strip())
         assert "actor" not in data
@@ -192,6 +198,7 @@ class TestLogEvent:
         secret = "ghp_" + "a" * 36
         log_event(SUBPROCESS_EXEC, details={"cmd": f"gh auth --token {secret}"})
 
+        flush_events()
         audit_file = tmp_path / "instance" / "audit" / "security.jsonl"
         content = audit_file.read_text()
         assert secret not in content
@@ -206,6 +213,7 @@ class TestLogEvent:
         secret = "sk-" + "a" * 40
         log_event(SUBPROCESS_EXEC, details={"cmd": ["run", "--key", secret]})
 
+        flush_events()
         audit_file = tmp_path / "instance" / "audit" / "security.jsonl"
         content = audit_file.read_text()
         assert secret not in content
@@ -219,6 +227,7 @@ class TestLogEvent:
         long_text = "x" * 5000
         log_event(MISSION_START, details={"mission": long_text})
 
+        flush_events()
         audit_file = tmp_path / "instance" / "audit" / "security.jsonl"
         data = json.loads(audit_file.read_text().strip())
         assert len(data["details"]["mission"]) == 2000
@@ -242,6 +251,7 @@ class TestLogEvent:
         log_event(MISSION_START, details={"mission": "first"})
         log_event(MISSION_COMPLETE, details={"mission": "first"})
 
+        flush_events()
         audit_file = tmp_path / "instance" / "audit" / "security.jsonl"
         lines = [l for l in audit_file.read_text().splitlines() if l.strip()]
         assert len(lines) == 2
@@ -256,6 +266,7 @@ class TestLogEvent:
 
         log_event(MISSION_START, details={"mission": "tâche française 🚀"})
 
+        flush_events()
         audit_file = tmp_path / "instance" / "audit" / "security.jsonl"
         data = json.loads(audit_file.read_text().strip())
         assert "tâche française 🚀" in data["details"]["mission"]
@@ -284,6 +295,7 @@ class TestConcurrentWrites:
             t.join()
 
         assert not errors
+        flush_events()
         audit_file = tmp_path / "instance" / "audit" / "security.jsonl"
         lines = [l for l in audit_file.read_text().splitlines() if l.strip()]
         assert len(lines) == 40
@@ -308,9 +320,102 @@ class TestRotation:
 
         with patch("app.log_rotation.rotate_log") as mock_rotate:
             log_event(MISSION_START, details={"mission": "test"})
+            flush_events()
             mock_rotate.assert_called_once_with(audit_file)
 
 
+# ---------------------------------------------------------------------------
+# Buffered writer
+# ---------------------------------------------------------------------------
+
+@pytest.fixture
+def audit_env(tmp_path, monkeypatch):
+    """KOAN_ROOT with a buffered audit config; returns the audit file path."""
+    monkeypatch.setenv("KOAN_ROOT", str(tmp_path))
+    (tmp_path / "instance").mkdir()
+    cfg = {"enabled": True, "max_size_mb": 10, "redact_patterns": [],
+           "buffered": True, "flush_interval_ms": 60_000}
+    monkeypatch.setattr("app.security_audit._get_audit_config", lambda: cfg)
+    yield tmp_path / "instance" / "audit" / "security.jsonl", cfg
+    flush_events()
+
+
+class TestBufferedWriter:
+    def test_events_queued_until_flush(self, audit_env):
+        audit_file, _ = audit_env
+        log_event(MISSION_START, details={"mission": "queued"})
+        assert not audit_file.exists()
+        flush_events()
+        assert "queued" in audit_file.read_text()
+
+    def test_batch_written_in_one_open(self, audit_env):
+        audit_file, _ = audit_env
+        for i in range(50):
+            log_event(GIT_OPERATION, details={"cmd": f"gh api {i}"})
+        with patch("app.security_audit._rotate_if_needed") as mock_rotate:
+            flush_events()
+        mock_rotate.assert_called_once()
+        lines = audit_file.read_text().splitlines()
+        assert [json.loads(l)["details"]["cmd"] for l in lines] == [
+            f"gh api {i}" for i in range(50)
+        ]
+
+    @pytest.mark.parametrize("event_type", [AUTH_GRANT, AUTH_DENY, CONFIG_CHANGE, MISSION_FAIL])
+    def test_critical_events_written_synchronously(self, audit_env, event_type):
+        audit_file, _ = audit_env
+        log_event(MISSION_START, details={"mission": "before"})
+        log_event(event_type)
+        lines = audit_file.read_text().splitlines()
+        # Pending events are committed first, preserving order
+        assert [json.loads(l)["event_type"] for l in lines] == [MISSION_START, event_type]
+
+    def test_explicit_sync(self, audit_env):
+        audit_file, _ = audit_env
+        log_event(GIT_OPERATION, details={"cmd": "push"}, sync=True)
+        assert "push" in audit_file.read_text()
+
+    def test_unbuffered_config_writes_immediately(self, audit_env):
+        audit_file, cfg = audit_env
+        cfg["buffered"] = False
+        log_event(GIT_OPERATION, details={"cmd": "fetch"})
+        assert "fetch" in audit_file.read_text()
+
+    def test_background_flush_within_interval(self, audit_env):
+        audit_file, cfg = audit_env
+        cfg["flush_interval_ms"] = 10
+        log_event(GIT_OPERATION, details={"cmd": "status"})
+        deadline = time.monotonic() + 5
+        while not audit_file.exists() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert "status" in audit_file.read_text()
+
+    def test_read_recent_events_sees_queued_events(self, audit_env):
+        log_event(MISSION_START, details={"mission": "pending"})
+        with patch("app.security_audit.os.fsync") as mock_fsync:
+            events = read_recent_events(count=1)
+        assert events[0]["details"]["mission"] == "pending"
+        mock_fsync.assert_not_called()  # durability is the writer's job
+
+
+class TestAuditConfigCache:
+    def test_reloads_only_when_config_changes(self, tmp_path, monkeypatch):
+        monkeypatch.setenv("KOAN_ROOT", str(tmp_path))
+        config_file = tmp_path / "instance" / "config.yaml"
+        config_file.parent.mkdir()
+        config_file.write_text("audit:\n  enabled: true\n")
+        monkeypatch.setattr("app.security_audit._config_cache", None)
+
+        with patch("app.utils.load_config", return_value={"audit": {"enabled": True}}) as mock_load:
+            assert _get_audit_config()["enabled"] is True
+            assert _get_audit_config()["enabled"] is True
+            assert mock_load.call_count == 1
+
+            config_file.write_text("audit:\n  enabled: false  # changed\n")
+            mock_load.return_value = {"audit": {"enabled": False}}
+            assert _get_audit_config()["enabled"] is False
+            assert mock_load.call_count == 2
+
+
 # ---------------------------------------------------------------------------
 # Reading events
 # ---------------------------------------------------------------------------
@@ -175,6 +175,18 @@ class TestRecordOutcome:
         assert len(data) == 1
         assert data[0]["outcome"] == "productive"
 
+    def test_model_tier_recorded_with_work_type(self, tracker_env, monkeypatch):
+        monkeypatch.setattr("app.utils.atomic_write", _mock_atomic_write)
+
+        routed = record_outcome(
+            tracker_env, "koan", "implement", 3, "Branch pushed.",
+            mission_title="Fix typo in README", model_tier="light",
+        )
+        plain = record_outcome(tracker_env, "koan", "implement", 3, "Branch pushed.")
+
+        assert (routed["model_tier"], routed["work_type"]) == ("light", "debug")
+        assert "model_tier" not in plain
+
     def test_records_empty(self, tracker_env, monkeypatch):
         monkeypatch.setattr("app.utils.atomic_write", _mock_atomic_write)
 
@@ -684,87 +696,67 @@ class TestCountCommitsSince:
         result = _count_commits_since("/nonexistent/path", "2026-01-01T00:00:00")
         assert result == -1
 
-    @patch("app.session_tracker.subprocess.run")
-    def test_counts_git_log_lines(self, mock_run):
-        mock_run.return_value = type("R", (), {
-            "returncode": 0,
-            "stdout": "abc123 first commit\ndef456 second commit\nghi789 third\n",
-        })()
+    @patch("app.git_service.run_git")
+    def test_counts_commits_with_rev_list(self, mock_git):
+        mock_git.return_value = (0, "3", "")
         result = _count_commits_since("/some/path", "2026-01-01T00:00:00")
         assert result == 3
-        mock_run.assert_called_once()
-        args = mock_run.call_args
-        assert "--since=2026-01-01T00:00:00" in args[0][0]
-
-    @patch("app.session_tracker.subprocess.run")
-    def test_returns_negative_on_git_error(self, mock_run):
-        mock_run.return_value = type("R", (), {
-            "returncode": 128,
-            "stdout": "",
-        })()
+        mock_git.assert_called_once()
+        args = mock_git.call_args[0]
+        assert args[:2] == ("rev-list", "--count")
+        assert "--since=2026-01-01T00:00:00" in args
+
+    @patch("app.git_service.run_git")
+    def test_returns_negative_on_git_error(self, mock_git):
+        mock_git.return_value = (128, "", "fatal: not a git repository")
         assert _count_commits_since("/path", "2026-01-01T00:00:00") == -1
 
-    @patch("app.session_tracker.subprocess.run")
-    def test_returns_zero_for_empty_log(self, mock_run):
-        mock_run.return_value = type("R", (), {
-            "returncode": 0,
-            "stdout": "",
-        })()
+    @patch("app.git_service.run_git")
+    def test_returns_zero_for_empty_log(self, mock_git):
+        mock_git.return_value = (0, "0", "")
         assert _count_commits_since("/path", "2026-01-01T00:00:00") == 0
 
-    @patch("app.session_tracker.subprocess.run")
-    def test_cache_hit_avoids_subprocess(self, mock_run):
+    @patch("app.git_service.run_git")
+    def test_cache_hit_avoids_subprocess(self, mock_git):
         """Second call with same args should return cached value."""
-        mock_run.return_value = type("R", (), {
-            "returncode": 0,
-            "stdout": "abc first\ndef second\n",
-        })()
+        mock_git.return_value = (0, "2", "")
         assert _count_commits_since("/path", "2026-01-01T00:00:00") == 2
         assert _count_commits_since("/path", "2026-01-01T00:00:00") == 2
-        mock_run.assert_called_once()
+        mock_git.assert_called_once()
 
-    @patch("app.session_tracker.subprocess.run")
-    def test_cache_miss_on_different_args(self, mock_run):
+    @patch("app.git_service.run_git")
+    def test_cache_miss_on_different_args(self, mock_git):
         """Different args should trigger separate subprocess calls."""
-        mock_run.return_value = type("R", (), {
-            "returncode": 0,
-            "stdout": "abc first\n",
-        })()
+        mock_git.return_value = (0, "1", "")
         _count_commits_since("/path-a", "2026-01-01T00:00:00")
         _count_commits_since("/path-b", "2026-01-01T00:00:00")
-        assert mock_run.call_count == 2
+        assert mock_git.call_count == 2
 
-    @patch("app.session_tracker.subprocess.run")
+    @patch("app.git_service.run_git")
     @patch("app.session_tracker.time.monotonic")
-    def test_cache_expires_after_ttl(self, mock_mono, mock_run):
+    def test_cache_expires_after_ttl(self, mock_mono, mock_git):
         """Cache entry should expire after _COMMITS_CACHE_TTL seconds."""
-        mock_run.return_value = type("R", (), {
-            "returncode": 0,
-            "stdout": "abc first\n",
-        })()
+        mock_git.return_value = (0, "1", "")
         mock_mono.return_value = 1000.0
         assert _count_commits_since("/path", "2026-01-01T00:00:00") == 1
 
         # Still within TTL — should use cache
         mock_mono.return_value = 1000.0 + _COMMITS_CACHE_TTL - 1
         assert _count_commits_since("/path", "2026-01-01T00:00:00") == 1
-        assert mock_run.call_count == 1
+        assert mock_git.call_count == 1
 
-        # Past TTL — should call subprocess again
+        # Past TTL — should call git again
         mock_mono.return_value = 1000.0 + _COMMITS_CACHE_TTL + 1
         assert _count_commits_since("/path", "2026-01-01T00:00:00") == 1
-        assert mock_run.call_count == 2
+        assert mock_git.call_count == 2
 
-    @patch("app.session_tracker.subprocess.run")
-    def test_error_result_is_cached(self, mock_run):
+    @patch("app.git_service.run_git")
+    def test_error_result_is_cached(self, mock_git):
         """Even -1 error results should be cached to avoid retrying."""
-        mock_run.return_value = type("R", (), {
-            "returncode": 128,
-            "stdout": "",
-        })()
+        mock_git.return_value = (128, "", "")
         assert _count_commits_since("/path", "2026-01-01T00:00:00") == -1
         assert _count_commits_since("/path", "2026-01-01T00:00:00") == -1
-        mock_run.assert_called_once()
+        mock_git.assert_called_once()
 
 
 class TestGetProjectDrift:
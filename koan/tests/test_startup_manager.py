@@ -35,6 +35,13 @@ def projects(tmp_path):
     return [("proj1", str(p1))]
 
 
+@pytest.fixture(autouse=True)
+def inline_deferred_steps():
+    """Run deferred startup steps inline so run_startup tests see them."""
+    with patch("app.config.get_defer_startup_tasks", return_value=False):
+        yield
+
+
 # ---------------------------------------------------------------------------
 # Test: recover_crashed_missions
 # ---------------------------------------------------------------------------
@@ -1133,3 +1140,132 @@ class TestRunStartupNotifications:
         msgs = [c.args[1] for c in mock_notify_raw.call_args_list]
         joined = " | ".join(msgs)
         assert "Auto-update pulled new commits" in joined
+
+
+# ---------------------------------------------------------------------------
+# Test: step graph
+# ---------------------------------------------------------------------------
+
+
+class TestRunSteps:
+    def test_dependencies_run_first_and_independent_steps_overlap(self):
+        import threading
+        from app.startup_manager import StartupStep, run_steps
+
+        order = []
+        both_started = threading.Barrier(2, timeout=5)
+
+        def independent(name):
+            def fn():
+                both_started.wait()  # deadlocks unless run concurrently
+                order.append(name)
+                return name
+            return fn
+
+        results, timings = run_steps([
+            StartupStep("c", lambda: order.append("c"), deps=("a", "b")),
+            StartupStep("a", independent("a")),
+            StartupStep("b", independent("b")),
+        ])
+
+        assert order[-1] == "c"
+        assert results["a"] == "a"
+        assert set(timings) == {"a", "b", "c"}
+        assert all(t >= 0 for t in timings.values())
+
+    def test_failed_step_logged_and_dependents_still_run(self, capsys):
+        from app.startup_manager import StartupStep, run_steps
+
+        after = MagicMock()
+        results, _ = run_steps([
+            StartupStep("Boom", MagicMock(side_effect=RuntimeError("bad"))),
+            StartupStep("After", after, deps=("Boom",)),
+        ])
+
+        after.assert_called_once()
+        assert results["Boom"] is None
+        assert "Boom failed: bad" in capsys.readouterr().out
+
+    def test_system_exit_propagates(self):
+        from app.startup_manager import StartupStep, run_steps
+
+        with pytest.raises(SystemExit):
+            run_steps([StartupStep("Exit", MagicMock(side_effect=SystemExit(3)))])
+
+    def test_invalid_graphs_rejected(self):
+        from app.startup_manager import StartupStep, run_steps
+
+        with pytest.raises(ValueError, match="unknown"):
+            run_steps([StartupStep("a", MagicMock(), deps=("missing",))])
+        with pytest.raises(ValueError, match="cycle"):
+            run_steps([
+                StartupStep("a", MagicMock(), deps=("b",)),
+                StartupStep("b", MagicMock(), deps=("a",)),
+            ])
+
+    def test_declared_graph_is_valid(self):
+        from app.startup_manager import build_startup_steps
+
+        steps = build_startup_steps("/tmp/koan", "/tmp/koan/instance", {"projects": []})
+        names = {s.name for s in steps}
+        assert all(d in names for s in steps for d in s.deps)
+        assert {s.name for s in steps if s.deferred} == {"Daily report", "Morning ritual"}
+
+    def test_git_sync_and_auto_update_not_concurrent(self):
+        """Git sync finishes before startup returns; auto-update runs last, alone."""
+        from app.startup_manager import build_startup_steps
+
+        steps = {s.name: s for s in build_startup_steps("/tmp/koan", "/tmp/koan/instance",
+                                                         {"projects": []})}
+        assert not steps["Git sync"].deferred
+        critical = {n for n, s in steps.items() if not s.deferred}
+        assert set(steps["Auto-update check"].deps) == critical - {"Auto-update check"}
+
+
+class TestDeferredStartup:
+    @patch("app.hooks.fire_hook")
+    @patch("app.hooks.init_hooks")
+    @patch("app.run._notify_raw")
+    @patch("app.run._notify")
+    @patch("app.run._build_startup_status", return_value="Active")
+    @patch("app.run.set_status")
+    @patch("app.banners.print_agent_banner")
+    @patch("app.utils.get_branch_prefix", return_value="koan/")
+    @patch("app.utils.get_cli_binary_for_shell", return_value="claude")
+    @patch("app.utils.get_interval_seconds", return_value=60)
+    @patch("app.utils.get_max_runs", return_value=10)
+    def test_deferred_steps_run_after_startup_returns(self, *mocks):
+        import threading
+        from app import startup_manager
+
+        release = threading.Event()
+        ritual = MagicMock(side_effect=lambda instance: release.wait(5))
+        critical = {
+            name: MagicMock(return_value=None) for name in (
+                "validate_config", "recover_crashed_missions", "run_migrations",
+                "populate_github_urls", "run_sanity_checks", "cleanup_memory",
+                "prune_missions_done", "cleanup_mission_history", "check_health",
+                "check_self_reflection", "handle_start_on_pause",
+                "handle_start_passive", "setup_git_identity", "setup_github_auth",
+                "check_auto_update",
+            )
+        }
+        critical["discover_workspace"] = MagicMock(return_value=[("p2", "/p2")])
+        git_sync = MagicMock()
+        with patch.multiple(startup_manager, **critical, run_git_sync=git_sync,
+                            run_daily_report=MagicMock(), run_morning_ritual=ritual), \
+                patch("app.config.get_defer_startup_tasks", return_value=True):
+            result = startup_manager.run_startup(
+                "/tmp/koan", "/tmp/koan/instance", [("proj1", "/p1")],
+            )
+            # Startup returned while the ritual is still running, git sync done
+            assert result == (10, 60, "koan/")
+            git_sync.assert_called_once()
+            assert not startup_manager.wait_for_deferred_steps(timeout=0.05)
+
+            release.set()
+            assert startup_manager.wait_for_deferred_steps(timeout=5)
+
+        ritual.assert_called_once_with("/tmp/koan/instance")
+        # Git sync sees the projects refreshed by workspace discovery
+        git_sync.assert_called_once_with("/tmp/koan/instance", [("p2", "/p2")])
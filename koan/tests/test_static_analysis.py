@@ -0,0 +1,266 @@
+"""Tests for app.static_analysis — local pre-pass for codebase scanners."""
+
+import json
+import subprocess
+from unittest.mock import patch
+
+import pytest
+
+from app.static_analysis import (
+    INDEX_VERSION,
+    _analyze_source,
+    build_index,
+    build_static_context,
+    find_complex_functions,
+    find_dead_code_candidates,
+    find_hotspots,
+    format_dead_code_candidates,
+    format_hotspots,
+    get_cache_path,
+    load_or_build_index,
+)
+
+
+def _git(cwd, *args):
+    subprocess.run(
+        ["git", *args], cwd=cwd, check=True, capture_output=True,
+        stdin=subprocess.DEVNULL,
+    )
+
+
+@pytest.fixture
+def project(tmp_path):
+    """A small git repo with live, dead and re-exported symbols."""
+    root = tmp_path / "proj"
+    pkg = root / "pkg"
+    pkg.mkdir(parents=True)
+    (pkg / "__init__.py").write_text("from pkg.core import helper\n")
+    (pkg / "core.py").write_text(
+        "import os\n"
+        "import json\n"
+        "\n"
+        "def helper(x):\n"
+        "    if x and os.sep:\n"
+        "        return 1\n"
+        "    for i in range(x):\n"
+        "        if i:\n"
+        "            return i\n"
+        "    return 0\n"
+        "\n"
+        "def _forgotten():\n"
+        "    return 42\n"
+        "\n"
+        "def dispatched():\n"
+        "    return 'dyn'\n"
+        "\n"
+        "class Service:\n"
+        "    def run(self):\n"
+        "        return helper(1)\n"
+        "\n"
+        "    def unused_method(self):\n"
+        "        return None\n"
+    )
+    (pkg / "cli.py").write_text(
+        "from pkg.core import Service\n"
+        "\n"
+        "def entry():\n"
+        "    return Service().run()\n"
+        "\n"
+        "HANDLERS = ['dispatched']\n"
+        "\n"
+        "if __name__ == '__main__':\n"
+        "    entry()\n"
+    )
+    (pkg / "orphan.py").write_text("VALUE = 1\n")
+    tests = root / "tests"
+    tests.mkdir()
+    (tests / "test_core.py").write_text(
+        "def test_unreferenced_fixture_like():\n    pass\n"
+    )
+    _git(root, "init", "-q")
+    _git(root, "-c", "user.name=t", "-c", "user.email=t@t", "add", ".")
+    _git(root, "-c", "user.name=t", "-c", "user.email=t@t",
+         "commit", "-q", "-m", "init")
+    return root
+
+
+class TestAnalyzeSource:
+    def test_collects_definitions_with_owner(self):
+        info = _analyze_source("m.py", "class A:\n    def f(self):\n        pass\n")
+        names = [(d["name"], d["kind"], d["owner"]) for d in info["definitions"]]
+        assert names == [("A", "class", ""), ("f", "method", "A")]
+
+    def test_complexity_counts_branches_and_boolops(self):
+        src = "def f(a, b):\n    if a and b:\n        return 1\n    while a:\n        pass\n"
+        info = _analyze_source("m.py", src)
+        assert info["definitions"][0]["complexity"] == 4
+
+    def test_nested_function_complexity_is_separate(self):
+        src = (
+            "def outer():\n"
+            "    def inner():\n"
+            "        if True:\n"
+            "            pass\n"
+            "    return inner\n"
+        )
+        info = _analyze_source("m.py", src)
+        assert [d["name"] for d in info["definitions"]] == ["outer"]
+        assert info["definitions"][0]["complexity"] == 1
+
+    def test_unused_import_detected(self):
+        info = _analyze_source("m.py", "import os\nimport sys\nprint(sys.argv)\n")
+        assert [i["name"] for i in info["unused_imports"]] == ["os"]
+
+    def test_all_exports_are_not_unused(self):
+        info = _analyze_source("m.py", "from x import y\n__all__ = ['y']\n")
+        assert info["unused_imports"] == []
+        assert info["exported"] == ["y"]
+
+    def test_init_modules_skip_unused_imports(self):
+        info = _analyze_source("pkg/__init__.py", "from pkg.a import b\n")
+        assert info["unused_imports"] == []
+        assert info["module"] == "pkg"
+
+    def test_relative_imports_resolved(self):
+        info = _analyze_source("pkg/sub/mod.py", "from ..core import x\n")
+        assert "pkg.core" in info["imports"]
+
+    def test_syntax_error_returns_none(self):
+        assert _analyze_source("bad.py", "def (:\n") is None
+
+
+class TestBuildIndex:
+    def test_index_has_commit_and_files(self, project):
+        index = build_index(str(project))
+        assert index["version"] == INDEX_VERSION
+        assert len(index["commit"]) == 40
+        assert "pkg/core.py" in index["files"]
+        assert index["churn"]["pkg/core.py"] == 1
+
+    def test_fan_in_counts_importers(self, project):
+        index = build_index(str(project))
+        assert index["fan_in"]["pkg.core"] == 2
+        assert "pkg.orphan" not in index["fan_in"]
+
+    def test_reexported_import_not_flagged(self, project):
+        (project / "pkg" / "facade.py").write_text("from pkg.core import helper\n")
+        (project / "pkg" / "user.py").write_text("from pkg.facade import helper\nhelper(1)\n")
+        _git(project, "add", ".")
+        index = build_index(str(project))
+        assert index["files"]["pkg/facade.py"]["unused_imports"] == []
+
+    def test_works_outside_git(self, tmp_path):
+        (tmp_path / "a.py").write_text("def f():\n    pass\n")
+        index = build_index(str(tmp_path))
+        assert index["commit"] == ""
+        assert "a.py" in index["files"]
+
+
+class TestCandidates:
+    def test_dead_code_certainty_levels(self, project):
+        candidates = find_dead_code_candidates(build_index(str(project)))
+        by_name = {c["name"]: c for c in candidates}
+
+        assert by_name["_forgotten"]["certainty"] == "high"
+        assert by_name["json"]["kind"] == "import"
+        assert by_name["Service.unused_method"]["certainty"] == "medium"
+        assert by_name["dispatched"]["certainty"] == "low"
+        assert by_name["pkg.orphan"]["kind"] == "module"
+        # Live symbols, scripts and tests are never candidates
+        assert "helper" not in by_name
+        assert "Service.run" not in by_name
+        assert "pkg.cli" not in by_name
+        assert "test_unreferenced_fixture_like" not in by_name
+
+    def test_candidates_ranked_by_certainty(self, project):
+        candidates = find_dead_code_candidates(build_index(str(project)))
+        order = [c["certainty"] for c in candidates]
+        assert order == sorted(order, key=["high", "medium", "low"].index)
+
+    def test_complex_functions_threshold(self, project):
+        index = build_index(str(project))
+        assert find_complex_functions(index, threshold=5)[0]["name"] == "helper"
+        assert find_complex_functions(index, threshold=50) == []
+
+    def test_hotspots_rank_by_churn_times_complexity(self, project):
+        hotspots = find_hotspots(build_index(str(project)))
+        assert hotspots[0]["path"] == "pkg/core.py"
+        assert all(not h["path"].startswith("tests/") for h in hotspots)
+
+    def test_hotspots_skip_paths_without_analysis(self, project):
+        index = build_index(str(project))
+        index["churn"].update({"README.md": 9, "pkg/deleted.py": 9})
+        paths = [h["path"] for h in find_hotspots(index)]
+        assert "README.md" not in paths
+        assert "pkg/deleted.py" not in paths
+
+    def test_file_cap_counts_only_python_files(self, project):
+        (project / "a_notes.txt").write_text("notes\n")
+        _git(project, "add", ".")
+        with patch("app.static_analysis.MAX_FILES", 1):
+            index = build_index(str(project))
+        assert list(index["files"]) == ["pkg/__init__.py"]
+
+
+class TestFormatting:
+    def test_dead_code_section(self, project):
+        text = format_dead_code_candidates(build_index(str(project)))
+        assert "## Static Analysis Pre-pass" in text
+        assert "[high] `pkg/core.py:12` function `_forgotten`" in text
+
+    def test_dead_code_section_truncates(self, project):
+        text = format_dead_code_candidates(build_index(str(project)), limit=1)
+        assert "more not shown" in text
+
+    def test_empty_index_renders_nothing(self):
+        assert format_dead_code_candidates({"files": {}}) == ""
+        assert format_hotspots({"files": {}, "churn": {}}) == ""
+
+    def test_hotspot_section(self, project):
+        text = format_hotspots(build_index(str(project)))
+        assert "### Hotspots" in text
+        assert "`pkg/core.py`" in text
+
+
+class TestCache:
+    def test_cache_written_and_reused(self, project, tmp_path):
+        cache = get_cache_path(tmp_path / "instance", "proj")
+        first = load_or_build_index(str(project), cache)
+        assert json.loads(cache.read_text())["commit"] == first["commit"]
+
+        with patch("app.static_analysis.build_index") as mock_build:
+            second = load_or_build_index(str(project), cache)
+        mock_build.assert_not_called()
+        assert second["files"].keys() == first["files"].keys()
+
+    def test_cache_invalidated_by_new_commit(self, project, tmp_path):
+        cache = get_cache_path(tmp_path / "instance", "proj")
+        first = load_or_build_index(str(project), cache)
+        (project / "pkg" / "new.py").write_text("X = 1\n")
+        _git(project, "add", ".")
+        _git(project, "-c", "user.name=t", "-c", "user.email=t@t",
+             "commit", "-q", "-m", "more")
+        second = load_or_build_index(str(project), cache)
+        assert second["commit"] != first["commit"]
+        assert "pkg/new.py" in second["files"]
+
+    def test_corrupt_cache_rebuilt(self, project, tmp_path):
+        cache = get_cache_path(tmp_path / "instance", "proj")
+        cache.parent.mkdir(parents=True)
+        cache.write_text("{not json")
+        index = load_or_build_index(str(project), cache)
+        assert "pkg/core.py" in index["files"]
+
+
+class TestBuildStaticContext:
+    def test_dead_code_kind(self, project, tmp_path):
+        text = build_static_context(str(project), tmp_path, "proj", kind="dead_code")
+        assert "Unreferenced Symbols" in text
+
+    def test_audit_kind_renders_hotspots(self, project, tmp_path):
+        text = build_static_context(str(project), tmp_path, "proj", kind="audit")
+        assert "Hotspots" in text
+
+    def test_failure_returns_empty(self, tmp_path):
+        with patch("app.static_analysis.load_or_build_index", side_effect=RuntimeError("x")):
+            assert build_static_context("/nope", tmp_path, "p", kind="dead_code") == ""
@@ -0,0 +1,112 @@
+"""Tests for app.tail_reader — reverse block readers for history files."""
+
+import json
+from contextlib import closing
+
+import pytest
+
+from app.tail_reader import (
+    iter_lines_reverse,
+    read_tail_text,
+    tail_jsonl,
+    tail_lines,
+    tail_text,
+)
+
+
+@pytest.fixture
+def lines_file(tmp_path):
+    path = tmp_path / "log.txt"
+    path.write_text("".join(f"line {i} é\n" for i in range(100)))
+    return path
+
+
+class TestIterLinesReverse:
+    @pytest.mark.parametrize("block_size", [1, 3, 7, 64, 8192])
+    def test_matches_reversed_readlines(self, lines_file, block_size):
+        expected = lines_file.read_text().splitlines()[::-1]
+        assert list(iter_lines_reverse(lines_file, block_size=block_size)) == expected
+
+    def test_missing_file_yields_nothing(self, tmp_path):
+        assert list(iter_lines_reverse(tmp_path / "nope")) == []
+
+    def test_empty_file(self, tmp_path):
+        path = tmp_path / "empty"
+        path.write_text("")
+        assert list(iter_lines_reverse(path)) == []
+
+    def test_partial_trailing_line(self, tmp_path):
+        path = tmp_path / "f"
+        path.write_text("a\nb\npartial")
+        assert list(iter_lines_reverse(path)) == ["partial", "b", "a"]
+        assert list(iter_lines_reverse(path, include_partial=False)) == ["b", "a"]
+
+    def test_crlf_and_blank_lines(self, tmp_path):
+        path = tmp_path / "f"
+        path.write_bytes(b"a\r\n\r\nb\r\n")
+        assert list(iter_lines_reverse(path, block_size=2)) == ["b", "", "a"]
+
+    def test_early_close_releases_file(self, lines_file):
+        with closing(iter_lines_reverse(lines_file)) as it:
+            assert next(it) == "line 99 é"
+
+
+class TestTailLines:
+    def test_oldest_first(self, lines_file):
+        assert tail_lines(lines_file, 3) == ["line 97 é", "line 98 é", "line 99 é"]
+
+    def test_more_than_available(self, tmp_path):
+        path = tmp_path / "f"
+        path.write_text("x\ny\n")
+        assert tail_lines(path, 10) == ["x", "y"]
+
+    def test_skip_blank(self, tmp_path):
+        path = tmp_path / "f"
+        path.write_text("x\n\ny\n\n")
+        assert tail_lines(path, 2, skip_blank=True) == ["x", "y"]
+
+    def test_zero_count(self, lines_file):
+        assert tail_lines(lines_file, 0) == []
+
+
+class TestTailJsonl:
+    def test_skips_invalid_and_partial_records(self, tmp_path):
+        path = tmp_path / "h.jsonl"
+        path.write_text(
+            "".join(json.dumps({"i": i}) + "\n" for i in range(5))
+            + "not json\n\n"
+            + '{"i": 99, "trunc'
+        )
+        assert tail_jsonl(path, 3, block_size=16) == [{"i": 2}, {"i": 3}, {"i": 4}]
+
+    def test_predicate_filters_without_counting(self, tmp_path):
+        path = tmp_path / "h.jsonl"
+        path.write_text("".join(json.dumps({"i": i}) + "\n" for i in range(10)))
+        result = tail_jsonl(path, 2, predicate=lambda r: r["i"] % 2 == 0)
+        assert result == [{"i": 6}, {"i": 8}]
+
+    def test_missing_file(self, tmp_path):
+        assert tail_jsonl(tmp_path / "nope.jsonl", 5) == []
+
+
+class TestReadTailText:
+    def test_short_file_not_truncated(self, tmp_path):
+        path = tmp_path / "j.md"
+        path.write_text("hello")
+        assert read_tail_text(path, 100) == ("hello", False)
+
+    def test_suffix_and_flag(self, lines_file):
+        full = lines_file.read_text()
+        text, truncated = read_tail_text(lines_file, 25)
+        assert text == full[-25:]
+        assert truncated
+
+    def test_multibyte_boundary(self, tmp_path):
+        path = tmp_path / "j.md"
+        full = "é" * 50 + "日本語" * 20
+        path.write_text(full)
+        for n in (1, 10, 59, 60, 61, 109):
+            assert tail_text(path, n) == full[-n:]
+
+    def test_missing_file(self, tmp_path):
+        assert read_tail_text(tmp_path / "nope", 10) == ("", False)
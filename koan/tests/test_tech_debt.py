@@ -145,6 +145,22 @@ class TestBuildPrompt:
         assert "Debt Score" in prompt
 
 
+    def test_prompt_includes_static_context(self):
+        prompt = build_tech_debt_prompt(
+            "test",
+            skill_dir=Path(__file__).parent.parent / "skills" / "core" / "tech_debt",
+            static_context="## Static Analysis Pre-pass\n- candidate",
+        )
+        assert "## Static Analysis Pre-pass" in prompt
+        assert "{STATIC_ANALYSIS}" not in prompt
+
+    def test_prompt_without_static_context_has_no_placeholder(self):
+        prompt = build_tech_debt_prompt(
+            "test",
+            skill_dir=Path(__file__).parent.parent / "skills" / "core" / "tech_debt",
+        )
+        assert "{STATIC_ANALYSIS}" not in prompt
+
 class TestExtractReportBody:
     def test_extracts_from_tech_debt_header(self):
         raw = "Some preamble\n\nTech Debt Report — myproject\n\n## Summary\nGood project."
@@ -52,32 +52,32 @@ class TestGetters:
 
 
 class TestSendRaw:
-    @patch("app.messaging.telegram.requests.post")
+    @patch("app.messaging.telegram.requests.Session.post")
     def test_short_message(self, mock_post, provider):
         mock_post.return_value = MagicMock(json=lambda: {"ok": True})
         assert provider._send_raw("hello") is True
         mock_post.assert_called_once()
         assert mock_post.call_args[1]["json"]["text"] == "hello"
 
-    @patch("app.messaging.telegram.requests.post")
+    @patch("app.messaging.telegram.requests.Session.post")
     def test_long_message_chunked(self, mock_post, provider):
         mock_post.return_value = MagicMock(json=lambda: {"ok": True})
         assert provider._send_raw("x" * 8500) is True
         assert mock_post.call_count == 3  # 4000 + 4000 + 500
 
-    @patch("app.messaging.telegram.requests.post")
+    @patch("app.messaging.telegram.requests.Session.post")
     def test_exact_boundary(self, mock_post, provider):
         mock_post.return_value = MagicMock(json=lambda: {"ok": True})
         assert provider._send_raw("x" * 4000) is True
         assert mock_post.call_count == 1
 
-    @patch("app.messaging.telegram.requests.post")
+    @patch("app.messaging.telegram.requests.Session.post")
     def test_just_over_boundary(self, mock_post, provider):
         mock_post.return_value = MagicMock(json=lambda: {"ok": True})
         assert provider._send_raw("x" * 4001) is True
         assert mock_post.call_count == 2
 
-    @patch("app.messaging.telegram.requests.post")
+    @patch("app.messaging.telegram.requests.Session.post")
     def test_api_error(self, mock_post, provider):
         mock_post.return_value = MagicMock(
             json=lambda: {"ok": False, "description": "bad"},
@@ -86,7 +86,7 @@ class TestSendRaw:
         assert provider._send_raw("test") is False
 
     @patch("app.retry.time.sleep")
-    @patch("app.messaging.telegram.requests.post",
+    @patch("app.messaging.telegram.requests.Session.post",
            side_effect=requests.RequestException("network"))
     def test_network_error(self, mock_post, mock_sleep, provider):
         assert provider._send_raw("test") is False
@@ -94,13 +94,13 @@ class TestSendRaw:
         assert mock_sleep.call_count == 2
 
     @patch("app.retry.time.sleep")
-    @patch("app.messaging.telegram.requests.post",
+    @patch("app.messaging.telegram.requests.Session.post",
            side_effect=ValueError("bad json"))
     def test_json_error(self, mock_post, mock_sleep, provider):
         assert provider._send_raw("test") is False
 
     @patch("app.retry.time.sleep")
-    @patch("app.messaging.telegram.requests.post")
+    @patch("app.messaging.telegram.requests.Session.post")
     def test_retry_on_network_then_success(self, mock_post, mock_sleep, provider):
         """_send_raw retries on transient network error and succeeds."""
         mock_post.side_effect = [
@@ -115,7 +115,7 @@ class TestSendRaw:
         p = TelegramProvider()
         assert p._send_raw("test") is False
 
-    @patch("app.messaging.telegram.requests.post")
+    @patch("app.messaging.telegram.requests.Session.post")
     def test_partial_failure_sends_truncation_notice(self, mock_post, provider):
         """If one chunk fails, returns False and sends truncation notice."""
         responses = [
@@ -131,7 +131,7 @@ class TestSendRaw:
         assert "truncated" in notice_text.lower()
         assert "1/2" in notice_text
 
-    @patch("app.messaging.telegram.requests.post")
+    @patch("app.messaging.telegram.requests.Session.post")
     def test_all_chunks_fail_no_truncation_notice(self, mock_post, provider):
         """If ALL chunks fail, no truncation notice (nothing was delivered)."""
         mock_post.return_value = MagicMock(
@@ -141,7 +141,7 @@ class TestSendRaw:
         # Only 2 chunk attempts, no notice (nothing delivered)
         assert mock_post.call_count == 2
 
-    @patch("app.messaging.telegram.requests.post")
+    @patch("app.messaging.telegram.requests.Session.post")
     def test_all_chunks_attempted_despite_failure(self, mock_post, provider):
         """All chunks are attempted even when earlier chunks fail."""
         responses = [
@@ -159,22 +159,60 @@ class TestSendRaw:
         assert "2/3" in notice_text
 
 
+class TestRateLimit:
+    """Telegram 429 responses are retried after retry_after."""
+
+    @patch("app.retry.time.sleep")
+    @patch("app.messaging.telegram.requests.Session.post")
+    def test_retry_after_honoured(self, mock_post, mock_sleep, provider):
+        mock_post.side_effect = [
+            MagicMock(json=lambda: {
+                "ok": False, "error_code": 429,
+                "parameters": {"retry_after": 7},
+            }),
+            MagicMock(json=lambda: {"ok": True, "result": {"message_id": 3}}),
+        ]
+        assert provider._send_raw("hello") is True
+        mock_sleep.assert_called_once_with(7.0)
+        assert provider.get_last_message_ids() == [3]
+
+    @patch("app.retry.time.sleep")
+    @patch("app.messaging.telegram.requests.Session.post")
+    def test_retry_after_capped(self, mock_post, mock_sleep, provider):
+        from app.messaging.telegram import MAX_RETRY_AFTER_SECONDS
+
+        mock_post.return_value = MagicMock(json=lambda: {
+            "ok": False, "error_code": 429, "parameters": {"retry_after": 3600},
+        })
+        assert provider._send_raw("hello") is False
+        assert all(c.args[0] == MAX_RETRY_AFTER_SECONDS for c in mock_sleep.call_args_list)
+
+    def test_session_reused_across_sends(self, provider):
+        session = provider._session
+        with patch.object(session, "post",
+                          return_value=MagicMock(json=lambda: {"ok": True})) as mock_post:
+            provider._send_raw("one")
+            provider._send_raw("two")
+        assert mock_post.call_count == 2
+        assert provider._session is session
+
+
 class TestSendMessage:
     """Tests for send_message with flood protection."""
 
-    @patch("app.messaging.telegram.requests.post")
+    @patch("app.messaging.telegram.requests.Session.post")
     def test_first_message_passes(self, mock_post, provider):
         mock_post.return_value = MagicMock(json=lambda: {"ok": True})
         assert provider.send_message("hello") is True
         mock_post.assert_called_once()
 
-    @patch("app.messaging.telegram.requests.post")
+    @patch("app.messaging.telegram.requests.Session.post")
     def test_empty_message(self, mock_post, provider):
         """Empty string goes to _send_raw directly (no flood tracking)."""
         mock_post.return_value = MagicMock(json=lambda: {"ok": True})
         assert provider.send_message("") is True
 
-    @patch("app.messaging.telegram.requests.post")
+    @patch("app.messaging.telegram.requests.Session.post")
     @patch("app.messaging.telegram.time.time")
     def test_duplicate_triggers_warning(self, mock_time, mock_post, provider):
         mock_post.return_value = MagicMock(json=lambda: {"ok": True})
@@ -188,7 +226,7 @@ class TestSendMessage:
         warning = mock_post.call_args_list[1][1]["json"]["text"]
         assert "flood" in warning.lower()
 
-    @patch("app.messaging.telegram.requests.post")
+    @patch("app.messaging.telegram.requests.Session.post")
     @patch("app.messaging.telegram.time.time")
     def test_third_duplicate_suppressed(self, mock_time, mock_post, provider):
         mock_post.return_value = MagicMock(json=lambda: {"ok": True})
@@ -202,7 +240,7 @@ class TestSendMessage:
         assert result is True
         assert mock_post.call_count == 2  # original + warning only
 
-    @patch("app.messaging.telegram.requests.post")
+    @patch("app.messaging.telegram.requests.Session.post")
     @patch("app.messaging.telegram.time.time")
     def test_different_message_resets(self, mock_time, mock_post, provider):
         mock_post.return_value = MagicMock(json=lambda: {"ok": True})
@@ -216,7 +254,7 @@ class TestSendMessage:
         assert result is True
         assert mock_post.call_count == 3
 
-    @patch("app.messaging.telegram.requests.post")
+    @patch("app.messaging.telegram.requests.Session.post")
     @patch("app.messaging.telegram.time.time")
     def test_window_expiry(self, mock_time, mock_post, provider):
         mock_post.return_value = MagicMock(json=lambda: {"ok": True})
@@ -230,7 +268,7 @@ class TestSendMessage:
         for call in mock_post.call_args_list:
             assert call[1]["json"]["text"] == "hello"
 
-    @patch("app.messaging.telegram.requests.post")
+    @patch("app.messaging.telegram.requests.Session.post")
     @patch("app.messaging.telegram.time.time")
     def test_flood_with_chunks(self, mock_time, mock_post, provider):
         mock_post.return_value = MagicMock(json=lambda: {"ok": True})
@@ -245,7 +283,7 @@ class TestSendMessage:
 
 
 class TestResetFloodState:
-    @patch("app.messaging.telegram.requests.post")
+    @patch("app.messaging.telegram.requests.Session.post")
     @patch("app.messaging.telegram.time.time")
     def test_reset_allows_resend(self, mock_time, mock_post, provider):
         mock_post.return_value = MagicMock(json=lambda: {"ok": True})
@@ -263,7 +301,7 @@ class TestResetFloodState:
 
 
 class TestPollUpdates:
-    @patch("app.messaging.telegram.requests.get")
+    @patch("app.messaging.telegram.requests.Session.get")
     def test_returns_updates(self, mock_get, provider):
         mock_get.return_value = MagicMock()
         mock_get.return_value.json.return_value = {
@@ -282,7 +320,7 @@ class TestPollUpdates:
         assert updates[0].message.text == "hello"
         assert updates[0].message.role == "user"
 
-    @patch("app.messaging.telegram.requests.get")
+    @patch("app.messaging.telegram.requests.Session.get")
     def test_passes_offset(self, mock_get, provider):
         mock_get.return_value = MagicMock()
         mock_get.return_value.json.return_value = {"ok": True, "result": []}
@@ -290,7 +328,7 @@ class TestPollUpdates:
         _, kwargs = mock_get.call_args
         assert kwargs["params"]["offset"] == 42
 
-    @patch("app.messaging.telegram.requests.get")
+    @patch("app.messaging.telegram.requests.Session.get")
     def test_no_offset(self, mock_get, provider):
         mock_get.return_value = MagicMock()
         mock_get.return_value.json.return_value = {"ok": True, "result": []}
@@ -298,12 +336,12 @@ class TestPollUpdates:
         _, kwargs = mock_get.call_args
         assert "offset" not in kwargs["params"]
 
-    @patch("app.messaging.telegram.requests.get",
+    @patch("app.messaging.telegram.requests.Session.get",
            side_effect=requests.RequestException("timeout"))
     def test_network_error(self, mock_get, provider):
         assert provider.poll_updates() == []
 
-    @patch("app.messaging.telegram.requests.get",
+    @patch("app.messaging.telegram.requests.Session.get",
            side_effect=requests.RequestException("connection refused"))
     def test_network_error_logs_to_stderr(self, mock_get, provider, capsys):
         """Network errors must be logged to stderr, not silently swallowed."""
@@ -312,13 +350,13 @@ class TestPollUpdates:
         assert "poll_updates error" in captured.err
         assert "connection refused" in captured.err
 
-    @patch("app.messaging.telegram.requests.get")
+    @patch("app.messaging.telegram.requests.Session.get")
     def test_json_error(self, mock_get, provider):
         mock_get.return_value = MagicMock()
         mock_get.return_value.json.side_effect = ValueError("bad")
         assert provider.poll_updates() == []
 
-    @patch("app.messaging.telegram.requests.get")
+    @patch("app.messaging.telegram.requests.Session.get")
     def test_json_error_logs_to_stderr(self, mock_get, provider, capsys):
         """JSON parse errors must be logged to stderr, not silently swallowed."""
         mock_get.return_value = MagicMock()
@@ -328,7 +366,7 @@ class TestPollUpdates:
         assert "poll_updates error" in captured.err
         assert "invalid json" in captured.err
 
-    @patch("app.messaging.telegram.requests.get")
+    @patch("app.messaging.telegram.requests.Session.get")
     def test_update_without_message(self, mock_get, provider):
         mock_get.return_value = MagicMock()
         mock_get.return_value.json.return_value = {
@@ -342,7 +380,7 @@ class TestPollUpdates:
 
 
 class TestSendTyping:
-    @patch("app.messaging.telegram.requests.post")
+    @patch("app.messaging.telegram.requests.Session.post")
     def test_sends_chat_action(self, mock_post, provider):
         mock_post.return_value = MagicMock(json=lambda: {"ok": True})
         assert provider.send_typing() is True
@@ -351,12 +389,12 @@ class TestSendTyping:
         assert call_json["action"] == "typing"
         assert call_json["chat_id"] == "12345"
 
-    @patch("app.messaging.telegram.requests.post")
+    @patch("app.messaging.telegram.requests.Session.post")
     def test_returns_false_on_api_error(self, mock_post, provider):
         mock_post.return_value = MagicMock(json=lambda: {"ok": False})
         assert provider.send_typing() is False
 
-    @patch("app.messaging.telegram.requests.post")
+    @patch("app.messaging.telegram.requests.Session.post")
     def test_returns_false_on_network_error(self, mock_post, provider):
         mock_post.side_effect = requests.RequestException("timeout")
         assert provider.send_typing() is False
@@ -439,7 +477,7 @@ class TestMarkdownToHtml:
 class TestSendWithParseMode:
     """Tests that code blocks trigger HTML parse_mode in API calls."""
 
-    @patch("app.messaging.telegram.requests.post")
+    @patch("app.messaging.telegram.requests.Session.post")
     def test_plain_text_no_parse_mode(self, mock_post, provider):
         """Messages without code blocks are sent without parse_mode."""
         mock_post.return_value = MagicMock(json=lambda: {"ok": True})
@@ -448,7 +486,7 @@ class TestSendWithParseMode:
         assert "parse_mode" not in payload
         assert payload["text"] == "plain text message"
 
-    @patch("app.messaging.telegram.requests.post")
+    @patch("app.messaging.telegram.requests.Session.post")
     def test_code_block_sends_html_parse_mode(self, mock_post, provider):
         """Messages with code blocks are converted to HTML and sent with parse_mode."""
         mock_post.return_value = MagicMock(json=lambda: {"ok": True})
@@ -458,7 +496,7 @@ class TestSendWithParseMode:
         assert "<pre>code</pre>" in payload["text"]
         assert "```" not in payload["text"]
 
-    @patch("app.messaging.telegram.requests.post")
+    @patch("app.messaging.telegram.requests.Session.post")
     def test_live_skill_output_rendered(self, mock_post, provider):
         """Full /live output is properly converted for Telegram."""
         mock_post.return_value = MagicMock(json=lambda: {"ok": True})
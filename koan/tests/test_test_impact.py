@@ -0,0 +1,249 @@
+"""Tests for test_impact — changed files → affected tests selection."""
+
+import sqlite3
+import subprocess
+from unittest.mock import patch
+
+import pytest
+
+from app import test_impact
+from app.test_impact import (
+    build_import_graph,
+    extract_imports,
+    get_project_test_impact_config,
+    load_coverage_map,
+    run_impacted_tests,
+    select_tests,
+)
+
+
+def _git(repo, *args):
+    subprocess.run(["git", *args], cwd=repo, check=True, capture_output=True)
+
+
+@pytest.fixture
+def repo(tmp_path):
+    """A small package with two test modules and a conftest."""
+    root = tmp_path / "repo"
+    files = {
+        "src/pkg/__init__.py": "",
+        "src/pkg/core.py": "VALUE = 1\n",
+        "src/pkg/api.py": "from pkg.core import VALUE\n",
+        "src/pkg/other.py": "def helper():\n    from . import core\n",
+        "tests/conftest.py": "",
+        "tests/test_api.py": "from pkg import api\n",
+        "tests/test_other.py": (
+            "from unittest.mock import patch\n"
+            "def test_x():\n    with patch('pkg.other.helper'):\n        pass\n"
+        ),
+        "README.md": "# repo\n",
+        "config.json": "{}\n",
+    }
+    for rel, content in files.items():
+        path = root / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content)
+    _git(root, "init", "-q")
+    _git(root, "add", ".")
+    _git(root, "-c", "user.email=t@t", "-c", "user.name=t", "commit", "-qm", "init")
+    return root
+
+
+class TestExtractImports:
+    def test_absolute_and_from_imports(self):
+        refs = extract_imports("import os.path\nfrom app.utils import load_config\n")
+        assert "os.path" in refs
+        assert "app.utils" in refs
+        assert "app.utils.load_config" in refs
+
+    def test_relative_and_lazy_imports(self):
+        source = "def f():\n    from ..pkg import mod\n    from . import sib\n"
+        refs = extract_imports(source)
+        assert "..pkg" in refs
+        assert "..pkg.mod" in refs
+        assert ".sib" in refs
+
+    def test_dotted_string_literals(self):
+        refs = extract_imports("patch('app.github.run_gh')\nx = 'not a module'\n")
+        assert "app.github.run_gh" in refs
+        assert "not a module" not in refs
+
+    def test_syntax_error_returns_empty(self):
+        assert extract_imports("def broken(:\n") == []
+
+
+class TestImportGraph:
+    def test_resolves_suffix_and_relative_imports(self, repo):
+        graph = build_import_graph(str(repo))
+
+        assert "src/pkg/core.py" in graph["src/pkg/api.py"]
+        assert "src/pkg/core.py" in graph["src/pkg/other.py"]
+        assert "src/pkg/api.py" in graph["tests/test_api.py"]
+        assert "tests/conftest.py" in graph["tests/test_api.py"]
+
+    def test_parsed_imports_cached_by_blob(self, repo):
+        build_import_graph(str(repo))
+        assert (repo / ".git" / "koan-test-impact" / "imports.json").exists()
+
+        with patch("app.test_impact.extract_imports", wraps=extract_imports) as spy:
+            build_import_graph(str(repo))
+        assert spy.call_count == 0
+
+    def test_modified_files_reparsed(self, repo):
+        build_import_graph(str(repo))
+        (repo / "src/pkg/api.py").write_text("import pkg.other\n")
+
+        graph = build_import_graph(str(repo))
+
+        assert "src/pkg/other.py" in graph["src/pkg/api.py"]
+        assert "src/pkg/core.py" not in graph["src/pkg/api.py"]
+
+    def test_not_a_repo(self, tmp_path):
+        assert build_import_graph(str(tmp_path)) is None
+
+
+class TestSelectTests:
+    def test_transitive_importers_selected(self, repo):
+        selection = select_tests(str(repo), ["src/pkg/core.py"])
+        assert selection.tests == ["tests/test_api.py", "tests/test_other.py"]
+
+    def test_leaf_change_selects_only_its_tests(self, repo):
+        assert select_tests(str(repo), ["src/pkg/api.py"]).tests == ["tests/test_api.py"]
+        assert select_tests(str(repo), ["src/pkg/other.py"]).tests == ["tests/test_other.py"]
+
+    def test_changed_test_selects_itself(self, repo):
+        assert select_tests(str(repo), ["tests/test_other.py"]).tests == ["tests/test_other.py"]
+
+    def test_conftest_change_selects_tests_below_it(self, repo):
+        selection = select_tests(str(repo), ["tests/conftest.py"])
+        assert selection.tests == ["tests/test_api.py", "tests/test_other.py"]
+
+    def test_docs_only_selects_nothing(self, repo):
+        selection = select_tests(str(repo), ["README.md", "docs/guide.md"])
+        assert selection.tests == []
+
+    @pytest.mark.parametrize("changed", [
+        ["config.json"],
+        ["src/pkg/api.py", "pyproject.toml"],
+        ["src/pkg/gone.py"],
+    ])
+    def test_untraceable_changes_are_unknown(self, repo, changed):
+        assert select_tests(str(repo), changed).tests is None
+
+    def test_coverage_map_adds_tests(self, repo):
+        db = repo / ".coverage"
+        conn = sqlite3.connect(db)
+        conn.executescript(
+            "CREATE TABLE file (id INTEGER PRIMARY KEY, path TEXT);"
+            "CREATE TABLE context (id INTEGER PRIMARY KEY, context TEXT);"
+            "CREATE TABLE line_bits (file_id INTEGER, context_id INTEGER, numbits BLOB);"
+        )
+        conn.execute("INSERT INTO file VALUES (1, ?)", (str(repo / "src/pkg/api.py"),))
+        conn.executemany("INSERT INTO context VALUES (?, ?)", [
+            (1, ""), (2, "tests/test_other.py::test_x|run"),
+        ])
+        conn.executemany("INSERT INTO line_bits VALUES (1, ?, x'01')", [(1,), (2,)])
+        conn.commit()
+        conn.close()
+
+        assert load_coverage_map(str(repo), ".coverage") == {
+            "src/pkg/api.py": ["tests/test_other.py"],
+        }
+        selection = select_tests(str(repo), ["src/pkg/api.py"], coverage_file=".coverage")
+        assert selection.tests == ["tests/test_api.py", "tests/test_other.py"]
+
+    def test_missing_coverage_file_ignored(self, repo):
+        assert load_coverage_map(str(repo), ".coverage") == {}
+
+
+class TestConfig:
+    def test_defaults(self):
+        cfg = get_project_test_impact_config({"projects": {"p": {}}}, "p")
+        assert cfg == {
+            "enabled": False,
+            "command": test_impact.DEFAULT_COMMAND,
+            "full_suite": False,
+            "coverage_file": "",
+        }
+
+    def test_project_override(self):
+        config = {
+            "defaults": {"test_impact": {"enabled": True}},
+            "projects": {"p": {"test_impact": {"command": "pytest -x {tests}"}}},
+        }
+        cfg = get_project_test_impact_config(config, "p")
+        assert cfg["enabled"] is True
+        assert cfg["command"] == "pytest -x {tests}"
+
+
+class TestRunImpactedTests:
+    OK = {"passed": True, "output": "", "details": "3 passed"}
+
+    def _config(self, **overrides):
+        cfg = {"enabled": True, "command": "pytest -q {tests}",
+               "full_suite": False, "coverage_file": ""}
+        cfg.update(overrides)
+        return cfg
+
+    def test_disabled_runs_full_suite(self):
+        with (
+            patch("app.test_impact._load_config", return_value=None),
+            patch("app.claude_step.run_project_tests", return_value=dict(self.OK)) as run,
+        ):
+            result = run_impacted_tests("/p", "make test", timeout=60)
+
+        run.assert_called_once_with("/p", test_cmd="make test", timeout=60)
+        assert result["selected"] is None
+
+    def test_runs_selected_subset(self, repo):
+        with (
+            patch("app.test_impact._load_config", return_value=self._config()),
+            patch("app.test_impact.resolve_base_branch", return_value="main"),
+            patch("app.test_impact.get_changed_files", return_value=["src/pkg/api.py"]),
+            patch("app.claude_step.run_project_tests", return_value=dict(self.OK)) as run,
+        ):
+            result = run_impacted_tests(str(repo), "make test")
+
+        run.assert_called_once_with(
+            str(repo), test_cmd="pytest -q tests/test_api.py", timeout=300,
+        )
+        assert result["selected"] == ["tests/test_api.py"]
+        assert result["details"] == "3 passed (1 impacted test files)"
+
+    def test_empty_selection_runs_full_suite(self, repo):
+        with (
+            patch("app.test_impact._load_config", return_value=self._config()),
+            patch("app.test_impact.resolve_base_branch", return_value="main"),
+            patch("app.test_impact.get_changed_files", return_value=["README.md"]),
+            patch("app.claude_step.run_project_tests", return_value=dict(self.OK)) as run,
+        ):
+            result = run_impacted_tests(str(repo), "make test")
+
+        run.assert_called_once_with(str(repo), test_cmd="make test", timeout=300)
+        assert result["selected"] is None
+
+    def test_full_suite_after_passing_subset(self, repo):
+        with (
+            patch("app.test_impact._load_config", return_value=self._config(full_suite=True)),
+            patch("app.test_impact.resolve_base_branch", return_value="main"),
+            patch("app.test_impact.get_changed_files", return_value=["src/pkg/api.py"]),
+            patch("app.claude_step.run_project_tests", return_value=dict(self.OK)) as run,
+        ):
+            run_impacted_tests(str(repo), "make test")
+
+        assert [c.kwargs["test_cmd"] for c in run.call_args_list] == [
+            "pytest -q tests/test_api.py", "make test",
+        ]
+
+    def test_failing_subset_skips_full_suite(self, repo):
+        failed = {"passed": False, "output": "boom", "details": "1 failed"}
+        with (
+            patch("app.test_impact._load_config", return_value=self._config(full_suite=True)),
+            patch("app.test_impact.resolve_base_branch", return_value="main"),
+            patch("app.test_impact.get_changed_files", return_value=["src/pkg/api.py"]),
+            patch("app.claude_step.run_project_tests", return_value=failed) as run,
+        ):
+            result = run_impacted_tests(str(repo), "make test")
+
+        assert run.call_count == 1
+        assert result["passed"] is False